@@ -0,0 +1 @@
+"""Performance benchmarks for the kg_to_script pipeline."""
@@ -0,0 +1,42 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+KG_ROOT = (REPO_ROOT / ".." / "script_to_kg" / "generated_kgs").resolve()
+
+
+def corpus_paths(limit: int = 0) -> List[Path]:
+    """Return every TTL file under script_to_kg/generated_kgs, sorted by path."""
+    paths = sorted(KG_ROOT.glob("*/*.ttl"))
+    return paths[:limit] if limit else paths
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Silence extractor console output and logging while timing."""
+    previous = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(previous)
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    """Run *fn* `repeat` times and return (best wall time in seconds, last result)."""
+    best = float("inf")
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
@@ -0,0 +1,103 @@
+"""
+Benchmark: memory held by a corpus of AgenticProjects, pydantic vs compact IR.
+
+The corpus is extracted once. Each mode then runs in its own fresh process,
+which unpickles --copies copies of the corpus and keeps them alive. The
+"pydantic" mode keeps the AgenticProjects as they are. The "compact" mode
+keeps only compact.compact(project). Each copy is unpickled separately, as a
+batch of extractions would produce it. Memory is reported two ways:
+
+  * the process's peak RSS;
+  * the Python heap still held at the end, from tracemalloc, measured in a
+    second, traced process.
+
+Conversion times are the best-of-N over the whole corpus.
+
+Usage:
+    From kg_to_script/:
+        python -m benchmarks.compact_ir
+        python -m benchmarks.compact_ir --copies 50 --limit 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import pickle
+import resource
+import sys
+import tracemalloc
+from typing import List
+
+from src.core.compact import compact, expand
+from src.core.extractor import extract_project
+
+from .common import best_of, corpus_paths, quiet
+
+MODES = ("pydantic", "compact")
+
+
+def _hold(mode: str, blobs: List[bytes], copies: int, traced: bool) -> float:
+    """Child-process task: MB held after loading *copies* of the corpus in *mode*."""
+    if traced:
+        tracemalloc.start()
+    held = []
+    for _ in range(copies):
+        for blob in blobs:
+            project = pickle.loads(blob)
+            held.append(compact(project) if mode == "compact" else project)
+    if traced:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return current / (1024 * 1024)
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=0, help="Only use the first N KGs.")
+    parser.add_argument("--copies", type=int, default=20, help="Copies of the corpus held in memory.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N conversion timing.")
+    args = parser.parse_args()
+
+    projects = []
+    with quiet():
+        for path in corpus_paths(args.limit):
+            try:
+                projects.append(extract_project(str(path)))
+            except Exception:
+                pass
+    if not projects:
+        print("[WARNING] No .ttl files found")
+        sys.exit(0)
+    blobs = [pickle.dumps(project) for project in projects]
+
+    compact_seconds, records = best_of(lambda: [compact(p) for p in projects], args.repeat)
+    expand_seconds, _ = best_of(lambda: [expand(r) for r in records], args.repeat)
+
+    print("=" * 65)
+    print("  Compact IR benchmark: memory held by a corpus of projects")
+    print("=" * 65)
+    print(f"  Projects : {len(projects)} x {args.copies} copies")
+    print(f"  compact(): {compact_seconds * 1000:.1f} ms   expand(): {expand_seconds * 1000:.1f} ms  (whole corpus)")
+    print(f"  {'mode':<10} {'peak RSS MB':>12} {'held py MB':>11}")
+
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for mode in MODES:
+        with context.Pool(1) as pool:
+            rss = pool.apply(_hold, (mode, blobs, args.copies, False))
+        with context.Pool(1) as pool:
+            heap = pool.apply(_hold, (mode, blobs, args.copies, True))
+        results[mode] = (rss, heap)
+        print(f"  {mode:<10} {rss:>12.1f} {heap:>11.1f}")
+
+    (rss_p, heap_p), (rss_c, heap_c) = results["pydantic"], results["compact"]
+    print(f"  compact / pydantic: peak RSS {rss_c / rss_p:.2f}x, held heap {heap_c / heap_p:.2f}x")
+    print("=" * 65)
+
+
+if __name__ == "__main__":
+    main()
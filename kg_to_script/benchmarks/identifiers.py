@@ -0,0 +1,266 @@
+"""
+Benchmark: identifier normalization (src/core/identifiers.py).
+
+Part one times each conversion per call, comparing the regexes the call sites
+used before the shared module (reference: re.sub with a pattern-cache lookup
+on every call) against the kernel, first with its memo caches cleared (cold)
+and then warm. The inputs are every IRI, var_name and label in the corpus.
+
+Part two times the evaluation extractors end to end: extract_kg over the KG
+corpus and extract_code over generated_projects/output_*. It runs each one
+once with the reference functions patched into their import sites and once
+with the kernel. The IR cache is off, so extract_kg includes extraction.
+
+Usage:
+    From kg_to_script/:
+        python -m benchmarks.identifiers
+        python -m benchmarks.identifiers --limit 20 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from src.core import identifiers
+from src.core.helpers import load_graph
+
+from .common import REPO_ROOT, best_of, corpus_paths, quiet
+
+
+# -- Reference implementations: the call sites before the shared module ------
+
+def ref_safe_var(iri: str) -> str:
+    if not iri:
+        return "unnamed"
+    name = iri.split("/")[-1].split("#")[-1]
+    name = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name)
+    name = re.sub(r"(?<=[A-Z])([A-Z][a-z])", r"_\1", name)
+    name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+    name = re.sub(r"_+", "_", name).strip("_").lower()
+    if not name:
+        return "unnamed"
+    if name[0].isdigit():
+        name = f"_{name}"
+    return name
+
+
+def ref_camel(s_: str) -> str:
+    return "".join(w.capitalize() for w in s_.split("_"))
+
+
+def ref_to_camel(name: str) -> str:
+    if not name:
+        return "unnamed"
+    parts = [p for p in re.split(r"[^a-zA-Z0-9]+", name) if p]
+    if not parts:
+        return "unnamed"
+    head, *tail = parts
+    out = head.lower() + "".join(p[:1].upper() + p[1:] for p in tail)
+    if out[0].isdigit():
+        out = f"item{out}"
+    return out
+
+
+def ref_to_kebab(name: str) -> str:
+    clean = re.sub(r"[^a-zA-Z0-9]+", "-", name or "")
+    clean = re.sub(r"-+", "-", clean).strip("-").lower()
+    return clean or "mastra-project"
+
+
+def ref_safe_schema_key(name: str) -> str:
+    key = re.sub(r"[^a-zA-Z0-9_]+", "_", name or "").strip("_")
+    if not key:
+        return "value"
+    if key[0].isdigit():
+        key = f"field_{key}"
+    return key
+
+
+def ref_normalize_name(value: object) -> str:
+    text = str(value or "")
+    text = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", text)
+    text = re.sub(r"([a-zA-Z])(\d)", r"\1_\2", text)
+    text = re.sub(r"(\d)([a-zA-Z])", r"\1_\2", text)
+    text = text.replace("-", "_").replace(" ", "_")
+    text = re.sub(r"[^a-zA-Z0-9_]+", "_", text)
+    text = re.sub(r"_+", "_", text).strip("_")
+    return text.lower()
+
+
+def ref_local_name(iri: object) -> str:
+    text = str(iri or "")
+    if "#" in text:
+        text = text.rsplit("#", 1)[-1]
+    if "/" in text:
+        text = text.rsplit("/", 1)[-1]
+    return text
+
+
+def ref_aliases_for(*values: object) -> Tuple[str, ...]:
+    aliases = []
+    seen = set()
+    for value in values:
+        if value is None:
+            continue
+        text = str(value).strip()
+        if not text:
+            continue
+        candidates = {text, ref_normalize_name(text), ref_local_name(text), ref_normalize_name(ref_local_name(text))}
+        for candidate in candidates:
+            normalized = ref_normalize_name(candidate)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                aliases.append(normalized)
+    return tuple(aliases)
+
+
+def ref_token_set(text: str) -> set:
+    raw = re.findall(r"[a-zA-Z_][a-zA-Z0-9_:\-]*", text or "")
+    tokens = {ref_normalize_name(token) for token in raw if token}
+    compact = ref_normalize_name(text)
+    if compact:
+        tokens.add(compact)
+    return tokens
+
+
+# (label, reference, kernel)
+CONVERSIONS: List[Tuple[str, Callable[[str], object], Callable[[str], object]]] = [
+    ("safe_var", ref_safe_var, identifiers.snake_identifier),
+    ("camel", ref_camel, identifiers.pascal_case),
+    ("_to_camel", ref_to_camel, identifiers.lower_camel_case),
+    ("_to_kebab", ref_to_kebab, identifiers.kebab_case),
+    ("_safe_schema_key", ref_safe_schema_key, identifiers.schema_key),
+    ("normalize_name", ref_normalize_name, identifiers.normalize_name),
+]
+
+# (module, attribute) -> reference function patched in for the "reference" run.
+PATCHES: Dict[Tuple[str, str], Callable] = {
+    ("src.core.helpers", "safe_var"): ref_safe_var,
+    ("src.core.helpers", "camel"): ref_camel,
+    ("src.core.extractor", "safe_var"): ref_safe_var,
+    ("src.core.extractor", "camel"): ref_camel,
+    ("evaluation.utils", "normalize_name"): ref_normalize_name,
+    ("evaluation.utils", "aliases_for"): ref_aliases_for,
+    ("evaluation.utils", "token_set"): ref_token_set,
+    ("evaluation.extractors.kg_extractor", "normalize_name"): ref_normalize_name,
+    ("evaluation.extractors.kg_extractor", "aliases_for"): ref_aliases_for,
+    ("evaluation.extractors.code_extractor", "normalize_name"): ref_normalize_name,
+    ("evaluation.extractors.code_extractor", "aliases_for"): ref_aliases_for,
+    ("evaluation.extractors.code_extractor", "token_set"): ref_token_set,
+    ("evaluation.metrics.oec", "normalize_name"): ref_normalize_name,
+    ("evaluation.metrics.oec", "token_set"): ref_token_set,
+}
+
+
+@contextlib.contextmanager
+def reference_functions() -> Iterator[None]:
+    """Patch the pre-kernel implementations into every import site."""
+    saved = {}
+    for (module_name, attr), fn in PATCHES.items():
+        module = importlib.import_module(module_name)
+        saved[(module, attr)] = getattr(module, attr)
+        setattr(module, attr, fn)
+    try:
+        yield
+    finally:
+        for (module, attr), fn in saved.items():
+            setattr(module, attr, fn)
+
+
+def corpus_names(paths: List[Path]) -> List[str]:
+    """Every IRI and literal up to 120 characters in *paths*, in corpus order (repeats kept)."""
+    names: List[str] = []
+    for path in paths:
+        try:
+            graph = load_graph(str(path))
+        except Exception:
+            continue
+        for triple in graph:
+            names.extend(str(term) for term in triple if len(str(term)) <= 120)
+    return names
+
+
+def _per_call_us(fn: Callable[[str], object], names: List[str], repeat: int, clear: bool) -> float:
+    def run() -> None:
+        if clear:
+            identifiers.cache_clear()
+        for name in names:
+            fn(name)
+
+    seconds, _ = best_of(run, repeat)
+    return seconds / len(names) * 1e6
+
+
+def _time_extractors(kg_paths: List[Path], project_dirs: List[Tuple[Path, str]], repeat: int) -> Tuple[float, float]:
+    from evaluation.extractors.code_extractor import extract_code
+    from evaluation.extractors.kg_extractor import extract_kg
+
+    def kg() -> None:
+        for path in kg_paths:
+            try:
+                extract_kg(path)
+            except Exception:
+                pass
+
+    def code() -> None:
+        for project_dir, framework in project_dirs:
+            extract_code(project_dir, framework)
+
+    with quiet():
+        kg_seconds, _ = best_of(kg, repeat)
+        code_seconds, _ = best_of(code, repeat)
+    return kg_seconds, code_seconds
+
+
+def generated_project_dirs() -> List[Tuple[Path, str]]:
+    """(project dir, framework) for every project under generated_projects/output_<framework>."""
+    dirs = []
+    for output in sorted((REPO_ROOT / "generated_projects").glob("output_*")):
+        framework = output.name[len("output_"):]
+        if framework == "interop":
+            continue
+        dirs.extend((project, framework) for project in sorted(output.iterdir()) if project.is_dir())
+    return dirs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=0, help="Use only the first N KGs (0 = all).")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing.")
+    args = parser.parse_args()
+
+    paths = corpus_paths(args.limit)
+    with quiet():
+        names = corpus_names(paths)
+    distinct = len(set(names))
+
+    print("=" * 72)
+    print("  Identifier benchmark: per-call cost and evaluation extractors")
+    print("=" * 72)
+    print(f"  {len(names)} names from {len(paths)} KGs ({distinct} distinct)")
+    print(f"  {'conversion':<18} {'reference µs':>13} {'cold µs':>9} {'warm µs':>9} {'speedup':>8}")
+    for label, reference, kernel in CONVERSIONS:
+        ref_us = _per_call_us(reference, names, args.repeat, clear=False)
+        cold_us = _per_call_us(kernel, names, args.repeat, clear=True)
+        warm_us = _per_call_us(kernel, names, args.repeat, clear=False)
+        print(f"  {label:<18} {ref_us:>13.2f} {cold_us:>9.2f} {warm_us:>9.2f} {ref_us / warm_us:>7.1f}x")
+
+    project_dirs = generated_project_dirs()
+    print()
+    print(f"  extract_kg over {len(paths)} KGs, extract_code over {len(project_dirs)} projects")
+    print(f"  {'functions':<18} {'extract_kg s':>13} {'extract_code s':>15}")
+    with reference_functions():
+        ref_kg, ref_code = _time_extractors(paths, project_dirs, args.repeat)
+    print(f"  {'reference':<18} {ref_kg:>13.3f} {ref_code:>15.3f}")
+    identifiers.cache_clear()
+    kernel_kg, kernel_code = _time_extractors(paths, project_dirs, args.repeat)
+    print(f"  {'kernel':<18} {kernel_kg:>13.3f} {kernel_code:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
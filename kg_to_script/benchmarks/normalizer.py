@@ -0,0 +1,89 @@
+"""
+Benchmark: normalize_ttl throughput on multi-megabyte synthetic TTL.
+
+The synthetic document repeats a block that exercises every repair: markdown
+fences and prose before the first prefix, separator lines, subjects missing
+their leading colon and closing period, dcterms:description chained in object
+position, undeclared standard prefixes, and single-quoted literals spanning
+several lines (the case that used to trigger quadratic list inserts).
+Throughput should stay flat as the document grows.
+
+Usage:
+    From kg_to_script/:
+        python -m benchmarks.normalizer
+        python -m benchmarks.normalizer --sizes 1 4 16 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from src.core.normalizer import normalize_ttl
+
+from .common import best_of
+
+_HEADER = """```turtle
+Generated knowledge graph for a synthetic crew
+---
+@prefix : <http://www.w3id.org/agentic-ai/onto#> .
+
+"""
+
+_BLOCK = """:agent_{n} a :LLMAgent ;
+    rdfs:label "Agent {n}" ;
+    :agentRole "Researcher {n}" ;
+    :agentPrompt :prompt_{n}
+:prompt_{n} a :Prompt ;
+    :promptInputData dcterms:description "input for {n}" ;
+    :promptContext "You are agent {n}.
+Stay on topic.
+Cite <sources> # not a comment" ;
+    :promptInstruction \"\"\"Step one.
+Step two for {n}.\"\"\" .
+task_{n} :performedByAgent :agent_{n} ;
+    dcterms:description 'Research task {n} with a
+multi-line single-quoted description' ;
+    beam:usesResource <http://example.org/resource/{n}>
+===
+"""
+
+
+def synthetic_ttl(size_bytes: int) -> str:
+    """Build a synthetic TTL document of roughly *size_bytes* characters."""
+    parts = [_HEADER]
+    total = len(_HEADER)
+    n = 0
+    while total < size_bytes:
+        block = _BLOCK.format(n=n)
+        parts.append(block)
+        total += len(block)
+        n += 1
+    # A final statement so the last block gets its closing period too.
+    parts.append(":end a :Marker .\n```\n")
+    return "".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 2, 4, 8], help="Document sizes in MB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing per size.")
+    args = parser.parse_args()
+
+    print("=" * 65)
+    print("  Normalizer benchmark: normalize_ttl on synthetic TTL")
+    print("=" * 65)
+    print(f"  {'size MB':>8} {'best ms':>10} {'MB/s':>8} {'out MB':>8}")
+
+    for size_mb in args.sizes:
+        document = synthetic_ttl(int(size_mb * 1024 * 1024))
+        seconds, output = best_of(lambda: normalize_ttl(document), args.repeat)
+        mb = len(document) / (1024 * 1024)
+        print(
+            f"  {mb:>8.2f} {seconds * 1000:>10.1f} {mb / seconds:>8.1f} "
+            f"{len(output) / (1024 * 1024):>8.2f}"
+        )
+    print("=" * 65)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: per-KG extraction time with raw SPARQL strings vs prepared queries.
+
+The "raw" run swaps the extractor's query names back to the string constants
+from queries.py, which is how extract_project ran before the prepared-query
+registry existed. Graph loading is identical in both modes.
+
+Usage:
+    From kg_to_script/:
+        python -m benchmarks.prepared_queries
+        python -m benchmarks.prepared_queries --limit 5 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+import time
+from typing import Iterator
+
+from rdflib.plugins.sparql import prepareQuery
+
+from src.core import extractor, prepared, queries
+
+from .common import best_of, corpus_paths, quiet
+
+
+@contextlib.contextmanager
+def _raw_queries() -> Iterator[None]:
+    """Temporarily point the extractor at the raw query strings."""
+    swapped = {name: getattr(extractor, name) for name in prepared.QUERY_NAMES if hasattr(extractor, name)}
+    try:
+        for name in swapped:
+            setattr(extractor, name, getattr(queries, name))
+        yield
+    finally:
+        for name, value in swapped.items():
+            setattr(extractor, name, value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=0, help="Only benchmark the first N KGs.")
+    parser.add_argument("--repeat", type=int, default=1, help="Best-of-N timing per KG and mode.")
+    args = parser.parse_args()
+
+    paths = corpus_paths(args.limit)
+    if not paths:
+        print("[WARNING] No .ttl files found")
+        sys.exit(0)
+
+    # Importing the extractor already compiled the registry; recompile fresh
+    # copies so the one-off cost is visible.
+    start = time.perf_counter()
+    for name in prepared.QUERY_NAMES:
+        prepareQuery(getattr(queries, name))
+    compile_time = time.perf_counter() - start
+
+    print("=" * 65)
+    print("  Prepared-query benchmark: extract_project per KG")
+    print("=" * 65)
+    print(f"  KGs             : {len(paths)}")
+    print(f"  Queries         : {len(prepared.QUERY_NAMES)}")
+    print(f"  One-off compile : {compile_time * 1000:.1f} ms")
+    print("=" * 65)
+    print(f"  {'KG':<44} {'raw ms':>8} {'prep ms':>8} {'x':>5}")
+
+    total_raw = total_prepared = 0.0
+    failures = []
+    for path in paths:
+        try:
+            with quiet():
+                with _raw_queries():
+                    raw, _ = best_of(lambda: extractor.extract_project(str(path)), args.repeat)
+                fast, _ = best_of(lambda: extractor.extract_project(str(path)), args.repeat)
+        except Exception as exc:
+            failures.append((path.name, str(exc)))
+            continue
+        total_raw += raw
+        total_prepared += fast
+        print(f"  {path.stem[:44]:<44} {raw * 1000:>8.1f} {fast * 1000:>8.1f} {raw / fast:>5.1f}")
+
+    print("=" * 65)
+    speedup = total_raw / total_prepared if total_prepared else 0.0
+    print(f"  Total: raw {total_raw:.2f}s  prepared {total_prepared:.2f}s  ({speedup:.1f}x)")
+    if failures:
+        print(f"  Skipped ({len(failures)}):")
+        for name, err in failures:
+            print(f"    - {name}: {err[:80]}")
+    print("=" * 65)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: every pipeline stage on synthetic KGs of growing size.
+
+For each size N, benchmarks/synthetic.py builds a team of N agents, 2N tasks,
+N/10 tools and one workflow of 2N steps, with the normalizer's defects
+injected. The benchmark then times normalize_ttl, the Turtle parse,
+extraction with both query backends, and adapt + generate_project for every
+framework. Time per agent should stay flat as N grows.
+
+Usage:
+    From kg_to_script/:
+        python -m benchmarks.scale
+        python -m benchmarks.scale --sizes 100 1000 --topology fanout
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import tempfile
+
+from rdflib import Graph
+
+from src.core.extractor import EXTRACTION_BACKENDS, extract_project_from_graph
+from src.core.normalizer import normalize_ttl
+
+from .common import best_of, quiet
+from .synthetic import DEFECTS, TOPOLOGIES, synthetic_kg
+
+FRAMEWORKS = ("autogen", "crewai", "langgraph", "mastra")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000], help="Agents per KG.")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="chain")
+    parser.add_argument("--max-steps", type=int, default=0, help="Cap on workflow steps (0: no cap).")
+    parser.add_argument("--repeat", type=int, default=1, help="Best-of-N timing per stage.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stages = ["normalize", "parse"] + [f"extract:{b}" for b in EXTRACTION_BACKENDS] + list(FRAMEWORKS)
+    print("=" * 65)
+    print(f"  Scale benchmark: synthetic KGs, {args.topology} workflow")
+    print("=" * 65)
+    widths = [max(10, len(stage)) for stage in stages]
+    print(f"  {'agents':>7} {'KB':>8}  " + " ".join(f"{s:>{w}}" for s, w in zip(stages, widths)) + "   (ms)")
+
+    for size in args.sizes:
+        document = synthetic_kg(
+            agents=size,
+            tasks=2 * size,
+            tools=max(1, size // 10),
+            steps=min(2 * size, args.max_steps) if args.max_steps else 2 * size,
+            topology=args.topology,
+            defects=DEFECTS,
+            defect_rate=0.05,
+            seed=args.seed,
+        )
+        timings = []
+        with quiet():
+            seconds, repaired = best_of(lambda: normalize_ttl(document), args.repeat)
+            timings.append(seconds)
+            seconds, graph = best_of(lambda: Graph().parse(data=repaired, format="turtle"), args.repeat)
+            timings.append(seconds)
+            project = None
+            for backend in EXTRACTION_BACKENDS:
+                seconds, project = best_of(lambda: extract_project_from_graph(graph, backend=backend), args.repeat)
+                timings.append(seconds)
+            for framework in FRAMEWORKS:
+                adapter = importlib.import_module(f"src.frameworks.{framework}.adapter")
+                generator = importlib.import_module(f"src.frameworks.{framework}.generator")
+
+                def generate() -> None:
+                    with tempfile.TemporaryDirectory() as out:
+                        generator.generate_project(adapter.adapt(project), out)
+
+                seconds, _ = best_of(generate, args.repeat)
+                timings.append(seconds)
+        print(
+            f"  {size:>7} {len(document) / 1024:>8.0f}  "
+            + " ".join(f"{seconds * 1000:>{w}.1f}" for seconds, w in zip(timings, widths))
+        )
+    print("=" * 65)
+
+
+if __name__ == "__main__":
+    main()
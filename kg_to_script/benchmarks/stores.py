@@ -0,0 +1,124 @@
+"""
+Benchmark: graph store against graph store, with the same query backend.
+
+A store only changes who parses the KG, so for each extraction backend the
+table compares every store with rdflib: parse-only time (load_graph), end-to-
+end extract_project time and its ratio to rdflib, and memory. Every
+(store, backend) combination runs in its own fresh process, so peak memory is
+not polluted by earlier runs. "import RSS" is the resident set size after
+importing the store's module, before any KG is loaded. pyoxigraph's native
+library costs a fixed ~11 MB there. "peak RSS" is the maximum over the run, and
+"py peak" is the Python-heap peak reported by tracemalloc. Stores that are
+not installed are skipped.
+
+Usage:
+    From kg_to_script/:
+        python -m benchmarks.stores
+        python -m benchmarks.stores --limit 10 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import multiprocessing
+import resource
+import sys
+import tracemalloc
+from typing import Dict, List, Tuple
+
+from src.core.extractor import EXTRACTION_BACKENDS, extract_project
+from src.core.helpers import load_graph
+from src.core.store import GRAPH_STORES
+
+from .common import best_of, corpus_paths, quiet
+
+_STORE_MODULES = {"oxigraph": "pyoxigraph"}
+
+
+def _rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _run(store: str, backend: str, paths: List[str], repeat: int) -> Tuple[float, float, float, float, float]:
+    """Child-process task: (best parse seconds, best extract seconds, import RSS MB, peak RSS MB, tracemalloc peak MB)."""
+    module = _STORE_MODULES.get(store)
+    if module:
+        importlib.import_module(module)
+    import_rss = _rss_mb()
+
+    def load_all() -> None:
+        for path in paths:
+            try:
+                load_graph(path, store=store)
+            except Exception:
+                pass
+
+    def extract_all() -> None:
+        for path in paths:
+            try:
+                extract_project(path, backend=backend, store=store)
+            except Exception:
+                pass
+
+    with quiet():
+        extract_all()  # warm-up: imports, prepared queries
+        parse_seconds, _ = best_of(load_all, repeat)
+        seconds, _ = best_of(extract_all, repeat)
+        # A separate traced pass; tracing slows allocation-heavy code down.
+        tracemalloc.start()
+        extract_all()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return parse_seconds, seconds, import_rss, _rss_mb(), traced_peak / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=0, help="Only benchmark the first N KGs.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing per combination.")
+    args = parser.parse_args()
+
+    paths = [str(path) for path in corpus_paths(args.limit)]
+    if not paths:
+        print("[WARNING] No .ttl files found")
+        sys.exit(0)
+
+    stores = []
+    for store in GRAPH_STORES:
+        module = _STORE_MODULES.get(store)
+        if module and importlib.util.find_spec(module) is None:
+            print(f"[SKIP] {store}: {module} not installed")
+        else:
+            stores.append(store)
+
+    width = 84
+    print("=" * width)
+    print("  Graph-store benchmark: same backend, store vs rdflib")
+    print("=" * width)
+    print(f"  KGs : {len(paths)}")
+    context = multiprocessing.get_context("spawn")
+    for backend in EXTRACTION_BACKENDS:
+        print(f"\n  backend={backend}")
+        print(
+            f"  {'store':<10} {'parse ms':>9} {'total ms':>9} {'vs rdflib':>10}"
+            f" {'import RSS MB':>14} {'peak RSS MB':>12} {'py peak MB':>11}"
+        )
+        baseline: Dict[str, float] = {}
+        for store in stores:
+            with context.Pool(1) as pool:
+                parse_s, seconds, import_mb, rss_mb, traced_mb = pool.apply(
+                    _run, (store, backend, paths, args.repeat)
+                )
+            baseline.setdefault("seconds", seconds)
+            ratio = baseline["seconds"] / seconds if seconds else float("nan")
+            print(
+                f"  {store:<10} {parse_s * 1000:>9.1f} {seconds * 1000:>9.1f} {ratio:>9.2f}x"
+                f" {import_mb:>14.1f} {rss_mb:>12.1f} {traced_mb:>11.1f}"
+            )
+    print("=" * width)
+
+if __name__ == "__main__":
+    main()
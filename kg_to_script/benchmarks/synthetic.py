@@ -0,0 +1,437 @@
+"""
+Seeded generator of synthetic AgentO knowledge graphs for scale and stress runs.
+
+The corpus KGs top out around 35 KB. synthetic_kg() emits valid AgentO
+Turtle of any size, in the shape the extractor reads:
+
+  - a :Team with a process system config, goal and agent members
+  - language models, tools (with capabilities and config bags)
+  - agents with roles, goals, prompts, tool usage, interactions, config bags
+  - tasks with prompts, config bags and producedResource/requiresResource
+    links, so task context chains resolve
+  - workflow steps over the tasks, wired by :nextStep in one of TOPOLOGIES
+  - agento-ext:KickoffInputBundle inputs referenced as {placeholders}
+
+The same arguments and seed always give the same document. *defects*
+injects the LLM-style syntax errors that normalize_ttl() repairs (DEFECTS,
+named after normalizer.REPAIRS); repairing a defective document yields the
+same graph as the clean one.
+
+Usage:
+    From kg_to_script/:
+        python -m benchmarks.synthetic --agents 1000 --tasks 2000 -o big.ttl
+        python -m benchmarks.synthetic --topology nested --defects all --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# :nextStep shapes over the workflow steps:
+#   chain   s1 → s2 → ... → sN
+#   fanout  a tree: step i branches to *fanout* children (BRANCHING)
+#   cycle   a chain whose last step loops back to the first (LOOP)
+#   nested  chains of *pattern_size* steps in leaf patterns, grouped by
+#           :hasSubPattern into parents of up to *pattern_size* patterns
+#           each, level by level, under one top pattern; consecutive leaves
+#           are linked by :nextPattern and by a step edge
+TOPOLOGIES = ("chain", "fanout", "cycle", "nested")
+
+# Defects normalize_ttl() repairs (a subset of normalizer.REPAIRS).
+DEFECTS = (
+    "markdown",            # ```turtle fences, prose header, --- separators
+    "subject_colons",      # `agent_1 :agentRole ...` without the leading colon
+    "property_objects",    # `:promptInputData dcterms:description "..."`
+    "statement_periods",   # a statement missing its closing period
+    "prefixes",            # standard @prefix declarations left out
+    "multiline_literals",  # "..." literals spanning several lines
+)
+
+_PREFIXES = (
+    ("", "http://www.w3id.org/agentic-ai/onto#"),
+    ("agento-ext", "http://www.w3id.org/agentic-ai/ext#"),
+    ("rdf", "http://www.w3.org/1999/02/22-rdf-syntax-ns#"),
+    ("rdfs", "http://www.w3.org/2000/01/rdf-schema#"),
+    ("dcterms", "http://purl.org/dc/terms/"),
+    ("xsd", "http://www.w3.org/2001/XMLSchema#"),
+    ("beam", "http://w3id.org/beam/core#"),
+)
+# Prefixes normalize_ttl() can re-declare on its own.
+_STANDARD = {"rdf", "rdfs", "dcterms", "xsd", "beam"}
+
+_WORDS = (
+    "market", "report", "customer", "travel", "code", "review", "data", "search",
+    "summary", "budget", "schedule", "research", "analysis", "email", "draft",
+    "risk", "design", "support", "plan", "forecast", "content", "audit", "trend",
+)
+_ROLES = ("Researcher", "Writer", "Analyst", "Planner", "Reviewer", "Coordinator", "Engineer")
+_AGENT_CONFIGS = (("verbose", "true"), ("allow_delegation", "false"), ("max_iter", "15"), ("temperature", "0.2"))
+_TOOL_CONFIGS = (("timeout", "30"), ("retries", "3"), ("endpoint", "https://api.example.org/v1"))
+
+
+class _Literal:
+    """A literal object; *datatype* is a prefixed name such as "xsd:integer"."""
+
+    __slots__ = ("text", "datatype")
+
+    def __init__(self, text: str, datatype: str = "") -> None:
+        self.text = text
+        self.datatype = datatype
+
+
+def synthetic_kg(
+    agents: int = 4,
+    tasks: int = 8,
+    tools: int = 4,
+    steps: Optional[int] = None,
+    topology: str = "chain",
+    fanout: int = 2,
+    pattern_size: int = 4,
+    configs: int = 2,
+    kickoff_inputs: int = 2,
+    process: str = "sequential",
+    defects: Iterable[str] = (),
+    defect_rate: float = 0.2,
+    seed: int = 0,
+) -> str:
+    """Build a synthetic AgentO Turtle document.
+
+    *steps* defaults to one workflow step per task (step i runs task
+    i mod *tasks*). *configs* is the config-bag size of every agent, task and
+    tool. Block-level *defects* hit each eligible statement with probability
+    *defect_rate*; "markdown" and "prefixes" apply to the whole document.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology: {topology!r} (expected one of {TOPOLOGIES})")
+    defects = frozenset(defects)
+    unknown = sorted(defects - set(DEFECTS))
+    if unknown:
+        raise ValueError(f"Unknown defects: {unknown} (expected some of {DEFECTS})")
+    if agents < 1 or tasks < 1:
+        raise ValueError("A synthetic KG needs at least one agent and one task")
+    steps = tasks if steps is None else steps
+    rng = random.Random(seed)
+    # Defects draw from their own stream so the content does not depend on them.
+    writer = _Writer(random.Random(f"defects-{seed}"), defects, defect_rate)
+
+    # ── Team ──
+    input_keys = [f"{rng.choice(_WORDS)}_input_{i}" for i in range(kickoff_inputs)]
+    writer.section("Team")
+    writer.statement(":team_main", ":Team", [
+        ("rdfs:label", _Literal("Synthetic Team")),
+        ("dcterms:description", _Literal(_sentence(rng, 12))),
+        ("@:hasAgentMember", [f":agent_{i}" for i in range(agents)]),
+        ("@:hasSystemConfig", [":config_team_process"]),
+        ("@:hasTeamGoal", [":goal_team"]),
+        ("@:hasWorkflowPattern", [":pattern_main"] if steps else []),
+    ])
+    writer.config(":config_team_process", "process", process)
+    writer.statement(":goal_team", ":Goal", [("dcterms:description", _Literal(_sentence(rng, 10)))])
+    writer.statement(":config_env_api_key", ":Config", [
+        (":configKey", _Literal("OPENAI_API_KEY")),
+        (":configValue", _Literal("${OPENAI_API_KEY}")),
+    ])
+
+    # ── Language models, tools ──
+    writer.section("Language models and tools")
+    lm_count = max(1, min(3, agents // 10 + 1))
+    for i in range(lm_count):
+        writer.statement(f":lm_{i}", ":LanguageModel", [
+            ("rdfs:label", _Literal(("gpt-4o-mini", "gpt-4o", "claude-3-haiku")[i])),
+        ])
+    for i in range(tools):
+        bag = _bag(rng, _TOOL_CONFIGS, configs)
+        writer.statement(f":tool_{i}", ":Tool", [
+            ("rdfs:label", _Literal(f"{rng.choice(_WORDS).title()} Tool {i}")),
+            ("dcterms:description", _Literal(_sentence(rng, 10))),
+            ("@:hasCapability", [f":capability_tool_{i}"]),
+            ("@:hasToolConfig", [f":config_tool_{i}_{k}" for k in range(len(bag))]),
+        ])
+        writer.statement(f":capability_tool_{i}", ":Capability", [
+            ("dcterms:description", _Literal(_sentence(rng, 6))),
+        ])
+        for k, (key, value) in enumerate(bag):
+            writer.config(f":config_tool_{i}_{k}", key, value)
+
+    # ── Agents ──
+    writer.section("Agents")
+    for i in range(agents):
+        role = f"{rng.choice(_ROLES)} {i}"
+        bag = _bag(rng, _AGENT_CONFIGS, configs)
+        used_tools = rng.sample(range(tools), min(tools, rng.randint(0, 3))) if tools else []
+        peers = sorted({rng.randrange(agents) for _ in range(min(2, agents - 1))} - {i})
+        writer.statement(f":agent_{i}", ":LLMAgent", [
+            (":agentID", _Literal(f"agent_{i}")),
+            (":agentRole", _Literal(role)),
+            ("@:hasAgentGoal", [f":goal_agent_{i}"]),
+            ("@:agentPrompt", [f":prompt_agent_{i}"]),
+            ("@:useLanguageModel", [f":lm_{i % lm_count}"]),
+            ("@:agentToolUsage", [f":tool_{t}" for t in used_tools]),
+            ("@:interactsWith", [f":agent_{p}" for p in peers]),
+            ("@:hasAgentConfig", [f":config_agent_{i}_{k}" for k in range(len(bag))]),
+        ])
+        writer.statement(f":goal_agent_{i}", ":Goal", [("dcterms:description", _Literal(_sentence(rng, 8)))])
+        writer.statement(f":prompt_agent_{i}", ":Prompt", [
+            (":promptContext", _Literal(_paragraph(rng, f"You are the {role}."))),
+        ])
+        for k, (key, value) in enumerate(bag):
+            writer.config(f":config_agent_{i}_{k}", key, value)
+
+    # ── Tasks ──
+    writer.section("Tasks")
+    for i in range(tasks):
+        required = [f":resource_task_{rng.randrange(i)}"] if i and rng.random() < 0.7 else []
+        keys = rng.sample(input_keys, min(len(input_keys), 2))
+        instruction = _paragraph(rng, _sentence(rng, 8)) + "".join(f"\n{key}: {{{key}}}" for key in keys)
+        writer.statement(f":task_{i}", ":Task", [
+            ("rdfs:label", _Literal(f"task_{i}")),
+            ("dcterms:description", _Literal(_sentence(rng, 10))),
+            ("@:performedByAgent", [f":agent_{rng.randrange(agents)}"]),
+            ("@:taskPrompt", [f":prompt_task_{i}"]),
+            ("@:producedResource", [f":resource_task_{i}"]),
+            ("@:requiresResource", required),
+            ("@:hasAgentConfig", [f":config_task_{i}_{k}" for k in range(configs)]),
+        ])
+        writer.statement(f":prompt_task_{i}", ":Prompt", [
+            (":promptInstruction", _Literal(instruction)),
+            (":promptInputData", _Literal(_sentence(rng, 5))),
+            (":promptOutputIndicator", _Literal(_sentence(rng, 6))),
+        ])
+        writer.statement(f":resource_task_{i}", "beam:Resource", [
+            ("dcterms:description", _Literal(f"Output of task {i}")),
+        ])
+        task_bag = [("expected_output", _sentence(rng, 6))] + [
+            (f"option_{k}", str(rng.randint(1, 99))) for k in range(1, configs)
+        ]
+        for k, (key, value) in enumerate(task_bag[:configs]):
+            writer.config(f":config_task_{i}_{k}", key, value)
+
+    # ── Workflow ──
+    if steps:
+        writer.section("Workflow")
+        _write_workflow(writer, rng, steps, tasks, topology, fanout, pattern_size)
+
+    # ── Kickoff inputs ──
+    if input_keys:
+        writer.section("Kickoff inputs")
+        for i, key in enumerate(input_keys):
+            values = [_sentence(rng, 3)] + [_sentence(rng, 3) for _ in range(rng.randint(0, 2))]
+            for k, value in enumerate(values):
+                writer.statement(f":kickoff_{i}_{k}", "agento-ext:KickoffInputBundle", [
+                    ("agento-ext:inputKey", _Literal(key)),
+                    ("agento-ext:inputValue", _Literal(value)),
+                    ("agento-ext:isDefaultValue", _Literal("true" if k == 0 else "false", "xsd:boolean")),
+                ])
+
+    return writer.document()
+
+
+def _write_workflow(
+    writer: "_Writer",
+    rng: random.Random,
+    steps: int,
+    tasks: int,
+    topology: str,
+    fanout: int,
+    pattern_size: int,
+) -> None:
+    edges: Dict[int, List[int]] = {}
+    patterns: List[Tuple[str, List[int], List[str]]] = []  # (iri, steps, sub-patterns)
+    next_pattern: Dict[str, str] = {}
+    if topology == "fanout":
+        for i in range(1, steps):
+            edges.setdefault((i - 1) // max(1, fanout), []).append(i)
+    else:
+        for i in range(steps - 1):
+            edges[i] = [i + 1]
+        if topology == "cycle" and steps > 1:
+            edges[steps - 1] = [0]
+
+    if topology == "nested":
+        size = max(1, pattern_size)
+        level = []
+        for n, start in enumerate(range(0, steps, size)):
+            iri = f":pattern_leaf_{n}"
+            patterns.append((iri, list(range(start, min(steps, start + size))), []))
+            level.append(iri)
+        for n, iri in enumerate(level[:-1]):
+            next_pattern[iri] = level[n + 1]
+        depth = 0
+        while len(level) > 1:
+            depth += 1
+            parents = []
+            for n, start in enumerate(range(0, len(level), max(2, size))):
+                iri = f":pattern_{depth}_{n}"
+                patterns.append((iri, [], level[start:start + max(2, size)]))
+                parents.append(iri)
+            level = parents
+        patterns.append((":pattern_main", [], level))
+    else:
+        patterns.append((":pattern_main", list(range(steps)), []))
+
+    for iri, members, subs in patterns:
+        writer.statement(iri, ":WorkflowPattern", [
+            ("rdfs:label", _Literal(iri[1:].replace("_", " ").title())),
+            ("@:hasWorkflowStep", [f":step_{i}" for i in members]),
+            ("@:hasSubPattern", subs),
+            ("@:nextPattern", [next_pattern[iri]] if iri in next_pattern else []),
+        ])
+    for i in range(steps):
+        types = [":WorkflowStep"]
+        if i == 0:
+            types.insert(0, ":StartStep")
+        elif i == steps - 1:
+            types.insert(0, ":EndStep")
+        writer.statement(f":step_{i}", ", ".join(types), [
+            ("rdfs:label", _Literal(f"Step {i}")),
+            (":stepOrder", _Literal(str(i + 1), "xsd:integer")),
+            ("@:hasAssociatedTask", [f":task_{i % tasks}"]),
+            ("@:nextStep", [f":step_{j}" for j in edges.get(i, [])]),
+        ])
+
+
+class _Writer:
+    """Serializes statements, injecting block-level defects as it goes."""
+
+    def __init__(self, rng: random.Random, defects: frozenset, rate: float) -> None:
+        self.rng = rng
+        self.defects = defects
+        self.rate = rate
+        self.lines: List[str] = []
+        # Line of the latest statement written without its closing period.
+        self._open_statement: Optional[int] = None
+
+    def _hit(self, defect: str) -> bool:
+        return defect in self.defects and self.rng.random() < self.rate
+
+    def section(self, title: str) -> None:
+        if "markdown" in self.defects:
+            self.lines += ["", "---"]
+        self.lines += ["", "#" * 60, f"# {title}", "#" * 60, ""]
+
+    def config(self, iri: str, key: str, value: str) -> None:
+        self.statement(iri, ":Config", [(":configKey", _Literal(key)), (":configValue", _Literal(value))])
+
+    def statement(self, subject: str, types: str, pairs: Sequence[Tuple[str, Any]]) -> None:
+        """Write ``subject a types`` plus *pairs*: (predicate, _Literal) or ("@" + predicate, [IRIs])."""
+        body: List[Tuple[str, str]] = []
+        for predicate, obj in pairs:
+            if predicate.startswith("@"):
+                if obj:
+                    body.append((predicate[1:], " , ".join(obj)))
+            else:
+                body.append((predicate, self._literal(obj)))
+
+        head = subject
+        if self._hit("subject_colons") and body and body[0][0].startswith(":"):
+            # `agent_1 :agentRole "..." ; a :LLMAgent .`
+            head = subject[1:]
+            body.append(("a", types))
+        else:
+            body.insert(0, ("a", types))
+
+        if self._hit("property_objects"):
+            for n, (predicate, text) in enumerate(body[1:], start=1):
+                if predicate.startswith(":") and text[:1] == '"' and not text.startswith('"""') and "^^" not in text:
+                    body[n] = (predicate, f"dcterms:description {text}")
+                    break
+
+        lines = [f"{head} {body[0][0]} {body[0][1]}"]
+        lines += [f"    {predicate} {text}" for predicate, text in body[1:]]
+        for n in range(len(lines) - 1):
+            lines[n] += " ;"
+        # The normalizer restores a missing period when the next subject
+        # starts (colon-less subjects are repaired before that pass), so any
+        # statement but the last may lose it; document() closes the last.
+        if self._hit("statement_periods"):
+            self._open_statement = len(self.lines) + len(lines) - 1
+        else:
+            lines[-1] += " ."
+            self._open_statement = None
+        self.lines += lines
+        self.lines.append("")
+
+    def _literal(self, literal: _Literal) -> str:
+        text = literal.text
+        if literal.datatype:
+            return f'"{text}"^^{literal.datatype}'
+        if "\n" in text:
+            quote = '"' if self._hit("multiline_literals") else '"""'
+            return f"{quote}{text}{quote}"
+        return f'"{text}"'
+
+    def document(self) -> str:
+        if self._open_statement is not None:
+            self.lines[self._open_statement] += " ."
+            self._open_statement = None
+        prefixes = [
+            f"@prefix {name}: <{iri}> ."
+            for name, iri in _PREFIXES
+            if not ("prefixes" in self.defects and name in _STANDARD)
+        ]
+        header = ["# Synthetic AgentO knowledge graph (benchmarks/synthetic.py)", ""]
+        if "markdown" in self.defects:
+            header = ["```turtle", "Here is the generated knowledge graph:", "---"]
+        body = header + prefixes + self.lines
+        if "markdown" in self.defects:
+            body.append("```")
+        return "\n".join(body) + "\n"
+
+
+def _bag(rng: random.Random, choices: Sequence[Tuple[str, str]], size: int) -> List[Tuple[str, str]]:
+    return rng.sample(list(choices), min(size, len(choices)))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[:1].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random, first: str) -> str:
+    return "\n".join([first] + [_sentence(rng, 7) for _ in range(rng.randint(1, 3))])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=8)
+    parser.add_argument("--tools", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=None, help="Workflow steps (default: one per task).")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default="chain")
+    parser.add_argument("--fanout", type=int, default=2, help="Children per step for --topology fanout.")
+    parser.add_argument("--pattern-size", type=int, default=4, help="Steps per leaf pattern for --topology nested.")
+    parser.add_argument("--configs", type=int, default=2, help="Config-bag size per agent, task and tool.")
+    parser.add_argument("--kickoff-inputs", type=int, default=2)
+    parser.add_argument("--defects", nargs="*", default=[], help=f"Any of {', '.join(DEFECTS)}, or 'all'.")
+    parser.add_argument("--defect-rate", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="Output .ttl path (default: stdout).")
+    args = parser.parse_args()
+
+    document = synthetic_kg(
+        agents=args.agents,
+        tasks=args.tasks,
+        tools=args.tools,
+        steps=args.steps,
+        topology=args.topology,
+        fanout=args.fanout,
+        pattern_size=args.pattern_size,
+        configs=args.configs,
+        kickoff_inputs=args.kickoff_inputs,
+        defects=DEFECTS if "all" in args.defects else args.defects,
+        defect_rate=args.defect_rate,
+        seed=args.seed,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(document)
+        print(f"[Written] {args.output} ({len(document) / 1024:.1f} KB)")
+    else:
+        sys.stdout.write(document)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,22 @@ from __future__ import annotations
 import ast
 import re
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Mapping, Optional
 
 from ..schemas import EvaluationElement, ExtractionResult, GraphSpec
-from ..utils import aliases_for, iter_text_files, normalize_name, read_project_text, token_set
+from ..utils import (
+    ProjectSource,
+    aliases_for,
+    decode_text,
+    iter_project_texts,
+    normalize_name,
+    read_project_text,
+    token_set,
+)
 
 
-def extract_code(project_dir: Path, framework: str) -> ExtractionResult:
+def extract_code(project_dir: ProjectSource, framework: str) -> ExtractionResult:
+    """Elements and graph of a generated project, on disk or an in-memory tree (path → bytes)."""
     text = read_project_text(project_dir)
     elements = _extract_common_elements(text, project_dir, framework)
     graph = _extract_graph(text, project_dir, framework)
@@ -20,7 +29,7 @@ def extract_code(project_dir: Path, framework: str) -> ExtractionResult:
         graph=graph,
         source_tokens=token_set(text),
         source_text=text,
-        metadata={"project_dir": str(project_dir), "framework": framework},
+        metadata={"project_dir": "<memory>" if isinstance(project_dir, Mapping) else str(project_dir), "framework": framework},
     )
 
 
@@ -35,14 +44,14 @@ _YAML_CONFIG_KEYWORDS = {
 }
 
 
-def _extract_common_elements(text: str, project_dir: Path, framework: str) -> List[EvaluationElement]:
+def _extract_common_elements(text: str, project_dir: ProjectSource, framework: str) -> List[EvaluationElement]:
     elements: List[EvaluationElement] = []
     framework = framework.lower()
 
     if framework in {"crewai", "autogen"}:
-        for path in iter_text_files(project_dir):
-            if path.suffix == ".py":
-                elements.extend(_extract_python_elements(path))
+        for name, source in iter_project_texts(project_dir):
+            if name.endswith(".py"):
+                elements.extend(_extract_python_elements(source))
 
     if framework in {"langgraph", "mastra"}:
         elements.extend(_extract_typescript_elements(text, framework))
@@ -84,12 +93,11 @@ _AUTOGEN_WF_COMMENT = re.compile(r"#\s*Workflow:\s*([a-zA-Z0-9_]+)")
 # --------------------------------------------------------------------------
 
 
-def _extract_python_elements(path: Path) -> List[EvaluationElement]:
+def _extract_python_elements(source: str) -> List[EvaluationElement]:
     elements: List[EvaluationElement] = []
     try:
-        source = path.read_text(encoding="utf-8")
         tree = ast.parse(source)
-    except (SyntaxError, UnicodeDecodeError):
+    except SyntaxError:
         return elements
 
     # ── Source-text level patterns (regex over raw text) ─────────────────
@@ -224,7 +232,7 @@ def _extract_typescript_elements(text: str, framework: str) -> List[EvaluationEl
 
 
 
-def _extract_graph(text: str, project_dir: Path, framework: str) -> GraphSpec:
+def _extract_graph(text: str, project_dir: ProjectSource, framework: str) -> GraphSpec:
     framework = framework.lower()
     if framework == "langgraph":
         return _extract_langgraph_graph(text)
@@ -259,7 +267,7 @@ def _extract_langgraph_graph(text: str) -> GraphSpec:
     return graph
 
 
-def _extract_mastra_graph(text: str, project_dir: Optional[Path] = None) -> GraphSpec:
+def _extract_mastra_graph(text: str, project_dir: Optional[ProjectSource] = None) -> GraphSpec:
     """Extract Mastra workflow graph.
 
     Processes each workflow TypeScript file individually so that `.then()` chains
@@ -275,7 +283,18 @@ def _extract_mastra_graph(text: str, project_dir: Optional[Path] = None) -> Grap
 
     # Try to find individual workflow files.
     workflow_files: List[Path] = []
-    if project_dir and project_dir.is_dir():
+    workflow_texts: List[str] = []
+    if isinstance(project_dir, Mapping):
+        for candidate_dir in ("src/mastra/workflows/", "src/workflows/", "workflows/"):
+            names = [name for name in project_dir if name.startswith(candidate_dir)]
+            if names:
+                workflow_texts = [
+                    decode_text(project_dir[name], errors="replace")
+                    for name in sorted(names)
+                    if name.endswith(".ts") and "/" not in name[len(candidate_dir):]
+                ]
+                break
+    elif project_dir and project_dir.is_dir():
         for candidate_dir in (
             project_dir / "src" / "mastra" / "workflows",
             project_dir / "src" / "workflows",
@@ -308,6 +327,9 @@ def _extract_mastra_graph(text: str, project_dir: Optional[Path] = None) -> Grap
                 _parse_workflow_text(wf_text)
             except OSError:
                 continue
+    elif workflow_texts:
+        for wf_text in workflow_texts:
+            _parse_workflow_text(wf_text)
     else:
         # No per-file isolation possible — process full text as before.
         _parse_workflow_text(text)
@@ -346,14 +368,14 @@ def _extract_autogen_graph(text: str) -> GraphSpec:
     return graph
 
 
-def _extract_crewai_graph(project_dir: Path) -> GraphSpec:
+def _extract_crewai_graph(project_dir: ProjectSource) -> GraphSpec:
     graph = GraphSpec()
-    for path in iter_text_files(project_dir):
-        if path.suffix != ".py":
+    for name, source in iter_project_texts(project_dir):
+        if not name.endswith(".py"):
             continue
         try:
-            tree = ast.parse(path.read_text(encoding="utf-8"))
-        except (SyntaxError, UnicodeDecodeError):
+            tree = ast.parse(source)
+        except SyntaxError:
             continue
         task_names: List[str] = []
         for node in ast.walk(tree):
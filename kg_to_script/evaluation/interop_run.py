@@ -8,12 +8,14 @@ Usage:
     python -m src.evaluation.interop_run
     python -m src.evaluation.interop_run --source crewai --target autogen
     python -m src.evaluation.interop_run --source crewai  # all targets
+    python -m src.evaluation.interop_run --in-memory      # score without writing projects
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import traceback
 from datetime import datetime
@@ -21,6 +23,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.extractor import extract_project
+from src.frameworks.emit import MemorySink
 
 from .config import FrameworkConfig, framework_configs
 from .extractors.code_extractor import extract_code
@@ -86,6 +89,7 @@ def _translate_and_evaluate(
     source_key: str,
     target_key: str,
     output_dir: Path,
+    in_memory: bool = False,
 ) -> Dict[str, Any]:
     """Translate a single KG from source → target and evaluate.
 
@@ -93,13 +97,16 @@ def _translate_and_evaluate(
         1. Extract canonical IR (AgenticProject) from the KG.
         2. Run the target framework's adapter + generator.
         3. Evaluate: compilation, dry-run, OEC, WGI.
+
+    With *in_memory*, the generator writes to a MemorySink and the project
+    is scored from that tree; nothing is written below output_dir.
     """
     result: Dict[str, Any] = {
         "project": project_name,
         "kg_path": str(kg_path),
         "source": source_key,
         "target": target_key,
-        "output_dir": str(output_dir),
+        "output_dir": None if in_memory else str(output_dir),
     }
 
     # Step 1: extract canonical IR
@@ -119,7 +126,16 @@ def _translate_and_evaluate(
         if target_key == "mastra" and hasattr(target_project, "project_var_name"):
             target_project.project_var_name = project_name
 
-        gen_fn(target_project, str(output_dir))
+        if in_memory:
+            sink = MemorySink()
+            project_dir = gen_fn(target_project, str(output_dir), sink=sink)
+            # Lay the tree out as it would be below output_dir (Mastra nests
+            # its project one level down), so both modes score the same.
+            prefix = os.path.relpath(project_dir, output_dir).replace(os.sep, "/")
+            evaluated = {name if prefix == "." else f"{prefix}/{name}": data for name, data in sink.files.items()}
+        else:
+            gen_fn(target_project, str(output_dir))
+            evaluated = output_dir
     except Exception as exc:
         result["status"] = "generation_error"
         result["error"] = f"{type(exc).__name__}: {exc}"
@@ -129,12 +145,12 @@ def _translate_and_evaluate(
     # Step 3: evaluate the generated output
     try:
         kg_eval = extract_kg(kg_path)
-        code_eval = extract_code(output_dir, target_key)
+        code_eval = extract_code(evaluated, target_key)
 
         oec = calculate_oec(kg_eval, code_eval)
         wgi = calculate_wgi(kg_eval, code_eval)
-        syntax_ok = compile_project(output_dir, target_key)
-        run_res = dry_run_project(output_dir, target_key)
+        syntax_ok = compile_project(evaluated, target_key)
+        run_res = dry_run_project(evaluated, target_key)
 
         result["status"] = "ok"
         result["oec"] = oec
@@ -158,10 +174,12 @@ def _evaluate_pair(
     target_key: str,
     source_config: FrameworkConfig,
     interop_base: Path,
+    in_memory: bool = False,
 ) -> Dict[str, Any]:
     """Evaluate all KGs from source_key translated to target_key."""
     pair_output_base = interop_base / source_key / target_key
-    pair_output_base.mkdir(parents=True, exist_ok=True)
+    if not in_memory:
+        pair_output_base.mkdir(parents=True, exist_ok=True)
 
     kg_dir = source_config.kg_dir
     if not kg_dir.exists():
@@ -190,6 +208,7 @@ def _evaluate_pair(
             source_key=source_key,
             target_key=target_key,
             output_dir=output_dir,
+            in_memory=in_memory,
         )
         projects.append(result)
 
@@ -304,6 +323,7 @@ def main() -> None:
                 target_key=target_key,
                 source_config=configs[source_key],
                 interop_base=interop_base,
+                in_memory=args.in_memory,
             )
             pair_result["is_same_framework"] = is_same
             all_pairs.append(pair_result)
@@ -400,6 +420,11 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Remove previous interop output before running.",
     )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Generate into memory and score from there, without writing the projects.",
+    )
     return parser.parse_args()
 
 
@@ -5,17 +5,26 @@ from __future__ import annotations
 import sys
 import subprocess
 from pathlib import Path
+from typing import Mapping
 
+from ..utils import ProjectSource
 
-def compile_project(project_dir: Path, framework: str) -> bool:
+
+def compile_project(project_dir: ProjectSource, framework: str) -> bool:
     """Checks syntax compilation of the project based on the framework type.
     
-    Returns True if compilation is successful, False otherwise.
+    Returns True if compilation is successful, False otherwise. An in-memory
+    tree (path → bytes) is compiled in-process; it has no node_modules, so
+    TypeScript is not checked, as for a directory without them.
     """
     framework = framework.lower()
     if framework in {"crewai", "autogen"}:
+        if isinstance(project_dir, Mapping):
+            return _compile_python_sources(project_dir)
         return _compile_python_files(project_dir)
     elif framework in {"langgraph", "mastra"}:
+        if isinstance(project_dir, Mapping):
+            return True
         return _compile_typescript_files(project_dir)
     return True
 
@@ -39,6 +48,19 @@ def _compile_python_files(project_dir: Path) -> bool:
     return success
 
 
+def _compile_python_sources(files: Mapping[str, bytes]) -> bool:
+    """In-memory _compile_python_files: compile() is what py_compile runs on each file."""
+    success = True
+    for name, data in files.items():
+        if not name.endswith(".py") or "__pycache__" in name.split("/"):
+            continue
+        try:
+            compile(data, name, "exec", dont_inherit=True)
+        except (SyntaxError, ValueError):
+            success = False
+    return success
+
+
 def _compile_typescript_files(project_dir: Path) -> bool:
     """Runs tsc compiler on the project directory if node_modules exists, otherwise defaults to True."""
     node_modules_path = project_dir / "node_modules"
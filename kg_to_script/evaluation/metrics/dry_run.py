@@ -5,16 +5,28 @@ from __future__ import annotations
 import os
 import sys
 import subprocess
+import tempfile
 from pathlib import Path
+from typing import Mapping
 
+from ..utils import ProjectSource, write_project_tree
 
-def dry_run_project(project_dir: Path, framework: str) -> dict:
+
+def dry_run_project(project_dir: ProjectSource, framework: str) -> dict:
     """Executes a dry-run check on python project's main.py using a dummy API key.
     
+    An in-memory tree (path → bytes) has to be run from real files, so it
+    is written to a temporary directory first.
+
     Returns a dict with 'status' and 'output'.
     """
     framework = framework.lower()
-    if framework in {"crewai", "autogen"}:
+    if framework in {"crewai", "autogen"} and isinstance(project_dir, Mapping):
+        if "main.py" in project_dir:
+            with tempfile.TemporaryDirectory() as tmp:
+                write_project_tree(project_dir, Path(tmp))
+                return _dry_run_python_project(Path(tmp) / "main.py")
+    elif framework in {"crewai", "autogen"}:
         main_py = project_dir / "main.py"
         if main_py.exists():
             return _dry_run_python_project(main_py)
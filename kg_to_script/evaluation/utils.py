@@ -2,27 +2,22 @@
 
 from __future__ import annotations
 
-import re
-from pathlib import Path
-from typing import Iterable, Iterator, Set
+from pathlib import Path, PurePosixPath
+from typing import Iterable, Iterator, Mapping, Set, Tuple, Union
+
+from src.core.identifiers import normalize_name as _normalize_name, word_tokens
 
 
 TEXT_EXTENSIONS = {".py", ".ts", ".tsx", ".js", ".jsx", ".yaml", ".yml", ".json", ".md"}
 SKIP_PARTS = {"node_modules", "__pycache__", ".pytest_cache", ".agento-env", "dist", "build"}
 
+# A generated project: its directory, or an in-memory tree of "/"-separated
+# relative path → bytes (MemorySink.files, src/frameworks/emit.py).
+ProjectSource = Union[Path, Mapping[str, bytes]]
+
 
 def normalize_name(value: object) -> str:
-    text = str(value or "")
-    # camelCase boundary: aB → a_B
-    text = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", text)
-    # letter → digit boundary: stepA2 → stepA_2, task2 → task_2
-    text = re.sub(r"([a-zA-Z])(\d)", r"\1_\2", text)
-    # digit → letter boundary: 2step → 2_step
-    text = re.sub(r"(\d)([a-zA-Z])", r"\1_\2", text)
-    text = text.replace("-", "_").replace(" ", "_")
-    text = re.sub(r"[^a-zA-Z0-9_]+", "_", text)
-    text = re.sub(r"_+", "_", text).strip("_")
-    return text.lower()
+    return _normalize_name(str(value or ""))
 
 
 def local_name(iri: str) -> str:
@@ -33,22 +28,15 @@ def local_name(iri: str) -> str:
 
 def token_set(text: str) -> Set[str]:
     # Include colon-joined identifiers (e.g. "task:my-step-2") in addition to plain words
-    raw = re.findall(r"[a-zA-Z_][a-zA-Z0-9_:\-]*", text or "")
-    tokens = {normalize_name(token) for token in raw if token}
-    compact = normalize_name(text)
+    tokens = set(word_tokens(text or ""))
+    compact = _normalize_name(text or "")
     if compact:
         tokens.add(compact)
     return tokens
 
 
-def read_project_text(project_dir: Path) -> str:
-    parts = []
-    for path in iter_text_files(project_dir):
-        try:
-            parts.append(path.read_text(encoding="utf-8"))
-        except UnicodeDecodeError:
-            continue
-    return "\n\n".join(parts)
+def read_project_text(project_dir: ProjectSource) -> str:
+    return "\n\n".join(text for _, text in iter_project_texts(project_dir))
 
 
 def iter_text_files(project_dir: Path) -> Iterator[Path]:
@@ -63,6 +51,43 @@ def iter_text_files(project_dir: Path) -> Iterator[Path]:
             yield path
 
 
+def iter_project_texts(project_dir: ProjectSource) -> Iterator[Tuple[str, str]]:
+    """(path, text) of each UTF-8 text file, in iter_text_files order, from disk or an in-memory tree."""
+    if isinstance(project_dir, Mapping):
+        for name in sorted(project_dir, key=lambda name: PurePosixPath(name).parts):
+            path = PurePosixPath(name)
+            if any(part in SKIP_PARTS for part in path.parts) or path.suffix not in TEXT_EXTENSIONS:
+                continue
+            try:
+                yield name, decode_text(project_dir[name])
+            except UnicodeDecodeError:
+                continue
+        return
+    for path in iter_text_files(project_dir):
+        try:
+            yield str(path), path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            continue
+
+
+def decode_text(data: bytes, errors: str = "strict") -> str:
+    """*data* decoded as Path.read_text would: UTF-8 with universal newlines."""
+    text = data.decode("utf-8", errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def write_project_tree(files: Mapping[str, bytes], root: Path) -> None:
+    """Write an in-memory project tree below *root* (for checks that must run real files)."""
+    for name, data in files.items():
+        if PurePosixPath(name).is_absolute() or ".." in PurePosixPath(name).parts:
+            raise ValueError(f"{name!r} is not a relative project path")
+        path = root / PurePosixPath(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
 def aliases_for(*values: object) -> tuple[str, ...]:
     aliases = []
     seen = set()
@@ -72,9 +97,10 @@ def aliases_for(*values: object) -> tuple[str, ...]:
         text = str(value).strip()
         if not text:
             continue
-        candidates = {text, normalize_name(text), local_name(text), normalize_name(local_name(text))}
-        for candidate in candidates:
-            normalized = normalize_name(candidate)
+        local = local_name(text)
+        # normalize_name is idempotent, so the four candidates of the
+        # original set {text, norm(text), local, norm(local)} reduce to two.
+        for normalized in (_normalize_name(text), _normalize_name(local)):
             if normalized and normalized not in seen:
                 seen.add(normalized)
                 aliases.append(normalized)
@@ -0,0 +1,281 @@
+"""
+Multi-target build: extract each KG once, generate every requested framework.
+
+The per-framework runners (``src.frameworks.<target>.run``) each rescan their
+KG directory and re-extract every TTL. ``build`` extracts each KG once with
+the union of the targets' EXTRACTION_SCOPEs and hands that one IR to every
+target's ``adapt`` / ``generate_project``. Adapters never modify the IR they
+are given (see core/overlay.py), so the projects match what the runners
+generate.
+
+    from src.build import build
+    summary = build(kg_paths, targets=["crewai", "mastra"])
+
+Each target writes to its own output root, by default
+generated_projects/output_<target>/<KG name without _instances>. Projects
+the root's build manifest (frameworks/build_cache.py) records as up to date
+are skipped, and a KG that is up to date for every target is not extracted.
+
+Usage:
+    From kg_to_script/:
+        python -m src.cli build --targets crewai,autogen,langgraph,mastra
+        python -m src.cli build --targets mastra --output mastra=/tmp/ts path/to/file.ttl
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .core.extractor import extract_project
+from .core.scope import ExtractionScope
+from .frameworks.batch import BatchItem, BatchResult
+from .frameworks.build_cache import BuildPlan, plan_build
+
+# Target name → KG directory under script_to_kg/generated_kgs its runner reads.
+TARGETS: Dict[str, str] = {
+    "crewai": "CrewAI",
+    "autogen": "AutoGen",
+    "langgraph": "LangGraph",
+    "mastra": "Mastra AI",
+}
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+KG_ROOT = (PROJECT_ROOT / ".." / "script_to_kg" / "generated_kgs").resolve()
+OUTPUT_ROOT = PROJECT_ROOT / "generated_projects"
+
+
+@dataclass(frozen=True)
+class Target:
+    """A framework's adapt/generate pair and where its projects go."""
+
+    name: str
+    adapt: Callable
+    generate_project: Callable
+    scope: ExtractionScope
+    output_root: Path
+
+    def generate(self, project, dir_name: str) -> str:
+        """Adapt the shared IR and write <output_root>/<dir_name>; returns the project directory."""
+        adapted = self.adapt(project)
+        if self.name == "mastra":
+            # The Mastra generator appends project_var_name itself; name it
+            # after the KG file so projects do not overwrite each other.
+            adapted.project_var_name = dir_name
+            return self.generate_project(adapted, str(self.output_root))
+        return self.generate_project(adapted, str(self.output_root / dir_name))
+
+    def batch_item(self, kg_path: Union[str, Path]) -> BatchItem:
+        """*kg_path* as the BatchItem its runner would build (for the build manifest)."""
+        project_dir = str(self.output_root / project_dir_name(kg_path))
+        output_dir = str(self.output_root) if self.name == "mastra" else project_dir
+        return BatchItem(str(kg_path), output_dir, project_dir)
+
+
+@dataclass
+class KGResult:
+    """Outcome of one KG: the directory generated per target, or the error.
+
+    Targets whose project was already up to date are listed in up_to_date
+    and also have their directory in outputs.
+    """
+
+    kg_path: str
+    dir_name: str
+    outputs: Dict[str, str] = field(default_factory=dict)
+    up_to_date: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    extract_seconds: float = 0.0
+    generate_seconds: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class BuildSummary:
+    """Every KGResult of one build, in input order."""
+
+    targets: List[str]
+    results: List[KGResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def succeeded(self, target: str) -> int:
+        return sum(1 for result in self.results if target in result.outputs)
+
+    def up_to_date(self, target: str) -> int:
+        return sum(1 for result in self.results if target in result.up_to_date)
+
+    def failures(self) -> List[Tuple[str, str, str]]:
+        """(KG file name, target or "extract", message) for every error."""
+        return [
+            (Path(result.kg_path).name, target, message)
+            for result in self.results
+            for target, message in result.errors.items()
+        ]
+
+    @property
+    def ok(self) -> bool:
+        return not any(result.errors for result in self.results)
+
+
+def parse_targets(spec: Union[str, Iterable[str]]) -> List[str]:
+    """"crewai,mastra" or ["crewai", "mastra"] → validated, de-duplicated list ("all" = every target)."""
+    names = spec.split(",") if isinstance(spec, str) else list(spec)
+    names = [name.strip().lower() for name in names if name.strip()]
+    if "all" in names:
+        return list(TARGETS)
+    unknown = sorted(set(names) - set(TARGETS))
+    if unknown:
+        raise ValueError(f"Unknown build targets: {unknown} (choose from {', '.join(TARGETS)})")
+    if not names:
+        raise ValueError("No build targets given")
+    return list(dict.fromkeys(names))
+
+
+def load_target(name: str, output_root: Optional[Union[str, Path]] = None) -> Target:
+    """Import a target's adapter and generator; output_root defaults to generated_projects/output_<name>."""
+    adapter = importlib.import_module(f"src.frameworks.{name}.adapter")
+    generator = importlib.import_module(f"src.frameworks.{name}.generator")
+    root = Path(output_root) if output_root is not None else OUTPUT_ROOT / f"output_{name}"
+    return Target(name, adapter.adapt, generator.generate_project, adapter.EXTRACTION_SCOPE, root)
+
+
+def project_dir_name(kg_path: Union[str, Path]) -> str:
+    """Output directory name the runners use: the file stem without "_instances"."""
+    return Path(kg_path).stem.replace("_instances", "")
+
+
+def collect_kgs(sources: Sequence[Union[str, Path]] = (), targets: Sequence[str] = ()) -> List[Path]:
+    """TTL files from *sources* (files, or directories searched recursively).
+
+    With no sources, every KG under generated_kgs/ is built; with a single
+    target, only that target's own KG directory (what its runner reads).
+    """
+    if not sources:
+        if len(targets) == 1:
+            sources = [KG_ROOT / TARGETS[targets[0]]]
+        else:
+            sources = [KG_ROOT]
+    paths: List[Path] = []
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            paths.extend(sorted(source.rglob("*.ttl")))
+        elif source.is_file():
+            paths.append(source)
+        else:
+            raise FileNotFoundError(f"KG file or directory not found: {source}")
+    return list(dict.fromkeys(path.resolve() for path in paths))
+
+
+def build_one(kg_path: Union[str, Path], targets: Sequence[Target], up_to_date: Iterable[str] = ()) -> KGResult:
+    """Extract *kg_path* once and generate it for every target not in *up_to_date*."""
+    result = KGResult(kg_path=str(kg_path), dir_name=project_dir_name(kg_path))
+    skip = set(up_to_date)
+    for target in targets:
+        if target.name in skip:
+            result.up_to_date.append(target.name)
+            result.outputs[target.name] = str(target.output_root / result.dir_name)
+    targets = [target for target in targets if target.name not in skip]
+    if not targets:
+        return result
+
+    scope = targets[0].scope.union(*(target.scope for target in targets[1:]))
+    start = time.perf_counter()
+    try:
+        project = extract_project(str(kg_path), scope=scope)
+    except Exception as exc:
+        result.errors["extract"] = str(exc)
+        return result
+    finally:
+        result.extract_seconds = time.perf_counter() - start
+
+    for target in targets:
+        start = time.perf_counter()
+        try:
+            result.outputs[target.name] = target.generate(project, result.dir_name)
+        except Exception as exc:
+            result.errors[target.name] = str(exc)
+        result.generate_seconds[target.name] = time.perf_counter() - start
+    return result
+
+
+def build(
+    kg_paths: Iterable[Union[str, Path]],
+    targets: Union[str, Iterable[str]] = "all",
+    output_roots: Optional[Mapping[str, Union[str, Path]]] = None,
+    clean: bool = False,
+    incremental: bool = True,
+    progress: Optional[Callable[[KGResult], None]] = None,
+) -> BuildSummary:
+    """Build every KG in *kg_paths* for every target.
+
+    Args:
+        kg_paths:     TTL files, built in the given order.
+        targets:      Target names or a comma-separated string; "all" for every framework.
+        output_roots: Per-target output root overrides ({"mastra": "/tmp/ts"}).
+        clean:        Remove each output root first, as the runners do.
+        incremental:  Skip projects the output root's build manifest (frameworks/build_cache.py)
+                      records as up to date; a KG up to date for every target is not extracted.
+        progress:     Called with each KGResult as soon as it is done.
+    """
+    names = parse_targets(targets)
+    roots = dict(output_roots or {})
+    unknown = sorted(set(roots) - set(names))
+    if unknown:
+        raise ValueError(f"Output roots given for targets not being built: {unknown}")
+    loaded = [load_target(name, roots.get(name)) for name in names]
+    kg_paths = [str(path) for path in kg_paths]
+
+    for target in loaded:
+        if clean and target.output_root.exists():
+            shutil.rmtree(target.output_root)
+        os.makedirs(target.output_root, exist_ok=True)
+
+    # Never prune here: a build may cover only part of an output root.
+    plans: Dict[str, BuildPlan] = {}
+    fresh: Dict[str, set] = {}
+    if incremental:
+        for target in loaded:
+            plan = plan_build(target.name, target.output_root, [target.batch_item(path) for path in kg_paths], clean=False, force=False, prune=False)
+            plans[target.name] = plan
+            fresh[target.name] = {item.kg_path for item in plan.fresh}
+
+    summary = BuildSummary(targets=names)
+    start = time.perf_counter()
+    try:
+        for kg_path in kg_paths:
+            result = build_one(kg_path, loaded, [name for name in names if kg_path in fresh.get(name, ())])
+            for target in loaded:
+                if target.name in plans and target.name not in result.up_to_date:
+                    error = result.errors.get(target.name, result.errors.get("extract"))
+                    plans[target.name].record(BatchResult(target.batch_item(kg_path), error))
+            summary.results.append(result)
+            if progress is not None:
+                progress(result)
+    finally:
+        for plan in plans.values():
+            plan.save()
+    summary.seconds = time.perf_counter() - start
+    return summary
+
+
+def format_summary(summary: BuildSummary) -> str:
+    """The combined summary block printed by ``kg_to_script build``."""
+    total = len(summary.results)
+    extract_seconds = sum(result.extract_seconds for result in summary.results)
+    lines = ["=" * 65, f"  Done. {total} knowledge graphs in {summary.seconds:.1f}s (extract {extract_seconds:.1f}s)"]
+    for target in summary.targets:
+        seconds = sum(result.generate_seconds.get(target, 0.0) for result in summary.results)
+        lines.append(
+            f"  {target:<10} {summary.succeeded(target)}/{total} generated  ({seconds:.1f}s, {summary.up_to_date(target)} up to date)"
+        )
+    failures = summary.failures()
+    if failures:
+        lines.append(f"  Errors ({len(failures)}):")
+        lines.extend(f"    - {name} [{target}]: {message}" for name, target, message in failures)
+    lines.append("=" * 65)
+    return "\n".join(lines)
@@ -0,0 +1,96 @@
+"""
+``kg_to_script`` command line.
+
+Usage:
+    From kg_to_script/:
+        python -m src.cli build --targets crewai,autogen,langgraph,mastra
+        python -m src.cli build --targets langgraph path/to/file.ttl path/to/kg_dir
+        python -m src.cli build --targets all --output crewai=/tmp/crew --clean
+        python -m src.cli build --targets crewai --force    # ignore the build manifest
+
+    Installed:
+        kg_to_script build --targets crewai,mastra
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .build import KGResult, TARGETS, build, collect_kgs, format_summary, parse_targets
+
+
+def _output_roots(values: List[str]) -> Dict[str, Path]:
+    roots: Dict[str, Path] = {}
+    for value in values:
+        target, sep, path = value.partition("=")
+        if not sep or not path:
+            raise ValueError(f"--output expects TARGET=DIR, got {value!r}")
+        roots[target.strip().lower()] = Path(path).expanduser().resolve()
+    return roots
+
+
+def _print_progress(result: KGResult) -> None:
+    name = Path(result.kg_path).name
+    if "extract" in result.errors:
+        print(f"[ERROR] {name}: {result.errors['extract']}")
+        return
+    status = " ".join(
+        [f"{target}=up-to-date" for target in result.up_to_date]
+        + [f"{target}={'ERROR' if target in result.errors else 'ok'}" for target in result.generate_seconds]
+    )
+    print(f"[Built] {name}  {status}")
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="kg_to_script", description="Compile AgentO knowledge graphs into framework projects.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("build", help="Extract each KG once and generate every target framework.")
+    command.add_argument("kgs", nargs="*", type=Path, help="TTL files or directories (default: script_to_kg/generated_kgs).")
+    command.add_argument(
+        "--targets",
+        default="all",
+        help=f"Comma-separated targets: {','.join(TARGETS)} or all (default: all).",
+    )
+    command.add_argument(
+        "--output",
+        action="append",
+        default=[],
+        metavar="TARGET=DIR",
+        help="Output root for one target (repeatable; default: generated_projects/output_<target>).",
+    )
+    command.add_argument("--clean", action="store_true", help="Remove each target's output root before building.")
+    command.add_argument("--force", action="store_true", help="Regenerate every project, ignoring the build manifests.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    try:
+        targets = parse_targets(args.targets)
+        roots = _output_roots(args.output)
+        kg_paths = collect_kgs(args.kgs, targets)
+    except (ValueError, FileNotFoundError) as exc:
+        print(f"[ERROR] {exc}")
+        sys.exit(2)
+    if not kg_paths:
+        print("[WARNING] No .ttl files found")
+        return
+
+    print("=" * 65)
+    print("  KG → Pydantic IR → " + " / ".join(targets))
+    print(f"  Files  : {len(kg_paths)} knowledge graphs")
+    print("=" * 65)
+    try:
+        summary = build(kg_paths, targets, output_roots=roots, clean=args.clean, incremental=not args.force, progress=_print_progress)
+    except ValueError as exc:
+        print(f"[ERROR] {exc}")
+        sys.exit(2)
+    print(format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""On-disk pickle caches shared by the extraction pipeline.
+
+Three caches live under one root (``$KG_TO_SCRIPT_CACHE_DIR``, default
+``~/.cache/kg_to_script``), one sub-directory each:
+
+    graphs/       parsed rdflib Graphs              (graph_cache.py)
+    ir/           extracted AgenticProject IR       (ir_cache.py)
+    incremental/  per-file re-extraction state      (incremental.py)
+
+Entries are ``<sha256>.pickle`` files, keyed by content except for
+incremental/, which is keyed by file path. Pickle is used for
+all of them because it round-trips what the pipeline relies on: the graph store's
+insertion order (which decides IR list order) and object sharing inside the
+IR (e.g. an agent's ``language_model`` is the same object as the entry in
+``project.language_models``).
+
+Entries not used for ``max_age_days`` are dropped, and the least recently used
+ones go first when a cache grows past ``max_bytes``. Inspect and clear them
+from the command line:
+
+    python -m src.core.cache info
+    python -m src.core.cache list [--kind graphs|ir|incremental]
+    python -m src.core.cache evict [--kind ...] [--max-mb N] [--max-age-days N]
+    python -m src.core.cache clear [--kind ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "KG_TO_SCRIPT_CACHE_DIR"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 30.0
+
+CACHE_KINDS = ("graphs", "ir", "incremental")
+
+_SUFFIX = ".pickle"
+
+
+def default_cache_root() -> Path:
+    """Cache root from $KG_TO_SCRIPT_CACHE_DIR, else ~/.cache/kg_to_script."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    return Path.home() / ".cache" / "kg_to_script"
+
+
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    path: Path
+    size: int
+    last_used: float
+
+
+class DiskCache:
+    """Pickle store under ``<root>/<kind>/`` with age and LRU size eviction."""
+
+    kind = ""
+
+    def __init__(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        kind: Optional[str] = None,
+    ) -> None:
+        self.kind = kind or self.kind
+        self.root = (Path(root) if root is not None else default_cache_root()) / self.kind
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached object for *key*, or None on a miss or unreadable entry."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning("Dropping unreadable %s cache entry %s: %s", self.kind, path.name, exc)
+            path.unlink(missing_ok=True)
+            return None
+        # mtime doubles as "last used" for age and size eviction.
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store *value* under *key* atomically, then enforce the size/age limits."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def entries(self) -> List[CacheEntry]:
+        """All entries, least recently used first."""
+        if not self.root.is_dir():
+            return []
+        found = []
+        for path in self.root.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append(CacheEntry(path.stem, path, stat.st_size, stat.st_mtime))
+        found.sort(key=lambda entry: entry.last_used)
+        return found
+
+    def total_bytes(self) -> int:
+        return sum(entry.size for entry in self.entries())
+
+    def evict(
+        self,
+        max_bytes: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+    ) -> int:
+        """Drop entries older than the age limit, then LRU entries over the size limit.
+
+        Returns the number of entries removed.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_age_days = self.max_age_days if max_age_days is None else max_age_days
+        cutoff = time.time() - max_age_days * 86400
+
+        kept: List[CacheEntry] = []
+        removed = 0
+        for entry in self.entries():
+            if entry.last_used < cutoff:
+                entry.path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                kept.append(entry)
+
+        total = sum(entry.size for entry in kept)
+        for entry in kept:
+            if total <= max_bytes:
+                break
+            entry.path.unlink(missing_ok=True)
+            total -= entry.size
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry; returns how many were removed."""
+        entries = self.entries()
+        for entry in entries:
+            entry.path.unlink(missing_ok=True)
+        return len(entries)
+
+
+# ─────────────────────── CLI ───────────────────────
+
+def _format_bytes(size: float) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+    return ""
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or clear the pipeline's on-disk caches.")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=f"Cache root (default: ${CACHE_DIR_ENV} or ~/.cache/kg_to_script).",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (
+        ("info", "Show location, entry count and total size."),
+        ("list", "List entries, least recently used first."),
+        ("clear", "Remove every entry."),
+        ("evict", "Apply the size and age limits now."),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--kind", choices=["all", *CACHE_KINDS], default="all")
+        if name == "evict":
+            command.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024))
+            command.add_argument("--max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    kinds = CACHE_KINDS if args.kind == "all" else (args.kind,)
+
+    for kind in kinds:
+        cache = DiskCache(args.cache_dir, kind=kind)
+        if args.command == "info":
+            entries = cache.entries()
+            total = sum(entry.size for entry in entries)
+            print(f"{kind:<11} {cache.root}  {len(entries)} entries, {_format_bytes(total)}")
+        elif args.command == "list":
+            for entry in cache.entries():
+                used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.last_used))
+                print(f"{kind:<11} {entry.key}  {_format_bytes(entry.size):>10}  {used}")
+        elif args.command == "evict":
+            removed = cache.evict(int(args.max_mb * 1024 * 1024), args.max_age_days)
+            print(f"Evicted {removed} entries from {cache.root}")
+        elif args.command == "clear":
+            print(f"Removed {cache.clear()} entries from {cache.root}")
+
+
+if __name__ == "__main__":
+    main()
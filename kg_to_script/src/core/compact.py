@@ -0,0 +1,262 @@
+"""Compact, slot-based form of the AgenticProject IR for holding large corpora.
+
+A pydantic model instance carries a per-instance ``__dict__``, a fields-set
+``set`` and an empty list or dict for every unset collection field. Holding
+tens of thousands of extracted entities that way costs far more memory than
+the data itself. The records here mirror the models in models.py field for
+field, with these differences:
+
+  * Each record is a ``__slots__`` object with no ``__dict__``.
+  * Lists become tuples. Empty lists share the ``()`` singleton.
+  * ``Dict[str, str]`` bags become flat ``(key, value, key, value, ...)``
+    tuples, in insertion order.
+  * IRIs, var_names and config keys are interned with ``sys.intern``, so an
+    IRI repeated across ``*_iris`` lists, and across projects, is stored once.
+
+Record classes are generated from the pydantic models, so the two cannot
+drift apart. ``compact()`` converts a model (usually an AgenticProject) into
+its record. ``expand()`` converts a record back into an equal model. It skips
+validation, because records only ever hold values taken from validated
+models. Adapters accept either form through ``as_project()``.
+
+Usage:
+    results = extract_projects(paths, compact=True)   # CompactProject per file
+    project = expand(results[0].project)              # AgenticProject again
+"""
+
+from __future__ import annotations
+
+import sys
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .models import (
+    AgenticProject,
+    AgentModel,
+    CapabilityModel,
+    ConfigModel,
+    ConstraintModel,
+    EnvironmentModel,
+    GoalModel,
+    HumanAgentModel,
+    InputVariableModel,
+    LanguageModelModel,
+    MemoryModel,
+    ObjectiveModel,
+    ResourceModel,
+    TaskModel,
+    ToolConfigModel,
+    ToolModel,
+    WorkflowPatternModel,
+    WorkflowStepModel,
+)
+
+_intern = sys.intern
+_new = object.__new__
+_set = object.__setattr__
+
+# List fields of IRIs / identifiers whose names do not end in _iris / _var_names.
+_IDENTIFIER_LISTS = frozenset({"interacts_with", "produced_resources", "required_resources"})
+
+
+def _is_identifier(name: str) -> bool:
+    """True for fields holding IRIs or snake-case identifiers, the strings worth interning."""
+    return (
+        name == "iri"
+        or name.endswith(("_iri", "_iris", "var_name", "var_names"))
+        or name in _IDENTIFIER_LISTS
+    )
+
+
+class CompactRecord:
+    """Base of the generated slot records; ``model`` is the pydantic class mirrored."""
+
+    __slots__ = ()
+    model: Type[BaseModel]
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self.__slots__, values):
+            _set(self, name, value)
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{n}={getattr(self, n)!r}' for n in self.__slots__)})"
+
+
+def _construct(model: Type[BaseModel], values: Dict[str, Any]) -> BaseModel:
+    """Build a *model* instance from complete, already-valid field *values*, skipping validation.
+
+    Equivalent to ``model.model_construct(**values)`` when every field is
+    given, but it also skips model_construct's per-field default handling,
+    which dominates its cost.
+    """
+    instance = _new(model)
+    _set(instance, "__dict__", values)
+    _set(instance, "__pydantic_fields_set__", set(values))
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+    return instance
+
+
+# Per record class: ((field, to_record, to_model), ...). Converters take the
+# value and the per-call memo that keeps shared sub-models shared.
+_Converter = Callable[[Any, Dict[int, Any]], Any]
+_PLANS: Dict[type, Tuple[Tuple[str, _Converter, _Converter], ...]] = {}
+_RECORDS: Dict[Type[BaseModel], type] = {}
+
+
+def _identity(value: Any, memo: Dict[int, Any]) -> Any:
+    return value
+
+
+def _intern_str(value: str, memo: Dict[int, Any]) -> str:
+    return _intern(value) if value else value
+
+
+def _str_tuple(values: List[str], memo: Dict[int, Any]) -> Tuple[str, ...]:
+    return tuple(values) if values else ()
+
+
+def _interned_tuple(values: List[str], memo: Dict[int, Any]) -> Tuple[str, ...]:
+    return tuple(map(_intern, values)) if values else ()
+
+
+def _str_list(values: Tuple[str, ...], memo: Dict[int, Any]) -> List[str]:
+    return list(values)
+
+
+def _pairs(bag: Dict[str, str], memo: Dict[int, Any]) -> Tuple[str, ...]:
+    if not bag:
+        return ()
+    flat: List[str] = []
+    for key, value in bag.items():
+        flat.append(_intern(key))
+        flat.append(value)
+    return tuple(flat)
+
+
+def _bag(pairs: Tuple[str, ...], memo: Dict[int, Any]) -> Dict[str, str]:
+    return dict(zip(pairs[::2], pairs[1::2]))
+
+
+def _compact_all(models: List[BaseModel], memo: Dict[int, Any]) -> Tuple[CompactRecord, ...]:
+    return tuple([_compact(model, memo) for model in models]) if models else ()
+
+
+def _expand_all(records: Tuple[CompactRecord, ...], memo: Dict[int, Any]) -> List[BaseModel]:
+    return [_expand(record, memo) for record in records]
+
+
+def _compact_optional(model: Any, memo: Dict[int, Any]) -> Any:
+    return None if model is None else _compact(model, memo)
+
+
+def _expand_optional(record: Any, memo: Dict[int, Any]) -> Any:
+    return None if record is None else _expand(record, memo)
+
+
+def _converters(name: str, annotation: Any) -> Tuple[_Converter, _Converter]:
+    """(to_record, to_model) for one field, chosen from its annotation."""
+    origin, args = get_origin(annotation), get_args(annotation)
+    if annotation is str:
+        return (_intern_str if _is_identifier(name) else _identity), _identity
+    if origin is list and args[0] is str:
+        return (_interned_tuple if _is_identifier(name) else _str_tuple), _str_list
+    if origin is list and issubclass(args[0], BaseModel):
+        return _compact_all, _expand_all
+    if origin is dict:
+        return _pairs, _bag
+    if origin is Union and type(None) in args:
+        return _compact_optional, _expand_optional
+    if annotation in (int, bool) or (isinstance(annotation, type) and issubclass(annotation, Enum)):
+        return _identity, _identity
+    raise TypeError(f"No compact form for field {name!r}: {annotation!r}")
+
+
+def _record_class(model: Type[BaseModel], name: str) -> type:
+    fields = model.model_fields
+    record = type(name, (CompactRecord,), {
+        "__slots__": tuple(fields),
+        "__doc__": f"Slot record mirroring {model.__name__}.",
+        "__module__": __name__,
+        "model": model,
+    })
+    _PLANS[record] = tuple(
+        (field, *_converters(field, info.annotation)) for field, info in fields.items()
+    )
+    _RECORDS[model] = record
+    return record
+
+
+CompactConfig = _record_class(ConfigModel, "CompactConfig")
+CompactGoal = _record_class(GoalModel, "CompactGoal")
+CompactCapability = _record_class(CapabilityModel, "CompactCapability")
+CompactEnvironment = _record_class(EnvironmentModel, "CompactEnvironment")
+CompactObjective = _record_class(ObjectiveModel, "CompactObjective")
+CompactHumanAgent = _record_class(HumanAgentModel, "CompactHumanAgent")
+CompactResource = _record_class(ResourceModel, "CompactResource")
+CompactConstraint = _record_class(ConstraintModel, "CompactConstraint")
+CompactLanguageModel = _record_class(LanguageModelModel, "CompactLanguageModel")
+CompactToolConfig = _record_class(ToolConfigModel, "CompactToolConfig")
+CompactTool = _record_class(ToolModel, "CompactTool")
+CompactAgent = _record_class(AgentModel, "CompactAgent")
+CompactTask = _record_class(TaskModel, "CompactTask")
+CompactWorkflowStep = _record_class(WorkflowStepModel, "CompactWorkflowStep")
+CompactWorkflowPattern = _record_class(WorkflowPatternModel, "CompactWorkflowPattern")
+CompactMemory = _record_class(MemoryModel, "CompactMemory")
+CompactInputVariable = _record_class(InputVariableModel, "CompactInputVariable")
+CompactProject = _record_class(AgenticProject, "CompactProject")
+
+
+def compact(model: BaseModel) -> CompactRecord:
+    """Convert an IR model (usually an AgenticProject) into its slot record.
+
+    A sub-model reachable along several paths (an agent's language_model is
+    also in project.language_models) becomes one shared record.
+    """
+    return _compact(model, {})
+
+
+def expand(record: CompactRecord) -> BaseModel:
+    """Convert a slot record back into an equal IR model, without re-validation.
+
+    The result shares no mutable state with *record*; records shared inside
+    it expand to shared models, as in the model compact() was given.
+    """
+    return _expand(record, {})
+
+
+def _compact(model: BaseModel, memo: Dict[int, Any]) -> CompactRecord:
+    record = memo.get(id(model))
+    if record is None:
+        cls = _RECORDS[type(model)]
+        values = model.__dict__
+        record = memo[id(model)] = cls(*[
+            to_record(values[field], memo) for field, to_record, _ in _PLANS[cls]
+        ])
+    return record
+
+
+def _expand(record: CompactRecord, memo: Dict[int, Any]) -> BaseModel:
+    model = memo.get(id(record))
+    if model is None:
+        model = memo[id(record)] = _construct(record.model, {
+            field: to_model(getattr(record, field), memo) for field, _, to_model in _PLANS[type(record)]
+        })
+    return model
+
+
+def as_project(project: Union[AgenticProject, CompactRecord]) -> AgenticProject:
+    """Return *project* as an AgenticProject, expanding a CompactProject."""
+    return expand(project) if isinstance(project, CompactRecord) else project
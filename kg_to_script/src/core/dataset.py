@@ -0,0 +1,198 @@
+"""Merged multi-KG dataset mode: a single-pass corpus extraction API.
+
+All KGs are loaded into one ``KGDataset``, one named graph per file (named
+after the file's ``file://`` IRI), and every registered query is run once
+over the dataset with its WHERE clause wrapped in ``GRAPH ?kgGraph { ... }``.
+The rows are then split by ``?kgGraph`` and each file's share is fed to the
+unchanged extraction functions:
+
+    results = extract_dataset(sorted(kg_dir.glob("*.ttl")))
+    for result in results:
+        if result.ok:
+            adapt(result.project)
+
+Rows are identical, in content and order, to running the queries against
+each file's own graph, so dataset mode produces the same IR as
+extract_project().
+
+This is a convenience, not a speedup. rdflib evaluates the GRAPH body once
+per named graph, so only per-query setup is shared and the total cost is
+that of extracting each file with backend="sparql" (about 1.4-1.5 s for the
+46 parseable corpus KGs either way). For speed, extract the files with
+backend="index" (about 0.55 s for the same corpus).
+"""
+
+from __future__ import annotations
+
+import re
+import warnings
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from rdflib import Dataset, Graph, URIRef
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+from rdflib.query import ResultRow
+from rdflib.term import Identifier, Node
+
+from . import queries
+from .extractor import ExtractionResult, extract_project_from_graph
+from .helpers import load_graph
+from .prepared import QUERY_NAMES, query_name
+
+# Variable bound to the named graph of every row in a dataset query.
+GRAPH_VAR = "kgGraph"
+
+_SELECT_RE = re.compile(r"\bSELECT(\s+DISTINCT)?\b")
+_WHERE_RE = re.compile(r"\bWHERE\s*\{")
+
+_GRAPH_QUERIES: Dict[str, Query] = {}
+
+
+class KGDataset(Dataset):
+    """An rdflib Dataset holding one independently stored named graph per KG file.
+
+    Named graphs keep their own Memory store instead of sharing the dataset's
+    quad store. With a shared store, rdflib filters the common indexes by
+    context for every graph a GRAPH pattern visits, which is quadratic in
+    corpus size, and triples that occur in several files take the position
+    of their first insertion, which reorders rows. Separate stores keep each
+    graph's evaluation exactly as it is for the standalone file.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._named: Dict[Node, Graph] = {}
+
+    def add_graph(self, g: Graph) -> Graph:
+        if g.identifier in self._named:
+            raise ValueError(f"Duplicate named graph: {g.identifier}")
+        self._named[g.identifier] = g
+        return g
+
+    def graph(self, identifier=None, base=None) -> Graph:
+        if identifier in self._named:
+            return self._named[identifier]
+        return super().graph(identifier, base)
+
+    def get_context(self, identifier, quoted: bool = False, base=None) -> Graph:
+        if identifier in self._named:
+            return self._named[identifier]
+        return super().get_context(identifier, quoted=quoted, base=base)
+
+    def contexts(self, triple=None) -> Iterator[Graph]:
+        for g in self._named.values():
+            if triple is None or triple in g:
+                yield g
+
+    def __len__(self) -> int:
+        return sum(len(g) for g in self._named.values())
+
+
+def graph_iri(path: Union[str, Path]) -> URIRef:
+    """Named-graph IRI for a KG file: its absolute file:// URI."""
+    return URIRef(Path(path).resolve().as_uri())
+
+
+def load_dataset(paths: Iterable[Union[str, Path]]) -> KGDataset:
+    """Load every TTL file in *paths* into a KGDataset, one named graph each."""
+    dataset = KGDataset()
+    for path in paths:
+        dataset.add_graph(load_graph(str(path), identifier=graph_iri(path)))
+    return dataset
+
+
+def graph_query_text(text: str) -> str:
+    """Rewrite a SELECT query so it runs per named graph and projects ?kgGraph first."""
+    text = _SELECT_RE.sub(lambda m: f"SELECT{m.group(1) or ''} ?{GRAPH_VAR}", text, count=1)
+    match = _WHERE_RE.search(text)
+    if match is None:
+        raise ValueError("Query has no WHERE clause")
+
+    # Find the brace closing the WHERE group.
+    depth = 1
+    end = match.end()
+    while depth:
+        if text[end] == "{":
+            depth += 1
+        elif text[end] == "}":
+            depth -= 1
+        end += 1
+    end -= 1
+    return f"{text[:match.end()]} GRAPH ?{GRAPH_VAR} {{{text[match.end():end]}}} {text[end:]}"
+
+
+def get_graph_query(name: str) -> Query:
+    """Return the compiled GRAPH ?kgGraph form of the query constant *name*."""
+    query = _GRAPH_QUERIES.get(name)
+    if query is None:
+        if name not in QUERY_NAMES:
+            raise KeyError(f"Unknown query constant: {name}")
+        query = prepareQuery(graph_query_text(getattr(queries, name)))
+        _GRAPH_QUERIES[name] = query
+    return query
+
+
+class GraphRows:
+    """One named graph's share of the dataset query results.
+
+    Answers ``query()`` for the registered queries like the graph itself
+    would, so it can be passed to extract_project_from_graph().
+    """
+
+    def __init__(self, identifier: Identifier) -> None:
+        self.identifier = identifier
+        self._rows: Dict[str, List[ResultRow]] = {}
+
+    def query(self, query: Union[str, Query]) -> List[ResultRow]:
+        return self._rows.get(query_name(query), [])
+
+
+def query_dataset(dataset: KGDataset) -> Dict[Identifier, GraphRows]:
+    """Run every registered query once over *dataset* and split the rows by named graph."""
+    split: Dict[Identifier, GraphRows] = {g.identifier: GraphRows(g.identifier) for g in dataset.contexts()}
+    with warnings.catch_warnings():
+        # rdflib's GRAPH evaluation touches Dataset.default_context, which
+        # warns once per named graph visited.
+        warnings.simplefilter("ignore", DeprecationWarning)
+        for name in QUERY_NAMES:
+            query = get_graph_query(name)
+            variables = query.algebra.PV
+            labels = variables[1:]
+            for row in dataset.query(query):
+                rows = split[row[0]]._rows.setdefault(name, [])
+                rows.append(ResultRow(dict(zip(variables, row)), labels))
+    return split
+
+
+def extract_dataset(paths: Iterable[Union[str, Path]]) -> List[ExtractionResult]:
+    """Extract every KG in *paths* through one merged dataset; one result per path, in input order.
+
+    Takes as long as per-file extract_project() calls (see the module docstring).
+
+    Files that fail to load or extract get an ExtractionResult with *error*
+    set; the rest of the batch is unaffected.
+    """
+    paths = [str(path) for path in paths]
+    results: List[Optional[ExtractionResult]] = [None] * len(paths)
+    dataset = KGDataset()
+    indexes: Dict[Identifier, int] = {}
+
+    for index, path in enumerate(paths):
+        try:
+            g = dataset.add_graph(load_graph(path, identifier=graph_iri(path)))
+        except Exception as exc:
+            results[index] = ExtractionResult.failed(index, path, exc)
+            continue
+        indexes[g.identifier] = index
+
+    for identifier, rows in query_dataset(dataset).items():
+        index = indexes[identifier]
+        path = paths[index]
+        try:
+            project = extract_project_from_graph(rows)
+        except Exception as exc:
+            results[index] = ExtractionResult.failed(index, path, exc)
+        else:
+            results[index] = ExtractionResult(index, path, project=project)
+    return results
@@ -0,0 +1,308 @@
+"""Extraction straight from a SPARQL endpoint.
+
+Running the ~54 extraction queries against a remote endpoint would cost one
+round trip each. Instead, one CONSTRUCT request pulls everything connected
+to a team (see TEAM_SUBGRAPH_TEMPLATE), partition_by_team() trims that down
+to the team's own partition, and the usual extractors run on it locally:
+
+    with SPARQLEndpoint(PUBLIC_ENDPOINT) as endpoint:
+        for team in list_teams(endpoint):
+            project = extract_project_from_endpoint(endpoint, team)
+
+``SPARQLEndpoint`` keeps a small pool of persistent HTTP connections per host,
+so extracting many teams reuses sockets instead of reconnecting per request.
+``LocalSPARQLServer`` serves an rdflib graph over the SPARQL protocol
+in-process, as a stand-in endpoint for tests and offline runs.
+
+The IR has the same content as a local extraction, but list order follows
+the endpoint's response rather than the source file.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urljoin, urlsplit
+
+from rdflib import Graph, URIRef
+
+from .extractor import extract_project_from_graph
+from .models import AgenticProject
+from .partition import partition_by_team
+from .queries import PREFIXES
+
+PUBLIC_ENDPOINT = "https://w3id.org/agentic-ai/sparql"
+
+# One request per team: every triple whose subject is connected to the team
+# along links in either direction (rdf:type links are not followed). A
+# property path cannot stop at other :Team nodes or count how many teams
+# reach a member, so this is a superset of the team's partition: teams that
+# share an individual (a language model, a literal value) come back
+# together. It is a union of whole connected components, so
+# partition_by_team() on it gives the team exactly its local partition.
+TEAM_SUBGRAPH_TEMPLATE = PREFIXES + """
+CONSTRUCT { ?s ?p ?o }
+WHERE {
+    <%(team)s> (!rdf:type|^(!rdf:type))* ?s .
+    ?s ?p ?o .
+}
+"""
+
+TEAM_LIST_QUERY_TEXT = PREFIXES + """
+SELECT DISTINCT ?team
+WHERE { ?team a :Team . }
+ORDER BY ?team
+"""
+
+_RDF_ACCEPT = "text/turtle, application/n-triples;q=0.9, application/rdf+xml;q=0.8"
+_JSON_ACCEPT = "application/sparql-results+json"
+_MAX_REDIRECTS = 5
+
+
+class EndpointError(RuntimeError):
+    """The endpoint answered with a non-success status."""
+
+
+class SPARQLEndpoint:
+    """Client for a SPARQL protocol endpoint with pooled keep-alive connections.
+
+    At most *max_idle* idle connections are kept per host; requests beyond
+    that open (and later drop) extra connections rather than block.
+    """
+
+    def __init__(self, url: str, timeout: float = 30.0, max_idle: int = 4) -> None:
+        self.url = url
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SPARQLEndpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    # ── Queries ──
+
+    def construct(self, query: str) -> Graph:
+        """Run a CONSTRUCT/DESCRIBE query and parse the returned RDF."""
+        body, content_type = self._request(query, _RDF_ACCEPT)
+        g = Graph()
+        g.parse(data=body.decode("utf-8"), format=content_type or "text/turtle")
+        return g
+
+    def select(self, query: str) -> List[Dict[str, str]]:
+        """Run a SELECT query; returns one {variable: value} dict per row."""
+        body, _ = self._request(query, _JSON_ACCEPT)
+        results = json.loads(body)["results"]["bindings"]
+        return [{name: term["value"] for name, term in row.items()} for row in results]
+
+    # ── HTTP ──
+
+    def _request(self, query: str, accept: str) -> Tuple[bytes, str]:
+        url = self.url
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            separator = "&" if "?" in path else "?"
+            target = f"{path}{separator}{urlencode({'query': query})}"
+
+            status, headers, body = self._send(parts.scheme, parts.netloc, target, accept)
+            if status in (301, 302, 303, 307, 308) and headers.get("location"):
+                url = urljoin(url, headers["location"])
+                continue
+            if status != 200:
+                raise EndpointError(f"SPARQL endpoint {url} returned HTTP {status}: {body[:200]!r}")
+            content_type = headers.get("content-type", "").split(";")[0].strip()
+            return body, content_type
+        raise EndpointError(f"Too many redirects from {self.url}")
+
+    def _send(
+        self, scheme: str, netloc: str, target: str, accept: str
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        headers = {"Accept": accept, "Connection": "keep-alive"}
+        conn, reused = self._acquire(scheme, netloc)
+        try:
+            try:
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle pooled connection; retry once on a fresh one.
+                conn = self._connect(scheme, netloc)
+                conn.request("GET", target, headers=headers)
+                response = conn.getresponse()
+            body = response.read()
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(scheme, netloc, conn)
+        return response.status, response_headers, body
+
+    def _acquire(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+        return self._connect(scheme, netloc), False
+
+    def _release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        if scheme == "http":
+            return http.client.HTTPConnection(netloc, timeout=self.timeout)
+        raise ValueError(f"Unsupported endpoint scheme: {scheme!r}")
+
+
+@contextmanager
+def _endpoint(endpoint: Union[str, SPARQLEndpoint]) -> Iterator[SPARQLEndpoint]:
+    """Use *endpoint* as is, or a client for the URL that is closed afterwards."""
+    if isinstance(endpoint, SPARQLEndpoint):
+        yield endpoint
+        return
+    with SPARQLEndpoint(endpoint) as client:
+        yield client
+
+
+def list_teams(endpoint: Union[str, SPARQLEndpoint]) -> List[str]:
+    """IRIs of every :Team individual the endpoint knows about (one request)."""
+    with _endpoint(endpoint) as client:
+        return [row["team"] for row in client.select(TEAM_LIST_QUERY_TEXT)]
+
+
+def fetch_team_graph(endpoint: Union[str, SPARQLEndpoint], team_iri: str) -> Graph:
+    """Fetch *team_iri*'s partition (see partition_by_team()) with a single CONSTRUCT request."""
+    team = URIRef(team_iri)
+    with _endpoint(endpoint) as client:
+        graph = client.construct(TEAM_SUBGRAPH_TEMPLATE % {"team": team})
+    # The response is a superset (see TEAM_SUBGRAPH_TEMPLATE); keep the team's own partition.
+    part = Graph()
+    partition = partition_by_team(graph).get(team)
+    if partition is not None:
+        for triple in partition.triples():
+            part.add(triple)
+    return part
+
+
+def extract_project_from_endpoint(
+    endpoint: Union[str, SPARQLEndpoint],
+    team_iri: str,
+    backend: str = "sparql",
+) -> AgenticProject:
+    """Fetch one team's subgraph from *endpoint* and extract it locally. See extract_project()."""
+    return extract_project_from_graph(fetch_team_graph(endpoint, team_iri), backend=backend)
+
+
+# ─────────────────────── Local stand-in endpoint ───────────────────────
+
+class LocalSPARQLServer:
+    """Serve an rdflib graph over the SPARQL protocol (GET/POST) on localhost.
+
+    Runs in a background thread; use as a context manager. *requests* and
+    *connections* count what clients did, so tests can check round trips
+    and connection reuse.
+    """
+
+    def __init__(self, graph: Graph, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.graph = graph
+        self.requests = 0
+        self.connections = 0
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/sparql"
+
+    def start(self) -> "LocalSPARQLServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalSPARQLServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def answer(self, query: str) -> Tuple[bytes, str]:
+        """Evaluate *query* against the graph; returns (body, content type)."""
+        result = self.graph.query(query)
+        if result.type in ("CONSTRUCT", "DESCRIBE"):
+            return result.graph.serialize(format="turtle").encode("utf-8"), "text/turtle"
+        return result.serialize(format="json"), _JSON_ACCEPT
+
+
+def _make_handler(server: LocalSPARQLServer) -> type:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so clients can pool
+
+        def setup(self) -> None:
+            super().setup()
+            server.connections += 1
+
+        def do_GET(self) -> None:
+            self._answer(parse_qs(urlsplit(self.path).query).get("query", [""])[0])
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            data = self.rfile.read(length).decode("utf-8")
+            if self.headers.get("Content-Type", "").startswith("application/sparql-query"):
+                self._answer(data)
+            else:
+                self._answer(parse_qs(data).get("query", [""])[0])
+
+        def _answer(self, query: str) -> None:
+            server.requests += 1
+            try:
+                body, content_type = server.answer(query)
+                status = 200
+            except Exception as exc:
+                body, content_type, status = str(exc).encode("utf-8"), "text/plain", 400
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
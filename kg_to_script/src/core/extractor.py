@@ -2,10 +2,15 @@
 
 This module is the single entry point for KG extraction. It:
   1. Loads a Turtle graph via rdflib.
-  2. Runs SPARQL queries (defined in queries.py) against the graph.
+  2. Runs SPARQL queries (defined in queries.py, compiled once per process
+     by prepared.py) against the graph, or answers the same queries from
+     in-memory triple indexes (index.py) when backend="index".
   3. Maps results into canonical IR models (defined in models.py).
   4. Returns a fully populated AgenticProject.
 
+extract_projects() / iter_extract_projects() run the same pipeline for many
+files over a process pool.
+
 Nothing here is framework-specific. All framework conveniences belong in
 the respective adapter layer (crewai/adapter.py, autogen/adapter.py, etc.).
 """
@@ -13,12 +18,20 @@ the respective adapter layer (crewai/adapter.py, autogen/adapter.py, etc.).
 from __future__ import annotations
 
 import logging
+import os
 import re
-from typing import Dict, List, Optional, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from rdflib import Graph
 
+from .compact import CompactProject, compact as compact_project
+from .graph import Digraph, has_cycle
 from .helpers import camel, extract_placeholders, load_graph, s, safe_var
+from .identifiers import is_snake_identifier
+from .index import TripleIndex
+from .ir_cache import IRCache, resolve_ir_cache
 from .models import (
     AgenticProject,
     AgentModel,
@@ -40,7 +53,7 @@ from .models import (
     WorkflowStepModel,
     WorkflowType,
 )
-from .queries import (
+from .prepared import (
     AGENT_ALL_CONFIGS_QUERY,
     AGENT_CAPABILITY_QUERY,
     AGENT_INTERACTS_QUERY,
@@ -96,6 +109,17 @@ from .queries import (
     WORKFLOW_STEPS_QUERY,
     WORKFLOW_SUB_PATTERN_QUERY,
 )
+from .profiler import (
+    ExtractionProfile,
+    emit_profile,
+    profile_graph,
+    profiling,
+    resolve_profile,
+    stage,
+    timed,
+)
+from .scope import FULL_SCOPE, ExtractionScope
+from .store import GRAPH_STORES
 
 logger = logging.getLogger(__name__)
 
@@ -104,34 +128,51 @@ ORCHESTRATION_CONFIG_KEY = "process"
 ORCHESTRATION_SEQUENTIAL = "sequential"
 ORCHESTRATION_HIERARCHICAL = "hierarchical"
 
+# Query backends accepted by extract_project(). "sparql" evaluates every query
+# with rdflib; "index" answers them from TripleIndex lookups.
+EXTRACTION_BACKENDS = ("sparql", "index")
+
+# List length from which _Attacher dedups through a set instead of a scan.
+_ATTACH_SET_MIN = 16
+
 
 # ─────────────────────── Internal helpers ───────────────────────
-def _has_cycle(steps: List[WorkflowStepModel], edges: List[Tuple[str, str]]) -> bool:
-    """Return True if the directed step graph contains any cycle (DFS)."""
-    adjacency: Dict[str, List[str]] = {}
-    for src, tgt in edges:
-        adjacency.setdefault(src, []).append(tgt)
-
-    visited: Set[str] = set()
-    rec_stack: Set[str] = set()
-
-    def dfs(node: str) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
-        for neighbour in adjacency.get(node, []):
-            if neighbour not in visited:
-                if dfs(neighbour):
-                    return True
-            elif neighbour in rec_stack:
-                return True
-        rec_stack.discard(node)
-        return False
-
-    return any(dfs(step.iri) for step in steps if step.iri and step.iri not in visited)
+class _Attacher:
+    """Appends to IR list fields, skipping duplicates, in first-seen order.
+
+    Replaces ``if value not in owner.field: owner.field.append(value)``, whose
+    membership test scans the list and makes relation passes quadratic for
+    teams with thousands of members. Short lists are still scanned (cheaper
+    than hashing); once a list reaches _ATTACH_SET_MIN items it gets a
+    seen-set, seeded from its current contents, so values attached earlier
+    (by another query or pass) still count as duplicates. Use one instance
+    per pass.
+    """
+
+    __slots__ = ("_seen", "_lists")
+
+    def __init__(self) -> None:
+        self._seen: Dict[int, Set[Any]] = {}
+        # Holding the lists keeps their ids from being reused by new lists.
+        self._lists: List[List[Any]] = []
+
+    def __call__(self, values: List[Any], value: Any) -> None:
+        if len(values) < _ATTACH_SET_MIN:
+            if value not in values:
+                values.append(value)
+            return
+        seen = self._seen.get(id(values))
+        if seen is None:
+            seen = self._seen[id(values)] = set(values)
+            self._lists.append(values)
+        if value not in seen:
+            seen.add(value)
+            values.append(value)
 
 
 # ─────────────────────── Extraction functions ───────────────────────
 
+@timed
 def _extract_team(g: Graph, system_configs: Dict[str, str]) -> Tuple[str, str, str, str]:
     """Extract team/project name, description, orchestration-mode keyword, and team IRI.
 
@@ -164,6 +205,7 @@ def _extract_team(g: Graph, system_configs: Dict[str, str]) -> Tuple[str, str, s
     return project_name, description, orchestration_mode, team_iri
 
 
+@timed
 def _extract_language_models(g: Graph) -> Dict[str, LanguageModelModel]:
     """Extract :LanguageModel individuals keyed by IRI.
 
@@ -186,6 +228,7 @@ def _extract_language_models(g: Graph) -> Dict[str, LanguageModelModel]:
     return models
 
 
+@timed
 def _extract_tools(g: Graph) -> Dict[str, ToolModel]:
     """Extract standalone :Tool individuals (excluding :LLMAgent subclasses)."""
     tools: Dict[str, ToolModel] = {}
@@ -218,6 +261,7 @@ def _extract_tools(g: Graph) -> Dict[str, ToolModel]:
     return tools
 
 
+@timed
 def _extract_agents(
     g: Graph,
     tools_map: Dict[str, ToolModel],
@@ -242,7 +286,7 @@ def _extract_agents(
         role = s(row.role)
 
         var_name = agent_id or label or safe_var(iri)
-        var_name = safe_var(var_name) if not re.match(r'^[a-z_][a-z0-9_]*$', var_name) else var_name
+        var_name = safe_var(var_name) if not is_snake_identifier(var_name) else var_name
 
         prompt_context = s(row.backstory)
 
@@ -267,13 +311,14 @@ def _extract_agents(
         if iri in agents:
             agents[iri].configs[s(row.key)] = s(row.value)
 
+    attach = _Attacher()
+
     # Agent → Tool links
     for row in g.query(AGENT_TOOLS_QUERY):
         iri = s(row.agent)
         tool_iri = s(row.tool)
         if iri in agents and tool_iri in tools_map:
-            if tool_iri not in agents[iri].tool_iris:
-                agents[iri].tool_iris.append(tool_iri)
+            attach(agents[iri].tool_iris, tool_iri)
 
     # Agent → LanguageModel
     for row in g.query(AGENT_LLM_QUERY):
@@ -286,8 +331,8 @@ def _extract_agents(
     for row in g.query(AGENT_KNOWLEDGE_QUERY):
         iri = s(row.agent)
         knowledge_iri = s(row.knowledge)
-        if iri in agents and knowledge_iri not in agents[iri].knowledge_iris:
-            agents[iri].knowledge_iris.append(knowledge_iri)
+        if iri in agents:
+            attach(agents[iri].knowledge_iris, knowledge_iri)
 
     # Apply defaults for required fields that may be absent in the KG
     for agent in agents.values():
@@ -297,6 +342,7 @@ def _extract_agents(
     return agents
 
 
+@timed
 def _extract_tasks(g: Graph, agents_map: Dict[str, AgentModel]) -> Dict[str, TaskModel]:
     """Extract :Task individuals with full property resolution."""
     tasks: Dict[str, TaskModel] = {}
@@ -313,7 +359,7 @@ def _extract_tasks(g: Graph, agents_map: Dict[str, AgentModel]) -> Dict[str, Tas
         agent_iri = s(row.agent)
 
         var_name = label or safe_var(iri)
-        var_name = safe_var(var_name) if not re.match(r'^[a-z_][a-z0-9_]*$', var_name) else var_name
+        var_name = safe_var(var_name) if not is_snake_identifier(var_name) else var_name
 
         tasks[iri] = TaskModel(
             iri=iri,
@@ -367,19 +413,20 @@ def _extract_tasks(g: Graph, agents_map: Dict[str, AgentModel]) -> Dict[str, Tas
     return tasks
 
 
+@timed
 def _resolve_task_context(g: Graph, tasks_map: Dict[str, TaskModel]) -> None:
     """Resolve task dependency chains via producedResource / requiresResource.
 
     If Task B requiresResource R, and Task A producedResource R,
     then Task B's context_task_var_names includes Task A's var_name.
     """
+    attach = _Attacher()
     resource_to_producer: Dict[str, str] = {}
     for row in g.query(TASK_PRODUCES_QUERY):
         task_iri = s(row.task)
         res_iri = s(row.resource)
         if task_iri in tasks_map:
-            if res_iri not in tasks_map[task_iri].produced_resources:
-                tasks_map[task_iri].produced_resources.append(res_iri)
+            attach(tasks_map[task_iri].produced_resources, res_iri)
             resource_to_producer[res_iri] = tasks_map[task_iri].var_name
 
     for row in g.query(TASK_REQUIRES_QUERY):
@@ -387,27 +434,24 @@ def _resolve_task_context(g: Graph, tasks_map: Dict[str, TaskModel]) -> None:
         res_iri = s(row.resource)
         if task_iri in tasks_map:
             task = tasks_map[task_iri]
-            if res_iri not in task.required_resources:
-                task.required_resources.append(res_iri)
+            attach(task.required_resources, res_iri)
             if res_iri in resource_to_producer:
                 producer_var = resource_to_producer[res_iri]
-                if producer_var != task.var_name and producer_var not in task.context_task_var_names:
-                    task.context_task_var_names.append(producer_var)
+                if producer_var != task.var_name:
+                    attach(task.context_task_var_names, producer_var)
 
 
+@timed
 def _extract_workflow(g: Graph, tasks_map: Dict[str, TaskModel]) -> List[WorkflowStepModel]:
     """Extract :WorkflowStep individuals in step order."""
     steps: List[WorkflowStepModel] = []
     task_iri_to_var: Dict[str, str] = {t.iri: t.var_name for t in tasks_map.values()}
     task_iri_to_agent: Dict[str, str] = {t.iri: t.agent_iri for t in tasks_map.values()}
 
+    attach = _Attacher()
     edge_map: Dict[str, List[str]] = {}
     for row in g.query(STEP_EDGES_QUERY):
-        source = s(row.source)
-        target = s(row.target)
-        edge_map.setdefault(source, [])
-        if target not in edge_map[source]:
-            edge_map[source].append(target)
+        attach(edge_map.setdefault(s(row.source), []), s(row.target))
 
     for row in g.query(WORKFLOW_QUERY):
         step_iri = s(row.step)
@@ -434,7 +478,8 @@ def _extract_workflow(g: Graph, tasks_map: Dict[str, TaskModel]) -> List[Workflo
 def _infer_workflow_type(orchestration_mode: str, steps: List[WorkflowStepModel]) -> WorkflowType:
     """Infer a framework-agnostic workflow topology from step edge structure.
 
-    Uses DFS-based cycle detection for accurate LOOP classification.
+    Cycle detection (graph.has_cycle) is iterative, so step chains of any
+    length classify without hitting the recursion limit.
     """
     if orchestration_mode == "hierarchical":
         return WorkflowType.HIERARCHICAL
@@ -443,7 +488,7 @@ def _infer_workflow_type(orchestration_mode: str, steps: List[WorkflowStepModel]
 
     edges = [(step.iri, target) for step in steps for target in step.next_step_iris]
 
-    if _has_cycle(steps, edges):
+    if has_cycle(Digraph(edges=edges)):
         return WorkflowType.LOOP
     if any(len(step.next_step_iris) > 1 for step in steps):
         return WorkflowType.BRANCHING
@@ -452,6 +497,7 @@ def _infer_workflow_type(orchestration_mode: str, steps: List[WorkflowStepModel]
     return WorkflowType.SEQUENTIAL
 
 
+@timed
 def _extract_memories(g: Graph) -> Dict[str, MemoryModel]:
     """Extract :Memory individuals and raw configs."""
     memories: Dict[str, MemoryModel] = {}
@@ -473,6 +519,7 @@ def _extract_memories(g: Graph) -> Dict[str, MemoryModel]:
     return memories
 
 
+@timed
 def _extract_workflow_patterns(
     g: Graph,
     steps: List[WorkflowStepModel],
@@ -501,11 +548,11 @@ def _extract_workflow_patterns(
         if wp_iri in patterns and step_iri in step_by_iri:
             patterns[wp_iri].steps.append(step_by_iri[step_iri])
 
+    attach = _Attacher()
     for row in g.query(WORKFLOW_SUB_PATTERN_QUERY):
         wp_iri = s(row.wp)
-        sub_iri = s(row.sub)
-        if wp_iri in patterns and sub_iri not in patterns[wp_iri].sub_pattern_iris:
-            patterns[wp_iri].sub_pattern_iris.append(sub_iri)
+        if wp_iri in patterns:
+            attach(patterns[wp_iri].sub_pattern_iris, s(row.sub))
 
     # Fallback: if no pattern exists but steps do, create a synthetic default
     if not patterns and steps:
@@ -522,6 +569,7 @@ def _extract_workflow_patterns(
     return list(patterns.values())
 
 
+@timed
 def _extract_system_configs(g: Graph) -> Dict[str, str]:
     """Extract :Team-level system configs as raw key/value strings."""
     configs: Dict[str, str] = {}
@@ -530,6 +578,7 @@ def _extract_system_configs(g: Graph) -> Dict[str, str]:
     return configs
 
 
+@timed
 def _extract_input_variables(
     g: Graph,
     tasks_map: Dict[str, TaskModel],
@@ -615,6 +664,7 @@ def _extract_input_variables(
     ]
 
 
+@timed
 def _extract_env_vars(g: Graph) -> List[ConfigModel]:
     """Extract environment variable configs (API keys, etc.)."""
     env_vars: List[ConfigModel] = []
@@ -627,6 +677,7 @@ def _extract_env_vars(g: Graph) -> List[ConfigModel]:
     return env_vars
 
 
+@timed
 def _extract_goals(g: Graph) -> Dict[str, GoalModel]:
     """Extract all :Goal individuals keyed by IRI."""
     goals: Dict[str, GoalModel] = {}
@@ -642,6 +693,7 @@ def _extract_goals(g: Graph) -> Dict[str, GoalModel]:
     return goals
 
 
+@timed
 def _extract_capabilities(g: Graph) -> Dict[str, CapabilityModel]:
     """Extract all :Capability individuals keyed by IRI."""
     caps: Dict[str, CapabilityModel] = {}
@@ -657,6 +709,7 @@ def _extract_capabilities(g: Graph) -> Dict[str, CapabilityModel]:
     return caps
 
 
+@timed
 def _extract_environments(g: Graph) -> Dict[str, EnvironmentModel]:
     """Extract all :Environment individuals keyed by IRI."""
     envs: Dict[str, EnvironmentModel] = {}
@@ -676,15 +729,16 @@ def _extract_environments(g: Graph) -> Dict[str, EnvironmentModel]:
         if iri in envs:
             envs[iri].configs[s(row.key)] = s(row.value)
 
+    attach = _Attacher()
     for row in g.query(ENVIRONMENT_CONTAINS_QUERY):
         iri = s(row.env)
-        res_iri = s(row.resource)
-        if iri in envs and res_iri not in envs[iri].contained_resource_iris:
-            envs[iri].contained_resource_iris.append(res_iri)
+        if iri in envs:
+            attach(envs[iri].contained_resource_iris, s(row.resource))
 
     return envs
 
 
+@timed
 def _extract_objectives(g: Graph) -> Dict[str, ObjectiveModel]:
     """Extract all :Objective individuals keyed by IRI."""
     objs: Dict[str, ObjectiveModel] = {}
@@ -701,6 +755,7 @@ def _extract_objectives(g: Graph) -> Dict[str, ObjectiveModel]:
     return objs
 
 
+@timed
 def _extract_human_agents(g: Graph) -> Dict[str, HumanAgentModel]:
     """Extract all :HumanAgent individuals keyed by IRI."""
     humans: Dict[str, HumanAgentModel] = {}
@@ -713,15 +768,16 @@ def _extract_human_agents(g: Graph) -> Dict[str, HumanAgentModel]:
                 role=s(row.role),
             )
 
+    attach = _Attacher()
     for row in g.query(HUMAN_PARTICIPATED_QUERY):
         iri = s(row.human)
-        task_iri = s(row.task)
-        if iri in humans and task_iri not in humans[iri].participated_task_iris:
-            humans[iri].participated_task_iris.append(task_iri)
+        if iri in humans:
+            attach(humans[iri].participated_task_iris, s(row.task))
 
     return humans
 
 
+@timed
 def _extract_resources(g: Graph) -> Dict[str, ResourceModel]:
     """Extract all beam:Resource (and beam:Instance) individuals keyed by IRI."""
     resources: Dict[str, ResourceModel] = {}
@@ -739,6 +795,7 @@ def _extract_resources(g: Graph) -> Dict[str, ResourceModel]:
     return resources
 
 
+@timed
 def _extract_constraints(g: Graph) -> Dict[str, ConstraintModel]:
     """Extract all :Constraint individuals keyed by IRI."""
     constraints: Dict[str, ConstraintModel] = {}
@@ -762,6 +819,7 @@ def _extract_constraints(g: Graph) -> Dict[str, ConstraintModel]:
 
 # ── Cross-ontology linking ──
 
+@timed
 def _link_agent_relations(
     g: Graph,
     agents_map: Dict[str, AgentModel],
@@ -769,11 +827,11 @@ def _link_agent_relations(
     capabilities_map: Dict[str, CapabilityModel],
 ) -> None:
     """Populate agent → relationship fields (interactsWith, operatesIn, capabilities, objectives)."""
+    attach = _Attacher()
     for row in g.query(AGENT_INTERACTS_QUERY):
         iri = s(row.agent)
-        target = s(row.target)
-        if iri in agents_map and target not in agents_map[iri].interacts_with:
-            agents_map[iri].interacts_with.append(target)
+        if iri in agents_map:
+            attach(agents_map[iri].interacts_with, s(row.target))
 
     for row in g.query(AGENT_OPERATES_IN_QUERY):
         iri = s(row.agent)
@@ -783,22 +841,22 @@ def _link_agent_relations(
 
     for row in g.query(AGENT_CAPABILITY_QUERY):
         iri = s(row.agent)
-        cap_iri = s(row.cap)
-        if iri in agents_map and cap_iri not in agents_map[iri].capability_iris:
-            agents_map[iri].capability_iris.append(cap_iri)
+        if iri in agents_map:
+            attach(agents_map[iri].capability_iris, s(row.cap))
 
     for row in g.query(AGENT_OBJECTIVE_QUERY):
         iri = s(row.agent)
-        obj_iri = s(row.obj)
-        if iri in agents_map and obj_iri not in agents_map[iri].objective_iris:
-            agents_map[iri].objective_iris.append(obj_iri)
+        if iri in agents_map:
+            attach(agents_map[iri].objective_iris, s(row.obj))
 
 
+@timed
 def _link_task_relations(
     g: Graph,
     tasks_map: Dict[str, TaskModel],
 ) -> None:
     """Populate task → ontology relationship fields."""
+    attach = _Attacher()
     for row in g.query(TASK_OBJECTIVE_QUERY):
         iri = s(row.task)
         obj_iri = s(row.obj)
@@ -807,9 +865,8 @@ def _link_task_relations(
 
     for row in g.query(TASK_CAPABILITY_QUERY):
         iri = s(row.task)
-        cap_iri = s(row.cap)
-        if iri in tasks_map and cap_iri not in tasks_map[iri].requires_capability_iris:
-            tasks_map[iri].requires_capability_iris.append(cap_iri)
+        if iri in tasks_map:
+            attach(tasks_map[iri].requires_capability_iris, s(row.cap))
 
     for row in g.query(TASK_PERFORMED_BY_QUERY):
         iri = s(row.task)
@@ -818,31 +875,31 @@ def _link_task_relations(
             tasks_map[iri].performed_by_iri = performer
 
 
+@timed
 def _link_tool_relations(
     g: Graph,
     tools_map: Dict[str, ToolModel],
     capabilities_map: Dict[str, CapabilityModel],
 ) -> None:
     """Populate tool → ontology relationship fields."""
+    attach = _Attacher()
     for row in g.query(TOOL_CAPABILITY_QUERY):
         iri = s(row.tool)
-        cap_iri = s(row.cap)
-        if iri in tools_map and cap_iri not in tools_map[iri].capability_iris:
-            tools_map[iri].capability_iris.append(cap_iri)
+        if iri in tools_map:
+            attach(tools_map[iri].capability_iris, s(row.cap))
 
     for row in g.query(TOOL_RESOURCE_USAGE_QUERY):
         iri = s(row.tool)
-        res_iri = s(row.resource)
-        if iri in tools_map and res_iri not in tools_map[iri].resource_usage_iris:
-            tools_map[iri].resource_usage_iris.append(res_iri)
+        if iri in tools_map:
+            attach(tools_map[iri].resource_usage_iris, s(row.resource))
 
     for row in g.query(TOOL_TOOL_USAGE_QUERY):
         iri = s(row.tool)
-        child_iri = s(row.child)
-        if iri in tools_map and child_iri not in tools_map[iri].tool_usage_iris:
-            tools_map[iri].tool_usage_iris.append(child_iri)
+        if iri in tools_map:
+            attach(tools_map[iri].tool_usage_iris, s(row.child))
 
 
+@timed
 def _link_team_relations(
     g: Graph,
     project: AgenticProject,
@@ -852,49 +909,41 @@ def _link_team_relations(
     if not team_iri:
         return
 
+    attach = _Attacher()
     for row in g.query(TEAM_AGENT_MEMBERS_QUERY):
-        iri = s(row.team)
-        agent_iri = s(row.agent)
-        if iri == team_iri and agent_iri not in project.agent_member_iris:
-            project.agent_member_iris.append(agent_iri)
+        if s(row.team) == team_iri:
+            attach(project.agent_member_iris, s(row.agent))
 
     for row in g.query(TEAM_WORKFLOW_PATTERN_QUERY):
-        iri = s(row.team)
-        wp_iri = s(row.wp)
-        if iri == team_iri and wp_iri not in project.workflow_pattern_iris:
-            project.workflow_pattern_iris.append(wp_iri)
+        if s(row.team) == team_iri:
+            attach(project.workflow_pattern_iris, s(row.wp))
 
     for row in g.query(TEAM_GOAL_QUERY):
-        iri = s(row.team)
-        goal_iri = s(row.goal)
-        if iri == team_iri and goal_iri not in project.goal_iris:
-            project.goal_iris.append(goal_iri)
+        if s(row.team) == team_iri:
+            attach(project.goal_iris, s(row.goal))
 
     for row in g.query(TEAM_TEAM_GOAL_QUERY):
-        iri = s(row.team)
-        goal_iri = s(row.goal)
-        if iri == team_iri and goal_iri not in project.goal_iris:
-            project.goal_iris.append(goal_iri)
+        if s(row.team) == team_iri:
+            attach(project.goal_iris, s(row.goal))
 
     for row in g.query(TEAM_OBJECTIVE_QUERY):
-        iri = s(row.team)
-        obj_iri = s(row.obj)
-        if iri == team_iri and obj_iri not in project.objective_iris:
-            project.objective_iris.append(obj_iri)
+        if s(row.team) == team_iri:
+            attach(project.objective_iris, s(row.obj))
 
 
+@timed
 def _link_workflow_relations(
     g: Graph,
     patterns: List[WorkflowPatternModel],
 ) -> None:
     """Populate workflow pattern → pattern relationship fields."""
     pattern_by_iri = {p.iri: p for p in patterns if p.iri}
+    attach = _Attacher()
 
     for row in g.query(WORKFLOW_RELATED_PATTERN_QUERY):
         wp_iri = s(row.wp)
-        rel_iri = s(row.related)
-        if wp_iri in pattern_by_iri and rel_iri not in pattern_by_iri[wp_iri].related_pattern_iris:
-            pattern_by_iri[wp_iri].related_pattern_iris.append(rel_iri)
+        if wp_iri in pattern_by_iri:
+            attach(pattern_by_iri[wp_iri].related_pattern_iris, s(row.related))
 
     for row in g.query(WORKFLOW_NEXT_PATTERN_QUERY):
         wp_iri = s(row.wp)
@@ -903,6 +952,7 @@ def _link_workflow_relations(
             pattern_by_iri[wp_iri].next_pattern_iri = next_iri
 
 
+@timed
 def _apply_human_input_flags(
     tasks_map: Dict[str, TaskModel],
     human_agents_map: Dict[str, HumanAgentModel],
@@ -923,7 +973,14 @@ def _apply_human_input_flags(
 
 # ─────────────────────── Public API ───────────────────────
 
-def extract_project(file_path: str) -> AgenticProject:
+def extract_project(
+    file_path: str,
+    backend: str = "sparql",
+    cache: Union[bool, IRCache, None] = None,
+    store: str = "rdflib",
+    profile: Union[bool, str, None] = None,
+    scope: ExtractionScope = FULL_SCOPE,
+) -> AgenticProject:
     """Parse a KG (.ttl) file and return a framework-agnostic AgenticProject.
 
     Pipeline:
@@ -935,36 +992,244 @@ def extract_project(file_path: str) -> AgenticProject:
 
     The orchestration mode ('sequential' / 'hierarchical' / '') is stored in
     system_configs["process"] for adapters that need it.
+
+    *backend* selects how the queries are answered (see EXTRACTION_BACKENDS);
+    both backends produce the same IR. *cache* enables the persistent IR cache
+    (ir_cache.py): True for the default location, an IRCache for a specific
+    one, or None to follow $KG_TO_SCRIPT_IR_CACHE. *store* picks the graph
+    store that parses the file (store.GRAPH_STORES); all stores give the same IR.
+    *profile* records per-stage, per-function and per-query timings
+    (profiler.py): True to log them, a path to append them as JSON lines, or
+    None to follow $KG_TO_SCRIPT_PROFILE. *scope* limits extraction to the
+    optional collections and relation passes a consumer reads (scope.py);
+    adapters pass their EXTRACTION_SCOPE, everything else keeps FULL_SCOPE.
+    """
+    project, _ = _extract_profiled(file_path, backend, cache, store, resolve_profile(profile), scope)
+    return project
+
+
+def _extract_profiled(
+    file_path: str,
+    backend: str,
+    cache: Union[bool, IRCache, None],
+    store: str,
+    profile_target: Optional[str],
+    scope: ExtractionScope = FULL_SCOPE,
+) -> Tuple[AgenticProject, Optional[ExtractionProfile]]:
+    """extract_project(), recording and emitting a profile when *profile_target* is set."""
+    if profile_target is None:
+        return _extract_project(file_path, backend, cache, store, scope), None
+    with profiling(file_path) as record:
+        project = _extract_project(file_path, backend, cache, store, scope)
+    emit_profile(record, profile_target)
+    return project, record
+
+
+def _extract_project(
+    file_path: str,
+    backend: str,
+    cache: Union[bool, IRCache, None],
+    store: str,
+    scope: ExtractionScope = FULL_SCOPE,
+) -> AgenticProject:
+    ir_cache = resolve_ir_cache(cache)
+    if ir_cache is None:
+        return extract_project_from_graph(load_graph(file_path, store=store), backend=backend, scope=scope)
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        key = ir_cache.key_for(f.read(), scope)
+    project = ir_cache.get(key)
+    if project is not None:
+        _report_extracted(project)
+        return project
+
+    project = extract_project_from_graph(load_graph(file_path, store=store), backend=backend, scope=scope)
+    ir_cache.put(key, project)
+    return project
+
+
+@dataclass
+class ExtractionResult:
+    """Outcome of one file in an extract_projects() batch.
+
+    Exactly one of *project* / *error* is set; *error* is the formatted
+    exception ("ValueError: ...") so results stay picklable across processes.
+    *index* is the file's position in the input sequence. *profile* holds the
+    file's profiler record (ExtractionProfile.to_dict()) when profiling is on.
+    *project* is a CompactProject when the batch ran with compact=True.
     """
-    g = load_graph(file_path)
 
+    index: int
+    path: str
+    project: Union[AgenticProject, CompactProject, None] = None
+    error: Optional[str] = None
+    profile: Optional[Dict[str, Any]] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @classmethod
+    def failed(cls, index: int, path: str, exc: BaseException) -> "ExtractionResult":
+        return cls(index, path, error=f"{type(exc).__name__}: {exc}")
+
+
+def extract_projects(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    backend: str = "sparql",
+    cache: Union[bool, IRCache, None] = None,
+    store: str = "rdflib",
+    profile: Union[bool, str, None] = None,
+    scope: ExtractionScope = FULL_SCOPE,
+    compact: bool = False,
+) -> List[ExtractionResult]:
+    """Extract many KG files in parallel and return one result per path, in input order.
+
+    Per-file failures are captured in ExtractionResult.error instead of
+    aborting the batch. See iter_extract_projects() for the arguments.
+    """
+    results = list(iter_extract_projects(
+        paths, workers=workers, backend=backend, cache=cache, store=store, profile=profile, scope=scope,
+        compact=compact,
+    ))
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+def iter_extract_projects(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    backend: str = "sparql",
+    cache: Union[bool, IRCache, None] = None,
+    store: str = "rdflib",
+    profile: Union[bool, str, None] = None,
+    scope: ExtractionScope = FULL_SCOPE,
+    compact: bool = False,
+) -> Iterator[ExtractionResult]:
+    """Yield an ExtractionResult per path as soon as each extraction completes.
+
+    Parsing and extraction run in a process pool of *workers* processes
+    (default: one per CPU). With workers=1, or a single path, everything runs
+    in-process, in input order. *backend*, *cache*, *store*, *profile* and
+    *scope* are passed through to extract_project(); summarize the profiles of a
+    batch with profiler.summarize(result.profile for result in results).
+    With *compact*, each result holds a CompactProject (compact.py) instead of
+    an AgenticProject: a fraction of the memory for a whole corpus, and a
+    smaller pickle back from the pool. Adapters accept either form.
+    """
+    if backend not in EXTRACTION_BACKENDS:
+        raise ValueError(
+            f"Unknown extraction backend: {backend!r} (expected one of {EXTRACTION_BACKENDS})"
+        )
+    if store not in GRAPH_STORES:
+        raise ValueError(f"Unknown graph store: {store!r} (expected one of {GRAPH_STORES})")
+    profile_target = resolve_profile(profile)
+    paths = [str(path) for path in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+
+    if workers == 1:
+        for index, path in enumerate(paths):
+            yield _extract_one(index, path, backend, cache, store, profile_target, scope, compact)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                _extract_one, index, path, backend, cache, store, profile_target, scope, compact
+            ): (index, path)
+            for index, path in enumerate(paths)
+        }
+        for future in as_completed(futures):
+            index, path = futures[future]
+            try:
+                yield future.result()
+            except Exception as exc:
+                # The worker itself died (e.g. BrokenProcessPool).
+                yield ExtractionResult.failed(index, path, exc)
+
+
+def _extract_one(
+    index: int,
+    path: str,
+    backend: str,
+    cache: Union[bool, IRCache, None],
+    store: str,
+    profile_target: Optional[str],
+    scope: ExtractionScope = FULL_SCOPE,
+    compact: bool = False,
+) -> ExtractionResult:
+    """Process-pool task: extract one file, capturing any error."""
+    try:
+        project, record = _extract_profiled(path, backend, cache, store, profile_target, scope)
+        if compact:
+            project = compact_project(project)
+        return ExtractionResult(index, path, project=project, profile=record.to_dict() if record else None)
+    except Exception as exc:
+        logger.warning("[Extraction failed] %s: %s", path, exc)
+        return ExtractionResult.failed(index, path, exc)
+
+
+def extract_project_from_graph(
+    graph: Union[Graph, TripleIndex],
+    backend: str = "sparql",
+    scope: ExtractionScope = FULL_SCOPE,
+) -> AgenticProject:
+    """Build an AgenticProject from an already-parsed graph. See extract_project().
+
+    A TripleIndex (e.g. a team partition from partition.py) is used as is,
+    whatever *backend* says.
+    """
+    if isinstance(graph, TripleIndex):
+        g = graph
+    elif backend == "sparql":
+        g = graph
+    elif backend == "index":
+        with stage("build_index"):
+            g = TripleIndex(graph)
+    else:
+        raise ValueError(
+            f"Unknown extraction backend: {backend!r} (expected one of {EXTRACTION_BACKENDS})"
+        )
+    return _extract_from(profile_graph(g), scope)
+
+
+def _extract_from(g: Any, scope: ExtractionScope = FULL_SCOPE) -> AgenticProject:
+    """Run every extraction pass over *g*, anything answering the registered queries via query()."""
     system_configs = _extract_system_configs(g)
     project_name, description, orchestration_mode, team_iri = _extract_team(g, system_configs)
     project_var_name = safe_var(project_name)
 
     lm_map = _extract_language_models(g)
     tools_map = _extract_tools(g)
-    memories_map = _extract_memories(g)
+    collections, relations = scope.collections, scope.relations
+    memories_map = _extract_memories(g) if "memories" in collections else {}
     agents_map = _extract_agents(g, tools_map, lm_map)
     tasks_map = _extract_tasks(g, agents_map)
     _resolve_task_context(g, tasks_map)
     workflow_steps = _extract_workflow(g, tasks_map)
     workflows = _extract_workflow_patterns(g, workflow_steps, orchestration_mode)
 
-    # Full ontology coverage
-    goals_map = _extract_goals(g)
-    capabilities_map = _extract_capabilities(g)
-    environments_map = _extract_environments(g)
-    objectives_map = _extract_objectives(g)
-    human_agents_map = _extract_human_agents(g)
-    resources_map = _extract_resources(g)
-    constraints_map = _extract_constraints(g)
+    # Full ontology coverage (parts outside *scope* stay empty)
+    goals_map = _extract_goals(g) if "goals" in collections else {}
+    capabilities_map = _extract_capabilities(g) if "capabilities" in collections else {}
+    environments_map = _extract_environments(g) if "environments" in collections else {}
+    objectives_map = _extract_objectives(g) if "objectives" in collections else {}
+    human_agents_map = _extract_human_agents(g) if "human_agents" in collections else {}
+    resources_map = _extract_resources(g) if "resources" in collections else {}
+    constraints_map = _extract_constraints(g) if "constraints" in collections else {}
 
     # Cross-ontology linking
-    _link_agent_relations(g, agents_map, tools_map, capabilities_map)
-    _link_task_relations(g, tasks_map)
-    _link_tool_relations(g, tools_map, capabilities_map)
-    _link_workflow_relations(g, workflows)
+    if "agent_relations" in relations:
+        _link_agent_relations(g, agents_map, tools_map, capabilities_map)
+    if "task_relations" in relations:
+        _link_task_relations(g, tasks_map)
+    if "tool_relations" in relations:
+        _link_tool_relations(g, tools_map, capabilities_map)
+    if "workflow_relations" in relations:
+        _link_workflow_relations(g, workflows)
 
     # Compute human_input flag once, centrally
     _apply_human_input_flags(tasks_map, human_agents_map)
@@ -994,8 +1259,10 @@ def extract_project(file_path: str) -> AgenticProject:
         workflows=workflows,
         memories=list(memories_map.values()),
         language_models=list(lm_map.values()),
-        input_variables=_extract_input_variables(g, tasks_map, agents_map),
-        env_vars=_extract_env_vars(g),
+        input_variables=(
+            _extract_input_variables(g, tasks_map, agents_map) if "input_variables" in collections else []
+        ),
+        env_vars=_extract_env_vars(g) if "env_vars" in collections else [],
         system_configs=system_configs,
         goals=list(goals_map.values()),
         capabilities=list(capabilities_map.values()),
@@ -1007,8 +1274,15 @@ def extract_project(file_path: str) -> AgenticProject:
     )
 
     # Team-level relationship linking (needs project ref)
-    _link_team_relations(g, project, team_iri)
+    if "team_relations" in relations:
+        _link_team_relations(g, project, team_iri)
+
+    _report_extracted(project)
+    return project
 
+
+def _report_extracted(project: AgenticProject) -> None:
+    """Log entity counts and print the console summary run.py scripts expect."""
     logger.info(
         "[Extracted] project=%s  agents=%d  tasks=%d  tools=%d  "
         "workflows=%d  goals=%d  capabilities=%d  environments=%d  "
@@ -1041,4 +1315,3 @@ def extract_project(file_path: str) -> AgenticProject:
         f"{len(project.resources)} resources, "
         f"{len(project.constraints)} constraints"
     )
-    return project
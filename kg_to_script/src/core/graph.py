@@ -0,0 +1,216 @@
+"""Directed-graph algorithms shared by the extractor and the framework adapters.
+
+Workflow steps (:nextStep), task dependencies (context_task_var_names) and
+LangGraph node/edge lists are all small directed graphs today. Generated KGs
+can still describe chains of thousands of steps. Everything here is
+therefore iterative (no recursion limit) and runs in O(V + E):
+
+    graph = Digraph(nodes, edges)
+    has_cycle(graph)                      # LOOP detection
+    topological_sort(graph)               # stable, cycle-tolerant order
+    strongly_connected_components(graph)  # Tarjan, iterative
+    levels(graph) / antichains(graph)     # longest-path layering
+
+Nodes are any hashable values. They keep the order they were first added,
+and every result is deterministic in that order. Parallel edges are kept,
+so degrees count edges rather than distinct neighbours.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Generic, Hashable, Iterable, List, Tuple, TypeVar
+
+N = TypeVar("N", bound=Hashable)
+
+
+class Digraph(Generic[N]):
+    """Directed multigraph with successor/predecessor lists and degree indexes.
+
+    *nodes* fixes the node order; endpoints of *edges* that are not in *nodes*
+    are added as they are met.
+    """
+
+    __slots__ = ("successors", "predecessors")
+
+    def __init__(self, nodes: Iterable[N] = (), edges: Iterable[Tuple[N, N]] = ()) -> None:
+        self.successors: Dict[N, List[N]] = {}
+        self.predecessors: Dict[N, List[N]] = {}
+        for node in nodes:
+            self.add_node(node)
+        for source, target in edges:
+            self.add_edge(source, target)
+
+    def add_node(self, node: N) -> None:
+        if node not in self.successors:
+            self.successors[node] = []
+            self.predecessors[node] = []
+
+    def add_edge(self, source: N, target: N) -> None:
+        self.add_node(source)
+        self.add_node(target)
+        self.successors[source].append(target)
+        self.predecessors[target].append(source)
+
+    @property
+    def nodes(self) -> List[N]:
+        return list(self.successors)
+
+    def __len__(self) -> int:
+        return len(self.successors)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self.successors
+
+    def edge_count(self) -> int:
+        return sum(map(len, self.successors.values()))
+
+    def out_degree(self, node: N) -> int:
+        return len(self.successors.get(node, ()))
+
+    def in_degree(self, node: N) -> int:
+        return len(self.predecessors.get(node, ()))
+
+    def sources(self) -> List[N]:
+        """Nodes without incoming edges, in node order."""
+        return [node for node, preds in self.predecessors.items() if not preds]
+
+    def sinks(self) -> List[N]:
+        """Nodes without outgoing edges, in node order."""
+        return [node for node, succs in self.successors.items() if not succs]
+
+
+def has_cycle(graph: Digraph[N]) -> bool:
+    """True if *graph* has a directed cycle (self-loops included)."""
+    # Kahn's algorithm: a cycle is whatever can never reach in-degree 0.
+    in_degree = {node: len(preds) for node, preds in graph.predecessors.items()}
+    ready = [node for node, degree in in_degree.items() if not degree]
+    removed = 0
+    while ready:
+        node = ready.pop()
+        removed += 1
+        for target in graph.successors[node]:
+            in_degree[target] -= 1
+            if not in_degree[target]:
+                ready.append(target)
+    return removed < len(graph)
+
+
+def topological_sort(graph: Digraph[N]) -> List[N]:
+    """Every node once, each after its predecessors, otherwise in node order.
+
+    Walks nodes in order and emits each one after first emitting its
+    not-yet-emitted predecessors (depth-first, in predecessor order). On a
+    DAG this is a topological order that moves a node only as far as its
+    dependencies require. An edge that closes a cycle is ignored where it is
+    met, so cyclic graphs still get every node exactly once.
+    """
+    order: List[N] = []
+    # 1 = on the current path, 2 = emitted.
+    state: Dict[N, int] = {}
+    predecessors = graph.predecessors
+    for root in graph.successors:
+        if root in state:
+            continue
+        state[root] = 1
+        stack = [(root, iter(predecessors[root]))]
+        while stack:
+            node, pending = stack[-1]
+            for pred in pending:
+                if pred not in state:
+                    state[pred] = 1
+                    stack.append((pred, iter(predecessors[pred])))
+                    break
+            else:
+                stack.pop()
+                state[node] = 2
+                order.append(node)
+    return order
+
+
+def strongly_connected_components(graph: Digraph[N]) -> List[List[N]]:
+    """Strongly connected components (Tarjan), in reverse topological order.
+
+    Each component lists its nodes in the order Tarjan's algorithm pops them.
+    A component never reaches a component listed after it.
+    """
+    index: Dict[N, int] = {}
+    low: Dict[N, int] = {}
+    on_stack: Dict[N, bool] = {}
+    stack: List[N] = []
+    components: List[List[N]] = []
+    successors = graph.successors
+    counter = 0
+
+    for root in successors:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(successors[root]))]
+        while work:
+            node, pending = work[-1]
+            for target in pending:
+                if target not in index:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    work.append((target, iter(successors[target])))
+                    break
+                if on_stack.get(target):
+                    low[node] = min(low[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def levels(graph: Digraph[N]) -> Dict[N, int]:
+    """Longest-path level of every node: 0 for sources, else 1 + max level of a predecessor.
+
+    Cycles are collapsed first: all nodes of a strongly connected component
+    share one level, and edges inside a component are ignored.
+    """
+    components = strongly_connected_components(graph)
+    component_of: Dict[N, int] = {}
+    for number, component in enumerate(components):
+        for node in component:
+            component_of[node] = number
+
+    # Tarjan lists components in reverse topological order.
+    component_level = [0] * len(components)
+    for number in range(len(components) - 1, -1, -1):
+        level = component_level[number]
+        for node in components[number]:
+            for target in graph.successors[node]:
+                other = component_of[target]
+                if other != number and component_level[other] <= level:
+                    component_level[other] = level + 1
+    return {node: component_level[component_of[node]] for node in graph.successors}
+
+
+def antichains(graph: Digraph[N]) -> List[List[N]]:
+    """Nodes grouped by levels(), lowest level first, each group in node order.
+
+    In a DAG no path joins two nodes of the same group, so each group can
+    run in parallel once the groups before it are done.
+    """
+    groups: List[List[N]] = []
+    for node, level in levels(graph).items():
+        while len(groups) <= level:
+            groups.append([])
+        groups[level].append(node)
+    return groups
@@ -0,0 +1,50 @@
+"""Content-addressed on-disk cache of parsed KG graphs.
+
+``load_graph`` normalizes and re-parses a TTL file on every call, and the same
+KG is loaded by each framework runner and several times by the evaluators.
+With the cache enabled, the parsed graph is stored once under
+
+    <cache dir>/graphs/<sha256(normalizer version + raw TTL)>.pickle
+
+and later loads deserialize it instead (see cache.py for storage, eviction
+and the inspect/clear CLI).
+
+The cache is opt-in: pass ``cache=True`` to ``load_graph`` or set
+``KG_TO_SCRIPT_GRAPH_CACHE=1``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional, Union
+
+from .cache import DiskCache, env_flag
+from .normalizer import NORMALIZER_VERSION
+
+GRAPH_CACHE_ENV = "KG_TO_SCRIPT_GRAPH_CACHE"
+
+
+class GraphCache(DiskCache):
+    """Stores parsed graphs keyed by the SHA-256 of their raw TTL content."""
+
+    kind = "graphs"
+
+    @staticmethod
+    def key_for(content: str) -> str:
+        """Cache key for raw TTL *content* under the current normalizer version."""
+        digest = hashlib.sha256()
+        digest.update(f"normalizer={NORMALIZER_VERSION}\0".encode("utf-8"))
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+
+def resolve_graph_cache(cache: Union[bool, GraphCache, None]) -> Optional[GraphCache]:
+    """Map load_graph's *cache* argument to a GraphCache (or None when disabled).
+
+    None defers to $KG_TO_SCRIPT_GRAPH_CACHE.
+    """
+    if isinstance(cache, GraphCache):
+        return cache
+    if cache is None:
+        cache = env_flag(GRAPH_CACHE_ENV)
+    return GraphCache() if cache else None
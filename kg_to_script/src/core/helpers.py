@@ -5,10 +5,13 @@ All functions here are stateless and framework-agnostic.
 
 from __future__ import annotations
 
+import logging
 import re
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
-from rdflib import Graph
+from rdflib import Graph, URIRef
+
+from .identifiers import pascal_case, snake_identifier
 
 
 def s(val: Any) -> str:
@@ -24,24 +27,12 @@ def safe_var(iri: str) -> str:
         "http://…/onto#SeniorEngineerAgent" → "senior_engineer_agent"
         "http://…/onto#GPT4Tool"            → "gp_t4_tool"
     """
-    if not iri:
-        return "unnamed"
-    name = iri.split("/")[-1].split("#")[-1]
-    # Insert _ before uppercase runs: "SeniorEngineer" → "Senior_Engineer"
-    name = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name)
-    name = re.sub(r"(?<=[A-Z])([A-Z][a-z])", r"_\1", name)
-    name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-    name = re.sub(r"_+", "_", name).strip("_").lower()
-    if not name:
-        return "unnamed"
-    if name[0].isdigit():
-        name = f"_{name}"
-    return name
+    return snake_identifier(iri)
 
 
 def camel(s_: str) -> str:
     """Convert snake_case to CamelCase: 'game_builder_crew' → 'GameBuilderCrew'."""
-    return "".join(w.capitalize() for w in s_.split("_"))
+    return pascal_case(s_)
 
 
 def extract_placeholders(text: str) -> List[str]:
@@ -49,17 +40,93 @@ def extract_placeholders(text: str) -> List[str]:
     return list(dict.fromkeys(re.findall(r"\{(\w+)\}", text)))
 
 
+from .graph_cache import GraphCache, resolve_graph_cache
 from .normalizer import normalize_ttl
+from .profiler import stage
+from .store import GRAPH_STORES, parse_turtle
 
+logger = logging.getLogger(__name__)
 
-def load_graph(file_path: str) -> Graph:
-    """Parse a Turtle (.ttl) file into an rdflib Graph after normalizing its content."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        
-    normalized_content = normalize_ttl(content)
-    
-    g = Graph()
-    g.parse(data=normalized_content, format="turtle")
-    return g
 
+def parse_ttl(
+    content: str,
+    repairs: Optional[List[str]] = None,
+    identifier: Optional[URIRef] = None,
+    store: str = "rdflib",
+) -> Graph:
+    """Parse raw Turtle *content* into an rdflib Graph named *identifier*.
+
+    Most KGs are already valid Turtle, so a strict parse is tried first and
+    normalize_ttl() only runs when it fails. The repair names that fired on
+    the slow path are appended to *repairs* when given. *store* picks the
+    parser (see store.GRAPH_STORES).
+    """
+    if store not in GRAPH_STORES:
+        raise ValueError(f"Unknown graph store: {store!r} (expected one of {GRAPH_STORES})")
+    try:
+        with stage("parse"):
+            return parse_turtle(content, identifier, store)
+    except ImportError:
+        raise
+    except Exception:
+        # rdflib raises BadSyntax for most errors, but also plain assertion
+        # and value errors on some malformed input; pyoxigraph raises SyntaxError.
+        pass
+    with stage("normalize_ttl"):
+        content = normalize_ttl(content, repairs)
+    with stage("parse"):
+        return parse_turtle(content, identifier, store)
+
+
+def load_graph(
+    file_path: str,
+    cache: Union[bool, GraphCache, None] = None,
+    identifier: Optional[URIRef] = None,
+    store: str = "rdflib",
+) -> Graph:
+    """Parse a Turtle (.ttl) file into an rdflib Graph, repairing its content if needed.
+
+    Logs "[Parsed] <path>  strict" or "[Repaired] <path>  repairs=..." so the
+    extraction log shows how often the repair chain is hit (see parse_ttl()).
+
+    *cache* enables the on-disk parsed-graph cache (graph_cache.py): True for the
+    default location, a GraphCache instance for a specific one, or None to
+    follow $KG_TO_SCRIPT_GRAPH_CACHE.
+
+    *identifier* names the returned graph (e.g. a named-graph IRI in a
+    dataset). Named graphs bypass the cache, whose entries are shared by
+    every load of the same content.
+
+    *store* picks the parser (see store.GRAPH_STORES); every store yields the
+    same graph, so cached graphs are shared between them.
+    """
+    with stage("load_graph"):
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        graph_cache = None if identifier is not None else resolve_graph_cache(cache)
+        if graph_cache is None:
+            return _parse_logged(file_path, content, identifier, store)
+
+        key = graph_cache.key_for(content)
+        g = graph_cache.get(key)
+        if g is None:
+            g = _parse_logged(file_path, content, store=store)
+            graph_cache.put(key, g)
+        return g
+
+
+def _parse_logged(
+    file_path: str,
+    content: str,
+    identifier: Optional[URIRef] = None,
+    store: str = "rdflib",
+) -> Graph:
+    """parse_ttl() plus one log line saying whether the repair chain was needed."""
+    repairs: List[str] = []
+    g = parse_ttl(content, repairs, identifier, store)
+    if repairs:
+        logger.info("[Repaired] %s  repairs=%s", file_path, ",".join(repairs))
+    else:
+        logger.info("[Parsed] %s  strict", file_path)
+    return g
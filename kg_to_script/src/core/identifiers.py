@@ -0,0 +1,165 @@
+"""Identifier normalization shared by the extractor, adapters and evaluation.
+
+The same few names (agent IRIs, var_names, roles, step names) are converted
+over and over: once per query row in the extractor, once per reference in
+each adapter, and up to eight times per value in evaluation.utils.aliases_for.
+Every conversion here uses patterns compiled at import time and is memoized
+in a bounded LRU cache, so a repeated name costs one dict lookup:
+
+    snake_identifier("http://…/onto#SeniorEngineerAgent")  # "senior_engineer_agent"
+    pascal_case("game_builder_crew")                       # "GameBuilderCrew"
+    lower_camel_case("research-agent")                     # "researchAgent"
+    kebab_case("My Project")                               # "my-project"
+    schema_key("2nd value")                                # "field_2nd_value"
+    normalize_name("stepA2")                               # "step_a_2"
+
+Inputs longer than MAX_CACHED_LENGTH (e.g. whole source files passed to
+evaluation.utils.token_set) are converted without being cached.
+
+The public helpers (helpers.safe_var, helpers.camel, evaluation.utils.*,
+the Mastra and LangGraph name helpers) delegate here and keep their
+signatures.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache, wraps
+from typing import Callable, FrozenSet, TypeVar
+
+# Distinct names kept per function; a large corpus has a few thousand.
+CACHE_SIZE = 16384
+MAX_CACHED_LENGTH = 256
+
+T = TypeVar("T")
+
+_LOWER_TO_UPPER = re.compile(r"(?<=[a-z0-9])([A-Z])")
+_UPPER_RUN_END = re.compile(r"(?<=[A-Z])([A-Z][a-z])")
+_NON_WORD = re.compile(r"[^a-zA-Z0-9_]")
+_NON_WORD_RUN = re.compile(r"[^a-zA-Z0-9_]+")
+_NON_ALNUM_RUN = re.compile(r"[^a-zA-Z0-9]+")
+_UNDERSCORES = re.compile(r"_+")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_LETTER_DIGIT = re.compile(r"([a-zA-Z])(\d)")
+_DIGIT_LETTER = re.compile(r"(\d)([a-zA-Z])")
+_SNAKE_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+# Plain words plus colon/dash-joined identifiers such as "task:my-step-2".
+_TOKEN = re.compile(r"[a-zA-Z_][a-zA-Z0-9_:\-]*")
+
+
+def _memoized(fn: Callable[[str], T]) -> Callable[[str], T]:
+    """*fn* behind a CACHE_SIZE LRU cache, bypassed for inputs over MAX_CACHED_LENGTH."""
+    cached = lru_cache(maxsize=CACHE_SIZE)(fn)
+
+    @wraps(fn)
+    def wrapper(text: str) -> T:
+        if len(text) > MAX_CACHED_LENGTH:
+            return fn(text)
+        return cached(text)
+
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+@_memoized
+def snake_identifier(iri: str) -> str:
+    """IRI fragment (or any name) → snake_case Python identifier; "unnamed" if nothing is left.
+
+        "http://…/onto#SeniorEngineerAgent" → "senior_engineer_agent"
+        "http://…/onto#GPT4Tool"            → "gp_t4_tool"
+    """
+    if not iri:
+        return "unnamed"
+    name = iri.split("/")[-1].split("#")[-1]
+    # Insert _ before uppercase runs: "SeniorEngineer" → "Senior_Engineer"
+    name = _LOWER_TO_UPPER.sub(r"_\1", name)
+    name = _UPPER_RUN_END.sub(r"_\1", name)
+    name = _NON_WORD.sub("_", name)
+    name = _UNDERSCORES.sub("_", name).strip("_").lower()
+    if not name:
+        return "unnamed"
+    if name[0].isdigit():
+        name = f"_{name}"
+    return name
+
+
+def is_snake_identifier(name: str) -> bool:
+    """True if *name* is already lowercase snake_case (letters, digits, _; no leading digit)."""
+    return _SNAKE_IDENTIFIER.match(name) is not None
+
+
+@_memoized
+def pascal_case(name: str) -> str:
+    """snake_case → CamelCase: 'game_builder_crew' → 'GameBuilderCrew'."""
+    return "".join(w.capitalize() for w in name.split("_"))
+
+
+@_memoized
+def _camel_words(name: str) -> str:
+    """lowerCamelCase join of *name*'s alphanumeric runs; "" if there are none."""
+    parts = [p for p in _NON_ALNUM_RUN.split(name) if p]
+    if not parts:
+        return ""
+    return parts[0].lower() + "".join(p[:1].upper() + p[1:] for p in parts[1:])
+
+
+def lower_camel_case(name: str, empty: str = "unnamed", digit_prefix: str = "item") -> str:
+    """snake/kebab/space-separated name → lowerCamelCase TS identifier.
+
+    *empty* is returned when *name* has no letters or digits; *digit_prefix*
+    is prepended when the result would start with a digit.
+    """
+    out = _camel_words(name or "")
+    if not out:
+        return empty
+    if out[0].isdigit():
+        out = f"{digit_prefix}{out}"
+    return out
+
+
+@_memoized
+def kebab_case(name: str) -> str:
+    """Any name → lowercase kebab-case package name; "mastra-project" if nothing is left."""
+    clean = _NON_ALNUM_RUN.sub("-", name)
+    clean = clean.strip("-").lower()
+    return clean or "mastra-project"
+
+
+@_memoized
+def schema_key(name: str) -> str:
+    """Any name → identifier-safe object key; "value" if nothing is left."""
+    key = _NON_WORD_RUN.sub("_", name).strip("_")
+    if not key:
+        return "value"
+    if key[0].isdigit():
+        key = f"field_{key}"
+    return key
+
+
+@_memoized
+def normalize_name(text: str) -> str:
+    """Comparison form of a name: snake_case split at case and letter/digit boundaries.
+
+        "researchAgent" → "research_agent",  "stepA2" → "step_a_2",  "2step" → "2_step"
+    """
+    # camelCase boundary: aB → a_B
+    text = _CAMEL_BOUNDARY.sub(r"\1_\2", text)
+    # letter → digit boundary: stepA2 → stepA_2, task2 → task_2
+    text = _LETTER_DIGIT.sub(r"\1_\2", text)
+    # digit → letter boundary: 2step → 2_step
+    text = _DIGIT_LETTER.sub(r"\1_\2", text)
+    text = _NON_WORD_RUN.sub("_", text)
+    text = _UNDERSCORES.sub("_", text).strip("_")
+    return text.lower()
+
+
+def word_tokens(text: str) -> FrozenSet[str]:
+    """normalize_name() of every word and colon/dash-joined identifier in *text*."""
+    return frozenset(normalize_name(token) for token in _TOKEN.findall(text))
+
+
+def cache_clear() -> None:
+    """Empty every memo cache (e.g. between benchmark runs)."""
+    for fn in (snake_identifier, pascal_case, _camel_words, kebab_case, schema_key, normalize_name):
+        fn.cache_clear()
@@ -0,0 +1,430 @@
+"""Incremental re-extraction of a KG file that was extracted before.
+
+When script_to_kg re-generates a KG, usually only a handful of triples
+change, yet extract_project() re-runs every query and rebuilds every model.
+``extract_incremental`` keeps per-file state in the cache (see cache.py),
+
+    <cache dir>/incremental/<sha256(path + backend + scope + extractor fingerprint)>.pickle
+
+and on the next call for the same file:
+
+  1. Indexes the new graph (index.py), splits it into dependency groups (one
+     per predicate, one per rdf:type class) and hashes each group's triples
+     in store order.
+  2. Re-runs only the queries whose triple patterns read a group whose hash
+     changed (query_dependencies()). The rows of every other query are
+     replayed from the previous run; they cannot differ.
+  3. Maps the rows into an AgenticProject as usual and diffs it against the
+     previous one (diff_projects()).
+  4. Returns the project and a ChangeSet: the triple diff, the changed
+     subjects, which queries ran, and the added / removed / modified entities
+     of every collection, for generators that rewrite only affected files.
+
+An unchanged file returns the previous project without even being parsed.
+The result is always equal to a full extraction of the new file.
+
+Blank nodes get fresh labels on every parse (so two full extractions of a KG
+with blank nodes differ too). Queries that match them are always re-run, and
+triples that contain them are left out of the triple diff.
+
+    python -m src.core.incremental path/to/kg.ttl [--backend index]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from collections import namedtuple
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+from rdflib import BNode, URIRef
+from rdflib.namespace import RDF
+from rdflib.plugins.sparql.parserutils import CompValue
+from rdflib.term import Node, Variable
+
+from .cache import DiskCache
+from .extractor import EXTRACTION_BACKENDS, _extract_from, _report_extracted
+from .helpers import load_graph
+from .index import TripleIndex
+from .ir_cache import extractor_fingerprint
+from .models import AgenticProject
+from .prepared import get_prepared, query_name
+from .profiler import profile_graph, stage
+from .scope import FULL_SCOPE, ExtractionScope
+
+# Bump when the stored state changes shape.
+STATE_VERSION = 1
+
+# Dependency on every group, for triple patterns with a variable predicate.
+ANY_GROUP = "*"
+# Dependency on all rdf:type triples, for patterns with a variable class.
+ANY_TYPE = (RDF.type, ANY_GROUP)
+
+# Collections keyed by something other than their iri.
+ENTITY_KEYS = {"input_variables": "name", "env_vars": "key"}
+
+
+# ─────────────────────── Change set ───────────────────────
+
+@dataclass
+class EntityChanges:
+    """Keys of one collection's entities that were added, removed or modified.
+
+    *reordered* is set when the surviving entities kept their content but
+    changed order, which changes generated output too.
+    """
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    reordered: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified or self.reordered)
+
+
+@dataclass
+class ChangeSet:
+    """What changed between the previous and the current extraction of *path*.
+
+    *full* is True when there was no previous state and every query ran.
+    *fields* names the changed project-level fields (name, team_iri,
+    system_configs, ...); *entities* holds only collections that changed.
+    """
+
+    path: str
+    full: bool = True
+    added_triples: int = 0
+    removed_triples: int = 0
+    changed_subjects: List[str] = field(default_factory=list)
+    requeried: List[str] = field(default_factory=list)
+    replayed: List[str] = field(default_factory=list)
+    fields: List[str] = field(default_factory=list)
+    entities: Dict[str, EntityChanges] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> bool:
+        """True if the project differs from the previous one."""
+        return bool(self.fields or self.entities)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _entity_key(collection: str, entity: Any) -> str:
+    return getattr(entity, ENTITY_KEYS.get(collection, "iri"))
+
+
+def _grouped(collection: str, entities: List[Any]) -> Dict[str, List[Any]]:
+    groups: Dict[str, List[Any]] = {}
+    for entity in entities:
+        groups.setdefault(_entity_key(collection, entity), []).append(entity)
+    return groups
+
+
+def _is_model_list(annotation: Any) -> bool:
+    if getattr(annotation, "__origin__", None) is not list:
+        return False
+    (item,) = annotation.__args__
+    return isinstance(item, type) and issubclass(item, BaseModel)
+
+
+# AgenticProject's entity lists (agents, tasks, ..., env_vars), in field order.
+ENTITY_COLLECTIONS = tuple(
+    name for name, info in AgenticProject.model_fields.items() if _is_model_list(info.annotation)
+)
+
+
+def diff_projects(
+    old: Optional[AgenticProject], new: AgenticProject
+) -> Tuple[List[str], Dict[str, EntityChanges]]:
+    """Changed project-level fields and per-collection entity changes from *old* to *new*.
+
+    With *old* None, every entity of *new* counts as added.
+    """
+    fields = []
+    if old is not None:
+        fields = [
+            name for name in AgenticProject.model_fields
+            if name not in ENTITY_COLLECTIONS and getattr(old, name) != getattr(new, name)
+        ]
+
+    entities: Dict[str, EntityChanges] = {}
+    for collection in ENTITY_COLLECTIONS:
+        before = _grouped(collection, getattr(old, collection) if old is not None else [])
+        after = _grouped(collection, getattr(new, collection))
+        changes = EntityChanges(
+            added=[key for key in after if key not in before],
+            removed=[key for key in before if key not in after],
+            modified=[key for key, items in after.items() if key in before and before[key] != items],
+        )
+        if not changes:
+            common = [key for key in after if key in before]
+            changes.reordered = common != [key for key in before if key in after]
+        if changes:
+            entities[collection] = changes
+    return fields, entities
+
+
+# ─────────────────────── Query dependencies ───────────────────────
+
+def _patterns(node: Any) -> List[Tuple[Any, Any, Any]]:
+    """Every triple pattern in a query algebra tree, including FILTER (NOT) EXISTS blocks."""
+    found: List[Tuple[Any, Any, Any]] = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, CompValue):
+            # BGPs hold (s, p, o) tuples; TriplesBlocks hold flat s, p, o[, s, p, o...] lists.
+            for triples in node["triples"] if "triples" in node else ():
+                found.extend(tuple(triples[i:i + 3]) for i in range(0, len(triples), 3))
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return found
+
+
+_DEPENDENCIES: Dict[str, FrozenSet[Hashable]] = {}
+
+
+def query_dependencies(name: str) -> FrozenSet[Hashable]:
+    """Dependency groups the rows of query *name* are computed from.
+
+    A predicate for each plain triple pattern, ``(rdf:type, class)`` for type
+    patterns, ANY_TYPE when the class is a variable and ANY_GROUP when the
+    predicate is (or is a property path).
+    """
+    dependencies = _DEPENDENCIES.get(name)
+    if dependencies is None:
+        groups: Set[Hashable] = set()
+        for _, predicate, obj in _patterns(get_prepared(name).algebra):
+            if not isinstance(predicate, URIRef):
+                groups.add(ANY_GROUP)
+            elif predicate != RDF.type:
+                groups.add(predicate)
+            elif isinstance(obj, Variable):
+                groups.add(ANY_TYPE)
+            else:
+                groups.add((RDF.type, obj))
+        dependencies = _DEPENDENCIES[name] = frozenset(groups)
+    return dependencies
+
+
+def _digest(parts: List[str]) -> str:
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def snapshot(index: TripleIndex) -> Tuple[Dict[Hashable, str], FrozenSet[str]]:
+    """Hash of every dependency group of the indexed graph, plus its triples without blank nodes.
+
+    Query rows depend on both the predicate-index order (?s p ?o scans) and
+    the subject-index order (s p ?o lookups), so a group's hash covers its
+    triples in both orders. Triples are returned as "<s> <p> <o>" N3 text.
+    """
+    n3: Dict[Node, str] = {}
+
+    def encode(term: Node) -> str:
+        text = n3.get(term)
+        if text is None:
+            text = n3[term] = term.n3()
+        return text
+
+    signatures: Dict[Hashable, str] = {}
+    triples: Set[str] = set()
+    for predicate in index.predicates():
+        pairs = list(index.pairs(predicate))
+        p = encode(predicate)
+        parts = [p]
+        for subject, obj in pairs:
+            s, o = encode(subject), encode(obj)
+            parts += (s, o)
+            if not isinstance(subject, BNode) and not isinstance(obj, BNode):
+                triples.add(f"{s} {p} {o}")
+        parts.append("|")
+        for subject in dict.fromkeys(subject for subject, _ in pairs):
+            parts.append(encode(subject))
+            parts += map(encode, index.objects(subject, predicate))
+        if predicate != RDF.type:
+            signatures[predicate] = _digest(parts)
+            continue
+        signatures[ANY_TYPE] = _digest(parts)
+        instances: Dict[Node, List[str]] = {}
+        for subject, cls in pairs:
+            instances.setdefault(cls, []).append(encode(subject))
+        for cls, subjects in instances.items():
+            signatures[(RDF.type, cls)] = _digest(subjects)
+    return signatures, frozenset(triples)
+
+
+def _stale_groups(old: Dict[Hashable, str], new: Dict[Hashable, str]) -> Set[Hashable]:
+    return {group for group in old.keys() | new.keys() if old.get(group) != new.get(group)}
+
+
+def _is_stale(name: str, stale: Set[Hashable]) -> bool:
+    if not stale:
+        return False
+    dependencies = query_dependencies(name)
+    return ANY_GROUP in dependencies or not dependencies.isdisjoint(stale)
+
+
+# ─────────────────────── Row replay ───────────────────────
+
+_ROW_TYPES: Dict[Tuple[str, ...], type] = {}
+
+Rows = Tuple[Tuple[str, ...], List[tuple]]
+
+
+def _row_type(fields: Tuple[str, ...]) -> type:
+    row_type = _ROW_TYPES.get(fields)
+    if row_type is None:
+        row_type = _ROW_TYPES[fields] = namedtuple("Row", fields)
+    return row_type
+
+
+class _ReplayGraph:
+    """Stands in for the graph during extraction, replaying stored rows of fresh queries.
+
+    Stale queries, and queries without stored rows, are answered by *live*
+    (the Graph or its TripleIndex, per backend). Every answer is recorded
+    for the next run.
+    """
+
+    def __init__(self, live: Any, previous: Dict[str, Rows], is_stale: Callable[[str], bool]) -> None:
+        self.live = live
+        self.previous = previous
+        self.is_stale = is_stale
+        self.rows: Dict[str, Rows] = {}
+        self.requeried: List[str] = []
+        self.replayed: List[str] = []
+
+    def query(self, query) -> List[tuple]:
+        name = query_name(query)
+        if name in self.previous and not self.is_stale(name):
+            fields, values = self.rows[name] = self.previous[name]
+            self.replayed.append(name)
+            row_type = _row_type(fields)
+            return [row_type(*row) for row in values]
+
+        result = self.live.query(query)
+        rows = list(result)
+        if hasattr(result, "vars"):
+            fields = tuple(str(var) for var in result.vars or ())
+        else:
+            fields = rows[0]._fields if rows else ()
+        self.rows[name] = (fields, [tuple(row) for row in rows])
+        self.requeried.append(name)
+        return rows
+
+
+# ─────────────────────── State and entry point ───────────────────────
+
+@dataclass
+class _State:
+    content_digest: str
+    signatures: Dict[Hashable, str]
+    triples: FrozenSet[str]
+    rows: Dict[str, Rows]
+    project: AgenticProject
+
+
+class IncrementalCache(DiskCache):
+    """Stores the previous extraction state of each KG file, keyed by its path."""
+
+    kind = "incremental"
+
+    @staticmethod
+    def key_for(file_path: str, backend: str = "sparql", scope: ExtractionScope = FULL_SCOPE) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"version={STATE_VERSION}\0".encode("utf-8"))
+        digest.update(f"extractor={extractor_fingerprint()}\0".encode("utf-8"))
+        digest.update(f"backend={backend}\0scope={scope.token()}\0".encode("utf-8"))
+        digest.update(os.path.abspath(file_path).encode("utf-8"))
+        return digest.hexdigest()
+
+
+def extract_incremental(
+    file_path: str,
+    backend: str = "sparql",
+    store: str = "rdflib",
+    scope: ExtractionScope = FULL_SCOPE,
+    cache: Optional[IncrementalCache] = None,
+) -> Tuple[AgenticProject, ChangeSet]:
+    """Extract *file_path*, reusing whatever its previous extraction still covers.
+
+    Returns the project, equal to what extract_project() would return, and
+    the ChangeSet against the previous extraction of the same path (a full
+    one, with every entity added, on the first call). *backend*, *store* and
+    *scope* are as in extract_project(); state is kept per backend and scope.
+    """
+    if backend not in EXTRACTION_BACKENDS:
+        raise ValueError(
+            f"Unknown extraction backend: {backend!r} (expected one of {EXTRACTION_BACKENDS})"
+        )
+    cache = cache if cache is not None else IncrementalCache()
+    key = cache.key_for(file_path, backend, scope)
+    previous: Optional[_State] = cache.get(key)
+
+    with open(file_path, "rb") as f:
+        content_digest = hashlib.sha256(f.read()).hexdigest()
+    changes = ChangeSet(path=str(file_path), full=previous is None)
+    if previous is not None and previous.content_digest == content_digest:
+        changes.replayed = list(previous.rows)
+        _report_extracted(previous.project)
+        return previous.project, changes
+
+    graph = load_graph(file_path, store=store)
+    with stage("build_index"):
+        index = TripleIndex(graph)
+    with stage("incremental_diff"):
+        signatures, triples = snapshot(index)
+
+    if previous is not None:
+        added, removed = triples - previous.triples, previous.triples - triples
+        changes.added_triples, changes.removed_triples = len(added), len(removed)
+        changes.changed_subjects = sorted({triple[1:triple.index("> ")] for triple in added | removed})
+        if signatures == previous.signatures:
+            # Only formatting changed: same triples in the same store order.
+            changes.replayed = list(previous.rows)
+            cache.put(key, replace(previous, content_digest=content_digest))
+            _report_extracted(previous.project)
+            return previous.project, changes
+
+    stale = _stale_groups(previous.signatures, signatures) if previous is not None else set()
+    replay = _ReplayGraph(
+        index if backend == "index" else graph,
+        previous.rows if previous is not None else {},
+        lambda name: _is_stale(name, stale),
+    )
+    project = _extract_from(profile_graph(replay), scope)
+    changes.requeried, changes.replayed = replay.requeried, replay.replayed
+
+    changes.fields, changes.entities = diff_projects(previous.project if previous is not None else None, project)
+    cache.put(key, _State(content_digest, signatures, triples, replay.rows, project))
+    return project, changes
+
+
+# ─────────────────────── CLI ───────────────────────
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Re-extract a KG file incrementally and print what changed since the last run."
+    )
+    parser.add_argument("path", help="Turtle (.ttl) file")
+    parser.add_argument("--backend", choices=EXTRACTION_BACKENDS, default="sparql")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Cache root (see cache.py).")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    _, changes = extract_incremental(args.path, backend=args.backend, cache=IncrementalCache(args.cache_dir))
+    print(json.dumps(changes.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
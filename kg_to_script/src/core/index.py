@@ -0,0 +1,508 @@
+"""Triple-index extraction backend for the agentO pipeline.
+
+An alternative to evaluating the SPARQL constants in queries.py. The graph is
+walked once into plain dict indexes (subject → predicate → objects and
+predicate → object → subjects, rdf:type included), and every registered query
+is answered by a small hand-written handler over those indexes.
+
+``TripleIndex.query`` accepts the same query objects as ``Graph.query`` and
+yields rows with the same field names, so the extraction functions in
+extractor.py run unchanged against either backend:
+
+    index = TripleIndex(load_graph(path))
+    for row in index.query(AGENTS_QUERY): ...
+
+Handlers reproduce rdflib's row order (triple-pattern order, OPTIONAL cross
+products, UNION branch order, ORDER BY, DISTINCT) because the extractor is
+first-row / last-row sensitive in places. Both indexes are built from
+rdflib's own iteration order to make that possible.
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from itertools import product
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from rdflib import BNode, Graph, Literal, Namespace, URIRef
+from rdflib.namespace import DCTERMS, RDF, RDFS, XSD
+from rdflib.term import Node
+
+from .prepared import query_name
+
+AGENTO = Namespace("http://www.w3id.org/agentic-ai/onto#")
+AGENTO_EXT = Namespace("http://www.w3id.org/agentic-ai/ext#")
+BEAM = Namespace("http://w3id.org/beam/core#")
+
+Handler = Callable[["TripleIndex"], Iterable[tuple]]
+
+_HANDLERS: Dict[str, Tuple[type, Handler, bool]] = {}
+
+
+def _handler(name: str, fields: Sequence[str], distinct: bool = False):
+    """Register the handler answering the query constant *name*."""
+    row_type = namedtuple(f"{name.title().replace('_', '')}Row", fields)
+
+    def register(fn: Handler) -> Handler:
+        _HANDLERS[name] = (row_type, fn, distinct)
+        return fn
+
+    return register
+
+
+def _optional(values: List[Node]) -> List[Optional[Node]]:
+    """OPTIONAL semantics for a single pattern: every match, or one unbound row."""
+    return values or [None]
+
+
+def _order_key(value: Optional[Node]) -> tuple:
+    """Sort key matching rdflib's ORDER BY: unbound < blank node < IRI < literal."""
+    if value is None:
+        return (0,)
+    if isinstance(value, BNode):
+        return (1, value)
+    if isinstance(value, URIRef):
+        return (2, value)
+    return (3, value)
+
+
+class TripleIndex:
+    """In-memory subject/predicate indexes over an rdflib Graph.
+
+    Exposes ``query`` so it can stand in for the Graph during extraction.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        self._spo: Dict[Node, Dict[Node, List[Node]]] = {}
+        self._pos: Dict[Node, Dict[Node, List[Node]]] = {}
+        # (s, p, o) -> position in predicate-index order; built by restricted()
+        self._ranks: Optional[Dict[Tuple[Node, Node, Node], int]] = None
+
+        for p in set(graph.predicates()):
+            by_object = self._pos[p] = {}
+            for subj, obj in graph.subject_objects(p):
+                by_object.setdefault(obj, []).append(subj)
+                self._spo.setdefault(subj, {})
+        for subj, by_predicate in self._spo.items():
+            for p, obj in graph.predicate_objects(subj):
+                by_predicate.setdefault(p, []).append(obj)
+
+    # ── Index lookups ──
+
+    def objects(self, subject: Optional[Node], predicate: Node) -> List[Node]:
+        """Objects of (subject, predicate, ?o) in rdflib's subject-index order."""
+        return self._spo.get(subject, {}).get(predicate, [])
+
+    def subjects(self, predicate: Node, obj: Node) -> List[Node]:
+        """Subjects of (?s, predicate, obj) in rdflib's predicate-index order."""
+        return self._pos.get(predicate, {}).get(obj, [])
+
+    def pairs(self, predicate: Node) -> Iterator[Tuple[Node, Node]]:
+        """All (subject, object) pairs for *predicate* in predicate-index order."""
+        for obj, subjects in self._pos.get(predicate, {}).items():
+            for subj in subjects:
+                yield subj, obj
+
+    def predicates(self) -> List[Node]:
+        """Every predicate in the graph, in predicate-index order."""
+        return list(self._pos)
+
+    def predicate_objects(self, subject: Node) -> Iterator[Tuple[Node, Node]]:
+        """(predicate, object) pairs of *subject* in rdflib's subject-index order."""
+        for predicate, objects in self._spo.get(subject, {}).items():
+            for obj in objects:
+                yield predicate, obj
+
+    def triples(self) -> Iterator[Tuple[Node, Node, Node]]:
+        """Every (subject, predicate, object) triple, in subject-index order."""
+        for subj, by_predicate in self._spo.items():
+            for predicate, objects in by_predicate.items():
+                for obj in objects:
+                    yield subj, predicate, obj
+
+    def restricted(self, subjects: Iterable[Node]) -> "TripleIndex":
+        """A TripleIndex over only the triples whose subject is in *subjects*.
+
+        Lookups keep this index's order, so handlers produce the rows they
+        would on a graph holding just those triples. Costs O(k log k) in the
+        number of kept triples; the parent's size does not matter.
+        """
+        if self._ranks is None:
+            self._ranks = {}
+            for predicate, by_object in self._pos.items():
+                for obj, subjs in by_object.items():
+                    for subj in subjs:
+                        self._ranks[(subj, predicate, obj)] = len(self._ranks)
+
+        sub = TripleIndex.__new__(TripleIndex)
+        sub.graph = self.graph
+        sub._spo = {subj: self._spo[subj] for subj in subjects if subj in self._spo}
+        sub._pos = {}
+        sub._ranks = None
+        kept = [
+            (subj, predicate, obj)
+            for subj, by_predicate in sub._spo.items()
+            for predicate, objects in by_predicate.items()
+            for obj in objects
+        ]
+        kept.sort(key=self._ranks.__getitem__)
+        for subj, predicate, obj in kept:
+            sub._pos.setdefault(predicate, {}).setdefault(obj, []).append(subj)
+        return sub
+
+    def instances(self, cls: Node) -> List[Node]:
+        """Subjects typed as *cls* (no subclass inference, as in the SPARQL queries)."""
+        return self.subjects(RDF.type, cls)
+
+    def is_a(self, subject: Node, cls: Node) -> bool:
+        return cls in self.objects(subject, RDF.type)
+
+    # ── Graph.query stand-in ──
+
+    def query(self, query) -> List[tuple]:
+        """Answer a registered query constant (raw or prepared) from the indexes."""
+        name = query_name(query)
+        if name not in _HANDLERS:
+            raise KeyError(f"No index handler for {name}")
+        row_type, fn, distinct = _HANDLERS[name]
+        rows = [row_type(*values) for values in fn(self)]
+        if distinct:
+            rows = list(dict.fromkeys(rows))
+        return rows
+
+
+# ─────────────────────── Handler factories ───────────────────────
+
+def _register_described(
+    name: str,
+    cls: Node,
+    subject_field: str,
+    optionals: Sequence[Tuple[str, Node]],
+    distinct: bool = True,
+    exclude: Optional[Node] = None,
+) -> None:
+    """``?x a cls`` followed by one OPTIONAL per (field, predicate)."""
+    fields = [subject_field] + [field for field, _ in optionals]
+
+    @_handler(name, fields, distinct=distinct)
+    def handle(index: TripleIndex) -> Iterator[tuple]:
+        for subj in index.instances(cls):
+            if exclude is not None and index.is_a(subj, exclude):
+                continue
+            columns = [_optional(index.objects(subj, pred)) for _, pred in optionals]
+            for values in product(*columns):
+                yield (subj, *values)
+
+
+def _register_link(
+    name: str,
+    cls: Node,
+    predicate: Node,
+    fields: Tuple[str, str],
+    distinct: bool = False,
+    exclude: Optional[Node] = None,
+    exclude_object: Optional[Node] = None,
+) -> None:
+    """``?x a cls ; predicate ?y`` with optional NOT EXISTS type filters."""
+
+    @_handler(name, fields, distinct=distinct)
+    def handle(index: TripleIndex) -> Iterator[tuple]:
+        for subj in index.instances(cls):
+            if exclude is not None and index.is_a(subj, exclude):
+                continue
+            for obj in index.objects(subj, predicate):
+                if exclude_object is not None and index.is_a(obj, exclude_object):
+                    continue
+                yield subj, obj
+
+
+def _register_configs(
+    name: str,
+    cls: Node,
+    predicate: Node,
+    subject_field: Optional[str],
+    exclude: Optional[Node] = None,
+) -> None:
+    """``?x a cls ; predicate ?cfg . ?cfg :configKey ?key ; :configValue ?value``."""
+    fields = ([subject_field] if subject_field else []) + ["key", "value"]
+
+    @_handler(name, fields)
+    def handle(index: TripleIndex) -> Iterator[tuple]:
+        for subj in index.instances(cls):
+            if exclude is not None and index.is_a(subj, exclude):
+                continue
+            for cfg in index.objects(subj, predicate):
+                for key in index.objects(cfg, AGENTO.configKey):
+                    for value in index.objects(cfg, AGENTO.configValue):
+                        yield ((subj,) if subject_field else ()) + (key, value)
+
+
+# ─────────────────────── Entity queries ───────────────────────
+
+_LABEL_DESC = [("label", RDFS.label), ("desc", DCTERMS.description)]
+
+_register_described("TEAM_QUERY", AGENTO.Team, "team", _LABEL_DESC, distinct=False)
+_register_described("LLM_QUERY", AGENTO.LanguageModel, "lm", _LABEL_DESC)
+_register_described(
+    "TOOLS_QUERY", AGENTO.Tool, "tool",
+    _LABEL_DESC + [("comment", RDFS.comment)], exclude=AGENTO.LLMAgent,
+)
+_register_described(
+    "TASKS_QUERY", AGENTO.Task, "task",
+    _LABEL_DESC + [("agent", AGENTO.performedByAgent)],
+)
+_register_described(
+    "WORKFLOW_PATTERN_QUERY", AGENTO.WorkflowPattern, "wp", _LABEL_DESC, distinct=False,
+)
+_register_described("MEMORY_QUERY", AGENTO.Memory, "mem", _LABEL_DESC)
+_register_described("GOALS_QUERY", AGENTO.Goal, "goal", _LABEL_DESC)
+_register_described(
+    "CAPABILITIES_QUERY", AGENTO.Capability, "cap",
+    _LABEL_DESC + [("comment", RDFS.comment)],
+)
+_register_described(
+    "ENVIRONMENTS_QUERY", AGENTO.Environment, "env",
+    _LABEL_DESC + [("envType", AGENTO.envType)],
+)
+_register_described(
+    "OBJECTIVES_QUERY", AGENTO.Objective, "obj",
+    _LABEL_DESC + [("goal", AGENTO.contributesToGoal)],
+)
+_register_described(
+    "HUMAN_AGENTS_QUERY", AGENTO.HumanAgent, "human", [("role", AGENTO.agentRole)],
+)
+_register_described("CONSTRAINTS_QUERY", AGENTO.Constraint, "con", _LABEL_DESC)
+
+
+@_handler(
+    "AGENTS_QUERY",
+    ["agent", "agentID", "role", "label", "goal", "goalDesc", "backstory"],
+    distinct=True,
+)
+def _agents(index: TripleIndex) -> Iterator[tuple]:
+    for agent in index.instances(AGENTO.LLMAgent):
+        goals = [
+            (goal, desc)
+            for goal in index.objects(agent, AGENTO.hasAgentGoal)
+            for desc in index.objects(goal, DCTERMS.description)
+        ] or [(None, None)]
+        backstories = _optional([
+            backstory
+            for prompt in index.objects(agent, AGENTO.agentPrompt)
+            for backstory in index.objects(prompt, AGENTO.promptContext)
+        ])
+        for agent_id, role, label, (goal, goal_desc), backstory in product(
+            _optional(index.objects(agent, AGENTO.agentID)),
+            _optional(index.objects(agent, AGENTO.agentRole)),
+            _optional(index.objects(agent, RDFS.label)),
+            goals,
+            backstories,
+        ):
+            yield agent, agent_id, role, label, goal, goal_desc, backstory
+
+
+@_handler("RESOURCES_QUERY", ["res", "label", "desc", "type"], distinct=True)
+def _resources(index: TripleIndex) -> Iterator[tuple]:
+    for rtype in (BEAM.Resource, BEAM.Instance):
+        for res in index.instances(rtype):
+            for label, desc in product(
+                _optional(index.objects(res, RDFS.label)),
+                _optional(index.objects(res, DCTERMS.description)),
+            ):
+                yield res, label, desc, rtype
+
+
+# ─────────────────────── Config bags ───────────────────────
+
+_register_configs(
+    "TOOL_CONFIGS_QUERY", AGENTO.Tool, AGENTO.hasToolConfig, "tool", exclude=AGENTO.LLMAgent,
+)
+_register_configs("AGENT_ALL_CONFIGS_QUERY", AGENTO.LLMAgent, AGENTO.hasAgentConfig, "agent")
+_register_configs("TASK_CONFIG_QUERY", AGENTO.Task, AGENTO.hasAgentConfig, "task")
+_register_configs("MEMORY_CONFIG_QUERY", AGENTO.Memory, AGENTO.hasConfig, "mem")
+_register_configs(
+    "ENVIRONMENT_CONFIGS_QUERY", AGENTO.Environment, AGENTO.hasEnvironmentConfig, "env",
+)
+_register_configs("CONSTRAINT_CONFIGS_QUERY", AGENTO.Constraint, AGENTO.hasConfig, "con")
+_register_configs("SYSTEM_CONFIG_QUERY", AGENTO.Team, AGENTO.hasSystemConfig, None)
+
+
+@_handler("ENV_CONFIG_QUERY", ["key", "value"])
+def _env_config(index: TripleIndex) -> Iterator[tuple]:
+    for cfg in index.instances(AGENTO.Config):
+        for key in index.objects(cfg, AGENTO.configKey):
+            # LCASE() only accepts plain / xsd:string literals; anything else is a filter error.
+            if not isinstance(key, Literal) or key.datatype not in (None, XSD.string):
+                continue
+            lowered = str(key).lower()
+            if "api_key" not in lowered and "env" not in lowered:
+                continue
+            for value in index.objects(cfg, AGENTO.configValue):
+                yield key, value
+
+
+@_handler("KICKOFF_INPUTS_QUERY", ["key", "value", "isDefault"])
+def _kickoff_inputs(index: TripleIndex) -> Iterator[tuple]:
+    for bundle in index.instances(AGENTO_EXT.KickoffInputBundle):
+        yield from product(
+            index.objects(bundle, AGENTO_EXT.inputKey),
+            index.objects(bundle, AGENTO_EXT.inputValue),
+            index.objects(bundle, AGENTO_EXT.isDefaultValue),
+        )
+
+
+# ─────────────────────── Tasks and prompts ───────────────────────
+
+@_handler(
+    "TASK_PROMPT_QUERY",
+    ["task", "instruction", "inputData", "outputIndicator", "context"],
+)
+def _task_prompts(index: TripleIndex) -> Iterator[tuple]:
+    for task in index.instances(AGENTO.Task):
+        prompts = index.objects(task, AGENTO.taskPrompt) + index.objects(task, AGENTO.hasPrompt)
+        for prompt in prompts:
+            if not index.is_a(prompt, AGENTO.Prompt):
+                continue
+            for values in product(
+                _optional(index.objects(prompt, AGENTO.promptInstruction)),
+                _optional(index.objects(prompt, AGENTO.promptInputData)),
+                _optional(index.objects(prompt, AGENTO.promptOutputIndicator)),
+                _optional(index.objects(prompt, AGENTO.promptContext)),
+            ):
+                yield (task, *values)
+
+
+@_handler("PROMPT_INPUT_DATA_QUERY", ["inputData"], distinct=True)
+def _prompt_input_data(index: TripleIndex) -> Iterator[tuple]:
+    for prompt in index.instances(AGENTO.Prompt):
+        for input_data in index.objects(prompt, AGENTO.promptInputData):
+            yield (input_data,)
+
+
+@_handler("DEFAULT_INPUTS_QUERY", ["resource", "desc"])
+def _default_inputs(index: TripleIndex) -> Iterator[tuple]:
+    for cls in (BEAM.Resource, AGENTO.Context):
+        for resource in index.instances(cls):
+            for desc in index.objects(resource, DCTERMS.description):
+                if "input" in str(desc).lower():
+                    yield resource, desc
+
+
+# ─────────────────────── Workflow ───────────────────────
+
+_STEP_TYPES = (AGENTO.WorkflowStep, AGENTO.StartStep, AGENTO.EndStep)
+
+
+@_handler("WORKFLOW_QUERY", ["step", "stepOrder", "task", "stepType"])
+def _workflow(index: TripleIndex) -> List[tuple]:
+    rows = []
+    for step, task in index.pairs(AGENTO.hasAssociatedTask):
+        step_types = [t for t in index.objects(step, RDF.type) if t in _STEP_TYPES]
+        for step_type, order in product(
+            _optional(step_types),
+            _optional(index.objects(step, AGENTO.stepOrder)),
+        ):
+            rows.append((step, order, task, step_type))
+    rows.sort(key=lambda row: _order_key(row[1]))
+    return rows
+
+
+@_handler("STEP_EDGES_QUERY", ["source", "target"], distinct=True)
+def _step_edges(index: TripleIndex) -> Iterator[tuple]:
+    return index.pairs(AGENTO.nextStep)
+
+
+@_handler("WORKFLOW_SUB_PATTERN_QUERY", ["wp", "sub"])
+def _workflow_sub_patterns(index: TripleIndex) -> Iterator[tuple]:
+    for sub in index.instances(AGENTO.WorkflowPattern):
+        for wp in index.subjects(AGENTO.hasSubPattern, sub):
+            yield wp, sub
+
+
+@_handler("WORKFLOW_RELATED_PATTERN_QUERY", ["wp", "related"])
+def _workflow_related_patterns(index: TripleIndex) -> Iterator[tuple]:
+    for wp in index.instances(AGENTO.WorkflowPattern):
+        sub_patterns = index.objects(wp, AGENTO.hasSubPattern)
+        for related in index.objects(wp, AGENTO.hasRelatedPattern):
+            if related not in sub_patterns:
+                yield wp, related
+
+
+_register_link(
+    "WORKFLOW_STEPS_QUERY", AGENTO.WorkflowPattern, AGENTO.hasWorkflowStep, ("wp", "step"),
+)
+_register_link(
+    "WORKFLOW_NEXT_PATTERN_QUERY", AGENTO.WorkflowPattern, AGENTO.nextPattern, ("wp", "next"),
+)
+
+# ─────────────────────── Relationship queries ───────────────────────
+
+
+@_handler("AGENT_TOOLS_QUERY", ["agent", "tool"], distinct=True)
+def _agent_tools(index: TripleIndex) -> Iterator[tuple]:
+    # rdflib evaluates `?tool a :Tool` (one unbound term) before
+    # `?agent :agentToolUsage ?tool` (two), so tools come out in type order.
+    # Rank lookups keep this linear in the number of links rather than agents × tools.
+    tool_rank = {
+        tool: rank for rank, tool in enumerate(index.instances(AGENTO.Tool))
+        if not index.is_a(tool, AGENTO.LLMAgent)
+    }
+    for agent in index.instances(AGENTO.LLMAgent):
+        used = {tool for tool in index.objects(agent, AGENTO.agentToolUsage) if tool in tool_rank}
+        for tool in sorted(used, key=tool_rank.__getitem__):
+            yield agent, tool
+
+
+_register_link(
+    "AGENT_LLM_QUERY", AGENTO.LLMAgent, AGENTO.useLanguageModel, ("agent", "lm"), distinct=True,
+)
+_register_link(
+    "AGENT_KNOWLEDGE_QUERY", AGENTO.LLMAgent, AGENTO.hasKnowledge, ("agent", "knowledge"),
+    distinct=True,
+)
+_register_link("AGENT_INTERACTS_QUERY", AGENTO.LLMAgent, AGENTO.interactsWith, ("agent", "target"))
+_register_link("AGENT_OPERATES_IN_QUERY", AGENTO.LLMAgent, AGENTO.operatesIn, ("agent", "env"))
+_register_link(
+    "AGENT_CAPABILITY_QUERY", AGENTO.LLMAgent, AGENTO.hasAgentCapability, ("agent", "cap"),
+)
+_register_link("AGENT_OBJECTIVE_QUERY", AGENTO.LLMAgent, AGENTO.hasObjective, ("agent", "obj"))
+
+_register_link("TASK_PRODUCES_QUERY", AGENTO.Task, AGENTO.producedResource, ("task", "resource"))
+_register_link("TASK_REQUIRES_QUERY", AGENTO.Task, AGENTO.requiresResource, ("task", "resource"))
+_register_link(
+    "TASK_OBJECTIVE_QUERY", AGENTO.Task, AGENTO.contributesToObjective, ("task", "obj"),
+)
+_register_link(
+    "TASK_PERFORMED_BY_QUERY", AGENTO.Task, AGENTO.performedBy, ("task", "performer"),
+    exclude_object=AGENTO.LLMAgent,
+)
+_register_link("TASK_CAPABILITY_QUERY", AGENTO.Task, AGENTO.requiresCapability, ("task", "cap"))
+
+_register_link(
+    "TOOL_CAPABILITY_QUERY", AGENTO.Tool, AGENTO.hasCapability, ("tool", "cap"),
+    exclude=AGENTO.LLMAgent,
+)
+_register_link(
+    "TOOL_RESOURCE_USAGE_QUERY", AGENTO.Tool, AGENTO.resourceUsage, ("tool", "resource"),
+    exclude=AGENTO.LLMAgent,
+)
+_register_link(
+    "TOOL_TOOL_USAGE_QUERY", AGENTO.Tool, AGENTO.toolUsage, ("tool", "child"),
+    exclude=AGENTO.LLMAgent,
+)
+
+_register_link(
+    "HUMAN_PARTICIPATED_QUERY", AGENTO.HumanAgent, AGENTO.humanParticipatedIn, ("human", "task"),
+)
+_register_link(
+    "ENVIRONMENT_CONTAINS_QUERY", AGENTO.Environment, AGENTO.containsResource, ("env", "resource"),
+)
+
+_register_link("TEAM_AGENT_MEMBERS_QUERY", AGENTO.Team, AGENTO.hasAgentMember, ("team", "agent"))
+_register_link(
+    "TEAM_WORKFLOW_PATTERN_QUERY", AGENTO.Team, AGENTO.hasWorkflowPattern, ("team", "wp"),
+)
+_register_link("TEAM_GOAL_QUERY", AGENTO.Team, AGENTO.hasGoal, ("team", "goal"))
+_register_link("TEAM_TEAM_GOAL_QUERY", AGENTO.Team, AGENTO.hasTeamGoal, ("team", "goal"))
+_register_link("TEAM_OBJECTIVE_QUERY", AGENTO.Team, AGENTO.hasObjective, ("team", "obj"))
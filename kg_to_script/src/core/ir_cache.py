@@ -0,0 +1,84 @@
+"""Persistent cache of extracted AgenticProject IR.
+
+``extract_project`` is deterministic for a given TTL file and extractor code,
+yet every framework runner and both evaluators re-extract the same KGs. With
+the cache enabled, the IR is stored once under
+
+    <cache dir>/ir/<sha256(extractor fingerprint + extraction scope + raw TTL)>.pickle
+
+and every later ``extract_project`` call for the same content loads it
+instead, across processes. See cache.py for storage, eviction and the
+inspect/clear CLI.
+
+The extractor fingerprint hashes the source of every module that shapes the
+IR, so editing a query, the normalizer or the models invalidates old entries
+without a manual version bump.
+
+The cache is opt-in: pass ``cache=True`` to ``extract_project`` or set
+``KG_TO_SCRIPT_IR_CACHE=1``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Optional, Union
+
+from .cache import DiskCache, env_flag
+from .scope import FULL_SCOPE, ExtractionScope
+
+IR_CACHE_ENV = "KG_TO_SCRIPT_IR_CACHE"
+
+# Modules whose source determines extract_project() output.
+FINGERPRINT_MODULES = (
+    "extractor.py",
+    "graph.py",
+    "helpers.py",
+    "identifiers.py",
+    "index.py",
+    "models.py",
+    "normalizer.py",
+    "queries.py",
+    "scope.py",
+)
+
+_fingerprint: Optional[str] = None
+
+
+def extractor_fingerprint() -> str:
+    """SHA-256 over the source of FINGERPRINT_MODULES, computed once per process."""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256()
+        core_dir = Path(__file__).resolve().parent
+        for name in FINGERPRINT_MODULES:
+            digest.update(name.encode("utf-8") + b"\0")
+            digest.update((core_dir / name).read_bytes())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+class IRCache(DiskCache):
+    """Stores AgenticProject IR keyed by raw TTL content, extraction scope and extractor fingerprint."""
+
+    kind = "ir"
+
+    @staticmethod
+    def key_for(content: str, scope: ExtractionScope = FULL_SCOPE) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"extractor={extractor_fingerprint()}\0".encode("utf-8"))
+        digest.update(f"scope={scope.token()}\0".encode("utf-8"))
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+
+def resolve_ir_cache(cache: Union[bool, IRCache, None]) -> Optional[IRCache]:
+    """Map extract_project's *cache* argument to an IRCache (or None when disabled).
+
+    None defers to $KG_TO_SCRIPT_IR_CACHE.
+    """
+    if isinstance(cache, IRCache):
+        return cache
+    if cache is None:
+        cache = env_flag(IR_CACHE_ENV)
+    return IRCache() if cache else None
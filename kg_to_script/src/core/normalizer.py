@@ -1,93 +1,133 @@
 import re
+from typing import List, Optional
+
+# Bump whenever load_graph() can produce a different graph for the same input
+# (repair chain output or the strict-parse fast path in helpers.parse_ttl);
+# it is part of the graph cache key (graph_cache.py).
+NORMALIZER_VERSION = "2"
+
+# Repairs run in a fixed number of linear passes: two whole-document regex
+# substitutions, one line pass for the markdown/header/separator clean-up, one
+# line pass for statement periods, a prefix scan, and one literal scan.
+# Python-level work is driven by precompiled regexes that jump between the
+# few characters that matter instead of visiting every character.
+
+_MISSING_SUBJECT_COLON_RE = re.compile(r'^\s*(?!\ba\b)([a-zA-Z_][a-zA-Z0-9_-]*)\s+(\:\w+)', re.MULTILINE)
+_INVALID_PROPERTY_OBJECT_RE = re.compile(
+    r'^([ \t]+:\w+)\s+dcterms:description\s+("""[\s\S]*?"""|"[^"\\]*(?:\\.[^"\\]*)*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\')',
+    re.MULTILINE,
+)
+_NEW_SUBJECT_RE = re.compile(r'^(\:\w+|<\S+>|@prefix|@base)\b')
+_SEPARATOR_RE = re.compile(r'---+|===+')
+_DECLARED_PREFIX_RE = re.compile(r"@prefix\s+(\w+):")
+_USED_PREFIX_RE = re.compile(r"\b(\w+):(?!\/\/)\w+")
+
+# Statement-period pass: only triple-quoted strings are tracked.
+_TRIPLE_OPEN_RE = re.compile(r'"""|\'\'\'')
+_TRIPLE_CLOSE_RE = {'"': re.compile(r'\\|"""'), "'": re.compile(r"\\|'''")}
+
+# Literal pass: characters that change the scanner state.
+_LITERAL_OUTSIDE_RE = re.compile(r'[<>#"\']')
+_LITERAL_TRIPLE_RE = {'"': re.compile(r'\\|"""'), "'": re.compile(r"\\|'''")}
+_LITERAL_SINGLE_RE = {'"': re.compile(r'[\\\n"]'), "'": re.compile(r"[\\\n']")}
+_LITERAL_UPGRADED_RE = {'"': re.compile(r'[\\"]'), "'": re.compile(r"[\\']")}
+
+# Repair step names reported through normalize_ttl(repairs=...), in pass order.
+REPAIRS = (
+    "typos",
+    "subject_colons",
+    "markdown",
+    "property_objects",
+    "statement_periods",
+    "prefixes",
+    "multiline_literals",
+)
+
+_STANDARD_PREFIXES = {
+    "rdf": "@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .",
+    "rdfs": "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .",
+    "dcterms": "@prefix dcterms: <http://purl.org/dc/terms/> .",
+    "dc": "@prefix dc: <http://purl.org/dc/elements/1.1/> .",
+    "xsd": "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .",
+    "beam": "@prefix beam: <http://w3id.org/beam/core#> .",
+    "pp": "@prefix pp: <http://purl.org/net/p-plan#> .",
+}
+
+
+def normalize_ttl(content: str, repairs: Optional[List[str]] = None) -> str:
+    """Normalize and repair common syntactic/formatting issues in Turtle (.ttl) content.
+
+    When *repairs* is given, the name of every repair step that changed the
+    content is appended to it (see REPAIRS).
+    """
+    def record(name: str, before: str, after: str) -> str:
+        if repairs is not None and after != before:
+            repairs.append(name)
+        return after
 
-def normalize_ttl(content: str) -> str:
-    """Normalize and repair common syntactic/formatting issues in Turtle (.ttl) content."""
     # Repair specific syntax typos from original files
-    content = content.replace('description">', 'description>')
-    content = content.replace('(see producedResource)." ;', '(see producedResource).""" ;')
+    fixed = content.replace('description">', 'description>')
+    fixed = fixed.replace('(see producedResource)." ;', '(see producedResource).""" ;')
+    content = record("typos", content, fixed)
     # Repair missing colons on subjects (like chefAgent :agentResourceUsage -> :chefAgent :agentResourceUsage)
-    content = re.sub(r'^\s*(?!\ba\b)([a-zA-Z_][a-zA-Z0-9_-]*)\s+(\:\w+)', r':\1 \2', content, flags=re.MULTILINE)
-
-    # 1. Clean markdown code fences (often hallucinated by LLMs)
-    content = _strip_markdown_fences(content)
-    
-    # 2. Fix comment headers and separator characters
-    content = _comment_non_rdf_headers(content)
-    
-    # 3. Comment out YAML/Markdown line separators anywhere in the file
-    content = _comment_separators(content)
-    
+    content = record("subject_colons", content, _MISSING_SUBJECT_COLON_RE.sub(r':\1 \2', content))
+
+    # 1-3. Strip markdown fences, comment out non-RDF headers and separator lines
+    raw_lines = content.splitlines()
+    lines = _clean_lines(raw_lines)
+    if repairs is not None and lines != raw_lines and not (raw_lines[-1:] == [""] and lines == raw_lines[:-1]):
+        # (dropping one trailing empty line alone is not a repair)
+        repairs.append("markdown")
+
     # 4. Fix syntax errors where properties are incorrectly chained in object position
-    content = _fix_invalid_property_objects(content)
-    
+    content = "\n".join(lines)
+    content = record("property_objects", content, _fix_invalid_property_objects(content))
+
     # 5. Add missing statement periods ('.') before new subjects
-    content = _fix_missing_statement_periods(content)
-    
+    content = record("statement_periods", content, _fix_missing_statement_periods(content))
+
     # 6. Add missing standard prefix declarations
-    content = _inject_missing_prefixes(content)
-    
+    content = record("prefixes", content, _inject_missing_prefixes(content))
+
     # 7. Repair single-quoted strings that contain physical newlines into triple-quoted strings
-    content = _fix_multiline_literals(content)
-    
+    content = record("multiline_literals", content, _fix_multiline_literals(content))
+
     return content
 
 
-def _strip_markdown_fences(content: str) -> str:
-    """Remove markdown code blocks, e.g., ```turtle or ```."""
-    lines = content.splitlines()
-    cleaned_lines = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("```"):
-            continue
-        cleaned_lines.append(line)
-    return "\n".join(cleaned_lines)
+def _clean_lines(lines: List[str]) -> List[str]:
+    """Line-level clean-up in one pass.
 
+    - Remove markdown code fences (often hallucinated by LLMs), e.g. ```turtle.
+    - Comment out non-RDF lines before the first declaration/triple.
+    - Comment out YAML/Markdown separator lines (--- or ===) anywhere.
+    """
+    lines = [line for line in lines if not line.strip().startswith("```")]
+    # Historically each clean-up step re-split the joined text, which drops one
+    # trailing empty line; keep that so output stays byte-identical.
+    if lines and lines[-1] == "":
+        lines.pop()
 
-def _comment_non_rdf_headers(content: str) -> str:
-    """Comment out non-RDF/Turtle lines at the beginning of the file before any declarations/triples start."""
-    lines = content.splitlines()
     cleaned_lines = []
-    
     rdf_started = False
     for line in lines:
-        stripped = line.strip()
-        
-        if rdf_started:
-            cleaned_lines.append(line)
-            continue
-            
-        # Check if the RDF content starts here
-        if stripped.startswith("@prefix") or stripped.startswith("@base") or (stripped and not stripped.startswith("#") and stripped[0] == ":"):
-            rdf_started = True
-            cleaned_lines.append(line)
-            continue
-            
-        # If RDF hasn't started yet and the line is not empty and not already a comment, we comment it out
-        if stripped and not stripped.startswith("#"):
-            if stripped == "---":
-                cleaned_lines.append("# ---")
-            else:
-                cleaned_lines.append(f"# {line}")
-        else:
-            cleaned_lines.append(line)
-            
-    return "\n".join(cleaned_lines)
-
-
-def _comment_separators(content: str) -> str:
-    """Comment out YAML/Markdown separator lines (like --- or ===) anywhere in the file."""
-    content = re.sub(r'^---+$', r'# \g<0>', content, flags=re.MULTILINE)
-    content = re.sub(r'^===+$', r'# \g<0>', content, flags=re.MULTILINE)
-    return content
+        if not rdf_started:
+            stripped = line.strip()
+            if stripped.startswith("@prefix") or stripped.startswith("@base") or (stripped and not stripped.startswith("#") and stripped[0] == ":"):
+                rdf_started = True
+            elif stripped and not stripped.startswith("#"):
+                line = "# ---" if stripped == "---" else f"# {line}"
+        if _SEPARATOR_RE.fullmatch(line):
+            line = f"# {line}"
+        cleaned_lines.append(line)
+    return cleaned_lines
 
 
 def _fix_invalid_property_objects(content: str) -> str:
     """Fix syntax errors where 'dcterms:description' is incorrectly placed in the object position preceding a literal.
     Example: :promptInputData dcterms:description "literal" -> :promptInputData "literal"
     """
-    pattern = r'^([ \t]+:\w+)\s+dcterms:description\s+("""[\s\S]*?"""|"[^"\\]*(?:\\.[^"\\]*)*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\')'
-    return re.sub(pattern, r'\1 \2', content, flags=re.MULTILINE)
+    return _INVALID_PROPERTY_OBJECT_RE.sub(r'\1 \2', content)
 
 
 def _replace_last_char(line: str, target: str, replacement: str) -> str:
@@ -95,7 +135,7 @@ def _replace_last_char(line: str, target: str, replacement: str) -> str:
     parts = line.split('#', 1)
     code_part = parts[0]
     comment_part = f"#{parts[1]}" if len(parts) > 1 else ""
-    
+
     # Strip trailing whitespace from code part and check ending
     stripped_code = code_part.rstrip()
     if stripped_code.endswith(target):
@@ -104,205 +144,177 @@ def _replace_last_char(line: str, target: str, replacement: str) -> str:
     return line
 
 
+def _triple_string_state(line: str, string_char: Optional[str]) -> Optional[str]:
+    """Return the open triple-quote char after scanning *line* (None when outside a string)."""
+    pos = 0
+    while True:
+        if string_char is None:
+            m = _TRIPLE_OPEN_RE.search(line, pos)
+            if not m:
+                return None
+            string_char = m.group()[0]
+            pos = m.end()
+        else:
+            m = _TRIPLE_CLOSE_RE[string_char].search(line, pos)
+            while m and m.group() == "\\":
+                m = _TRIPLE_CLOSE_RE[string_char].search(line, m.end() + 1)
+            if not m:
+                return string_char
+            string_char = None
+            pos = m.end()
+
+
 def _fix_missing_statement_periods(content: str) -> str:
     """Find any statements that are missing a closing period ('.') before a new subject begins, taking care not to modify lines inside multiline string literals."""
-    lines = content.splitlines()
     cleaned_lines = []
-    
     last_rdf_line_idx = -1
-    new_subject_pattern = re.compile(r'^(\:\w+|<\S+>|@prefix|@base)\b')
-    
-    in_string = False
-    string_char = None
-    
-    for idx, line in enumerate(lines):
+    string_char: Optional[str] = None
+
+    for line in content.splitlines():
+        starts_new_subject = string_char is None and _NEW_SUBJECT_RE.match(line) is not None
+        string_char = _triple_string_state(line, string_char)
+
         stripped = line.strip()
-        
-        starts_new_subject = False
-        if not in_string and new_subject_pattern.match(line):
-            starts_new_subject = True
-            
-        # Update in_string state by scanning the line
-        chars = list(line)
-        length = len(chars)
-        c_idx = 0
-        while c_idx < length:
-            if not in_string:
-                if c_idx + 2 < length and chars[c_idx] == '"' and chars[c_idx+1] == '"' and chars[c_idx+2] == '"':
-                    in_string = True
-                    string_char = '"'
-                    c_idx += 3
-                elif c_idx + 2 < length and chars[c_idx] == "'" and chars[c_idx+1] == "'" and chars[c_idx+2] == "'":
-                    in_string = True
-                    string_char = "'"
-                    c_idx += 3
-                elif chars[c_idx] in ('"', "'"):
-                    c_idx += 1
-                else:
-                    c_idx += 1
-            else:
-                if chars[c_idx] == '\\':
-                    c_idx += 2
-                    continue
-                if chars[c_idx] == string_char and c_idx + 2 < length and chars[c_idx+1] == string_char and chars[c_idx+2] == string_char:
-                    in_string = False
-                    c_idx += 3
-                else:
-                    c_idx += 1
-                    
         if not stripped or stripped.startswith("#"):
             cleaned_lines.append(line)
             continue
-            
-        if starts_new_subject:
-            if last_rdf_line_idx != -1:
-                prev_line = cleaned_lines[last_rdf_line_idx]
-                prev_stripped = prev_line.strip()
-                if prev_stripped and not prev_stripped.endswith('.'):
-                    if prev_stripped.endswith(';'):
-                        cleaned_lines[last_rdf_line_idx] = _replace_last_char(prev_line, ';', '.')
-                    elif not prev_stripped.endswith((',', '[', ']', '.')):
-                        cleaned_lines[last_rdf_line_idx] = prev_line + " ."
-                    
+
+        if starts_new_subject and last_rdf_line_idx != -1:
+            prev_line = cleaned_lines[last_rdf_line_idx]
+            prev_stripped = prev_line.strip()
+            if prev_stripped and not prev_stripped.endswith('.'):
+                if prev_stripped.endswith(';'):
+                    cleaned_lines[last_rdf_line_idx] = _replace_last_char(prev_line, ';', '.')
+                elif not prev_stripped.endswith((',', '[', ']', '.')):
+                    cleaned_lines[last_rdf_line_idx] = prev_line + " ."
+
         cleaned_lines.append(line)
-        if not in_string:
+        if string_char is None:
             last_rdf_line_idx = len(cleaned_lines) - 1
-            
+
     return "\n".join(cleaned_lines)
 
 
 def _inject_missing_prefixes(content: str) -> str:
     """Detect used but undeclared prefixes (e.g. rdf:, rdfs:, dcterms:, xsd:, beam:) and prepend declarations."""
-    prefixes_to_add = {
-        "rdf": "@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .",
-        "rdfs": "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .",
-        "dcterms": "@prefix dcterms: <http://purl.org/dc/terms/> .",
-        "dc": "@prefix dc: <http://purl.org/dc/elements/1.1/> .",
-        "xsd": "@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .",
-        "beam": "@prefix beam: <http://w3id.org/beam/core#> .",
-        "pp": "@prefix pp: <http://purl.org/net/p-plan#> .",
-    }
-    
-    declared_prefixes = set(re.findall(r"@prefix\s+(\w+):", content))
-    
-    used_prefixes = set()
-    for match in re.findall(r"\b(\w+):(?!\/\/)\w+", content):
-        if match not in {"http", "https"}:
-            used_prefixes.add(match)
-            
-    prefix_declarations = []
-    for prefix, decl in prefixes_to_add.items():
-        if prefix in used_prefixes and prefix not in declared_prefixes:
-            prefix_declarations.append(decl)
-            
+    declared_prefixes = set(_DECLARED_PREFIX_RE.findall(content))
+    used_prefixes = set(_USED_PREFIX_RE.findall(content)) - {"http", "https"}
+
+    prefix_declarations = [
+        decl
+        for prefix, decl in _STANDARD_PREFIXES.items()
+        if prefix in used_prefixes and prefix not in declared_prefixes
+    ]
     if prefix_declarations:
         content = "\n".join(prefix_declarations) + "\n\n" + content
-        
+
     return content
 
 
 def _fix_multiline_literals(content: str) -> str:
-    """Convert single-quoted string literals that span physical newlines into valid triple-quoted string literals."""
-    chars = list(content)
-    length = len(chars)
+    """Convert single-quoted string literals that span physical newlines into valid triple-quoted string literals.
+
+    Output is assembled from slices; the opening quote of every literal is its
+    own slice so upgrading it to a triple quote is an O(1) replacement.
+    """
+    length = len(content)
+    result: List[str] = []
     i = 0
-    in_string = False
     in_uri = False
-    string_char = None  # " or '
-    is_triple = False
-    upgraded = False
-    string_start_idx = -1
-    
-    result = []
-    
+
     while i < length:
-        if not in_string:
-            # Handle URIs
-            if chars[i] == '<':
-                in_uri = True
-            elif chars[i] == '>':
-                in_uri = False
-                
-            # Handle comments
-            if chars[i] == '#' and not in_uri:
-                while i < length and chars[i] != '\n':
-                    result.append(chars[i])
-                    i += 1
-                continue
-                
-            # Check for triple quotes
-            if not in_uri and i + 2 < length and chars[i] == '"' and chars[i+1] == '"' and chars[i+2] == '"':
-                in_string = True
-                is_triple = True
-                upgraded = False
-                string_char = '"'
-                string_start_idx = len(result)
-                result.extend(['"', '"', '"'])
-                i += 3
-            elif not in_uri and i + 2 < length and chars[i] == "'" and chars[i+1] == "'" and chars[i+2] == "'":
-                in_string = True
-                is_triple = True
-                upgraded = False
-                string_char = "'"
-                string_start_idx = len(result)
-                result.extend(["'", "'", "'"])
-                i += 3
-            elif not in_uri and chars[i] in ('"', "'"):
-                in_string = True
-                is_triple = False
-                upgraded = False
-                string_char = chars[i]
-                string_start_idx = len(result)
-                result.append(chars[i])
-                i += 1
-            else:
-                result.append(chars[i])
-                i += 1
-        else:
-            # Inside a string literal
-            if chars[i] == '\\':
-                result.append(chars[i])
-                if i + 1 < length:
-                    result.append(chars[i+1])
-                    i += 2
-                else:
-                    i += 1
+        # Outside a literal: jump to the next character that changes state.
+        if in_uri:
+            end = content.find(">", i)
+            if end == -1:
+                result.append(content[i:])
+                break
+            result.append(content[i:end + 1])
+            i = end + 1
+            in_uri = False
+            continue
+
+        m = _LITERAL_OUTSIDE_RE.search(content, i)
+        if not m:
+            result.append(content[i:])
+            break
+        pos = m.start()
+        result.append(content[i:pos])
+        char = content[pos]
+
+        if char == "<":
+            in_uri = True
+            result.append(char)
+            i = pos + 1
+            continue
+        if char == ">":
+            result.append(char)
+            i = pos + 1
+            continue
+        if char == "#":
+            end = content.find("\n", pos)
+            end = length if end == -1 else end
+            result.append(content[pos:end])
+            i = end
+            continue
+
+        # Opening quote
+        if content.startswith(char * 3, pos):
+            result.append(char * 3)
+            i = _copy_literal_body(content, pos + 3, _LITERAL_TRIPLE_RE[char], char * 3, result)
+            continue
+
+        open_idx = len(result)
+        result.append(char)
+        i = pos + 1
+        while True:
+            m = _LITERAL_SINGLE_RE[char].search(content, i)
+            if not m:
+                result.append(content[i:])
+                return "".join(result)
+            pos = m.start()
+            found = content[pos]
+            if found == "\\":
+                result.append(content[i:pos + 2])
+                i = pos + 2
                 continue
-            
-            if is_triple:
-                if not upgraded:
-                    # Standard triple quote close
-                    if chars[i] == string_char and i + 2 < length and chars[i+1] == string_char and chars[i+2] == string_char:
-                        in_string = False
-                        result.extend([string_char, string_char, string_char])
-                        i += 3
-                    else:
-                        result.append(chars[i])
-                        i += 1
-                else:
-                    # Upgraded triple quote close (originally single-quoted, so it only has one quote at the end)
-                    if chars[i] == string_char:
-                        in_string = False
-                        result.extend([string_char, string_char, string_char])
-                        i += 1
-                    else:
-                        result.append(chars[i])
-                        i += 1
-            else:
-                # Inside single-quoted string literal
-                if chars[i] == string_char:
-                    in_string = False
-                    result.append(chars[i])
-                    i += 1
-                elif chars[i] == '\n':
-                    # Upgrade to triple quotes
-                    result.insert(string_start_idx, string_char * 2)
-                    is_triple = True
-                    upgraded = True
-                    result.append(chars[i])
-                    i += 1
-                else:
-                    result.append(chars[i])
-                    i += 1
-                    
+            if found == char:
+                result.append(content[i:pos + 1])
+                i = pos + 1
+                break
+            # Physical newline: upgrade to a triple-quoted literal
+            result[open_idx] = char * 3
+            result.append(content[i:pos + 1])
+            i = _copy_literal_body(content, pos + 1, _LITERAL_UPGRADED_RE[char], char, result, closing=char * 3)
+            break
+
     return "".join(result)
+
+
+def _copy_literal_body(
+    content: str,
+    start: int,
+    pattern: "re.Pattern[str]",
+    terminator: str,
+    result: List[str],
+    closing: Optional[str] = None,
+) -> int:
+    """Copy a literal body up to and including *terminator* (skipping backslash escapes).
+
+    The terminator is emitted as *closing* when given. Returns the index just
+    past the terminator, or len(content) for an unterminated literal.
+    """
+    i = start
+    while True:
+        m = pattern.search(content, i)
+        if not m:
+            result.append(content[i:])
+            return len(content)
+        pos = m.start()
+        if m.group() == "\\":
+            result.append(content[i:pos + 2])
+            i = pos + 2
+            continue
+        result.append(content[i:pos])
+        result.append(closing or terminator)
+        return pos + len(terminator)
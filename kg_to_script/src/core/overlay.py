@@ -0,0 +1,46 @@
+"""Copy-on-write patching of the shared canonical IR.
+
+One extracted AgenticProject is adapted for several frameworks in turn
+(evaluation/interop_run.py), so adapters must not modify it. Instead of
+deep-copying the whole project, an adapter builds an overlay: every model it
+changes is replaced by a shallow copy carrying the new field values, and
+every model it leaves alone is the canonical object itself.
+
+    agents = patch_each(project.agents, _with_agent_fallbacks)
+    project = patched(project, agents=agents)
+
+The cost is proportional to the number of changed models, plus one list of
+references per patched collection. Nothing in the overlay may be modified in
+place, because most of it is shared with the canonical project and with the
+other adapters' overlays.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, List, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def patched(model: M, **changes: Any) -> M:
+    """*model* with *changes* applied, without touching *model*.
+
+    Returns *model* itself when every change equals the current value,
+    otherwise a shallow copy; unchanged fields stay shared.
+    """
+    values = model.__dict__
+    changes = {
+        field: value for field, value in changes.items()
+        if values[field] is not value and values[field] != value
+    }
+    return model.model_copy(update=changes) if changes else model
+
+
+def patch_each(models: List[M], patch: Callable[[M], M]) -> List[M]:
+    """Apply *patch* to every model; returns *models* itself when nothing changed."""
+    result = [patch(model) for model in models]
+    if all(new is old for new, old in zip(result, models)):
+        return models
+    return result
@@ -0,0 +1,121 @@
+"""Partition a multi-team KG into one sub-graph per :Team.
+
+The extraction queries assume one team per graph (``_extract_team`` takes the
+first TEAM_QUERY row). Large KGs such as the public AgentO graph describe
+many teams at once, so ``extract_teams`` splits the graph first and extracts
+each part:
+
+    for project in extract_teams("agento.ttl"):
+        adapt(project)
+
+A team's partition holds every triple whose subject is one of its members:
+
+  1. Individuals reachable from the team along object links. rdf:type
+     objects (classes) and other :Team nodes are not entered.
+  2. Individuals no team reaches, attached through links into the team's
+     exclusive members (e.g. a task pointing at one of its agents), together
+     with everything they reach in turn.
+
+Shared individuals (a language model used by two teams) belong to every
+partition that reaches them; individuals linked to no team are left out.
+One TripleIndex is built for the whole graph; the walks and the per-team
+restricted indexes cost time linear in the total partition size, not
+teams × graph.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+from rdflib import BNode, Graph, URIRef
+from rdflib.namespace import RDF
+from rdflib.term import Node
+
+from .extractor import extract_project_from_graph
+from .helpers import load_graph
+from .index import AGENTO, TripleIndex
+from .models import AgenticProject
+
+
+def partition_by_team(graph: Graph) -> Dict[Node, TripleIndex]:
+    """Split *graph* into one TripleIndex per :Team individual, keyed by team IRI.
+
+    Each partition is a restricted view of one shared index and answers the
+    extraction queries exactly as a graph holding only its triples would.
+    """
+    index = TripleIndex(graph)
+    teams = index.instances(AGENTO.Team)
+    team_set = set(teams)
+
+    # Reverse links (object -> subjects), built once for the attachment pass.
+    incoming: Dict[Node, List[Node]] = {}
+    for predicate in graph.predicates(unique=True):
+        if predicate == RDF.type:
+            continue
+        for subj, obj in index.pairs(predicate):
+            if _is_individual(obj):
+                incoming.setdefault(obj, []).append(subj)
+
+    # 1. Forward reachability per team.
+    members: Dict[Node, Set[Node]] = {team: _reach(index, [team], team_set) for team in teams}
+    owners: Dict[Node, int] = {}
+    for reached in members.values():
+        for node in reached:
+            owners[node] = owners.get(node, 0) + 1
+
+    # 2. Attach unreached individuals through links into exclusive members.
+    blocked = team_set | owners.keys()
+    for team, reached in members.items():
+        frontier = [
+            subj
+            for node in reached
+            if owners[node] == 1
+            for subj in incoming.get(node, ())
+            if subj not in owners and subj not in team_set
+        ]
+        if frontier:
+            reached |= _reach(index, frontier, blocked, incoming)
+
+    return {team: index.restricted(reached) for team, reached in members.items()}
+
+
+def _is_individual(node: Node) -> bool:
+    return isinstance(node, (URIRef, BNode))
+
+
+def _reach(
+    index: TripleIndex,
+    start: Iterable[Node],
+    blocked: Set[Node],
+    incoming: Optional[Dict[Node, List[Node]]] = None,
+) -> Set[Node]:
+    """Nodes reachable from *start* along object links, never entering *blocked*.
+
+    With *incoming*, links are also followed backwards (undirected walk).
+    """
+    seen: Set[Node] = set(start)
+    queue = deque(seen)
+    while queue:
+        node = queue.popleft()
+        neighbours = [obj for predicate, obj in index.predicate_objects(node) if predicate != RDF.type]
+        if incoming is not None:
+            neighbours.extend(incoming.get(node, ()))
+        for nxt in neighbours:
+            if nxt not in seen and nxt not in blocked and _is_individual(nxt):
+                seen.add(nxt)
+                queue.append(nxt)
+    return seen
+
+
+def extract_teams(file_path: str, backend: str = "sparql") -> List[AgenticProject]:
+    """Parse a KG once and return one AgenticProject per :Team, in graph order.
+
+    Graphs with at most one team are extracted whole with *backend*, exactly
+    like extract_project(). Partitions are always answered by their index.
+    """
+    graph = load_graph(file_path)
+    teams = list(graph.subjects(RDF.type, AGENTO.Team))
+    if len(teams) <= 1:
+        return [extract_project_from_graph(graph, backend=backend)]
+    return [extract_project_from_graph(part) for part in partition_by_team(graph).values()]
@@ -0,0 +1,66 @@
+"""Prepared-query registry for the agentO extraction pipeline.
+
+Every ``*_QUERY`` constant in queries.py is parsed and translated into SPARQL
+algebra once per process and then reused for every graph. Passing a raw string
+to ``Graph.query`` makes rdflib re-parse and re-algebrize it on each call,
+which dominates extraction time on batch runs.
+
+Compiled queries are exposed under the same names as the raw constants, so
+callers only need to change the module they import from:
+
+    from .prepared import AGENTS_QUERY
+    for row in g.query(AGENTS_QUERY): ...
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple, Union
+
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.sparql import Query
+
+from . import queries
+
+QUERY_NAMES: Tuple[str, ...] = tuple(
+    sorted(name for name in vars(queries) if name.endswith("_QUERY"))
+)
+
+_PREPARED: Dict[str, Query] = {}
+_NAMES_BY_ID: Dict[int, str] = {}
+_NAMES_BY_TEXT: Dict[str, str] = {getattr(queries, name): name for name in QUERY_NAMES}
+
+
+def get_prepared(name: str) -> Query:
+    """Return the compiled form of the query constant *name*, compiling it on first use."""
+    query = _PREPARED.get(name)
+    if query is None:
+        if name not in QUERY_NAMES:
+            raise KeyError(f"Unknown query constant: {name}")
+        query = prepareQuery(getattr(queries, name))
+        _PREPARED[name] = query
+        _NAMES_BY_ID[id(query)] = name
+    return query
+
+
+def query_name(query: Union[str, Query]) -> str:
+    """Return the constant name for a registered query, given either its raw text or compiled form."""
+    if isinstance(query, str):
+        name = _NAMES_BY_TEXT.get(query)
+    else:
+        name = _NAMES_BY_ID.get(id(query))
+    if name is None:
+        raise KeyError("Query is not registered in queries.py")
+    return name
+
+
+def prepare_all() -> Dict[str, Query]:
+    """Compile every registered query and return them keyed by constant name."""
+    return {name: get_prepared(name) for name in QUERY_NAMES}
+
+
+def __getattr__(name: str) -> Query:
+    # PEP 562 module attribute hook: `from .prepared import AGENTS_QUERY`
+    # resolves to the compiled query for queries.AGENTS_QUERY.
+    if name in QUERY_NAMES:
+        return get_prepared(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,250 @@
+"""Opt-in extraction profiler.
+
+Enabled per call with ``extract_project(path, profile=...)`` /
+``extract_projects(paths, profile=...)`` or for every call through
+``$KG_TO_SCRIPT_PROFILE``:
+
+    profile=True / KG_TO_SCRIPT_PROFILE=1       log one "[Profile] {json}" line per KG
+    profile="prof.jsonl" / KG_TO_SCRIPT_PROFILE=prof.jsonl
+                                                append one JSON record per KG to the file
+
+A record holds the wall time of the loading stages (load_graph, which
+includes parse and normalize_ttl, and build_index for backend="index"), of
+every ``_extract_*`` / ``_link_*`` function, and per query constant the call
+count, evaluation time, row count and the time the extractor spent
+converting the rows into IR. Batch results carry
+their record in ExtractionResult.profile. Summarize records across KGs with:
+
+    python -m src.core.profiler prof.jsonl [--top N]
+
+When profiling is off, the hooks cost one ContextVar lookup per call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
+
+from .prepared import query_name
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "KG_TO_SCRIPT_PROFILE"
+
+# Sentinel target: log the record instead of appending it to a file.
+LOG_TARGET = "-"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class QueryStats:
+    calls: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+    convert_seconds: float = 0.0
+
+
+@dataclass
+class ExtractionProfile:
+    """Timings for one extract_project() call."""
+
+    path: str
+    total_seconds: float = 0.0
+    stages: Dict[str, float] = field(default_factory=dict)
+    functions: Dict[str, float] = field(default_factory=dict)
+    queries: Dict[str, QueryStats] = field(default_factory=dict)
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_ACTIVE: ContextVar[Optional[ExtractionProfile]] = ContextVar("extraction_profile", default=None)
+
+
+def active_profile() -> Optional[ExtractionProfile]:
+    """The profile being recorded in this context, if any."""
+    return _ACTIVE.get()
+
+
+@contextlib.contextmanager
+def profiling(path: str) -> Iterator[ExtractionProfile]:
+    """Record an ExtractionProfile for everything run inside the block."""
+    profile = ExtractionProfile(path=path)
+    token = _ACTIVE.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_seconds = time.perf_counter() - start
+        _ACTIVE.reset(token)
+
+
+@contextlib.contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Add the block's wall time to stage *name* of the active profile."""
+    profile = _ACTIVE.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_stage(name, time.perf_counter() - start)
+
+
+def timed(fn: F) -> F:
+    """Record the wall time of every call to *fn* under its name."""
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profile = _ACTIVE.get()
+        if profile is None:
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            profile.functions[name] = profile.functions.get(name, 0.0) + elapsed
+
+    return wrapper  # type: ignore[return-value]
+
+
+class ProfiledGraph:
+    """Wraps anything with ``query()`` (Graph, TripleIndex, ...) and records per-query stats.
+
+    Rows are evaluated eagerly to time the query itself; the time the caller
+    spends between rows is recorded as conversion time.
+    """
+
+    def __init__(self, graph: Any, profile: ExtractionProfile) -> None:
+        self.graph = graph
+        self.profile = profile
+
+    def query(self, query) -> Iterator[Any]:
+        name = query_name(query)
+        stats = self.profile.queries.get(name)
+        if stats is None:
+            stats = self.profile.queries[name] = QueryStats()
+        start = time.perf_counter()
+        rows = list(self.graph.query(query))
+        stats.seconds += time.perf_counter() - start
+        stats.calls += 1
+        stats.rows += len(rows)
+        return self._convert(rows, stats)
+
+    @staticmethod
+    def _convert(rows: List[Any], stats: QueryStats) -> Iterator[Any]:
+        for row in rows:
+            start = time.perf_counter()
+            yield row
+            stats.convert_seconds += time.perf_counter() - start
+
+
+def profile_graph(graph: Any) -> Any:
+    """Return *graph* wrapped in a ProfiledGraph when profiling is active."""
+    profile = _ACTIVE.get()
+    return graph if profile is None else ProfiledGraph(graph, profile)
+
+
+def resolve_profile(profile: Union[bool, str, Path, None]) -> Optional[str]:
+    """Map the *profile* argument to a target: a JSON-lines path, LOG_TARGET, or None (off).
+
+    None defers to $KG_TO_SCRIPT_PROFILE ("1"/"true"/... to log, anything
+    else is a path).
+    """
+    if profile is None:
+        profile = os.environ.get(PROFILE_ENV, "").strip()
+        if profile.lower() in ("", "0", "false", "no", "off"):
+            return None
+        if profile.lower() in ("1", "true", "yes", "on"):
+            return LOG_TARGET
+    if profile is True:
+        return LOG_TARGET
+    if not profile:
+        return None
+    return str(profile)
+
+
+def emit_profile(profile: ExtractionProfile, target: str) -> None:
+    """Log *profile* as JSON or append it to the JSON-lines file *target*."""
+    line = json.dumps(profile.to_dict(), sort_keys=True)
+    if target == LOG_TARGET:
+        logger.info("[Profile] %s", line)
+        return
+    # One write per record keeps lines whole when worker processes share the file.
+    with open(target, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def load_profiles(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read the records of a JSON-lines profile file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(records: Iterable[Dict[str, Any]], top: int = 15) -> str:
+    """Render a summary table of profile records (ExtractionProfile.to_dict() form)."""
+    records = [record for record in records if record]
+    stages: Dict[str, float] = {}
+    functions: Dict[str, float] = {}
+    queries: Dict[str, QueryStats] = {}
+    total = 0.0
+    for record in records:
+        total += record["total_seconds"]
+        for name, seconds in record["stages"].items():
+            stages[name] = stages.get(name, 0.0) + seconds
+        for name, seconds in record["functions"].items():
+            functions[name] = functions.get(name, 0.0) + seconds
+        for name, values in record["queries"].items():
+            stats = queries.setdefault(name, QueryStats())
+            stats.calls += values["calls"]
+            stats.seconds += values["seconds"]
+            stats.rows += values["rows"]
+            stats.convert_seconds += values["convert_seconds"]
+
+    def share(seconds: float) -> str:
+        return f"{100 * seconds / total:5.1f}%" if total else "    -"
+
+    lines = ["=" * 72, f"  Extraction profile: {len(records)} KGs, {total * 1000:.1f} ms total", "=" * 72]
+    lines.append(f"  {'stage':<40} {'ms':>10} {'share':>7}")
+    for name, seconds in sorted(stages.items(), key=lambda item: -item[1]):
+        lines.append(f"  {name:<40} {seconds * 1000:>10.1f} {share(seconds):>7}")
+    lines += ["-" * 72, f"  {'function':<40} {'ms':>10} {'share':>7}"]
+    for name, seconds in sorted(functions.items(), key=lambda item: -item[1])[:top]:
+        lines.append(f"  {name:<40} {seconds * 1000:>10.1f} {share(seconds):>7}")
+    lines += ["-" * 72, f"  {'query':<32} {'calls':>6} {'rows':>7} {'query ms':>10} {'convert ms':>11}"]
+    for name, stats in sorted(queries.items(), key=lambda item: -item[1].seconds)[:top]:
+        lines.append(
+            f"  {name:<32} {stats.calls:>6} {stats.rows:>7} "
+            f"{stats.seconds * 1000:>10.1f} {stats.convert_seconds * 1000:>11.1f}"
+        )
+    lines.append("=" * 72)
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarize extraction profile records.")
+    parser.add_argument("path", type=Path, help="JSON-lines file written with profile=<path>.")
+    parser.add_argument("--top", type=int, default=15, help="Rows shown for functions and queries.")
+    args = parser.parse_args()
+    print(summarize(load_profiles(args.path), top=args.top))
+
+
+if __name__ == "__main__":
+    main()
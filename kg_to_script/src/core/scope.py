@@ -0,0 +1,84 @@
+"""Extraction scopes: which optional parts of the IR extract_project() fills.
+
+Team, agents, tasks, tools, language models and workflows are always
+extracted. Everything else is optional: the collections in COLLECTIONS and
+the cross-entity linking passes in RELATIONS. Each adapter declares the scope
+its adapter, generator and templates consume as ``EXTRACTION_SCOPE`` in its
+adapter.py, and run.py passes it on:
+
+    project = adapt(extract_project(kg_path, scope=EXTRACTION_SCOPE))
+
+Parts outside the scope keep their model defaults (empty lists, None) and
+their queries are never run. FULL_SCOPE, the default, extracts everything;
+evaluation and any code that inspects the whole IR should keep using it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import FrozenSet
+
+# Optional AgenticProject collections. task.human_input is derived from
+# human_agents, so scopes that read human_input need "human_agents".
+COLLECTIONS = (
+    "memories",
+    "input_variables",
+    "env_vars",
+    "goals",
+    "capabilities",
+    "environments",
+    "objectives",
+    "human_agents",
+    "resources",
+    "constraints",
+)
+
+# Linking passes and the fields they fill:
+#   agent_relations     agent.interacts_with / operates_in_iri / capability_iris / objective_iris
+#   task_relations      task.contributes_to_objective_iri / requires_capability_iris / performed_by_iri
+#   tool_relations      tool.capability_iris / resource_usage_iris / tool_usage_iris
+#   team_relations      project.agent_member_iris / workflow_pattern_iris / goal_iris / objective_iris
+#   workflow_relations  pattern.related_pattern_iris / next_pattern_iri
+RELATIONS = (
+    "agent_relations",
+    "task_relations",
+    "tool_relations",
+    "team_relations",
+    "workflow_relations",
+)
+
+
+@dataclass(frozen=True)
+class ExtractionScope:
+    """The optional collections and relation passes an IR consumer needs."""
+
+    collections: FrozenSet[str] = frozenset(COLLECTIONS)
+    relations: FrozenSet[str] = frozenset(RELATIONS)
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of names; store frozensets so scopes hash and compare.
+        object.__setattr__(self, "collections", frozenset(self.collections))
+        object.__setattr__(self, "relations", frozenset(self.relations))
+        unknown = sorted(
+            (self.collections - set(COLLECTIONS)) | (self.relations - set(RELATIONS))
+        )
+        if unknown:
+            raise ValueError(f"Unknown extraction scope entries: {unknown}")
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.collections) == len(COLLECTIONS) and len(self.relations) == len(RELATIONS)
+
+    def union(self, *others: "ExtractionScope") -> "ExtractionScope":
+        """The smallest scope covering this one and *others* (e.g. one extraction for several adapters)."""
+        return ExtractionScope(
+            collections=self.collections.union(*(other.collections for other in others)),
+            relations=self.relations.union(*(other.relations for other in others)),
+        )
+
+    def token(self) -> str:
+        """Stable text form, e.g. for cache keys."""
+        return ",".join(sorted(self.collections)) + "|" + ",".join(sorted(self.relations))
+
+
+FULL_SCOPE = ExtractionScope()
@@ -0,0 +1,92 @@
+"""Graph-store backends: who parses a KG and builds the triples extraction runs on.
+
+``load_graph(path, store=...)`` selects one of GRAPH_STORES:
+
+  - "rdflib": rdflib's pure-Python Turtle parser (the default).
+  - "oxigraph": the native Rust parser from pyoxigraph (optional dependency,
+    ``pip install kg_to_script[oxigraph]``).
+
+Either way the result is an rdflib Graph holding the same triples in the same
+order, so the queries in queries.py and both query backends (extractor.py
+EXTRACTION_BACKENDS) run unchanged and produce identical IR. Queries are not
+evaluated inside oxigraph itself: its engine returns rows in its own index
+order, and the extractor is row-order sensitive (first row wins, duplicate
+OPTIONAL rows), so the IR would change.
+
+The oxigraph store only speeds up parsing, 2-3x on the corpus. That pays off
+with backend="index", where parsing is most of the cost: extraction is about
+2x faster than with the rdflib store. With backend="sparql", query
+evaluation dominates and the two stores are within run-to-run noise.
+Importing pyoxigraph adds a fixed ~11 MB of resident memory. See
+benchmarks/stores.py.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.namespace import XSD
+from rdflib.term import Node
+
+GRAPH_STORES = ("rdflib", "oxigraph")
+
+
+def parse_turtle(data: str, identifier: Optional[URIRef] = None, store: str = "rdflib") -> Graph:
+    """Parse Turtle *data* into a Graph named *identifier* using *store*.
+
+    Raises on invalid Turtle (BadSyntax/SyntaxError and friends), like
+    Graph.parse, so callers can fall back to the repair chain.
+    """
+    if store == "rdflib":
+        g = Graph(identifier=identifier)
+        g.parse(data=data, format="turtle")
+        return g
+    if store == "oxigraph":
+        return _parse_oxigraph(data, identifier)
+    raise ValueError(f"Unknown graph store: {store!r} (expected one of {GRAPH_STORES})")
+
+
+def _parse_oxigraph(data: str, identifier: Optional[URIRef]) -> Graph:
+    try:
+        import pyoxigraph
+    except ImportError as exc:
+        raise ImportError(
+            'store="oxigraph" needs pyoxigraph: pip install "kg_to_script[oxigraph]"'
+        ) from exc
+
+    g = Graph(identifier=identifier)
+    to_rdflib = _term_converter(pyoxigraph)
+    add = g.add
+    # The parser streams triples in document order, which is the order
+    # rdflib's own Turtle parser inserts them in.
+    for triple in pyoxigraph.parse(data, format=pyoxigraph.RdfFormat.TURTLE):
+        add((to_rdflib(triple.subject), to_rdflib(triple.predicate), to_rdflib(triple.object)))
+    return g
+
+
+def _term_converter(pyoxigraph) -> Callable[[object], Node]:
+    """Return a memoized pyoxigraph term → rdflib term conversion."""
+    named_node = pyoxigraph.NamedNode
+    blank_node = pyoxigraph.BlankNode
+    xsd_string = str(XSD.string)
+    converted: Dict[object, Node] = {}
+
+    def to_rdflib(term) -> Node:
+        node = converted.get(term)
+        if node is None:
+            if isinstance(term, named_node):
+                node = URIRef(term.value)
+            elif isinstance(term, blank_node):
+                node = BNode(term.value)
+            elif term.language:
+                node = Literal(term.value, lang=term.language)
+            elif term.datatype.value == xsd_string:
+                # rdflib keeps plain literals untyped.
+                node = Literal(term.value)
+            else:
+                node = Literal(term.value, datatype=URIRef(term.datatype.value))
+            converted[term] = node
+        return node
+
+    return to_rdflib
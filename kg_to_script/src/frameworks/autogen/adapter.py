@@ -2,9 +2,27 @@ from __future__ import annotations
 
 from typing import Dict, List
 
-from ...core.models import AgenticProject, TaskModel
+from ...core.compact import as_project
+from ...core.models import AgenticProject, AgentModel, TaskModel
+from ...core.overlay import patch_each, patched
+from ...core.scope import ExtractionScope
 from .models import AutoGenProject
 
+# What the adapter and team.py.j2 read beyond agents, tasks, tools and workflows.
+EXTRACTION_SCOPE = ExtractionScope(
+    collections=(
+        "input_variables",
+        "goals",
+        "capabilities",
+        "environments",
+        "objectives",
+        "human_agents",
+        "resources",
+        "constraints",
+    ),
+    relations=(),
+)
+
 
 def _resolve_model_name(project: AgenticProject) -> str:
     if project.language_models and project.language_models[0].model_name:
@@ -33,31 +51,41 @@ def _build_ordered_tasks(project: AgenticProject) -> List[TaskModel]:
     return ordered or list(project.tasks)
 
 
+def _with_agent_fallbacks(agent: AgentModel) -> AgentModel:
+    role = agent.role or "LLM Agent"
+    backstory = agent.backstory or agent.system_prompt or f"You are a {role}."
+    return patched(
+        agent,
+        role=role,
+        goal=agent.goal or role,
+        backstory=backstory,
+        system_prompt=agent.system_prompt or backstory,
+    )
+
+
+def _with_task_fallbacks(task: TaskModel) -> TaskModel:
+    return patched(
+        task,
+        description=(
+            task.description or task.prompt_instruction or task.var_name.replace("_", " ").title()
+        ),
+        expected_output=task.expected_output or f"Completed: {task.var_name}",
+    )
+
+
 def adapt(project: AgenticProject) -> AutoGenProject:
-    """Map AgenticProject into AutoGenProject for the AutoGen generator."""
-    project = project.model_copy(deep=True)
+    """Map AgenticProject into AutoGenProject for the AutoGen generator.
+
+    *project* is never modified: agents and tasks that need fallback values
+    are patched copies (core/overlay.py), everything else is shared.
+    """
+    project = as_project(project)
     # Ensure fallbacks are applied for Agent and Task values that may be missing in Core
-    for agent in project.agents:
-        if not agent.role:
-            agent.role = "LLM Agent"
-        if not agent.goal:
-            agent.goal = agent.role
-        if not agent.backstory and agent.system_prompt:
-            agent.backstory = agent.system_prompt
-        if not agent.system_prompt and agent.backstory:
-            agent.system_prompt = agent.backstory
-        if not agent.backstory:
-            agent.backstory = f"You are a {agent.role}."
-        if not agent.system_prompt:
-            agent.system_prompt = agent.backstory
-
-    for task in project.tasks:
-        if not task.description and task.prompt_instruction:
-            task.description = task.prompt_instruction
-        if not task.description:
-            task.description = task.var_name.replace("_", " ").title()
-        if not task.expected_output:
-            task.expected_output = f"Completed: {task.var_name}"
+    project = patched(
+        project,
+        agents=patch_each(project.agents, _with_agent_fallbacks),
+        tasks=patch_each(project.tasks, _with_task_fallbacks),
+    )
 
     return AutoGenProject(
         name=project.name,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
@@ -14,6 +14,7 @@ from ...core.models import (
     ObjectiveModel,
     ResourceModel,
 )
+from ..emit import Emitter, OutputSink
 from .models import AutoGenProject
 
 
@@ -148,29 +149,25 @@ def _build_tool_context(project: AutoGenProject):
     return tool_defs
 
 
-def generate_project(project: AutoGenProject, output_dir: str) -> str:
-    os.makedirs(output_dir, exist_ok=True)
-
+def generate_project(project: AutoGenProject, output_dir: str, sink: Optional[OutputSink] = None) -> str:
     env = _create_jinja_env()
 
-    team_template = env.get_template("team.py.j2")
-    team_ctx = _build_team_context(project)
-    with open(os.path.join(output_dir, "team.py"), "w", encoding="utf-8") as f:
-        f.write(team_template.render(**team_ctx))
+    with Emitter(output_dir, sink) as out:
+        team_template = env.get_template("team.py.j2")
+        team_ctx = _build_team_context(project)
+        out.write_text("team.py", team_template.render(**team_ctx))
 
-    main_template = env.get_template("main.py.j2")
-    main_ctx = _build_main_context(project)
-    with open(os.path.join(output_dir, "main.py"), "w", encoding="utf-8") as f:
-        f.write(main_template.render(**main_ctx))
+        main_template = env.get_template("main.py.j2")
+        main_ctx = _build_main_context(project)
+        out.write_text("main.py", main_template.render(**main_ctx))
 
-    requirements = """
+        requirements = """
 autogen-agentchat>=0.4.0
 autogen-ext>=0.4.0
 openai
 python-dotenv
 """
 
-    with open(os.path.join(output_dir, "requirements.txt"), "w", encoding="utf-8") as f:
-        f.write(requirements.strip())
+        out.write_text("requirements.txt", requirements.strip())
 
     return output_dir
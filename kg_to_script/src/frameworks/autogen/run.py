@@ -2,25 +2,32 @@
 CLI Runner: batch-process generated_kgs/AutoGen/*.ttl → AutoGen project directories.
 
 Pipeline: KG (.ttl) → agnostic extraction → AutoGen adapter → code generation.
+
+Usage:
+    python -m src.frameworks.autogen.run [--jobs N]
+    python -m src.frameworks.autogen.run path/to/file.ttl
 """
 
 import os
-import shutil
 import sys
 
 try:
     from ...core.extractor import extract_project
-    from .adapter import adapt
+    from .adapter import EXTRACTION_SCOPE, adapt
     from .generator import generate_project
+    from ..batch import BatchItem, parse_runner_args, run_batch
+    from ..build_cache import plan_build
 except ImportError:
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
     from src.core.extractor import extract_project
-    from src.frameworks.autogen.adapter import adapt
+    from src.frameworks.autogen.adapter import EXTRACTION_SCOPE, adapt
     from src.frameworks.autogen.generator import generate_project
+    from src.frameworks.batch import BatchItem, parse_runner_args, run_batch
+    from src.frameworks.build_cache import plan_build
 
 
 def process_single(kg_path: str, output_dir: str) -> str:
-    project = adapt(extract_project(kg_path))
+    project = adapt(extract_project(kg_path, scope=EXTRACTION_SCOPE))
     return generate_project(project, output_dir)
 
 
@@ -29,8 +36,9 @@ def main() -> None:
     kg_dir = os.path.abspath(os.path.join(project_root, "..", "script_to_kg", "generated_kgs", "AutoGen"))
     output_base = os.path.join(project_root, "generated_projects", "output_autogen")
 
-    if len(sys.argv) > 1 and sys.argv[1].endswith(".ttl"):
-        kg_path = os.path.abspath(sys.argv[1])
+    args = parse_runner_args(__doc__)
+    if args.kg_path:
+        kg_path = os.path.abspath(args.kg_path)
         base_name = os.path.splitext(os.path.basename(kg_path))[0]
         output_dir = os.path.join(output_base, base_name.replace("_instances", ""))
         print(f"[Processing] {kg_path}")
@@ -47,24 +55,25 @@ def main() -> None:
         print(f"[WARNING] No .ttl files found in {kg_dir}")
         return
 
-    if os.path.exists(output_base):
-        shutil.rmtree(output_base)
-    os.makedirs(output_base, exist_ok=True)
-
-    success = 0
+    items = [
+        BatchItem(os.path.join(kg_dir, filename), os.path.join(output_base, os.path.splitext(filename)[0].replace("_instances", "")))
+        for filename in ttl_files
+    ]
+    plan = plan_build("autogen", output_base, items, force=args.force)
+    success = len(plan.fresh)
     failures = []
-    for filename in ttl_files:
-        kg_path = os.path.join(kg_dir, filename)
-        output_dir = os.path.join(output_base, os.path.splitext(filename)[0].replace("_instances", ""))
-        print(f"[Processing] {filename}")
-        try:
-            process_single(kg_path, output_dir)
-            success += 1
-        except Exception as exc:
-            failures.append((filename, str(exc)))
-            print(f"  [ERROR] {exc}")
+    try:
+        for result in run_batch(process_single, plan.stale, jobs=args.jobs, on_start=lambda item: print(f"[Processing] {item.name}")):
+            plan.record(result)
+            if result.ok:
+                success += 1
+            else:
+                failures.append((result.item.name, result.error))
+                print(f"  [ERROR] {result.error}")
+    finally:
+        plan.save()
 
-    print(f"[Done] {success}/{len(ttl_files)} generated")
+    print(f"[Done] {success}/{len(ttl_files)} generated ({plan.summary()})")
     if failures:
         for name, error in failures:
             print(f"  - {name}: {error}")
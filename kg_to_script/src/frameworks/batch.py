@@ -0,0 +1,172 @@
+"""
+Batch mode shared by the framework runners (``src.frameworks.<target>.run``).
+
+Every runner accepts the same arguments:
+
+    python -m src.frameworks.crewai.run                 # all KGs, one after another
+    python -m src.frameworks.crewai.run --jobs 4        # all KGs on a 4-process pool
+    python -m src.frameworks.crewai.run --jobs 0        # one process per CPU
+    python -m src.frameworks.crewai.run --force         # ignore the build manifest (build_cache.py)
+    python -m src.frameworks.crewai.run path/to/file.ttl
+
+``run_batch`` runs a runner's ``process_single(kg_path, output_dir)`` for
+every BatchItem and yields one BatchResult per item, always in input order.
+With ``jobs > 1`` each worker captures the stdout/stderr of its KG, and the
+parent replays it when that KG's turn comes, so the console output matches
+a sequential run instead of interleaving. Items that write the same project
+directory run in one worker, in order. The runner removes and recreates its
+output tree before calling run_batch, so workers only ever add to it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One KG to process: process_single(kg_path, output_dir) writes project_dir."""
+
+    kg_path: str
+    output_dir: str
+    project_dir: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.kg_path)
+
+    def target(self) -> str:
+        return os.path.normcase(os.path.abspath(self.project_dir or self.output_dir))
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one BatchItem: error is None on success, else str(exception).
+
+    In parallel mode, output holds what the item wrote, as ("stdout" |
+    "stderr", text) chunks in the order it was written.
+    """
+
+    item: BatchItem
+    error: Optional[str] = None
+    output: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def replay(self) -> None:
+        """Write the captured output to this process's stdout/stderr."""
+        for stream, text in self.output:
+            getattr(sys, stream).write(text)
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+class _Recorder(io.TextIOBase):
+    """Text stream that appends (stream name, text) chunks to a shared list."""
+
+    def __init__(self, stream: str, chunks: List[Tuple[str, str]]) -> None:
+        self._stream = stream
+        self._chunks = chunks
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self._chunks.append((self._stream, text))
+        return len(text)
+
+
+def resolve_jobs(jobs: int) -> int:
+    """--jobs value → worker count: 0 (or negative) means one per CPU."""
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def parse_runner_args(description: Optional[str] = None, argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """The runners' shared command line: an optional single .ttl file, --jobs and --force."""
+    parser = argparse.ArgumentParser(description=description.strip().splitlines()[0] if description else None)
+    parser.add_argument("kg_path", nargs="?", help="Process only this .ttl file.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for batch mode (default 1; 0 = one per CPU).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every project, ignoring the output root's build manifest.",
+    )
+    args = parser.parse_args(argv)
+    if args.kg_path is not None and not args.kg_path.endswith(".ttl"):
+        parser.error(f"expected a .ttl file, got {args.kg_path!r}")
+    return args
+
+
+def _run_one(process: Callable[[str, str], object], item: BatchItem) -> BatchResult:
+    try:
+        process(item.kg_path, item.output_dir)
+    except Exception as exc:
+        return BatchResult(item, error=str(exc))
+    return BatchResult(item)
+
+
+def _run_captured(process: Callable[[str, str], object], items: List[BatchItem]) -> List[BatchResult]:
+    """Worker entry point: process *items* in order, capturing each one's output."""
+    results = []
+    for item in items:
+        chunks: List[Tuple[str, str]] = []
+        with contextlib.redirect_stdout(_Recorder("stdout", chunks)), contextlib.redirect_stderr(_Recorder("stderr", chunks)):
+            result = _run_one(process, item)
+        result.output = chunks
+        results.append(result)
+    return results
+
+
+def run_batch(
+    process: Callable[[str, str], object],
+    items: Sequence[BatchItem],
+    jobs: int = 1,
+    on_start: Optional[Callable[[BatchItem], None]] = None,
+) -> Iterator[BatchResult]:
+    """Run *process* over *items*, yielding BatchResults in input order.
+
+    *process* must be a module-level function so it can be sent to workers.
+    *on_start* is called just before an item's output is shown (before it
+    runs when sequential, before its captured output is replayed otherwise).
+    """
+    jobs = resolve_jobs(jobs)
+    if jobs <= 1 or len(items) <= 1:
+        for item in items:
+            if on_start is not None:
+                on_start(item)
+            yield _run_one(process, item)
+        return
+
+    groups: Dict[str, List[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(item.target(), []).append(index)
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(groups))) as pool:
+        pending: Dict[int, Tuple[Future, int]] = {}
+        for indices in groups.values():
+            future = pool.submit(_run_captured, process, [items[i] for i in indices])
+            for position, index in enumerate(indices):
+                pending[index] = (future, position)
+        for index, item in enumerate(items):
+            future, position = pending.pop(index)
+            if on_start is not None:
+                on_start(item)
+            result = future.result()[position]
+            result.replay()
+            yield result
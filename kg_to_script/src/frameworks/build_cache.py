@@ -0,0 +1,247 @@
+"""
+Incremental project builds: a manifest per output root.
+
+Every runner (and ``kg_to_script build``) used to delete its whole
+generated_projects/output_<framework> tree and regenerate every project.
+Now each output root holds a ``.build_manifest.json`` with one entry per
+project directory:
+
+    {"kg": "/…/generated_kgs/CrewAI/job-posting_instances.ttl",
+     "ttl": sha256(TTL bytes),
+     "templates": sha256(<framework>/templates/**),
+     "code": sha256(extractor fingerprint + core/overlay.py, core/compact.py
+                    + frameworks/emit.py + <framework>/*.py)}
+
+A rebuild regenerates only the projects whose fingerprint changed (or
+whose directory is gone). It removes the directories the manifest recorded
+for KGs that are no longer in the batch, and reports up-to-date / rebuilt /
+removed counts. A missing or unreadable manifest, or ``--force``, means a
+full rebuild. In that case runners that clean their output (everything but
+Mastra, which keeps node_modules) empty the root first, as before. A stale
+project is regenerated in place: the generators' Emitter (emit.py) only
+rewrites files whose content changed and removes the ones it no longer
+emits. Directories without an emitter record are still deleted first.
+
+    plan = plan_build("crewai", output_base, items, clean=True)
+    for result in run_batch(process_single, plan.stale, jobs=args.jobs):
+        plan.record(result)
+    plan.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Union
+
+from ..core.ir_cache import extractor_fingerprint
+from . import emit
+from .batch import BatchItem, BatchResult
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".build_manifest.json"
+MANIFEST_VERSION = 1
+
+# Core modules the adapters use beyond those in extractor_fingerprint().
+ADAPTER_CORE_MODULES = ("overlay.py", "compact.py")
+# Modules in this package that every generator writes its output through.
+FRAMEWORK_SHARED_MODULES = ("emit.py",)
+
+_FRAMEWORKS_DIR = Path(__file__).resolve().parent
+_CORE_DIR = _FRAMEWORKS_DIR.parent / "core"
+
+_fingerprints: Dict[str, "Fingerprint"] = {}
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """What one generated project depends on."""
+
+    ttl: str
+    templates: str
+    code: str
+
+
+def _hash_files(paths: Sequence[Path], root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path.relative_to(root)).encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def framework_fingerprint(framework: str) -> Fingerprint:
+    """(templates, code) hashes of *framework*, computed once per process; ttl is empty."""
+    if framework not in _fingerprints:
+        package = _FRAMEWORKS_DIR / framework
+        templates = sorted(path for path in (package / "templates").rglob("*") if path.is_file())
+        code = hashlib.sha256(f"extractor={extractor_fingerprint()}\0".encode("utf-8"))
+        code.update(_hash_files([_CORE_DIR / name for name in ADAPTER_CORE_MODULES], _CORE_DIR).encode("utf-8"))
+        shared = [_FRAMEWORKS_DIR / name for name in FRAMEWORK_SHARED_MODULES]
+        code.update(_hash_files(shared, _FRAMEWORKS_DIR).encode("utf-8"))
+        code.update(_hash_files(sorted(package.glob("*.py")), package).encode("utf-8"))
+        _fingerprints[framework] = Fingerprint("", _hash_files(templates, package), code.hexdigest())
+    return _fingerprints[framework]
+
+
+def fingerprint(framework: str, kg_path: Union[str, Path]) -> Fingerprint:
+    """Fingerprint of the project *framework* generates from *kg_path*."""
+    base = framework_fingerprint(framework)
+    ttl = hashlib.sha256(Path(kg_path).read_bytes()).hexdigest()
+    return Fingerprint(ttl, base.templates, base.code)
+
+
+@dataclass
+class ManifestEntry:
+    kg: str
+    ttl: str
+    templates: str
+    code: str
+
+    def matches(self, fp: Fingerprint) -> bool:
+        return (self.ttl, self.templates, self.code) == (fp.ttl, fp.templates, fp.code)
+
+
+class BuildManifest:
+    """The ``.build_manifest.json`` of one output root: project dir name → ManifestEntry."""
+
+    def __init__(self, output_root: Union[str, Path], framework: str) -> None:
+        self.output_root = Path(output_root)
+        self.framework = framework
+        self.path = self.output_root / MANIFEST_NAME
+        self.projects: Dict[str, ManifestEntry] = {}
+        self.loaded = False
+
+    @classmethod
+    def load(cls, output_root: Union[str, Path], framework: str) -> "BuildManifest":
+        """Read the manifest; an absent, unreadable or foreign one loads empty (loaded=False)."""
+        manifest = cls(output_root, framework)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_VERSION or data.get("framework") != framework:
+                return manifest
+            manifest.projects = {name: ManifestEntry(**entry) for name, entry in data["projects"].items()}
+        except FileNotFoundError:
+            return manifest
+        except Exception as exc:
+            logger.warning("Ignoring unreadable build manifest %s: %s", manifest.path, exc)
+            return manifest
+        manifest.loaded = True
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.output_root.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "framework": self.framework,
+            "projects": {name: asdict(entry) for name, entry in sorted(self.projects.items())},
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.output_root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+                f.write("\n")
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+@dataclass
+class BuildPlan:
+    """Which items of a batch need generating, and the bookkeeping to record them."""
+
+    manifest: BuildManifest
+    fresh: List[BatchItem] = field(default_factory=list)
+    stale: List[BatchItem] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    fingerprints: Dict[BatchItem, Fingerprint] = field(default_factory=dict)
+
+    def project_name(self, item: BatchItem) -> str:
+        return project_name(self.manifest.output_root, item)
+
+    def record(self, result: BatchResult) -> None:
+        """Record a generated project; a failed one is forgotten so the next run retries it."""
+        name = self.project_name(result.item)
+        if result.ok:
+            fp = self.fingerprints[result.item]
+            self.manifest.projects[name] = ManifestEntry(result.item.kg_path, fp.ttl, fp.templates, fp.code)
+        else:
+            self.manifest.projects.pop(name, None)
+
+    def save(self) -> None:
+        self.manifest.save()
+
+    def summary(self) -> str:
+        return f"Incremental: {len(self.fresh)} up to date, {len(self.stale)} rebuilt, {len(self.removed)} removed"
+
+
+def project_name(output_root: Union[str, Path], item: BatchItem) -> str:
+    """The manifest key of *item*: its project directory relative to the output root."""
+    return os.path.relpath(item.target(), os.path.abspath(output_root))
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def plan_build(
+    framework: str,
+    output_root: Union[str, Path],
+    items: Sequence[BatchItem],
+    clean: bool = True,
+    force: bool = False,
+    prune: bool = True,
+) -> BuildPlan:
+    """Split *items* into up-to-date and stale projects and prepare the output root.
+
+    Args:
+        framework:   Framework package name ("crewai", ...), which selects the templates/code hashed.
+        output_root: The runner's output_base; holds the manifest.
+        items:       Every KG of the batch.
+        clean:       Remove a stale project's directory before it is regenerated unless the
+                     emitter recorded its files, and the whole root on a full rebuild
+                     (False for Mastra, which keeps node_modules).
+        force:       Treat every item as stale and start from a new manifest.
+        prune:       Remove projects whose KG is not among *items* (off for single-file runs).
+    """
+    output_root = Path(output_root)
+    manifest = BuildManifest(output_root, framework) if force else BuildManifest.load(output_root, framework)
+    if clean and not manifest.loaded and output_root.exists():
+        shutil.rmtree(output_root)
+    output_root.mkdir(parents=True, exist_ok=True)
+
+    plan = BuildPlan(manifest)
+    names = set()
+    for item in items:
+        name = plan.project_name(item)
+        names.add(name)
+        fp = plan.fingerprints[item] = fingerprint(framework, item.kg_path)
+        entry = manifest.projects.get(name)
+        if entry is not None and entry.matches(fp) and entry.kg == item.kg_path and os.path.isdir(item.target()):
+            plan.fresh.append(item)
+            continue
+        plan.stale.append(item)
+        if clean and emit.load_record(item.target()) is None:
+            _remove(Path(item.target()))
+
+    if prune:
+        for name in sorted(set(manifest.projects) - names):
+            if os.path.isabs(name) or ".." in Path(name).parts:
+                logger.warning("Not removing %r outside %s", name, output_root)
+            else:
+                _remove(output_root / name)
+            del manifest.projects[name]
+            plan.removed.append(name)
+    return plan
@@ -9,9 +9,30 @@ from __future__ import annotations
 import re
 from typing import Dict, List, Optional
 
-from ...core.models import AgenticProject, TaskModel, WorkflowStepModel
+from ...core.compact import as_project
+from ...core.graph import Digraph, topological_sort
+from ...core.models import AgenticProject, AgentModel, LanguageModelModel, TaskModel, WorkflowStepModel
+from ...core.overlay import patch_each, patched
+from ...core.scope import ExtractionScope
 from .models import CrewProject, ProcessType
 
+# What the adapter and crew.py.j2 read beyond agents, tasks, tools and
+# workflows; human_agents also feeds task.human_input.
+EXTRACTION_SCOPE = ExtractionScope(
+    collections=(
+        "input_variables",
+        "env_vars",
+        "goals",
+        "capabilities",
+        "environments",
+        "objectives",
+        "human_agents",
+        "resources",
+        "constraints",
+    ),
+    relations=(),
+)
+
 
 def _infer_process(project: AgenticProject) -> ProcessType:
     """Determine CrewAI process type from system_configs or workflow topology."""
@@ -26,32 +47,17 @@ def _infer_process(project: AgenticProject) -> ProcessType:
 
 
 def _topological_sort_tasks(tasks: List[TaskModel]) -> List[TaskModel]:
-    """Sort tasks topologically so that dependencies appear before the tasks that require them."""
-    tasks_by_var = {t.var_name: t for t in tasks}
-    visited = {}
-    sorted_tasks = []
-
-    def visit(task_var: str):
-        if visited.get(task_var) == "visiting":
-            # Cycle detected; break recursion to avoid infinite loop
-            return
-        if visited.get(task_var) == "visited":
-            return
-
-        visited[task_var] = "visiting"
-        task = tasks_by_var.get(task_var)
-        if task:
-            for dep_var in task.context_task_var_names:
-                visit(dep_var)
-
-        visited[task_var] = "visited"
-        if task and task not in sorted_tasks:
-            sorted_tasks.append(task)
+    """Sort tasks topologically so that dependencies appear before the tasks that require them.
 
-    for task in tasks:
-        visit(task.var_name)
-
-    return sorted_tasks
+    Dependency cycles are broken where they are met; tasks sharing a var_name
+    collapse to the last of them, placed where the first one was.
+    """
+    tasks_by_var = {t.var_name: t for t in tasks}
+    graph: Digraph[str] = Digraph(task.var_name for task in tasks)
+    for task in tasks_by_var.values():
+        for dep_var in task.context_task_var_names:
+            graph.add_edge(dep_var, task.var_name)
+    return [tasks_by_var[var] for var in topological_sort(graph) if var in tasks_by_var]
 
 
 def _flatten_workflow_steps(project: AgenticProject) -> List[WorkflowStepModel]:
@@ -131,19 +137,64 @@ def _infer_llm_provider(lm_name: str, lm_desc: str) -> tuple[str, str]:
     return provider, model_name
 
 
+def _with_llm_provider(lm: LanguageModelModel) -> LanguageModelModel:
+    if lm.provider:
+        return lm
+    provider, model_name = _infer_llm_provider(lm.name, lm.description)
+    return patched(lm, provider=provider, model_name=lm.model_name or model_name)
+
+
+def _with_task_fallbacks(task: TaskModel, agent_var_by_iri: Dict[str, str]) -> TaskModel:
+    return patched(
+        task,
+        description=(
+            task.description or task.prompt_instruction or task.var_name.replace("_", " ").title()
+        ),
+        expected_output=task.expected_output or f"Completed: {task.var_name}",
+        # Redundant if the extractor already set it; kept as a safety net for
+        # KGs that don't use performedByAgent.
+        agent_var_name=task.agent_var_name or agent_var_by_iri.get(task.agent_iri, ""),
+    )
+
+
 def adapt(project: AgenticProject) -> CrewProject:
-    """Adapt framework-agnostic AgenticProject into CrewProject."""
-    project = project.model_copy(deep=True)
+    """Adapt framework-agnostic AgenticProject into CrewProject.
+
+    *project* is never modified: language models, agents and tasks that need
+    derived values are patched copies (core/overlay.py), everything else is
+    shared.
+    """
+    project = as_project(project)
     tools_by_iri = {tool.iri: tool for tool in project.tools}
 
     # ── Populate LLM provider/model_name in language_model objects ──
     # This is CrewAI-specific: the generator needs a concrete provider string.
-    for lm in project.language_models:
-        if not lm.provider:
-            provider, model_name = _infer_llm_provider(lm.name, lm.description)
-            lm.provider = provider
-            if not lm.model_name and model_name:
-                lm.model_name = model_name
+    language_models = patch_each(project.language_models, _with_llm_provider)
+    lm_by_iri = {lm.iri: lm for lm in language_models}
+
+    def with_agent_fallbacks(agent: AgentModel) -> AgentModel:
+        role = agent.role or "LLM Agent"
+        backstory = agent.backstory or agent.system_prompt or f"You are a {role}."
+        lm = agent.language_model
+        return patched(
+            agent,
+            role=role,
+            goal=agent.goal or role,
+            backstory=backstory,
+            system_prompt=agent.system_prompt or backstory,
+            language_model=lm_by_iri.get(lm.iri, lm) if lm is not None else None,
+        )
+
+    agents = patch_each(project.agents, with_agent_fallbacks)
+    agent_var_by_iri: Dict[str, str] = {}
+    for agent in agents:
+        agent_var_by_iri.setdefault(agent.iri, agent.var_name)
+    project = patched(
+        project,
+        language_models=language_models,
+        agents=agents,
+        tasks=patch_each(project.tasks, lambda task: _with_task_fallbacks(task, agent_var_by_iri)),
+    )
 
     # ── Compute per-agent CrewAI derived fields ──
     agent_allow_delegation: Dict[str, Optional[bool]] = {}
@@ -151,20 +202,6 @@ def adapt(project: AgenticProject) -> CrewProject:
     agent_tool_var_names: Dict[str, List[str]] = {}
 
     for agent in project.agents:
-        if not agent.role:
-            agent.role = "LLM Agent"
-        if not agent.goal:
-            agent.goal = agent.role
-        # Backstory sync
-        if not agent.backstory and agent.system_prompt:
-            agent.backstory = agent.system_prompt
-        if not agent.system_prompt and agent.backstory:
-            agent.system_prompt = agent.backstory
-        if not agent.backstory:
-            agent.backstory = f"You are a {agent.role}."
-        if not agent.system_prompt:
-            agent.system_prompt = agent.backstory
-
         # allow_delegation / verbose from config bag
         agent_allow_delegation[agent.var_name] = _derive_allow_delegation(agent.configs)
         agent_verbose[agent.var_name] = _derive_verbose(agent.configs)
@@ -177,24 +214,6 @@ def adapt(project: AgenticProject) -> CrewProject:
                 var_names.append(tool.var_name)
         agent_tool_var_names[agent.var_name] = var_names
 
-        # Resolve agent_var_name for tasks (redundant if extractor already set it)
-        # kept as a safety net for KGs that don't use performedByAgent
-        agents_by_iri = {a.iri: a for a in project.agents}
-
-    for task in project.tasks:
-        if not task.description and task.prompt_instruction:
-            task.description = task.prompt_instruction
-        if not task.description:
-            task.description = task.var_name.replace("_", " ").title()
-        if not task.expected_output:
-            task.expected_output = f"Completed: {task.var_name}"
-
-        if not task.agent_var_name and task.agent_iri:
-            for agent in project.agents:
-                if agent.iri == task.agent_iri:
-                    task.agent_var_name = agent.var_name
-                    break
-
     # ── Compute per-tool CamelCase class names ──
     tool_class_names: Dict[str, str] = {
         tool.var_name: _derive_tool_class_name(tool.label, tool.iri)
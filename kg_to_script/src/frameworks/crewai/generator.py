@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import os
 from collections import OrderedDict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml
 from jinja2 import Environment, FileSystemLoader
@@ -35,6 +35,7 @@ from ...core.models import (
     TaskModel,
     ToolModel,
 )
+from ..emit import Emitter, OutputSink
 from .models import CrewProject
 
 
@@ -582,7 +583,7 @@ def build_pyproject_toml(project: CrewProject) -> str:
 
 # ─────────────────────── Public API ───────────────────────
 
-def generate_project(project: CrewProject, output_dir: str) -> str:
+def generate_project(project: CrewProject, output_dir: str, sink: Optional[OutputSink] = None) -> str:
     """
     Generate a complete CrewAI project directory from a CrewProject IR.
 
@@ -598,59 +599,46 @@ def generate_project(project: CrewProject, output_dir: str) -> str:
         ├── crew.py
         └── main.py
 
+    Files go to *sink* when given (emit.py: an in-memory tree or an
+    archive) instead of the directory.
+
     Returns:
         The output directory path.
     """
-    # Create directory structure
     config_dir = os.path.join(output_dir, "config")
-    os.makedirs(config_dir, exist_ok=True)
 
     # ── Layer 3A: YAML generation (PyYAML) ──
     agents_yaml = build_agents_yaml(project)
     tasks_yaml = build_tasks_yaml(project)
     inputs_yaml = build_inputs_yaml(project)
 
-    with open(os.path.join(config_dir, "agents.yaml"), "w", encoding="utf-8") as f:
-        f.write(agents_yaml)
-
-    with open(os.path.join(config_dir, "tasks.yaml"), "w", encoding="utf-8") as f:
-        f.write(tasks_yaml)
-
-    with open(os.path.join(config_dir, "inputs.yaml"), "w", encoding="utf-8") as f:
-        f.write(inputs_yaml)
-
-    # ── Layer 3B: Python generation (Jinja2) ──
-    env = _create_jinja_env()
-
-    # crew.py
-    crew_template = env.get_template("crew.py.j2")
-    crew_ctx = _build_crew_context(project)
-    crew_code = crew_template.render(**crew_ctx)
-    with open(os.path.join(output_dir, "crew.py"), "w", encoding="utf-8") as f:
-        f.write(crew_code)
-
-    # main.py
-    main_template = env.get_template("main.py.j2")
-    main_ctx = _build_main_context(project)
-    main_code = main_template.render(**main_ctx)
-    with open(os.path.join(output_dir, "main.py"), "w", encoding="utf-8") as f:
-        f.write(main_code)
-
-    # ── .env file (only when KG explicitly provides values) ──
-    if project.env_vars:
-        with open(os.path.join(output_dir, ".env"), "w", encoding="utf-8") as f:
-            for ev in project.env_vars:
-                f.write(f"{ev.key}={ev.value}\n")
-
-    # ── .env.example (always generated – safe placeholder version) ──
-    env_example_content = build_env_example(project)
-    with open(os.path.join(output_dir, ".env.example"), "w", encoding="utf-8") as f:
-        f.write(env_example_content)
-
-    # ── pyproject.toml ──
-    pyproject_content = build_pyproject_toml(project)
-    with open(os.path.join(output_dir, "pyproject.toml"), "w", encoding="utf-8") as f:
-        f.write(pyproject_content)
+    with Emitter(output_dir, sink) as out:
+        out.write_text(os.path.join(config_dir, "agents.yaml"), agents_yaml)
+        out.write_text(os.path.join(config_dir, "tasks.yaml"), tasks_yaml)
+        out.write_text(os.path.join(config_dir, "inputs.yaml"), inputs_yaml)
+
+        # ── Layer 3B: Python generation (Jinja2) ──
+        env = _create_jinja_env()
+
+        # crew.py
+        crew_template = env.get_template("crew.py.j2")
+        crew_ctx = _build_crew_context(project)
+        out.write_text("crew.py", crew_template.render(**crew_ctx))
+
+        # main.py
+        main_template = env.get_template("main.py.j2")
+        main_ctx = _build_main_context(project)
+        out.write_text("main.py", main_template.render(**main_ctx))
+
+        # ── .env file (only when KG explicitly provides values) ──
+        if project.env_vars:
+            out.write_text(".env", "".join(f"{ev.key}={ev.value}\n" for ev in project.env_vars))
+
+        # ── .env.example (always generated – safe placeholder version) ──
+        out.write_text(".env.example", build_env_example(project))
+
+        # ── pyproject.toml ──
+        out.write_text("pyproject.toml", build_pyproject_toml(project))
 
     print(
         f"  [Generated] {output_dir}/ "
@@ -7,6 +7,9 @@ Usage:
     From project root:
         python -m src.frameworks.crewai.run
 
+    Parallel batch (N worker processes, 0 = one per CPU):
+        python -m src.frameworks.crewai.run --jobs N
+
     Single file:
         python -m src.frameworks.crewai.run path/to/file.ttl
 
@@ -16,20 +19,23 @@ Usage:
 
 import os
 import sys
-import shutil
 
 # Support both `python -m` and direct script execution
 try:
     from ...core.extractor import extract_project
-    from .adapter import adapt
+    from .adapter import EXTRACTION_SCOPE, adapt
     from .generator import generate_project
+    from ..batch import BatchItem, parse_runner_args, resolve_jobs, run_batch
+    from ..build_cache import plan_build
 except ImportError:
     sys.path.insert(
         0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
     )
     from core.extractor import extract_project
-    from src.frameworks.crewai.adapter import adapt
+    from src.frameworks.crewai.adapter import EXTRACTION_SCOPE, adapt
     from src.frameworks.crewai.generator import generate_project
+    from src.frameworks.batch import BatchItem, parse_runner_args, resolve_jobs, run_batch
+    from src.frameworks.build_cache import plan_build
 
 
 def process_single(kg_path: str, output_dir: str) -> str:
@@ -44,7 +50,7 @@ def process_single(kg_path: str, output_dir: str) -> str:
         The output directory path
     """
     # Layer 1: SPARQL extraction → Layer 2: Pydantic IR
-    project = adapt(extract_project(kg_path))
+    project = adapt(extract_project(kg_path, scope=EXTRACTION_SCOPE))
 
     # Layer 3: File generation (YAML + Jinja2)
     return generate_project(project, output_dir)
@@ -56,9 +62,11 @@ def main():
     )
     output_base = os.path.join(project_root, "generated_projects", "output_crewai")
 
+    args = parse_runner_args(__doc__)
+
     # ── Handle single-file mode ──
-    if len(sys.argv) > 1 and sys.argv[1].endswith(".ttl"):
-        kg_path = os.path.abspath(sys.argv[1])
+    if args.kg_path:
+        kg_path = os.path.abspath(args.kg_path)
         base_name = os.path.splitext(os.path.basename(kg_path))[0]
         # Remove _instances suffix for cleaner directory name
         dir_name = base_name.replace("_instances", "")
@@ -81,10 +89,13 @@ def main():
         print(f"[WARNING] No .ttl files found in {kg_dir}")
         sys.exit(0)
 
-    # Clean output directory
-    if os.path.exists(output_base):
-        shutil.rmtree(output_base)
-    os.makedirs(output_base, exist_ok=True)
+    # Compare against the output root's build manifest: only projects whose KG,
+    # templates or generator code changed are regenerated (--force: all of them)
+    items = [
+        BatchItem(os.path.join(kg_dir, filename), os.path.join(output_base, os.path.splitext(filename)[0].replace("_instances", "")))
+        for filename in ttl_files
+    ]
+    plan = plan_build("crewai", output_base, items, force=args.force)
 
     # Header
     print("=" * 65)
@@ -94,29 +105,28 @@ def main():
     print(f"  Source : {kg_dir}")
     print(f"  Output : {output_base}")
     print(f"  Files  : {len(ttl_files)} knowledge graphs")
+    print(f"  Jobs   : {resolve_jobs(args.jobs)}")
     print("=" * 65)
 
-    # Process each KG
-    success = 0
+    # Process each stale KG (on a process pool with --jobs; results come back in file order)
+    success = len(plan.fresh)
     errors = []
 
-    for filename in ttl_files:
-        kg_path = os.path.join(kg_dir, filename)
-        base_name = os.path.splitext(filename)[0]
-        dir_name = base_name.replace("_instances", "")
-        output_dir = os.path.join(output_base, dir_name)
-
-        print(f"\n[Processing] {filename}")
-        try:
-            process_single(kg_path, output_dir)
-            success += 1
-        except Exception as e:
-            print(f"  [ERROR] {e}")
-            errors.append((filename, str(e)))
+    try:
+        for result in run_batch(process_single, plan.stale, jobs=args.jobs, on_start=lambda item: print(f"\n[Processing] {item.name}")):
+            plan.record(result)
+            if result.ok:
+                success += 1
+            else:
+                print(f"  [ERROR] {result.error}")
+                errors.append((result.item.name, result.error))
+    finally:
+        plan.save()
 
     # Summary
     print("\n" + "=" * 65)
     print(f"  Done. {success}/{len(ttl_files)} projects generated successfully.")
+    print(f"  {plan.summary()}")
     if errors:
         print(f"  Errors ({len(errors)}):")
         for fname, err in errors:
@@ -0,0 +1,352 @@
+"""
+File emission shared by the generators: write-if-changed, to any output sink.
+
+``generate_project`` used to rewrite every output file on every run. That
+bumped each mtime even when nothing changed, which invalidates ``tsc
+--incremental`` builds, editor indexes and rsync. The generators now write
+through an Emitter:
+
+    with Emitter(output_dir) as out:
+        out.write_text("main.py", code)
+        out.write_text(config_dir / "agents.yaml", agents_yaml)   # absolute paths must be inside output_dir
+
+Paths are resolved against the project directory, and the emitter hands
+"/"-separated project-relative paths to an OutputSink:
+
+    DirectorySink  (the default) the project directory on disk
+    MemorySink     an in-memory tree {relative path: bytes}, e.g. to score
+                   generated code without writing it (evaluation/utils.py)
+    ArchiveSink    a zip or tar(.gz) archive written to a file or stream,
+                   e.g. for a service that returns the project as a download
+
+    tree = MemorySink()
+    generate_project(project, "travel-app", sink=tree)
+    tree.read_text("main.py")
+
+On disk, a file is replaced only when the SHA-256 of the new content
+differs from the file there. The replacement is atomic (temp file in the
+same directory + os.replace), so a reader never sees a half-written file.
+The directory sink records {relative path: sha256} of everything it wrote
+in the project's ``.generated_files``. When a generation finishes, files
+the previous generation recorded but this one no longer emitted are
+removed. Everything else in the directory (node_modules, a user's .env) is
+left alone, which is why a stale project no longer has to be deleted
+before it is regenerated (see build_cache.plan_build). If generation
+fails, nothing is removed and the record keeps the old and the new files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tarfile
+import tempfile
+import zipfile
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".generated_files"
+MANIFEST_VERSION = 1
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _default_mode() -> int:
+    """Permissions open(path, "w") would give a new file (mkstemp creates 0600)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _file_hash(path: Path, size: int) -> Optional[str]:
+    """SHA-256 of *path* if it is a regular file of *size* bytes, else None."""
+    try:
+        if not path.is_file() or path.stat().st_size != size:
+            return None
+        return sha256(path.read_bytes())
+    except OSError:
+        return None
+
+
+def write_if_changed(path: PathLike, data: bytes, digest: Optional[str] = None) -> bool:
+    """Atomically write *data* to *path* unless it already holds exactly that; returns whether it wrote."""
+    path = Path(path)
+    digest = digest or sha256(data)
+    if _file_hash(path, len(data)) == digest:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = _default_mode()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return True
+
+
+def load_record(root: PathLike) -> Optional[Dict[str, str]]:
+    """The {relative path: sha256} a previous generation recorded in *root*, or None."""
+    path = Path(root) / MANIFEST_NAME
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        return dict(data["files"])
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("Ignoring unreadable %s: %s", path, exc)
+        return None
+
+
+class OutputSink(ABC):
+    """Where an Emitter puts one project's files; paths are "/"-separated and project-relative.
+
+    Subclasses must implement write(); read(), mkdir() and finish() are optional hooks.
+    """
+
+    # Line ending write_text() uses for the files of this sink.
+    newline = "\n"
+
+    def read(self, rel: str) -> Optional[bytes]:
+        """Content *rel* currently has in the sink, or None."""
+        return None
+
+    @abstractmethod
+    def write(self, rel: str, data: bytes, digest: str) -> bool:
+        """Store *data* as *rel*; returns whether the stored content changed."""
+
+    def mkdir(self, rel: str) -> None:
+        """Create the (possibly empty) directory *rel*; only meaningful on disk."""
+
+    def finish(self, files: Dict[str, str], complete: bool) -> List[str]:
+        """End a generation that emitted *files* ({rel: sha256}); returns the paths removed.
+
+        complete is False when generation failed part-way.
+        """
+        return []
+
+
+class DirectorySink(OutputSink):
+    """The project directory on disk: atomic write-if-changed plus the .generated_files record."""
+
+    newline = os.linesep
+
+    def __init__(self, root: PathLike) -> None:
+        self.root = Path(root)
+        self.previous: Dict[str, str] = load_record(self.root) or {}
+
+    def read(self, rel: str) -> Optional[bytes]:
+        try:
+            return (self.root / rel).read_bytes()
+        except OSError:
+            return None
+
+    def write(self, rel: str, data: bytes, digest: str) -> bool:
+        return write_if_changed(self.root / rel, data, digest)
+
+    def mkdir(self, rel: str) -> None:
+        (self.root / rel).mkdir(parents=True, exist_ok=True)
+
+    def finish(self, files: Dict[str, str], complete: bool) -> List[str]:
+        """Save the record; after a complete generation, remove the previous one's leftovers."""
+        removed = []
+        record = dict(files) if complete else {**self.previous, **files}
+        if complete:
+            for rel in sorted(set(self.previous) - set(files)):
+                if os.path.isabs(rel) or ".." in Path(rel).parts:
+                    logger.warning("Not removing %r outside %s", rel, self.root)
+                    continue
+                (self.root / rel).unlink(missing_ok=True)
+                removed.append(rel)
+        if record or self.previous:
+            data = {"version": MANIFEST_VERSION, "files": dict(sorted(record.items()))}
+            write_if_changed(self.root / MANIFEST_NAME, (json.dumps(data, indent=2) + "\n").encode("utf-8"))
+        self.previous = record
+        return removed
+
+
+class MemorySink(OutputSink):
+    """An in-memory project tree: files maps "/"-separated relative path → bytes.
+
+    Reusing a MemorySink for the next generation of the same project keeps
+    the write-if-changed semantics: only changed files count as written,
+    and files that are no longer emitted are dropped.
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[str, bytes] = {}
+
+    def read(self, rel: str) -> Optional[bytes]:
+        return self.files.get(rel)
+
+    def read_text(self, rel: str, encoding: str = "utf-8") -> str:
+        return self.files[rel].decode(encoding)
+
+    def write(self, rel: str, data: bytes, digest: str) -> bool:
+        changed = self.files.get(rel) != data
+        self.files[rel] = data
+        return changed
+
+    def finish(self, files: Dict[str, str], complete: bool) -> List[str]:
+        if not complete:
+            return []
+        removed = sorted(set(self.files) - set(files))
+        for rel in removed:
+            del self.files[rel]
+        return removed
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self.files))
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+ARCHIVE_FORMATS = ("zip", "tar", "tar.gz")
+
+# Entry timestamp (zip cannot store earlier dates), so equal projects give equal archives.
+_ARCHIVE_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+class ArchiveSink(OutputSink):
+    """Streams projects into a zip, tar or tar.gz archive.
+
+    *target* is a path or a writable binary stream; the stream need not be
+    seekable (an HTTP response body, sys.stdout.buffer). A project's files
+    are held until its generation completes and then written as
+    ``<prefix>/<path>`` entries, so a failed generation adds nothing.
+    Close the sink (or use it as a context manager) to finish the archive.
+
+        with ArchiveSink(response, format="tar.gz", prefix="travel-app") as archive:
+            generate_project(project, "travel-app", sink=archive)
+    """
+
+    def __init__(self, target: Union[PathLike, IO[bytes]], format: str = "zip", prefix: str = "") -> None:
+        if format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unknown archive format {format!r} (choose from {', '.join(ARCHIVE_FORMATS)})")
+        self.format = format
+        self.prefix = prefix.strip("/")
+        self.entries: List[str] = []
+        self._pending: Dict[str, bytes] = {}
+        if format == "zip":
+            self._archive = zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            mode = "w|gz" if format == "tar.gz" else "w|"
+            if isinstance(target, (str, os.PathLike)):
+                self._archive = tarfile.open(name=os.fspath(target), mode=mode)
+            else:
+                self._archive = tarfile.open(fileobj=target, mode=mode)
+
+    def __enter__(self) -> "ArchiveSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def write(self, rel: str, data: bytes, digest: str) -> bool:
+        self._pending[rel] = data
+        return True
+
+    def finish(self, files: Dict[str, str], complete: bool) -> List[str]:
+        pending, self._pending = self._pending, {}
+        if complete:
+            for rel in files:
+                self._add(f"{self.prefix}/{rel}" if self.prefix else rel, pending[rel])
+        return []
+
+    def _add(self, name: str, data: bytes) -> None:
+        if isinstance(self._archive, zipfile.ZipFile):
+            info = zipfile.ZipInfo(name, date_time=_ARCHIVE_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(data))
+        self.entries.append(name)
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+class Emitter:
+    """Writes one generated project to a sink, skipping files whose content is unchanged.
+
+    Attributes:
+        root:      The project directory paths are resolved against.
+        sink:      Where the files go; a DirectorySink on root by default.
+        files:     {relative path: sha256} of every file emitted so far, in emission order.
+        written:   Relative paths that were created or replaced.
+        unchanged: Relative paths whose content already matched.
+        removed:   Relative paths of the previous generation deleted by close().
+    """
+
+    def __init__(self, root: PathLike, sink: Optional[OutputSink] = None) -> None:
+        self.root = Path(root)
+        self.sink = sink if sink is not None else DirectorySink(self.root)
+        self.files: Dict[str, str] = {}
+        self.written: List[str] = []
+        self.unchanged: List[str] = []
+        self.removed: List[str] = []
+
+    def __enter__(self) -> "Emitter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(prune=exc_type is None)
+
+    def relpath(self, path: PathLike) -> str:
+        """*path* (relative to root, or absolute inside it) as a "/"-separated relative path."""
+        rel = os.path.relpath(os.path.abspath(self.root / path), os.path.abspath(self.root))
+        if rel == os.curdir or rel == os.pardir or rel.startswith(os.pardir + os.sep):
+            raise ValueError(f"{path} is not inside {self.root}")
+        return rel.replace(os.sep, "/")
+
+    def read_bytes(self, path: PathLike) -> Optional[bytes]:
+        """What the sink currently holds for *path* (e.g. the previous generation's file), or None."""
+        return self.sink.read(self.relpath(path))
+
+    def mkdir(self, path: PathLike) -> None:
+        """Create the directory *path* even if nothing is emitted into it."""
+        self.sink.mkdir(self.relpath(path))
+
+    def write_bytes(self, path: PathLike, data: bytes) -> bool:
+        """Emit *data* as *path*; returns whether the sink's content changed."""
+        rel = self.relpath(path)
+        digest = sha256(data)
+        changed = self.sink.write(rel, data, digest)
+        self.files[rel] = digest
+        (self.written if changed else self.unchanged).append(rel)
+        return changed
+
+    def write_text(self, path: PathLike, text: str, encoding: str = "utf-8") -> bool:
+        """Emit *text* as *path*; on disk with the platform's newlines, as open(path, "w") writes it."""
+        if self.sink.newline != "\n":
+            text = text.replace("\n", self.sink.newline)
+        return self.write_bytes(path, text.encode(encoding))
+
+    def close(self, prune: bool = True) -> None:
+        """Finish the generation; with *prune*, the previous generation's leftovers are removed."""
+        self.removed = self.sink.finish(self.files, complete=prune)
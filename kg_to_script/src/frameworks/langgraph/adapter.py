@@ -5,9 +5,16 @@ from __future__ import annotations
 import re
 from typing import Dict, List
 
+from ...core.compact import as_project
+from ...core.graph import Digraph
+from ...core.identifiers import lower_camel_case
 from ...core.models import (
     AgenticProject,
+    AgentModel,
+    TaskModel,
 )
+from ...core.overlay import patch_each, patched
+from ...core.scope import ExtractionScope
 from .models import (
     LangGraphAgentModel,
     LangGraphEdgeModel,
@@ -17,19 +24,14 @@ from .models import (
     LangGraphToolModel,
 )
 
+# The TypeScript templates only read agents, tasks, tools and workflows; the
+# ontology collections LangGraphProject carries stay empty under this scope.
+EXTRACTION_SCOPE = ExtractionScope(collections=(), relations=())
+
 
 def _to_lower_camel(name: str) -> str:
     """Convert snake/kebab/space names to lowerCamelCase for TS identifiers."""
-    if not name:
-        return "node"
-    parts = re.split(r"[^a-zA-Z0-9]+", name)
-    parts = [p for p in parts if p]
-    if not parts:
-        return "node"
-    out = parts[0].lower() + "".join(p[:1].upper() + p[1:] for p in parts[1:])
-    if out[0].isdigit():
-        out = f"n{out}"
-    return out
+    return lower_camel_case(name or "", empty="node", digit_prefix="n")
 
 
 
@@ -148,9 +150,10 @@ def _is_supervisor_topology(
     more than one other node. Branching DAGs where a non-router node happens to have
     out-degree > 1 (like trip-planner's extraction step) are NOT supervisors.
     """
+    graph = Digraph(edges=((e.source, e.target) for e in edges))
     return any(
         ("router" in n.name.lower() or "router" in n.ts_name.lower())
-        and sum(1 for e in edges if e.source == n.iri) > 1
+        and graph.out_degree(n.iri) > 1
         for n in nodes
     )
 
@@ -202,23 +205,34 @@ def _resolve_router_and_routes(
     return router_node.ts_name, routes
 
 
+def _with_agent_fallbacks(agent: AgentModel) -> AgentModel:
+    role = agent.role or "agent"
+    return patched(agent, role=role, goal=agent.goal or role)
+
+
+def _with_task_fallbacks(task: TaskModel) -> TaskModel:
+    return patched(
+        task,
+        description=(
+            task.description or task.prompt_instruction or task.var_name.replace("_", " ").title()
+        ),
+        expected_output=task.expected_output or f"Completed: {task.var_name}",
+    )
+
+
 def adapt(project: AgenticProject) -> LangGraphProject:
-    """Adapt framework-agnostic AgenticProject into LangGraphProject."""
-    project = project.model_copy(deep=True)
+    """Adapt framework-agnostic AgenticProject into LangGraphProject.
+
+    *project* is never modified: agents and tasks that need fallback values
+    are patched copies (core/overlay.py), everything else is shared.
+    """
+    project = as_project(project)
     # Ensure fallbacks are applied for Agent and Task values that may be missing in Core
-    for agent in project.agents:
-        if not agent.role:
-            agent.role = "agent"
-        if not agent.goal:
-            agent.goal = agent.role
-
-    for task in project.tasks:
-        if not task.description and task.prompt_instruction:
-            task.description = task.prompt_instruction
-        if not task.description:
-            task.description = task.var_name.replace("_", " ").title()
-        if not task.expected_output:
-            task.expected_output = f"Completed: {task.var_name}"
+    project = patched(
+        project,
+        agents=patch_each(project.agents, _with_agent_fallbacks),
+        tasks=patch_each(project.tasks, _with_task_fallbacks),
+    )
 
     tools = _map_tools(project)
     agents = _map_agents(project)
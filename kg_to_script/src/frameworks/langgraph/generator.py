@@ -6,10 +6,11 @@ import json
 import os
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
+from ..emit import Emitter, OutputSink
 from .models import LangGraphProject
 
 
@@ -64,26 +65,26 @@ def _build_common_context(project: LangGraphProject) -> Dict[str, Any]:
     }
 
 
-def _build_manifest(output_dir: str, pattern: str) -> Dict[str, Any]:
-    generated_files = []
-    for root, _, files in os.walk(output_dir):
-        for file in files:
-            if file == "manifest.json":
-                continue
-            abs_path = os.path.join(root, file)
-            rel_path = os.path.relpath(abs_path, output_dir)
-            generated_files.append(rel_path.replace("\\", "/"))
-
-    return {
+def _build_manifest(out: Emitter, pattern: str) -> Dict[str, Any]:
+    """manifest.json listing what *out* emitted; the timestamp only moves when an emitted file changed."""
+    manifest = {
         "framework": "langgraph",
         "language": "typescript",
         "pattern": pattern,
-        "generated_files": sorted(generated_files),
+        "generated_files": sorted(name for name in out.files if name != "manifest.json"),
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
+    if not out.written:
+        try:
+            previous = json.loads(out.read_bytes("manifest.json") or b"null")
+        except ValueError:
+            previous = None
+        if isinstance(previous, dict) and "timestamp" in previous and {**previous, "timestamp": None} == {**manifest, "timestamp": None}:
+            manifest["timestamp"] = previous["timestamp"]
+    return manifest
 
 
-def _write_base_files(output_dir: str) -> None:
+def _write_base_files(out: Emitter) -> None:
     package_json = {
         "name": "langgraph-generated-project",
         "version": "0.1.0",
@@ -105,9 +106,7 @@ def _write_base_files(output_dir: str) -> None:
             "@types/node": "^20.0.0",
         },
     }
-    with open(os.path.join(output_dir, "package.json"), "w", encoding="utf-8") as f:
-        json.dump(package_json, f, indent=2)
-        f.write("\n")
+    out.write_text("package.json", json.dumps(package_json, indent=2) + "\n")
 
     tsconfig = {
         "compilerOptions": {
@@ -121,70 +120,51 @@ def _write_base_files(output_dir: str) -> None:
         },
         "include": ["**/*.ts"],
     }
-    with open(os.path.join(output_dir, "tsconfig.json"), "w", encoding="utf-8") as f:
-        json.dump(tsconfig, f, indent=2)
-        f.write("\n")
+    out.write_text("tsconfig.json", json.dumps(tsconfig, indent=2) + "\n")
 
     env_example = [
         "# Copy to .env and set actual values",
         "OPENAI_API_KEY=your_openai_api_key_here",
         "# Optional: OPENAI_BASE_URL=https://api.openai.com/v1",
     ]
-    with open(os.path.join(output_dir, ".env.example"), "w", encoding="utf-8") as f:
-        f.write("\n".join(env_example) + "\n")
+    out.write_text(".env.example", "\n".join(env_example) + "\n")
 
 
-def generate_project(project: LangGraphProject, output_dir: str) -> str:
-    """Generate TypeScript LangGraph project from LangGraphProject IR."""
-    os.makedirs(output_dir, exist_ok=True)
+def generate_project(project: LangGraphProject, output_dir: str, sink: Optional[OutputSink] = None) -> str:
+    """Generate TypeScript LangGraph project from LangGraphProject IR (into *sink* when given, see emit.py)."""
     nodes_dir = os.path.join(output_dir, "nodes")
-    os.makedirs(nodes_dir, exist_ok=True)
 
     env = _create_jinja_env()
     ctx = _build_common_context(project)
     pattern = project.pattern_type
 
-    if pattern == "linear":
-        template = env.get_template("linear.index.ts.j2")
-        content = template.render(**ctx)
-        with open(os.path.join(output_dir, "index.ts"), "w", encoding="utf-8") as f:
-            f.write(content.strip() + "\n")
-    elif pattern == "tool_calling":
-        template = env.get_template("tool_calling.index.ts.j2")
-        content = template.render(**ctx)
-        with open(os.path.join(output_dir, "index.ts"), "w", encoding="utf-8") as f:
-            f.write(content.strip() + "\n")
-    elif pattern == "branching":
-        template = env.get_template("branching.index.ts.j2")
-        content = template.render(**ctx)
-        with open(os.path.join(output_dir, "index.ts"), "w", encoding="utf-8") as f:
-            f.write(content.strip() + "\n")
-    else:
-        # supervisor: full hub-and-spoke with explicit router node
-        index_template = env.get_template("supervisor.index.ts.j2")
-        types_template = env.get_template("supervisor.types.ts.j2")
-        router_template = env.get_template("supervisor.router.ts.j2")
-        general_template = env.get_template("supervisor.general-input.ts.j2")
-
-        with open(os.path.join(output_dir, "index.ts"), "w", encoding="utf-8") as f:
-            f.write(index_template.render(**ctx).strip() + "\n")
-
-        with open(os.path.join(output_dir, "types.ts"), "w", encoding="utf-8") as f:
-            f.write(types_template.render(**ctx).strip() + "\n")
-
-        with open(os.path.join(nodes_dir, "router.ts"), "w", encoding="utf-8") as f:
-            f.write(router_template.render(**ctx).strip() + "\n")
-
-        with open(os.path.join(nodes_dir, "general-input.ts"), "w", encoding="utf-8") as f:
-            f.write(general_template.render(**ctx).strip() + "\n")
-
-
-    _write_base_files(output_dir)
-
-    manifest = _build_manifest(output_dir, pattern)
-    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
-        f.write("\n")
+    with Emitter(output_dir, sink) as out:
+        out.mkdir(nodes_dir)
+        if pattern == "linear":
+            template = env.get_template("linear.index.ts.j2")
+            out.write_text("index.ts", template.render(**ctx).strip() + "\n")
+        elif pattern == "tool_calling":
+            template = env.get_template("tool_calling.index.ts.j2")
+            out.write_text("index.ts", template.render(**ctx).strip() + "\n")
+        elif pattern == "branching":
+            template = env.get_template("branching.index.ts.j2")
+            out.write_text("index.ts", template.render(**ctx).strip() + "\n")
+        else:
+            # supervisor: full hub-and-spoke with explicit router node
+            index_template = env.get_template("supervisor.index.ts.j2")
+            types_template = env.get_template("supervisor.types.ts.j2")
+            router_template = env.get_template("supervisor.router.ts.j2")
+            general_template = env.get_template("supervisor.general-input.ts.j2")
+
+            out.write_text("index.ts", index_template.render(**ctx).strip() + "\n")
+            out.write_text("types.ts", types_template.render(**ctx).strip() + "\n")
+            out.write_text(os.path.join(nodes_dir, "router.ts"), router_template.render(**ctx).strip() + "\n")
+            out.write_text(os.path.join(nodes_dir, "general-input.ts"), general_template.render(**ctx).strip() + "\n")
+
+        _write_base_files(out)
+
+        manifest = _build_manifest(out, pattern)
+        out.write_text("manifest.json", json.dumps(manifest, indent=2) + "\n")
 
     print(f"  [Generated] {output_dir}/ (TypeScript, pattern={pattern})")
     return output_dir
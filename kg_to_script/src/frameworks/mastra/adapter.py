@@ -6,8 +6,11 @@ import json
 import re
 from typing import Dict, List, Optional, Tuple
 
+from ...core.compact import as_project
 from ...core.helpers import camel
+from ...core.identifiers import kebab_case, lower_camel_case, schema_key
 from ...core.models import AgenticProject, WorkflowType
+from ...core.scope import ExtractionScope
 from .models import (
     ConfigModel,
     ControlFlowType,
@@ -21,35 +24,31 @@ from .models import (
     WorkflowModel,
 )
 
+# What the adapter and templates read beyond agents, tasks, tools and
+# workflows; task_relations fills task.performed_by_iri, which ties tools to tasks.
+EXTRACTION_SCOPE = ExtractionScope(
+    collections=(
+        "memories",
+        "goals",
+        "capabilities",
+        "environments",
+        "objectives",
+        "human_agents",
+    ),
+    relations=("task_relations",),
+)
+
 
 def _to_kebab(name: str) -> str:
-    clean = re.sub(r"[^a-zA-Z0-9]+", "-", name or "")
-    clean = re.sub(r"-+", "-", clean).strip("-").lower()
-    return clean or "mastra-project"
+    return kebab_case(name or "")
 
 
 def _to_camel(name: str) -> str:
-    if not name:
-        return "unnamed"
-    parts = re.split(r"[^a-zA-Z0-9]+", name)
-    parts = [p for p in parts if p]
-    if not parts:
-        return "unnamed"
-    head = parts[0].lower()
-    tail = "".join(p[:1].upper() + p[1:] for p in parts[1:])
-    out = head + tail
-    if out and out[0].isdigit():
-        out = f"item{out}"
-    return out
+    return lower_camel_case(name or "")
 
 
 def _safe_schema_key(name: str) -> str:
-    key = re.sub(r"[^a-zA-Z0-9_]+", "_", name or "").strip("_")
-    if not key:
-        return "value"
-    if key[0].isdigit():
-        key = f"field_{key}"
-    return key
+    return schema_key(name or "")
 
 
 def _to_zod_type(type_hint: str) -> str:
@@ -590,8 +589,11 @@ def _map_workflows(
 
 
 def adapt(project: AgenticProject) -> MastraProject:
-    """Adapt framework-agnostic AgenticProject into MastraProject."""
-    project = project.model_copy(deep=True)
+    """Adapt framework-agnostic AgenticProject into MastraProject.
+
+    Only reads *project*; every Mastra model is built fresh.
+    """
+    project = as_project(project)
 
     language_models_by_iri = _map_language_models(project)
     tools_by_iri, tools_var_by_iri = _map_tools(project)
@@ -9,7 +9,7 @@ from __future__ import annotations
 import warnings
 
 from ...core.extractor import extract_project
-from .adapter import adapt
+from .adapter import EXTRACTION_SCOPE, adapt
 from .models import MastraProject
 
 
@@ -24,4 +24,4 @@ def extract_mastra_project(ttl_path: str) -> MastraProject:
         DeprecationWarning,
         stacklevel=2,
     )
-    return adapt(extract_project(ttl_path))
+    return adapt(extract_project(ttl_path, scope=EXTRACTION_SCOPE))
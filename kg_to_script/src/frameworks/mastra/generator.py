@@ -23,10 +23,11 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 from jinja2 import Environment, FileSystemLoader
 
+from ..emit import Emitter, OutputSink
 from .models import MastraAgentModel, MastraProject, MastraToolModel, MemoryModel, WorkflowModel
 
 
@@ -291,52 +292,53 @@ def _sanitize_zod_schema(schema: Optional[str]) -> Optional[str]:
 
 # ─────────────────────── File Generators ───────────────────────
 
-def generate_project(project: MastraProject, output_dir: str) -> str:
+def generate_project(project: MastraProject, output_dir: str, sink: Optional[OutputSink] = None) -> str:
     """
     Generate complete Mastra AI TypeScript project directory.
     
     Args:
         project: MastraProject IR from extraction layer
         output_dir: Base output directory path
+        sink: Where the files go instead of the project directory (emit.py:
+            an in-memory tree or an archive); paths in it are relative to
+            the project directory
         
     Returns:
         Full path to generated project directory
     """
     project_dir = Path(output_dir) / project.project_var_name
-    project_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create src/mastra directory structure
     mastra_dir = project_dir / "src" / "mastra"
-    mastra_dir.mkdir(parents=True, exist_ok=True)
-    
-    (mastra_dir / "agents").mkdir(exist_ok=True)
-    (mastra_dir / "tools").mkdir(exist_ok=True)
-    (mastra_dir / "workflows").mkdir(exist_ok=True)
-    if project.memory_configs:
-        (mastra_dir / "memory").mkdir(exist_ok=True)
-    
-    # Generate files
-    _generate_index_ts(project, mastra_dir)
-    _generate_agent_files(project, mastra_dir / "agents")
-    _generate_tool_files(project, mastra_dir / "tools")
-    _generate_workflow_files(project, mastra_dir / "workflows")
-    _generate_ad_hoc_tasks(project, mastra_dir / "workflows")
-    _generate_agents_index(project, mastra_dir / "agents")
-    _generate_tools_index(project, mastra_dir / "tools")
-    _generate_workflows_index(project, mastra_dir / "workflows")
-    if project.memory_configs:
-        _generate_memory_files(project, mastra_dir / "memory")
-        _generate_memory_index(project, mastra_dir / "memory")
-    
-    _generate_package_json(project, project_dir)
-    _generate_tsconfig_json(project, project_dir)
-    _generate_env_example(project, project_dir)
-    _generate_readme(project, project_dir)
+
+    with Emitter(project_dir, sink) as out:
+        # Create src/mastra directory structure
+        out.mkdir(mastra_dir / "agents")
+        out.mkdir(mastra_dir / "tools")
+        out.mkdir(mastra_dir / "workflows")
+        if project.memory_configs:
+            out.mkdir(mastra_dir / "memory")
+
+        # Generate files
+        _generate_index_ts(project, mastra_dir, out)
+        _generate_agent_files(project, mastra_dir / "agents", out)
+        _generate_tool_files(project, mastra_dir / "tools", out)
+        _generate_workflow_files(project, mastra_dir / "workflows", out)
+        _generate_ad_hoc_tasks(project, mastra_dir / "workflows", out)
+        _generate_agents_index(project, mastra_dir / "agents", out)
+        _generate_tools_index(project, mastra_dir / "tools", out)
+        _generate_workflows_index(project, mastra_dir / "workflows", out)
+        if project.memory_configs:
+            _generate_memory_files(project, mastra_dir / "memory", out)
+            _generate_memory_index(project, mastra_dir / "memory", out)
+
+        _generate_package_json(project, project_dir, out)
+        _generate_tsconfig_json(project, project_dir, out)
+        _generate_env_example(project, project_dir, out)
+        _generate_readme(project, project_dir, out)
     
     return str(project_dir)
 
 
-def _generate_index_ts(project: MastraProject, mastra_dir: Path) -> None:
+def _generate_index_ts(project: MastraProject, mastra_dir: Path, out: Emitter) -> None:
     """Generate src/mastra/index.ts - Mastra instance + registrations."""
     env = _create_jinja_env()
     template = env.get_template("index.ts.j2")
@@ -348,10 +350,10 @@ def _generate_index_ts(project: MastraProject, mastra_dir: Path) -> None:
         memory_configs=project.memory_configs,
     )
     
-    (mastra_dir / "index.ts").write_text(content, encoding="utf-8")
+    out.write_text(mastra_dir / "index.ts", content)
 
 
-def _generate_agent_files(project: MastraProject, agents_dir: Path) -> None:
+def _generate_agent_files(project: MastraProject, agents_dir: Path, out: Emitter) -> None:
     """Generate per-agent TypeScript files."""
     env = _create_jinja_env()
     template = env.get_template("agent.ts.j2")
@@ -363,18 +365,18 @@ def _generate_agent_files(project: MastraProject, agents_dir: Path) -> None:
         )
         
         file_path = agents_dir / f"{agent.var_name}.ts"
-        file_path.write_text(content, encoding="utf-8")
+        out.write_text(file_path, content)
 
 
-def _generate_agents_index(project: MastraProject, agents_dir: Path) -> None:
+def _generate_agents_index(project: MastraProject, agents_dir: Path, out: Emitter) -> None:
     """Generate src/mastra/agents/index.ts export barrel."""
     env = _create_jinja_env()
     template = env.get_template("agents.index.ts.j2")
     content = template.render(agents=project.agents)
-    (agents_dir / "index.ts").write_text(content, encoding="utf-8")
+    out.write_text(agents_dir / "index.ts", content)
 
 
-def _generate_tool_files(project: MastraProject, tools_dir: Path) -> None:
+def _generate_tool_files(project: MastraProject, tools_dir: Path, out: Emitter) -> None:
     """Generate per-tool TypeScript files with createTool(). Skip storage tools."""
     env = _create_jinja_env()
     template = env.get_template("tool.ts.j2")
@@ -392,18 +394,18 @@ def _generate_tool_files(project: MastraProject, tools_dir: Path) -> None:
         content = template.render(tool=tool_for_render)
 
         file_path = tools_dir / f"{tool.var_name}.ts"
-        file_path.write_text(content, encoding="utf-8")
+        out.write_text(file_path, content)
 
 
-def _generate_tools_index(project: MastraProject, tools_dir: Path) -> None:
+def _generate_tools_index(project: MastraProject, tools_dir: Path, out: Emitter) -> None:
     """Generate src/mastra/tools/index.ts export barrel."""
     env = _create_jinja_env()
     template = env.get_template("tools.index.ts.j2")
     content = template.render(tools=project.tools)
-    (tools_dir / "index.ts").write_text(content, encoding="utf-8")
+    out.write_text(tools_dir / "index.ts", content)
 
 
-def _generate_workflow_files(project: MastraProject, workflows_dir: Path) -> None:
+def _generate_workflow_files(project: MastraProject, workflows_dir: Path, out: Emitter) -> None:
     """Generate per-workflow TypeScript files. (Milestone 2+)"""
     if not project.workflows:
         return
@@ -433,18 +435,18 @@ def _generate_workflow_files(project: MastraProject, workflows_dir: Path) -> Non
         )
         
         file_path = workflows_dir / f"{workflow.var_name}.ts"
-        file_path.write_text(content, encoding="utf-8")
+        out.write_text(file_path, content)
 
 
-def _generate_workflows_index(project: MastraProject, workflows_dir: Path) -> None:
+def _generate_workflows_index(project: MastraProject, workflows_dir: Path, out: Emitter) -> None:
     """Generate src/mastra/workflows/index.ts export barrel."""
     env = _create_jinja_env()
     template = env.get_template("workflows.index.ts.j2")
     content = template.render(workflows=project.workflows)
-    (workflows_dir / "index.ts").write_text(content, encoding="utf-8")
+    out.write_text(workflows_dir / "index.ts", content)
 
 
-def _generate_memory_files(project: MastraProject, memory_dir: Path) -> None:
+def _generate_memory_files(project: MastraProject, memory_dir: Path, out: Emitter) -> None:
     """Generate per-memory TypeScript files. (Milestone 3+)"""
     env = _create_jinja_env()
     template = env.get_template("memory.ts.j2")
@@ -461,18 +463,18 @@ def _generate_memory_files(project: MastraProject, memory_dir: Path) -> None:
         )
 
         file_path = memory_dir / f"{mem.var_name}.ts"
-        file_path.write_text(content, encoding="utf-8")
+        out.write_text(file_path, content)
 
 
-def _generate_memory_index(project: MastraProject, memory_dir: Path) -> None:
+def _generate_memory_index(project: MastraProject, memory_dir: Path, out: Emitter) -> None:
     """Generate src/mastra/memory/index.ts export barrel."""
     env = _create_jinja_env()
     template = env.get_template("memory.index.ts.j2")
     content = template.render(memory_configs=project.memory_configs)
-    (memory_dir / "index.ts").write_text(content, encoding="utf-8")
+    out.write_text(memory_dir / "index.ts", content)
 
 
-def _generate_package_json(project: MastraProject, project_dir: Path) -> None:
+def _generate_package_json(project: MastraProject, project_dir: Path, out: Emitter) -> None:
     """Generate package.json with auto-inferred dependencies."""
     env = _create_jinja_env()
     template = env.get_template("package.json.j2")
@@ -487,20 +489,20 @@ def _generate_package_json(project: MastraProject, project_dir: Path) -> None:
         dev_dependencies=dev_dependencies,
     )
     
-    (project_dir / "package.json").write_text(content, encoding="utf-8")
+    out.write_text(project_dir / "package.json", content)
 
 
-def _generate_tsconfig_json(project: MastraProject, project_dir: Path) -> None:
+def _generate_tsconfig_json(project: MastraProject, project_dir: Path, out: Emitter) -> None:
     """Generate tsconfig.json - TypeScript configuration."""
     env = _create_jinja_env()
     template = env.get_template("tsconfig.json.j2")
     
     content = template.render()
     
-    (project_dir / "tsconfig.json").write_text(content, encoding="utf-8")
+    out.write_text(project_dir / "tsconfig.json", content)
 
 
-def _generate_env_example(project: MastraProject, project_dir: Path) -> None:
+def _generate_env_example(project: MastraProject, project_dir: Path, out: Emitter) -> None:
     """Generate .env.example with required API keys."""
     env = _create_jinja_env()
     template = env.get_template("env.example.j2")
@@ -585,10 +587,10 @@ def _generate_env_example(project: MastraProject, project_dir: Path) -> None:
     
     content = template.render(env_vars=env_vars)
     
-    (project_dir / ".env.example").write_text(content, encoding="utf-8")
+    out.write_text(project_dir / ".env.example", content)
 
 
-def _generate_readme(project: MastraProject, project_dir: Path) -> None:
+def _generate_readme(project: MastraProject, project_dir: Path, out: Emitter) -> None:
     """Generate README.md with project documentation."""
     env = _create_jinja_env()
     template = env.get_template("README.md.j2")
@@ -601,10 +603,10 @@ def _generate_readme(project: MastraProject, project_dir: Path) -> None:
         workflows=project.workflows,
     )
     
-    (project_dir / "README.md").write_text(content, encoding="utf-8")
+    out.write_text(project_dir / "README.md", content)
 
 
-def _generate_ad_hoc_tasks(project: MastraProject, workflows_dir: Path) -> None:
+def _generate_ad_hoc_tasks(project: MastraProject, workflows_dir: Path, out: Emitter) -> None:
     """Generate standalone ad-hoc tasks as createStep steps."""
     workflow_task_iris = set()
     for wf in project.workflows:
@@ -621,4 +623,4 @@ def _generate_ad_hoc_tasks(project: MastraProject, workflows_dir: Path) -> None:
     env = _create_jinja_env()
     template = env.get_template("ad_hoc_tasks.ts.j2")
     content = template.render(tasks=ad_hoc_tasks)
-    (workflows_dir / "ad_hoc_tasks.ts").write_text(content, encoding="utf-8")
+    out.write_text(workflows_dir / "ad_hoc_tasks.ts", content)
@@ -7,6 +7,9 @@ Usage:
     From project root:
         python -m src.frameworks.mastra.run
 
+    Parallel batch (N worker processes, 0 = one per CPU):
+        python -m src.frameworks.mastra.run --jobs N
+
     Single file:
         python -m src.frameworks.mastra.run path/to/file.ttl
 
@@ -22,15 +25,19 @@ from pathlib import Path
 # Support both `python -m` and direct script execution
 try:
     from ...core.extractor import extract_project
-    from .adapter import adapt
+    from .adapter import EXTRACTION_SCOPE, adapt
     from .generator import generate_project
+    from ..batch import BatchItem, parse_runner_args, resolve_jobs, run_batch
+    from ..build_cache import plan_build
 except ImportError:
     sys.path.insert(
         0, str(Path(__file__).parent.parent.parent.parent)
     )
     from src.core.extractor import extract_project
-    from src.frameworks.mastra.adapter import adapt
+    from src.frameworks.mastra.adapter import EXTRACTION_SCOPE, adapt
     from src.frameworks.mastra.generator import generate_project
+    from src.frameworks.batch import BatchItem, parse_runner_args, resolve_jobs, run_batch
+    from src.frameworks.build_cache import plan_build
 
 
 def process_single(kg_path: str, output_dir: str) -> str:
@@ -51,7 +58,7 @@ def process_single(kg_path: str, output_dir: str) -> str:
     try:
         # Layer 1 + Layer 2: agnostic extraction -> Mastra-specific adaptation
         print("  [1/3] KG extraction + Mastra adaptation...")
-        project = adapt(extract_project(kg_path))
+        project = adapt(extract_project(kg_path, scope=EXTRACTION_SCOPE))
         
         # Override project_var_name with the filename to prevent overwriting
         base_name = Path(kg_path).stem
@@ -89,9 +96,11 @@ def main():
     project_root = Path(__file__).parent.parent.parent.parent
     output_base = project_root / "generated_projects" / "output_mastra"
 
+    args = parse_runner_args(__doc__)
+
     # ── Handle single-file mode ──
-    if len(sys.argv) > 1 and sys.argv[1].endswith(".ttl"):
-        kg_path = Path(sys.argv[1]).resolve()
+    if args.kg_path:
+        kg_path = Path(args.kg_path).resolve()
         
         if not kg_path.exists():
             print(f"[ERROR] File not found: {kg_path}")
@@ -132,11 +141,16 @@ def main():
         print(f"[WARNING] No .ttl files found in {kg_dir}")
         sys.exit(0)
 
-    # Clean output directory (commented out to preserve node_modules caches)
-    # if output_base.exists():
-    #     print(f"[INFO] Cleaning output directory: {output_base}")
-    #     shutil.rmtree(output_base)
-    output_base.mkdir(parents=True, exist_ok=True)
+    # Output is not cleaned, to preserve node_modules caches. The build
+    # manifest skips projects whose KG, templates and generator code are
+    # unchanged (--force: regenerate all) and removes those whose KG is gone.
+    # Every project lands in output_base/<project_var_name>, so project_dir
+    # tells the manifest and the pool which tree each item writes.
+    items = [
+        BatchItem(str(ttl_file), str(output_base), str(output_base / ttl_file.stem.replace("_instances", "")))
+        for ttl_file in ttl_files
+    ]
+    plan = plan_build("mastra", output_base, items, clean=False, force=args.force)
 
     # Header
     print("\n")
@@ -147,24 +161,29 @@ def main():
     print(f"  Source : {kg_dir}")
     print(f"  Output : {output_base}")
     print(f"  Files  : {len(ttl_files)} knowledge graphs")
+    print(f"  Jobs   : {resolve_jobs(args.jobs)}")
     print("=" * 65)
     print()
 
-    # Process each KG
-    success = 0
+    # Process each stale KG (on a process pool with --jobs; results come back in file order)
+    position = {item: i for i, item in enumerate(items, 1)}
+    success = len(plan.fresh)
     errors = []
-    
-    for i, ttl_file in enumerate(ttl_files, 1):
-        print(f"[{i}/{len(ttl_files)}] {ttl_file.name}")
-        
-        try:
-            process_single(str(ttl_file), str(output_base))
-            success += 1
-        except Exception as e:
-            error_msg = f"{ttl_file.name}: {str(e)}"
-            errors.append(error_msg)
-            print(f"  ✗ FAILED: {error_msg}\n")
-            continue
+
+    def announce(item: BatchItem) -> None:
+        print(f"[{position[item]}/{len(items)}] {item.name}")
+
+    try:
+        for result in run_batch(process_single, plan.stale, jobs=args.jobs, on_start=announce):
+            plan.record(result)
+            if result.ok:
+                success += 1
+            else:
+                error_msg = f"{result.item.name}: {result.error}"
+                errors.append(error_msg)
+                print(f"  ✗ FAILED: {error_msg}\n")
+    finally:
+        plan.save()
 
     # Final summary
     print("\n")
@@ -174,6 +193,7 @@ def main():
     print(f"  Total    : {len(ttl_files)} files")
     print(f"  Success  : {success} projects generated")
     print(f"  Failed   : {len(errors)} errors")
+    print(f"  {plan.summary()}")
     print("=" * 65)
     
     if errors:
@@ -0,0 +1,62 @@
+"""
+Shared corpus fixtures for the tests that run over every generated KG.
+
+A test that takes a ``kg_path`` argument is parametrized over every KG in
+script_to_kg/generated_kgs (ids like "CrewAI/recruitment_instances").
+``kg_graph(path)`` and ``kg_project(path)`` parse and extract each KG once
+per session and skip the calling test for KGs that do not parse.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.core.extractor import extract_project_from_graph
+from src.core.helpers import load_graph
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+KG_PATHS = sorted(KG_ROOT.glob("*/*.ttl"))
+
+
+def kg_id(path: Path) -> str:
+    return f"{path.parent.name}/{path.stem}"
+
+
+def pytest_generate_tests(metafunc):
+    if "kg_path" in metafunc.fixturenames:
+        metafunc.parametrize("kg_path", KG_PATHS, ids=kg_id)
+
+
+def _skip_on_error(cache: dict, path: Path, load):
+    if path not in cache:
+        try:
+            cache[path] = load(path)
+        except Exception as exc:  # a few generated KGs are not valid Turtle even after normalizing
+            cache[path] = exc
+    value = cache[path]
+    if isinstance(value, Exception):
+        pytest.skip(f"KG does not parse: {value}")
+    return value
+
+
+@pytest.fixture(scope="session")
+def kg_paths():
+    """Every corpus KG path, sorted."""
+    return KG_PATHS
+
+
+@pytest.fixture(scope="session")
+def kg_graph():
+    """kg_graph(path) → the rdflib Graph of a corpus KG, parsed once per session. Do not modify it."""
+    graphs = {}
+    return lambda path: _skip_on_error(graphs, Path(path), lambda p: load_graph(str(p)))
+
+
+@pytest.fixture(scope="session")
+def kg_project(kg_graph):
+    """kg_project(path) → the AgenticProject of a corpus KG, extracted once per session. Do not modify it."""
+    projects = {}
+    return lambda path: _skip_on_error(projects, Path(path), lambda p: extract_project_from_graph(kg_graph(p)))
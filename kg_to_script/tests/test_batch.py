@@ -0,0 +1,103 @@
+"""
+Tests for the runners' shared batch mode (src/frameworks/batch.py).
+
+A parallel run must report the same results, in the same order, as a
+sequential one. Its console output must come back per file and in file
+order, and its generated projects must be identical.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.frameworks.batch import BatchItem, parse_runner_args, resolve_jobs, run_batch
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+FRAMEWORK_DIRS = {"crewai": "CrewAI", "autogen": "AutoGen", "langgraph": "LangGraph", "mastra": "Mastra AI"}
+
+# Generated files that embed a timestamp (.generated_files holds manifest.json's hash).
+VOLATILE_FILES = {"manifest.json", ".generated_files"}
+
+
+def _echo(kg_path: str, output_dir: str) -> None:
+    print(f"start {os.path.basename(kg_path)}")
+    print(f"warn {kg_path}", file=sys.stderr)
+    if "bad" in kg_path:
+        raise ValueError(f"cannot process {os.path.basename(kg_path)}")
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "log.txt"), "a", encoding="utf-8") as handle:
+        handle.write(os.path.basename(kg_path) + "\n")
+
+
+def _read_tree(root: Path):
+    files = {}
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            if name not in VOLATILE_FILES:
+                path = Path(dirpath) / name
+                files[str(path.relative_to(root))] = path.read_bytes()
+    return files
+
+
+def _items(tmp_path: Path, names):
+    return [BatchItem(f"/kgs/{name}.ttl", str(tmp_path / name)) for name in names]
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_results_and_output_in_input_order(tmp_path, capsys, jobs):
+    names = ["a", "bad_b", "c", "d", "bad_e", "f"]
+    started = []
+    results = list(run_batch(_echo, _items(tmp_path, names), jobs=jobs, on_start=lambda item: started.append(item.name)))
+
+    assert [result.item.name for result in results] == started == [f"{name}.ttl" for name in names]
+    assert [result.error for result in results] == [
+        None, "cannot process bad_b.ttl", None, None, "cannot process bad_e.ttl", None,
+    ]
+    captured = capsys.readouterr()
+    assert captured.out.split() == [word for name in names for word in ("start", f"{name}.ttl")]
+    assert captured.err.split() == [word for name in names for word in ("warn", f"/kgs/{name}.ttl")]
+
+
+def test_items_writing_the_same_project_run_in_order(tmp_path):
+    shared = str(tmp_path / "shared")
+    items = [BatchItem(f"/kgs/{i}.ttl", shared if i % 2 else str(tmp_path / str(i))) for i in range(8)]
+    assert all(result.ok for result in run_batch(_echo, items, jobs=4))
+    assert (tmp_path / "shared" / "log.txt").read_text().split() == ["1.ttl", "3.ttl", "5.ttl", "7.ttl"]
+
+
+@pytest.mark.parametrize("framework", sorted(FRAMEWORK_DIRS))
+def test_parallel_runner_output_matches_sequential(tmp_path, framework):
+    run = importlib.import_module(f"src.frameworks.{framework}.run")
+    kg_paths = sorted((KG_ROOT / FRAMEWORK_DIRS[framework]).glob("*.ttl"))[:4]
+
+    trees, errors = [], []
+    for jobs in (1, 3):
+        root = tmp_path / f"jobs{jobs}"
+        if framework == "mastra":
+            items = [BatchItem(str(path), str(root), str(root / path.stem.replace("_instances", ""))) for path in kg_paths]
+        else:
+            items = [BatchItem(str(path), str(root / path.stem.replace("_instances", ""))) for path in kg_paths]
+        errors.append([result.error for result in run_batch(run.process_single, items, jobs=jobs)])
+        trees.append(_read_tree(root))
+    assert errors[0] == errors[1]
+    assert trees[0] == trees[1] and trees[0]
+
+
+def test_parse_runner_args():
+    assert (parse_runner_args(argv=[]).kg_path, parse_runner_args(argv=[]).jobs) == (None, 1)
+    args = parse_runner_args(argv=["--jobs", "4", "x.ttl"])
+    assert (args.kg_path, args.jobs) == ("x.ttl", 4)
+    assert parse_runner_args(argv=["-j", "0"]).jobs == 0
+    with pytest.raises(SystemExit):
+        parse_runner_args(argv=["notes.txt"])
+
+
+def test_resolve_jobs():
+    assert resolve_jobs(3) == 3
+    assert resolve_jobs(0) == (os.cpu_count() or 1)
@@ -0,0 +1,59 @@
+"""
+Tests for the parallel batch extraction API (extract_projects / iter_extract_projects).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.core.extractor import extract_project, extract_projects, iter_extract_projects
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+PATHS = sorted(str(p) for p in (KG_ROOT / "CrewAI").glob("*.ttl"))[:6]
+
+
+@pytest.fixture
+def broken_ttl(tmp_path):
+    path = tmp_path / "broken.ttl"
+    path.write_text("@prefix : <http://x/#> .\n:a :b [ [ [ .\n", encoding="utf-8")
+    return str(path)
+
+
+def test_results_match_serial_extraction_in_input_order():
+    results = extract_projects(PATHS, workers=3)
+    assert [r.path for r in results] == PATHS
+    assert [r.index for r in results] == list(range(len(PATHS)))
+    for result in results:
+        assert result.ok
+        assert result.project.model_dump() == extract_project(result.path).model_dump()
+
+
+def test_errors_are_captured_per_file(broken_ttl, tmp_path):
+    missing = str(tmp_path / "missing.ttl")
+    results = extract_projects([PATHS[0], broken_ttl, missing, PATHS[1]], workers=2)
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert results[1].project is None and results[1].error
+    assert results[2].error.startswith("FileNotFoundError:")
+
+
+def test_stream_yields_every_file_once():
+    seen = sorted(r.index for r in iter_extract_projects(PATHS, workers=2))
+    assert seen == list(range(len(PATHS)))
+
+
+def test_single_worker_runs_in_order(broken_ttl):
+    results = list(iter_extract_projects([broken_ttl, PATHS[0]], workers=1))
+    assert [r.index for r in results] == [0, 1]
+    assert [r.ok for r in results] == [False, True]
+
+
+def test_unknown_backend_fails_fast():
+    with pytest.raises(ValueError, match="Unknown extraction backend"):
+        extract_projects(PATHS, backend="nope")
+
+
+def test_empty_batch():
+    assert extract_projects([]) == []
@@ -0,0 +1,124 @@
+"""
+Tests for the multi-target build (src/build.py, src/cli.py).
+
+One build must extract each KG once and write, for every target, the same
+files as that framework's own runner pipeline
+(adapt(extract_project(path, scope=EXTRACTION_SCOPE)) → generate_project).
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+
+import src.build as build_module
+from src.build import TARGETS, build, collect_kgs, format_summary, parse_targets, project_dir_name
+from src.cli import main
+from src.core.extractor import extract_project
+from src.core.scope import COLLECTIONS, ExtractionScope
+from src.frameworks.build_cache import MANIFEST_NAME
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+# The first KG of each framework directory.
+SAMPLE_KGS = [sorted((KG_ROOT / directory).glob("*.ttl"))[0] for directory in TARGETS.values()]
+
+# Generated files that embed a timestamp (.generated_files holds manifest.json's hash).
+VOLATILE_FILES = {"manifest.json", ".generated_files"}
+
+
+def _read_tree(root: Path):
+    files = {}
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            if name not in VOLATILE_FILES:
+                path = Path(dirpath) / name
+                files[str(path.relative_to(root))] = path.read_bytes()
+    return files
+
+
+def _runner_output(target: str, kg_path: Path, root: Path) -> Path:
+    adapter = importlib.import_module(f"src.frameworks.{target}.adapter")
+    generator = importlib.import_module(f"src.frameworks.{target}.generator")
+    project = adapter.adapt(extract_project(str(kg_path), scope=adapter.EXTRACTION_SCOPE))
+    dir_name = project_dir_name(kg_path)
+    if target == "mastra":
+        project.project_var_name = dir_name
+        generator.generate_project(project, str(root))
+    else:
+        generator.generate_project(project, str(root / dir_name))
+    return root / dir_name
+
+
+def test_build_matches_runners(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(build_module, "extract_project", lambda path, **kw: calls.append(path) or extract_project(path, **kw))
+    roots = {target: tmp_path / "build" / target for target in TARGETS}
+
+    summary = build(SAMPLE_KGS, "all", output_roots=roots)
+
+    assert summary.ok and calls == [str(path) for path in SAMPLE_KGS]
+    for kg_path in SAMPLE_KGS:
+        for target in TARGETS:
+            expected = _runner_output(target, kg_path, tmp_path / "runner" / target)
+            built = roots[target] / project_dir_name(kg_path)
+            assert _read_tree(built) == _read_tree(expected), (target, kg_path.name)
+
+
+def test_extraction_error_is_reported_per_kg(tmp_path):
+    broken = tmp_path / "broken_instances.ttl"
+    broken.write_text(":a :b ", encoding="utf-8")
+    summary = build([broken, SAMPLE_KGS[0]], "autogen", output_roots={"autogen": tmp_path / "out"})
+
+    assert not summary.ok
+    assert [result.dir_name for result in summary.results] == ["broken", project_dir_name(SAMPLE_KGS[0])]
+    assert summary.succeeded("autogen") == 1
+    ((name, target, _),) = summary.failures()
+    assert (name, target) == ("broken_instances.ttl", "extract")
+    assert "1/2 generated" in format_summary(summary)
+
+
+def test_clean_removes_output_root(tmp_path):
+    root = tmp_path / "out"
+    (root / "stale").mkdir(parents=True)
+    build([SAMPLE_KGS[0]], "langgraph", output_roots={"langgraph": root}, clean=True)
+    assert sorted(os.listdir(root)) == [MANIFEST_NAME, project_dir_name(SAMPLE_KGS[0])]
+
+
+def test_parse_targets():
+    assert parse_targets("all") == list(TARGETS)
+    assert parse_targets(" Mastra,crewai,mastra ") == ["mastra", "crewai"]
+    with pytest.raises(ValueError, match="haystack"):
+        parse_targets("crewai,haystack")
+    with pytest.raises(ValueError, match="not being built"):
+        build([], "crewai", output_roots={"mastra": "/tmp/x"})
+
+
+def test_collect_kgs(tmp_path):
+    assert collect_kgs(targets=["crewai"]) == sorted((KG_ROOT / "CrewAI").glob("*.ttl"))
+    assert len(collect_kgs(targets=["crewai", "mastra"])) == len(list(KG_ROOT.glob("*/*.ttl")))
+    assert collect_kgs([SAMPLE_KGS[0], SAMPLE_KGS[0].parent]) == sorted(SAMPLE_KGS[0].parent.glob("*.ttl"))
+    with pytest.raises(FileNotFoundError):
+        collect_kgs([tmp_path / "missing.ttl"])
+
+
+def test_scope_union():
+    a = ExtractionScope(collections=("goals",), relations=())
+    b = ExtractionScope(collections=("memories",), relations=("task_relations",))
+    assert a.union(b) == ExtractionScope(collections=("goals", "memories"), relations=("task_relations",))
+    assert a.union() == a
+    assert ExtractionScope(collections=COLLECTIONS, relations=()).union(b).collections == frozenset(COLLECTIONS)
+
+
+def test_cli(tmp_path, capsys):
+    main(["build", "--targets", "crewai,autogen", "--output", f"crewai={tmp_path / 'c'}", "--output", f"autogen={tmp_path / 'a'}", str(SAMPLE_KGS[0])])
+    out = capsys.readouterr().out
+    assert "crewai     1/1 generated" in out and "autogen    1/1 generated" in out
+    assert (tmp_path / "a" / project_dir_name(SAMPLE_KGS[0])).is_dir()
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["build", "--targets", "crewai", "--output", "crewai"])
+    assert exit_info.value.code == 2
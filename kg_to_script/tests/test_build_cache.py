@@ -0,0 +1,168 @@
+"""
+Tests for the incremental build manifest (src/frameworks/build_cache.py).
+
+A second build must skip every project. Editing one TTL, a template or the
+generator code must rebuild exactly the projects it affects. A KG that
+disappears takes its project directory with it.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+import src.frameworks.build_cache as build_cache
+from src.build import build
+from src.frameworks.autogen.run import process_single
+from src.frameworks.batch import BatchItem, BatchResult, run_batch
+from src.frameworks.build_cache import MANIFEST_NAME, BuildManifest, Fingerprint, plan_build
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+AUTOGEN_KGS = sorted((KG_ROOT / "AutoGen").glob("*.ttl"))[:3]
+
+
+@pytest.fixture
+def kgs(tmp_path):
+    kg_dir = tmp_path / "kgs"
+    kg_dir.mkdir()
+    for path in AUTOGEN_KGS:
+        shutil.copy(path, kg_dir / path.name)
+    return sorted(kg_dir.glob("*.ttl"))
+
+
+def _items(kgs, root: Path):
+    return [BatchItem(str(path), str(root / path.stem.replace("_instances", ""))) for path in kgs]
+
+
+def _run(kgs, root: Path, **kwargs):
+    plan = plan_build("autogen", root, _items(kgs, root), **kwargs)
+    for result in run_batch(process_single, plan.stale):
+        plan.record(result)
+    plan.save()
+    return plan
+
+
+def _names(items):
+    return [Path(item.kg_path).name for item in items]
+
+
+def test_second_run_skips_everything(kgs, tmp_path):
+    root = tmp_path / "out"
+    first = _run(kgs, root)
+    assert (len(first.fresh), len(first.stale), first.removed) == (0, 3, [])
+
+    second = _run(kgs, root)
+    assert (_names(second.fresh), second.stale) == ([path.name for path in kgs], [])
+    assert second.summary() == "Incremental: 3 up to date, 0 rebuilt, 0 removed"
+    data = json.loads((root / MANIFEST_NAME).read_text())
+    assert sorted(data["projects"]) == sorted(path.stem.replace("_instances", "") for path in kgs)
+
+
+def test_changed_ttl_rebuilds_only_that_project(kgs, tmp_path):
+    root = tmp_path / "out"
+    _run(kgs, root)
+    keep = root / kgs[0].stem.replace("_instances", "") / "team.py"
+    mtime = keep.stat().st_mtime_ns
+
+    kgs[1].write_text(kgs[1].read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    plan = _run(kgs, root)
+    assert _names(plan.stale) == [kgs[1].name]
+    assert keep.stat().st_mtime_ns == mtime
+
+
+def test_template_or_code_change_rebuilds_everything(kgs, tmp_path, monkeypatch):
+    root = tmp_path / "out"
+    _run(kgs, root)
+    base = build_cache.framework_fingerprint("autogen")
+    for changed in (Fingerprint("", "new-templates", base.code), Fingerprint("", base.templates, "new-code")):
+        monkeypatch.setitem(build_cache._fingerprints, "autogen", changed)
+        assert len(_run(kgs, root).stale) == 3
+        assert len(_run(kgs, root).fresh) == 3
+
+
+def test_emit_module_change_rebuilds_everything(kgs, tmp_path, monkeypatch):
+    root = tmp_path / "out"
+    _run(kgs, root)
+    frameworks = tmp_path / "frameworks"
+    shutil.copytree(build_cache._FRAMEWORKS_DIR, frameworks, ignore=shutil.ignore_patterns("__pycache__"))
+    monkeypatch.setattr(build_cache, "_FRAMEWORKS_DIR", frameworks)
+    monkeypatch.setattr(build_cache, "_fingerprints", {})
+    assert len(_run(kgs, root).fresh) == 3
+
+    with open(frameworks / "emit.py", "a", encoding="utf-8") as handle:
+        handle.write("\n# changed\n")
+    monkeypatch.setattr(build_cache, "_fingerprints", {})
+    assert len(_run(kgs, root).stale) == 3
+
+
+def test_removed_kg_removes_its_project(kgs, tmp_path):
+    root = tmp_path / "out"
+    _run(kgs, root)
+    (root / "unrelated").mkdir()
+
+    plan = _run(kgs[:2], root)
+    gone = kgs[2].stem.replace("_instances", "")
+    assert plan.removed == [gone] and len(plan.fresh) == 2
+    assert not (root / gone).exists() and (root / "unrelated").is_dir()
+    assert gone not in BuildManifest.load(root, "autogen").projects
+
+
+def test_missing_project_dir_or_failure_is_rebuilt(kgs, tmp_path):
+    root = tmp_path / "out"
+    plan = _run(kgs, root)
+    shutil.rmtree(root / kgs[0].stem.replace("_instances", ""))
+    plan = plan_build("autogen", root, _items(kgs, root))
+    assert _names(plan.stale) == [kgs[0].name]
+
+    plan.record(BatchResult(plan.stale[0], error="boom"))
+    plan.save()
+    assert kgs[0].stem.replace("_instances", "") not in BuildManifest.load(root, "autogen").projects
+
+
+def test_full_rebuild_cleans_root_without_manifest(kgs, tmp_path):
+    root = tmp_path / "out"
+    (root / "leftover").mkdir(parents=True)
+    _run(kgs, root, clean=False)
+    assert (root / "leftover").is_dir()
+
+    (root / MANIFEST_NAME).write_text("{not json", encoding="utf-8")
+    plan = _run(kgs, root)
+    assert len(plan.stale) == 3 and not (root / "leftover").exists()
+
+    plan = _run(kgs, root, force=True)
+    assert len(plan.stale) == 3
+
+
+def test_manifest_of_another_framework_is_ignored(kgs, tmp_path):
+    root = tmp_path / "out"
+    _run(kgs, root)
+    assert not BuildManifest.load(root, "crewai").loaded
+    assert BuildManifest.load(root, "autogen").loaded
+
+
+def test_prune_stays_inside_root(kgs, tmp_path):
+    root = tmp_path / "out"
+    outside = tmp_path / "keep"
+    outside.mkdir()
+    _run(kgs, root)
+    manifest = json.loads((root / MANIFEST_NAME).read_text())
+    manifest["projects"]["../keep"] = next(iter(manifest["projects"].values()))
+    (root / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+    plan = _run(kgs, root)
+    assert plan.removed == ["../keep"] and outside.is_dir()
+
+
+def test_build_command_skips_up_to_date_kgs(kgs, tmp_path, monkeypatch):
+    roots = {"autogen": tmp_path / "a", "langgraph": tmp_path / "l"}
+    assert build(kgs, "autogen,langgraph", output_roots=roots).up_to_date("autogen") == 0
+
+    calls = []
+    monkeypatch.setattr("src.build.extract_project", lambda *args, **kwargs: calls.append(args))
+    summary = build(kgs, "autogen,langgraph", output_roots=roots)
+    assert calls == [] and summary.ok
+    assert (summary.up_to_date("autogen"), summary.succeeded("langgraph")) == (3, 3)
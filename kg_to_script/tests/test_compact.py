@@ -0,0 +1,120 @@
+"""
+Tests for the compact IR (src/core/compact.py).
+
+compact() / expand() must round-trip every corpus project exactly, records
+must pickle, adapters must produce the same output from either form, and a
+large set of compact projects must hold much less memory than the pydantic
+projects it came from.
+"""
+
+from __future__ import annotations
+
+import pickle
+import tracemalloc
+
+import pytest
+
+from benchmarks.synthetic import synthetic_kg
+from src.core.compact import (
+    CompactAgent,
+    CompactProject,
+    CompactRecord,
+    as_project,
+    compact,
+    expand,
+)
+from src.core.extractor import extract_project_from_graph, extract_projects
+from src.core.helpers import parse_ttl
+from src.core.models import AgenticProject
+
+
+FRAMEWORKS = ("autogen", "crewai", "langgraph", "mastra")
+
+
+def test_round_trip_is_lossless(kg_path, kg_project):
+    project = kg_project(kg_path)
+    record = compact(project)
+    assert isinstance(record, CompactProject)
+
+    restored = expand(record)
+    assert type(restored) is AgenticProject
+    assert restored == project
+    assert restored.model_dump() == project.model_dump()
+    assert expand(pickle.loads(pickle.dumps(record))) == project
+
+
+def test_expanded_projects_share_no_mutable_state(kg_paths, kg_project):
+    project = kg_project(kg_paths[0])
+    record = compact(project)
+    first = expand(record)
+    first.agents[0].tool_iris.append("urn:extra")
+    first.agents[0].configs["extra"] = "1"
+    first.tasks.clear()
+    assert expand(record) == project
+
+
+def test_records_are_slotted_and_identifiers_interned():
+    document = synthetic_kg(agents=10, tasks=20, seed=1)
+    first = compact(extract_project_from_graph(parse_ttl(document)))
+    second = compact(extract_project_from_graph(parse_ttl(document)))
+
+    agent = first.agents[0]
+    assert isinstance(agent, CompactAgent) and not hasattr(agent, "__dict__")
+    assert isinstance(agent.interacts_with, tuple)
+    assert isinstance(agent.configs, tuple) and len(agent.configs) % 2 == 0
+    # The same IRI read from two separate extractions is one string object.
+    assert agent.iri is second.agents[0].iri
+    assert first.agent_member_iris[0] is second.agent_member_iris[0]
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_adapters_accept_compact_projects(kg_path, framework, kg_project):
+    adapter = pytest.importorskip(f"src.frameworks.{framework}.adapter")
+    project = kg_project(kg_path)
+    before = project.model_dump()
+    assert adapter.adapt(compact(project)) == adapter.adapt(project)
+    assert project.model_dump() == before
+
+
+def test_as_project(kg_paths, kg_project):
+    project = kg_project(kg_paths[0])
+    assert as_project(project) is project
+    assert as_project(compact(project)) == project
+
+
+def test_shared_sub_models_stay_shared(kg_paths, kg_project):
+    project = kg_project(kg_paths[0])
+    assert any(agent.language_model for agent in project.agents)
+    restored = expand(pickle.loads(pickle.dumps(compact(project))))
+    by_iri = {lm.iri: lm for lm in restored.language_models}
+    for agent in restored.agents:
+        if agent.language_model is not None:
+            assert agent.language_model is by_iri[agent.language_model.iri]
+
+
+def test_extract_projects_compact(kg_paths):
+    paths = [str(path) for path in kg_paths[:3]]
+    plain = extract_projects(paths, workers=1)
+    compacted = extract_projects(paths, workers=1, compact=True)
+    for full, small in zip(plain, compacted):
+        assert small.ok == full.ok
+        if full.ok:
+            assert isinstance(small.project, CompactRecord)
+            assert expand(small.project) == full.project
+
+
+def test_compact_corpus_holds_less_memory():
+    document = synthetic_kg(agents=300, tasks=600, tools=30, steps=200, seed=3)
+    blob = pickle.dumps(extract_project_from_graph(parse_ttl(document)))
+
+    def held(keep) -> int:
+        tracemalloc.start()
+        try:
+            projects = [keep(pickle.loads(blob)) for _ in range(5)]
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(projects) == 5
+        return current
+
+    assert held(compact) < 0.5 * held(lambda project: project)
@@ -0,0 +1,63 @@
+"""
+Tests for merged multi-KG dataset mode (one GRAPH ?kgGraph query per corpus).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from rdflib.plugins.sparql import prepareQuery
+
+from src.core import prepared, queries
+from src.core.dataset import (
+    extract_dataset,
+    get_graph_query,
+    graph_iri,
+    graph_query_text,
+    load_dataset,
+    query_dataset,
+)
+from src.core.extractor import extract_project
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+PATHS = sorted(str(p) for p in (KG_ROOT / "CrewAI").glob("*.ttl"))
+
+
+def test_every_query_has_a_graph_form():
+    for name in prepared.QUERY_NAMES:
+        assert str(get_graph_query(name).algebra.PV[0]) == "kgGraph"
+
+
+def test_graph_query_text_wraps_where_group():
+    text = graph_query_text(queries.RESOURCES_QUERY)
+    assert "SELECT DISTINCT ?kgGraph ?res" in text
+    assert "GRAPH ?kgGraph {" in text
+    prepareQuery(text)
+
+
+def test_rows_match_per_graph_queries():
+    dataset = load_dataset(PATHS)
+    split = query_dataset(dataset)
+    for path in PATHS:
+        graph = dataset.graph(graph_iri(path))
+        rows = split[graph.identifier]
+        for name in prepared.QUERY_NAMES:
+            query = prepared.get_prepared(name)
+            assert list(rows.query(query)) == list(graph.query(query)), name
+
+
+def test_extract_dataset_matches_extract_project():
+    results = extract_dataset(PATHS)
+    assert [r.path for r in results] == PATHS
+    for result in results:
+        assert result.ok
+        assert result.project.model_dump() == extract_project(result.path).model_dump()
+
+
+def test_failures_are_captured(tmp_path):
+    broken = tmp_path / "broken.ttl"
+    broken.write_text("@prefix : <http://x/#> .\n:a :b [ [ [ .\n", encoding="utf-8")
+    results = extract_dataset([PATHS[0], str(broken), PATHS[0]])
+    assert [r.ok for r in results] == [True, False, False]
+    assert results[2].error.startswith("ValueError: Duplicate named graph")
@@ -0,0 +1,245 @@
+"""
+Tests for write-if-changed emission and output sinks (src/frameworks/emit.py).
+
+Regenerating a project from the same KG must leave every file (and its
+mtime) untouched. A file is only replaced atomically when its content
+changes, and files a previous generation emitted but this one does not
+are removed. An in-memory tree or archive must hold exactly the files the
+directory gets, and evaluation must score a tree like the directory.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.core.extractor import extract_project
+from src.frameworks.autogen.run import process_single
+from src.frameworks.batch import BatchItem, run_batch
+from src.frameworks.build_cache import plan_build
+from src.frameworks.emit import (
+    MANIFEST_NAME,
+    ArchiveSink,
+    Emitter,
+    MemorySink,
+    OutputSink,
+    load_record,
+    write_if_changed,
+)
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+FRAMEWORK_DIRS = {"crewai": "CrewAI", "autogen": "AutoGen", "langgraph": "LangGraph", "mastra": "Mastra AI"}
+
+
+def _generate(framework: str, output_dir: Path, sink=None):
+    adapter = importlib.import_module(f"src.frameworks.{framework}.adapter")
+    generator = importlib.import_module(f"src.frameworks.{framework}.generator")
+    kg_path = sorted((KG_ROOT / FRAMEWORK_DIRS[framework]).glob("*.ttl"))[0]
+    return Path(generator.generate_project(adapter.adapt(extract_project(str(kg_path))), str(output_dir), sink=sink))
+
+
+def _tree(root: Path):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*")
+        if path.is_file() and path.name not in {MANIFEST_NAME, "manifest.json"}
+    }
+
+
+def _mtimes(root: Path):
+    return {str(path.relative_to(root)): path.stat().st_mtime_ns for path in root.rglob("*") if path.is_file()}
+
+
+@pytest.mark.parametrize("framework", sorted(FRAMEWORK_DIRS))
+def test_regenerating_leaves_files_untouched(tmp_path, framework):
+    adapter = importlib.import_module(f"src.frameworks.{framework}.adapter")
+    generator = importlib.import_module(f"src.frameworks.{framework}.generator")
+    kg_path = sorted((KG_ROOT / FRAMEWORK_DIRS[framework]).glob("*.ttl"))[0]
+    project = extract_project(str(kg_path))
+
+    project_dir = Path(generator.generate_project(adapter.adapt(project), str(tmp_path / "out")))
+    before = _mtimes(project_dir)
+    record = load_record(project_dir)
+    assert record and set(record) == set(before) - {MANIFEST_NAME}
+
+    generator.generate_project(adapter.adapt(project), str(tmp_path / "out"))
+    assert _mtimes(project_dir) == before
+
+
+def test_langgraph_manifest_lists_emitted_files(tmp_path):
+    from src.frameworks.langgraph.adapter import adapt
+    from src.frameworks.langgraph.generator import generate_project
+
+    kg_path = sorted((KG_ROOT / "LangGraph").glob("*.ttl"))[0]
+    out = Path(generate_project(adapt(extract_project(str(kg_path))), str(tmp_path / "p")))
+    (out / "notes.txt").write_text("mine", encoding="utf-8")
+    generate_project(adapt(extract_project(str(kg_path))), str(out))
+
+    manifest = json.loads((out / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["generated_files"] == sorted(set(load_record(out)) - {"manifest.json"})
+    assert "notes.txt" not in manifest["generated_files"] and (out / "notes.txt").exists()
+
+
+def test_write_if_changed(tmp_path):
+    path = tmp_path / "sub" / "file.txt"
+    assert write_if_changed(path, b"one")
+    mtime = path.stat().st_mtime_ns
+    assert not write_if_changed(path, b"one") and path.stat().st_mtime_ns == mtime
+
+    os.chmod(path, 0o640)
+    assert write_if_changed(path, b"two")
+    assert path.read_bytes() == b"two" and path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in path.parent.iterdir()] == ["file.txt"]
+
+
+def test_files_no_longer_emitted_are_removed(tmp_path):
+    (tmp_path / "user.txt").write_text("keep", encoding="utf-8")
+    with Emitter(tmp_path) as out:
+        out.write_text("a.ts", "a")
+        out.write_text(tmp_path / "nested" / "b.ts", "b")
+    assert load_record(tmp_path) == {name: out.files[name] for name in ("a.ts", "nested/b.ts")}
+
+    with Emitter(tmp_path) as out:
+        out.write_text("a.ts", "a")
+        out.write_text("c.ts", "c")
+    assert (out.written, out.unchanged, out.removed) == (["c.ts"], ["a.ts"], ["nested/b.ts"])
+    assert not (tmp_path / "nested" / "b.ts").exists() and (tmp_path / "user.txt").exists()
+
+
+def test_failed_generation_removes_nothing(tmp_path):
+    with Emitter(tmp_path) as out:
+        out.write_text("a.ts", "a")
+    with pytest.raises(RuntimeError):
+        with Emitter(tmp_path) as out:
+            out.write_text("b.ts", "b")
+            raise RuntimeError("template error")
+    assert (tmp_path / "a.ts").exists()
+    assert sorted(load_record(tmp_path)) == ["a.ts", "b.ts"]
+
+
+def test_paths_outside_the_project_are_rejected(tmp_path):
+    out = Emitter(tmp_path / "project")
+    for path in ("../escape.ts", tmp_path / "escape.ts", "."):
+        with pytest.raises(ValueError):
+            out.write_text(path, "x")
+
+
+def test_stale_project_is_regenerated_in_place(tmp_path):
+    kg_path = tmp_path / "kgs" / "team_instances.ttl"
+    kg_path.parent.mkdir()
+    shutil.copy(sorted((KG_ROOT / "AutoGen").glob("*.ttl"))[0], kg_path)
+    root = tmp_path / "out"
+    items = [BatchItem(str(kg_path), str(root / "team"))]
+
+    for edit in ("", "\n# comment only\n"):
+        kg_path.write_text(kg_path.read_text(encoding="utf-8") + edit, encoding="utf-8")
+        plan = plan_build("autogen", root, items)
+        assert len(plan.stale) == 1
+        for result in run_batch(process_single, plan.stale):
+            assert result.ok
+            plan.record(result)
+        plan.save()
+        if not edit:
+            before = _mtimes(root / "team")
+    assert _mtimes(root / "team") == before
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, chunk):
+        self.data += chunk
+        return len(chunk)
+
+
+@pytest.mark.parametrize("framework", sorted(FRAMEWORK_DIRS))
+def test_memory_and_archive_sinks_hold_the_directory_tree(tmp_path, framework):
+    expected = _tree(_generate(framework, tmp_path / "disk"))
+
+    tree = MemorySink()
+    project_dir = _generate(framework, tmp_path / "mem", sink=tree)
+    assert not (tmp_path / "mem").exists()
+    assert {name: data for name, data in tree.files.items() if name != "manifest.json"} == expected
+
+    stream = _Unseekable()
+    with ArchiveSink(stream, format="tar.gz", prefix=project_dir.name) as archive:
+        _generate(framework, tmp_path / "tar", sink=archive)
+    with tarfile.open(fileobj=io.BytesIO(bytes(stream.data)), mode="r:gz") as tar:
+        names = [name for name in tar.getnames() if not name.endswith("/manifest.json")]
+        assert sorted(names) == sorted(f"{project_dir.name}/{name}" for name in expected)
+        assert {name.split("/", 1)[1]: tar.extractfile(name).read() for name in names} == expected
+
+    with ArchiveSink(tmp_path / "project.zip") as archive:
+        _generate(framework, tmp_path / "zip", sink=archive)
+    with zipfile.ZipFile(tmp_path / "project.zip") as zf:
+        assert {name: zf.read(name) for name in zf.namelist() if name != "manifest.json"} == expected
+    assert not (tmp_path / "tar").exists() and not (tmp_path / "zip").exists()
+
+
+def test_memory_sink_reuse_reports_changes_and_drops_old_files():
+    tree = MemorySink()
+    with Emitter("project", tree) as out:
+        out.write_text("a.ts", "a")
+        out.write_text("b.ts", "b")
+    with Emitter("project", tree) as out:
+        out.write_text("a.ts", "a")
+        out.write_text("c.ts", "c")
+    assert (out.written, out.unchanged, out.removed) == (["c.ts"], ["a.ts"], ["b.ts"])
+    assert list(tree) == ["a.ts", "c.ts"] and tree.read_text("c.ts") == "c"
+
+
+def test_sink_without_write_cannot_be_instantiated():
+    class ReadOnlySink(OutputSink):
+        def read(self, rel):
+            return b""
+
+    for sink in (OutputSink, ReadOnlySink):
+        with pytest.raises(TypeError):
+            sink()
+
+
+def test_failed_generation_adds_nothing_to_an_archive(tmp_path):
+    with ArchiveSink(tmp_path / "out.zip") as archive:
+        with pytest.raises(RuntimeError):
+            with Emitter("broken", archive) as out:
+                out.write_text("a.ts", "a")
+                raise RuntimeError("template error")
+        with Emitter("ok", archive) as out:
+            out.write_text("b.ts", "b")
+    with zipfile.ZipFile(tmp_path / "out.zip") as zf:
+        assert zf.namelist() == ["b.ts"]
+    with pytest.raises(ValueError):
+        ArchiveSink(tmp_path / "out.rar", format="rar")
+
+
+@pytest.mark.parametrize("framework", sorted(FRAMEWORK_DIRS))
+def test_evaluation_scores_memory_tree_like_directory(tmp_path, framework):
+    from evaluation.extractors.code_extractor import extract_code
+    from evaluation.metrics.compilation import compile_project
+
+    project_dir = _generate(framework, tmp_path / "disk")
+    tree = MemorySink()
+    _generate(framework, tmp_path / "mem", sink=tree)
+    # LangGraph's manifest.json is scored too, and its timestamp differs per run.
+    (project_dir / "manifest.json").unlink(missing_ok=True)
+    tree.files.pop("manifest.json", None)
+
+    on_disk, in_memory = extract_code(project_dir, framework), extract_code(tree.files, framework)
+    assert in_memory.source_text == on_disk.source_text
+    assert in_memory.elements == on_disk.elements
+    assert (in_memory.graph.nodes, in_memory.graph.edges) == (on_disk.graph.nodes, on_disk.graph.edges)
+    assert compile_project(tree.files, framework) == compile_project(project_dir, framework)
+    assert not compile_project({"main.py": b"def broken(:\n"}, "crewai")
@@ -0,0 +1,152 @@
+"""
+Tests for endpoint-backed extraction against the in-process LocalSPARQLServer.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+from src.core.endpoint import (
+    EndpointError,
+    LocalSPARQLServer,
+    SPARQLEndpoint,
+    extract_project_from_endpoint,
+    fetch_team_graph,
+    list_teams,
+)
+from src.core.extractor import extract_project
+from src.core.helpers import load_graph
+from src.core.partition import extract_teams, partition_by_team
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+MERGED = [
+    "LangGraph/chat-agent_instances.ttl",
+    "LangGraph/email-agent_instances.ttl",
+    "CrewAI/recruitment_instances.ttl",
+    "CrewAI/trip_planner_instances.ttl",
+]
+
+ONTO = "http://www.w3id.org/agentic-ai/onto#"
+
+# Three teams sharing one language model; each task is only reachable
+# backwards, through the agent it points at.
+TEAMS_TTL = "\n".join(
+    [
+        "@prefix : <http://www.w3id.org/agentic-ai/onto#> .",
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .",
+        ":gpt4 a :LanguageModel ; rdfs:label \"GPT-4\" .",
+    ]
+    + [
+        f":team{i} a :Team ; rdfs:label \"Team{i}\" ; :hasAgentMember :agent{i} .\n"
+        f":agent{i} a :LLMAgent ; :agentRole \"Role{i}\" ; :useLanguageModel :gpt4 .\n"
+        f":task{i} a :Task ; rdfs:label \"Task{i}\" ; :performedByAgent :agent{i} ."
+        for i in range(3)
+    ]
+)
+
+
+# team0 delegates to team1: its closure enters team1, which must not pull
+# team1's agent and task into team0's partition.
+CROSS_TEAM_TTL = TEAMS_TTL + "\n:agent0 :delegatesTo :team1 ."
+
+
+def _unordered(value):
+    """The IR with every list sorted: endpoint responses do not keep file order."""
+    if isinstance(value, dict):
+        return {key: _unordered(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return sorted((_unordered(item) for item in value), key=lambda item: json.dumps(item, sort_keys=True, default=str))
+    return value
+
+
+@pytest.fixture(scope="module")
+def merged_graph() -> Graph:
+    g = Graph()
+    for name in MERGED:
+        g += load_graph(str(KG_ROOT / name))
+    return g
+
+
+def test_one_construct_per_team_over_one_connection(merged_graph):
+    expected = [extract_project(str(KG_ROOT / name)) for name in MERGED]
+    with LocalSPARQLServer(merged_graph) as server, SPARQLEndpoint(server.url) as endpoint:
+        projects = [extract_project_from_endpoint(endpoint, project.team_iri) for project in expected]
+        assert server.requests == len(MERGED)
+        assert server.connections == 1
+
+    for project, single in zip(projects, expected):
+        assert _unordered(project.model_dump()) == _unordered(single.model_dump())
+
+
+@pytest.mark.parametrize("graph_name", ["merged", "cross_team"])
+def test_team_subgraph_matches_local_partition(merged_graph, graph_name):
+    graph = merged_graph if graph_name == "merged" else Graph().parse(data=CROSS_TEAM_TTL, format="turtle")
+    with LocalSPARQLServer(graph) as server:
+        for team, part in partition_by_team(graph).items():
+            assert set(fetch_team_graph(server.url, str(team))) == set(part.triples())
+
+
+def test_cross_team_link_extracts_like_local_teams(tmp_path):
+    kg_path = tmp_path / "teams.ttl"
+    kg_path.write_text(CROSS_TEAM_TTL, encoding="utf-8")
+    local = {project.team_iri: project for project in extract_teams(str(kg_path))}
+    with LocalSPARQLServer(Graph().parse(data=CROSS_TEAM_TTL, format="turtle")) as server:
+        for i in range(3):
+            project = extract_project_from_endpoint(server.url, f"{ONTO}team{i}")
+            assert project.team_iri == f"{ONTO}team{i}"
+            assert _unordered(project.model_dump()) == _unordered(local[project.team_iri].model_dump())
+    assert [agent.iri for agent in local[f"{ONTO}team0"].agents] == [f"{ONTO}agent0"]
+
+
+def test_attached_individuals_stay_with_their_team():
+    with LocalSPARQLServer(Graph().parse(data=TEAMS_TTL, format="turtle")) as server:
+        assert list_teams(server.url) == [f"{ONTO}team{i}" for i in range(3)]
+        project = extract_project_from_endpoint(server.url, f"{ONTO}team1")
+
+    assert [agent.iri for agent in project.agents] == [f"{ONTO}agent1"]
+    assert [task.iri for task in project.tasks] == [f"{ONTO}task1"]
+    assert [model.iri for model in project.language_models] == [f"{ONTO}gpt4"]
+
+
+def test_failed_query_raises_endpoint_error():
+    with LocalSPARQLServer(Graph()) as server, SPARQLEndpoint(server.url) as endpoint:
+        with pytest.raises(EndpointError, match="HTTP 400"):
+            endpoint.select("SELECT nonsense")
+
+
+def test_url_argument_closes_its_connections(monkeypatch):
+    closed = []
+    close = SPARQLEndpoint.close
+    monkeypatch.setattr(SPARQLEndpoint, "close", lambda self: closed.append(self) or close(self))
+    with LocalSPARQLServer(Graph().parse(data=TEAMS_TTL, format="turtle")) as server:
+        list_teams(server.url)
+        extract_project_from_endpoint(server.url, f"{ONTO}team1")
+        assert len(closed) == 2 and not any(client._idle for client in closed)
+
+        with SPARQLEndpoint(server.url) as endpoint:
+            list_teams(endpoint)
+            assert len(closed) == 2 and endpoint._idle
+
+
+class _FailingConnection:
+    closed = False
+
+    def request(self, *args, **kwargs):
+        raise KeyboardInterrupt
+
+    def close(self):
+        self.closed = True
+
+
+def test_interrupted_request_closes_its_connection(monkeypatch):
+    conn = _FailingConnection()
+    endpoint = SPARQLEndpoint("http://127.0.0.1:1/sparql")
+    monkeypatch.setattr(endpoint, "_connect", lambda scheme, netloc: conn)
+    with pytest.raises(KeyboardInterrupt):
+        endpoint.select("SELECT * WHERE { ?s ?p ?o }")
+    assert conn.closed and not endpoint._idle
@@ -0,0 +1,150 @@
+"""
+Tests for the shared graph algorithms (src/core/graph.py) and their call sites.
+
+Every algorithm runs on 100k-node chains and cycles, far beyond Python's
+recursion limit. On small random graphs, each one is checked against a brute-force
+reachability reference.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+
+import pytest
+
+from src.core.extractor import _infer_workflow_type
+from src.core.graph import (
+    Digraph,
+    antichains,
+    has_cycle,
+    levels,
+    strongly_connected_components,
+    topological_sort,
+)
+from src.core.models import TaskModel, WorkflowStepModel, WorkflowType
+
+
+LONG = 100_000
+
+
+def _chain(n: int, closed: bool = False) -> Digraph[int]:
+    edges = [(i, i + 1) for i in range(n - 1)]
+    if closed:
+        edges.append((n - 1, 0))
+    return Digraph(range(n), edges)
+
+
+def _reachable(graph: Digraph, start) -> set:
+    seen, stack = set(), list(graph.successors[start])
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(graph.successors[node])
+    return seen
+
+
+def _random_graph(seed: int) -> Digraph[int]:
+    rng = random.Random(seed)
+    n = rng.randint(1, 12)
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 2 * n))]
+    return Digraph(range(n), edges)
+
+
+def test_long_chain():
+    assert LONG > sys.getrecursionlimit() * 10
+    chain = _chain(LONG)
+    assert not has_cycle(chain)
+    assert topological_sort(chain) == list(range(LONG))
+    assert len(strongly_connected_components(chain)) == LONG
+    assert levels(chain)[LONG - 1] == LONG - 1
+    assert len(antichains(chain)) == LONG
+    assert (chain.sources(), chain.sinks()) == ([0], [LONG - 1])
+
+
+def test_long_chain_listed_backwards():
+    # Edges still run 0 -> 1 -> ..., but the nodes are listed in reverse, so
+    # every node's whole predecessor chain must be emitted before it.
+    chain = Digraph(reversed(range(LONG)), [(i, i + 1) for i in range(LONG - 1)])
+    assert topological_sort(chain) == list(range(LONG))
+
+
+def test_long_cycle():
+    cycle = _chain(LONG, closed=True)
+    assert has_cycle(cycle)
+    assert sorted(topological_sort(cycle)) == list(range(LONG))
+    (component,) = strongly_connected_components(cycle)
+    assert sorted(component) == list(range(LONG))
+    assert set(levels(cycle).values()) == {0}
+
+
+def test_degrees_count_parallel_edges():
+    graph = Digraph(["a", "b"], [("a", "b"), ("a", "b"), ("b", "c")])
+    assert graph.nodes == ["a", "b", "c"]
+    assert (graph.out_degree("a"), graph.in_degree("b"), graph.out_degree("z")) == (2, 2, 0)
+    assert graph.edge_count() == 3 and len(graph) == 3 and "c" in graph
+
+
+def test_self_loop_is_a_cycle():
+    assert has_cycle(Digraph(edges=[("a", "a")]))
+    assert topological_sort(Digraph(edges=[("a", "a")])) == ["a"]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_against_reachability(seed):
+    graph = _random_graph(seed)
+    nodes = graph.nodes
+    reach = {node: _reachable(graph, node) for node in nodes}
+
+    assert has_cycle(graph) == any(node in reach[node] for node in nodes)
+
+    components = strongly_connected_components(graph)
+    assert sorted(node for component in components for node in component) == sorted(nodes)
+    component_of = {node: i for i, component in enumerate(components) for node in component}
+    for a in nodes:
+        for b in nodes:
+            mutual = a == b or (b in reach[a] and a in reach[b])
+            assert (component_of[a] == component_of[b]) == mutual
+            if b in reach[a] and not mutual:
+                # Reverse topological order: reachable components come first.
+                assert component_of[b] < component_of[a]
+
+    order = topological_sort(graph)
+    assert sorted(order) == sorted(nodes)
+    if not has_cycle(graph):
+        position = {node: i for i, node in enumerate(order)}
+        assert all(position[a] < position[b] for a in nodes for b in graph.successors[a])
+        for group in antichains(graph):
+            assert not any(b in reach[a] for a in group for b in group)
+
+    level = levels(graph)
+    for a in nodes:
+        for b in graph.successors[a]:
+            assert level[b] > level[a] or component_of[a] == component_of[b]
+
+
+def test_infer_workflow_type_on_long_chain():
+    steps = [
+        WorkflowStepModel(
+            iri=f"urn:step{i}",
+            step_order=i,
+            task_var_name=f"task_{i}",
+            next_step_iris=[f"urn:step{(i + 1) % LONG}"] if i < LONG - 1 else [],
+        )
+        for i in range(LONG)
+    ]
+    assert _infer_workflow_type("", steps) == WorkflowType.SEQUENTIAL
+    steps[-1].next_step_iris = ["urn:step0"]
+    assert _infer_workflow_type("", steps) == WorkflowType.LOOP
+
+
+def test_crewai_task_sort_on_long_dependency_chain():
+    adapter = pytest.importorskip("src.frameworks.crewai.adapter")
+    n = 20_000
+    # Listed last-first; each task requires the one before it.
+    tasks = [
+        TaskModel(iri=f"urn:t{i}", var_name=f"t{i}", context_task_var_names=[f"t{i - 1}"] if i else [])
+        for i in reversed(range(n))
+    ]
+    assert [task.var_name for task in adapter._topological_sort_tasks(tasks)] == [f"t{i}" for i in range(n)]
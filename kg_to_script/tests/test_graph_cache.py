@@ -0,0 +1,112 @@
+"""
+Tests for the on-disk caches: the shared pickle store and the parsed-graph cache.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+from rdflib import Graph
+
+from src.core import cache as disk_cache
+from src.core import graph_cache
+from src.core.graph_cache import GraphCache
+from src.core.helpers import load_graph
+
+
+TTL = """
+@prefix : <http://www.w3id.org/agentic-ai/onto#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+:my_team a :Team ;
+    rdfs:label "MyTeam" ;
+    :hasAgentMember :agent_alice .
+
+:agent_alice a :LLMAgent ;
+    :agentRole "Leader" .
+"""
+
+
+@pytest.fixture
+def ttl_file(tmp_path):
+    path = tmp_path / "team.ttl"
+    path.write_text(TTL, encoding="utf-8")
+    return path
+
+
+def _graph(n: int) -> Graph:
+    g = Graph()
+    g.parse(data=TTL.replace("MyTeam", f"Team{n}"), format="turtle")
+    return g
+
+
+def test_load_graph_populates_then_hits_cache(tmp_path, ttl_file, monkeypatch):
+    cache = GraphCache(tmp_path / "cache")
+    first = load_graph(str(ttl_file), cache=cache)
+    assert len(cache.entries()) == 1
+
+    # A hit must not re-parse.
+    monkeypatch.setattr("src.core.helpers.parse_ttl", lambda *_: pytest.fail("cache miss"))
+    second = load_graph(str(ttl_file), cache=cache)
+    assert set(second) == set(first)
+
+
+def test_key_depends_on_content_and_normalizer_version(monkeypatch):
+    key = GraphCache.key_for(TTL)
+    assert GraphCache.key_for(TTL + "\n") != key
+    monkeypatch.setattr(graph_cache, "NORMALIZER_VERSION", "test")
+    assert GraphCache.key_for(TTL) != key
+
+
+def test_cache_disabled_by_default(ttl_file, tmp_path, monkeypatch):
+    monkeypatch.delenv(graph_cache.GRAPH_CACHE_ENV, raising=False)
+    monkeypatch.setenv(disk_cache.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    load_graph(str(ttl_file))
+    assert GraphCache().entries() == []
+
+    monkeypatch.setenv(graph_cache.GRAPH_CACHE_ENV, "1")
+    load_graph(str(ttl_file))
+    assert len(GraphCache().entries()) == 1
+
+
+def test_unreadable_entry_is_dropped(tmp_path):
+    cache = GraphCache(tmp_path)
+    key = GraphCache.key_for(TTL)
+    cache.put(key, _graph(0))
+    cache.entries()[0].path.write_bytes(b"not a pickle")
+    assert cache.get(key) is None
+    assert cache.entries() == []
+
+
+def test_evict_by_age(tmp_path):
+    cache = GraphCache(tmp_path)
+    cache.put("old", _graph(0))
+    cache.put("new", _graph(1))
+    stale = time.time() - 10 * 86400
+    os.utime(cache.root / "old.pickle", (stale, stale))
+
+    assert cache.evict(max_age_days=5) == 1
+    assert [entry.key for entry in cache.entries()] == ["new"]
+
+
+def test_evict_by_size_drops_least_recently_used(tmp_path):
+    cache = GraphCache(tmp_path)
+    for n in range(3):
+        cache.put(f"g{n}", _graph(n))
+        stamp = time.time() - (10 - n)
+        os.utime(cache.root / f"g{n}.pickle", (stamp, stamp))
+    cache.get("g0")  # touch: g1 becomes the least recently used
+
+    entry_size = max(entry.size for entry in cache.entries())
+    assert cache.evict(max_bytes=2 * entry_size) == 1
+    assert sorted(entry.key for entry in cache.entries()) == ["g0", "g2"]
+
+
+def test_clear(tmp_path):
+    cache = GraphCache(tmp_path)
+    cache.put("a", _graph(0))
+    cache.put("b", _graph(1))
+    assert cache.clear() == 2
+    assert cache.total_bytes() == 0
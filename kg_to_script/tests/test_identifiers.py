@@ -0,0 +1,92 @@
+"""
+Tests for the shared identifier normalization (src/core/identifiers.py).
+
+Each kernel function must return exactly what its pre-kernel call site
+returned (the reference implementations in benchmarks/identifiers.py). The
+inputs are every IRI and literal in the corpus plus random strings.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+
+import pytest
+
+from benchmarks import identifiers as ref
+from evaluation.utils import aliases_for, normalize_name, token_set
+from src.core import identifiers
+from src.core.helpers import camel, safe_var
+from src.frameworks.langgraph.adapter import _to_lower_camel
+from src.frameworks.mastra.adapter import _safe_schema_key, _to_camel, _to_kebab
+
+
+ALPHABET = string.ascii_letters + string.digits + "_- :#/.é"
+
+PAIRS = [
+    (safe_var, ref.ref_safe_var),
+    (camel, ref.ref_camel),
+    (_to_camel, ref.ref_to_camel),
+    (_to_kebab, ref.ref_to_kebab),
+    (_safe_schema_key, ref.ref_safe_schema_key),
+    (normalize_name, ref.ref_normalize_name),
+    (token_set, ref.ref_token_set),
+]
+
+
+def _random_names(seed: int, count: int = 500) -> list:
+    rng = random.Random(seed)
+    return ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 20))) for _ in range(count)]
+
+
+def _check(names) -> None:
+    for name in names:
+        for kernel, reference in PAIRS:
+            assert kernel(name) == reference(name), (kernel.__name__, name)
+        assert set(aliases_for(name, name.upper())) == set(ref.ref_aliases_for(name, name.upper())), name
+
+
+def test_matches_reference_on_corpus(kg_path, kg_graph):
+    _check({str(term) for triple in kg_graph(kg_path) for term in triple})
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_reference_on_random_strings(seed):
+    _check(_random_names(seed))
+
+
+def test_langgraph_lower_camel():
+    assert _to_lower_camel("research-agent") == "researchAgent"
+    assert _to_lower_camel("--") == "node"
+    assert _to_lower_camel("2nd step") == "n2ndStep"
+
+
+def test_aliases_are_deterministic():
+    assert aliases_for("http://x/onto#ResearchAgent", "researchAgent") == ("http_x_onto_research_agent", "research_agent")
+    assert aliases_for(None, " ", "a-b") == ("a_b",)
+
+
+def test_long_inputs_are_not_cached():
+    identifiers.cache_clear()
+    long_text = "ResearchAgent " * 100
+    assert len(long_text) > identifiers.MAX_CACHED_LENGTH
+    assert identifiers.normalize_name(long_text) == ref.ref_normalize_name(long_text)
+    assert identifiers.normalize_name.cache_info().currsize == 0
+
+    identifiers.normalize_name("ResearchAgent")
+    identifiers.normalize_name("ResearchAgent")
+    info = identifiers.normalize_name.cache_info()
+    assert (info.currsize, info.hits) == (1, 1)
+
+    assert identifiers.lower_camel_case(long_text) == ref.ref_to_camel(long_text)
+    identifiers.lower_camel_case("research-agent")
+    identifiers.lower_camel_case("research-agent", empty="node", digit_prefix="n")
+    info = identifiers._camel_words.cache_info()
+    assert (info.currsize, info.hits) == (1, 1)
+
+
+def test_is_snake_identifier():
+    assert identifiers.is_snake_identifier("research_agent_2")
+    assert identifiers.is_snake_identifier("_private")
+    assert not identifiers.is_snake_identifier("2agent")
+    assert not identifiers.is_snake_identifier("researchAgent")
@@ -0,0 +1,165 @@
+"""
+Tests for incremental re-extraction (src/core/incremental.py).
+
+After any edit, the incremental result must equal a full extraction of the
+new file on both backends. It must re-run only the queries that read a
+changed group and report the edit in its ChangeSet.
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Literal
+from rdflib.namespace import RDF
+
+from benchmarks.synthetic import synthetic_kg
+from src.core.extractor import extract_project, extract_project_from_graph
+from src.core.helpers import load_graph
+from src.core.incremental import (
+    IncrementalCache,
+    diff_projects,
+    extract_incremental,
+    query_dependencies,
+)
+from src.core.index import AGENTO
+from src.core.models import AgenticProject
+
+
+BACKENDS = ("sparql", "index")
+ONTO = "http://www.w3id.org/agentic-ai/onto#"
+
+
+def _triples(graph) -> list:
+    triples = list(graph)
+    if any(isinstance(term, BNode) for triple in triples for term in triple):
+        pytest.skip("blank-node labels differ between any two parses")
+    return triples
+
+
+def _write(path: Path, triples: list) -> str:
+    path.write_text("".join(f"{s.n3()} {p.n3()} {o.n3()} .\n" for s, p, o in triples), encoding="utf-8")
+    return str(path)
+
+
+def _edit(triples: list, rng: random.Random) -> list:
+    triples = list(triples)
+    op = rng.choice(("drop", "literal", "copy", "swap"))
+    if op == "drop":
+        triples.pop(rng.randrange(len(triples)))
+    elif op == "literal":
+        plain = [i for i, (_, _, o) in enumerate(triples) if isinstance(o, Literal) and o.datatype is None]
+        if plain:
+            i = rng.choice(plain)
+            s, p, o = triples[i]
+            triples[i] = (s, p, Literal(f"{o} (edited)", lang=o.language))
+    elif op == "copy":
+        _, p, o = rng.choice(triples)
+        triples.append((rng.choice(triples)[0], p, o))
+    else:
+        i, j = rng.randrange(len(triples)), rng.randrange(len(triples))
+        triples[i], triples[j] = triples[j], triples[i]
+    return triples
+
+
+@pytest.fixture
+def cache(tmp_path) -> IncrementalCache:
+    return IncrementalCache(tmp_path / "cache")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_matches_full_extraction_after_edits(kg_path, backend, cache, tmp_path, kg_graph):
+    triples = _triples(kg_graph(kg_path))
+    target = tmp_path / "kg.ttl"
+    rng = random.Random(kg_path.name)
+    for _ in range(3):
+        file_path = _write(target, triples)
+        try:
+            full = extract_project_from_graph(load_graph(file_path), backend=backend)
+        except Exception:  # the edit broke the KG (e.g. a dangling step order)
+            break
+        project, changes = extract_incremental(file_path, backend=backend, cache=cache)
+        assert project == full and project.model_dump() == full.model_dump()
+        by_iri = {lm.iri: lm for lm in project.language_models}
+        assert all(a.language_model is by_iri[a.language_model.iri] for a in project.agents if a.language_model)
+        triples = _edit(triples, rng)
+
+
+def test_first_run_is_full_and_unchanged_file_is_free(cache, tmp_path):
+    path = tmp_path / "kg.ttl"
+    path.write_text(synthetic_kg(agents=4, tasks=6, seed=2), encoding="utf-8")
+
+    project, changes = extract_incremental(str(path), cache=cache)
+    assert changes.full and changes.requeried and not changes.replayed
+    assert changes.entities["agents"].added == [a.iri for a in project.agents]
+
+    again, changes = extract_incremental(str(path), cache=cache)
+    assert again == project
+    assert not changes.full and not changes.changed and not changes.requeried
+    assert (changes.added_triples, changes.removed_triples) == (0, 0)
+
+
+def test_reformatted_file_replays_every_query(cache, tmp_path):
+    path = tmp_path / "kg.ttl"
+    document = synthetic_kg(agents=4, tasks=6, seed=2)
+    path.write_text(document, encoding="utf-8")
+    project, _ = extract_incremental(str(path), cache=cache)
+
+    path.write_text("# regenerated\n" + document.replace(" ;\n", " ;\n\n"), encoding="utf-8")
+    again, changes = extract_incremental(str(path), cache=cache)
+    assert again == project and not changes.changed
+    assert not changes.requeried and changes.replayed
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_role_edit_requeries_only_agent_queries(backend, cache, tmp_path):
+    path = tmp_path / "kg.ttl"
+    document = synthetic_kg(agents=6, tasks=10, seed=4)
+    path.write_text(document, encoding="utf-8")
+    extract_incremental(str(path), backend=backend, cache=cache)
+
+    start = document.index(':agentRole "', document.index(":agent_1 a :LLMAgent"))
+    edited = document[:start] + ':agentRole "Editor' + document[start + len(':agentRole "'):]
+    path.write_text(edited, encoding="utf-8")
+    after, changes = extract_incremental(str(path), backend=backend, cache=cache)
+
+    assert after == extract_project(str(path), backend=backend)
+    assert set(changes.requeried) == {"AGENTS_QUERY", "HUMAN_AGENTS_QUERY"}
+    assert changes.changed_subjects == [f"{ONTO}agent_1"]
+    assert (changes.added_triples, changes.removed_triples) == (1, 1)
+    assert changes.fields == [] and list(changes.entities) == ["agents"]
+    assert changes.entities["agents"].modified == [f"{ONTO}agent_1"]
+    assert after.agents[1].role.startswith("Editor")
+
+
+def test_added_and_removed_entities(cache, tmp_path):
+    path = tmp_path / "kg.ttl"
+    small = tmp_path / "small.ttl"
+    path.write_text(synthetic_kg(agents=3, tasks=4, seed=5), encoding="utf-8")
+    extract_incremental(str(path), cache=cache)
+
+    path.write_text(synthetic_kg(agents=4, tasks=3, seed=5), encoding="utf-8")
+    project, changes = extract_incremental(str(path), cache=cache)
+    small.write_text(synthetic_kg(agents=4, tasks=3, seed=5), encoding="utf-8")
+    assert project == extract_project(str(small))
+    assert f"{ONTO}agent_3" in changes.entities["agents"].added
+    assert f"{ONTO}task_3" in changes.entities["tasks"].removed
+
+
+def test_diff_projects():
+    old = AgenticProject(name="p", agents=[{"iri": "urn:a", "var_name": "a"}, {"iri": "urn:b", "var_name": "b"}])
+    new = AgenticProject(name="q", agents=[{"iri": "urn:b", "var_name": "b"}, {"iri": "urn:a", "var_name": "a"}])
+    fields, entities = diff_projects(old, new)
+    assert fields == ["name"]
+    assert entities["agents"].reordered and not entities["agents"].modified
+
+    fields, entities = diff_projects(None, old)
+    assert fields == [] and entities["agents"].added == ["urn:a", "urn:b"]
+
+
+def test_query_dependencies_include_filter_patterns():
+    assert (RDF.type, AGENTO.LLMAgent) in query_dependencies("TOOLS_QUERY")
+    assert (RDF.type, AGENTO.Tool) in query_dependencies("TOOLS_QUERY")
+    assert AGENTO.nextStep in query_dependencies("STEP_EDGES_QUERY")
@@ -0,0 +1,45 @@
+"""
+Parity tests for the triple-index extraction backend.
+
+Every KG in script_to_kg/generated_kgs is extracted with both backends; the
+index backend must return the same rows for every query constant (in the same
+order) and build an identical AgenticProject.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.core import prepared, queries
+from src.core.extractor import extract_project, extract_project_from_graph
+from src.core.index import TripleIndex
+
+
+def test_corpus_is_present(kg_paths):
+    assert len(kg_paths) == 47
+
+
+def test_index_rows_match_sparql(kg_path, kg_graph):
+    g = kg_graph(kg_path)
+    index = TripleIndex(g)
+    for name in prepared.QUERY_NAMES:
+        query = prepared.get_prepared(name)
+        expected = [tuple(row) for row in g.query(query)]
+        assert [tuple(row) for row in index.query(query)] == expected, name
+
+
+def test_index_project_matches_sparql(kg_path, kg_graph):
+    g = kg_graph(kg_path)
+    expected = extract_project_from_graph(g, backend="sparql")
+    actual = extract_project_from_graph(g, backend="index")
+    assert actual.model_dump() == expected.model_dump()
+
+
+def test_index_accepts_raw_query_strings(kg_paths, kg_graph):
+    index = TripleIndex(kg_graph(kg_paths[0]))
+    assert index.query(queries.AGENTS_QUERY) == index.query(prepared.AGENTS_QUERY)
+
+
+def test_unknown_backend(kg_paths):
+    with pytest.raises(ValueError):
+        extract_project(str(kg_paths[0]), backend="nope")
@@ -0,0 +1,76 @@
+"""
+Tests for the persistent AgenticProject IR cache.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.core import ir_cache
+from src.core.extractor import extract_project
+from src.core.ir_cache import IRCache
+
+
+TTL = """
+@prefix : <http://www.w3id.org/agentic-ai/onto#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+:my_team a :Team ;
+    rdfs:label "MyTeam" ;
+    :hasAgentMember :agent_alice .
+
+:agent_alice a :LLMAgent ;
+    :agentRole "Leader" ;
+    :useLanguageModel :gpt4 .
+
+:gpt4 a :LanguageModel ;
+    rdfs:label "GPT-4" .
+"""
+
+
+@pytest.fixture
+def ttl_file(tmp_path):
+    path = tmp_path / "team.ttl"
+    path.write_text(TTL, encoding="utf-8")
+    return path
+
+
+def test_second_extraction_is_served_from_cache(tmp_path, ttl_file, monkeypatch, capsys):
+    cache = IRCache(tmp_path / "cache")
+    first = extract_project(str(ttl_file), cache=cache)
+    assert len(cache.entries()) == 1
+
+    monkeypatch.setattr(
+        "src.core.extractor.extract_project_from_graph",
+        lambda *args, **kwargs: pytest.fail("IR cache miss"),
+    )
+    capsys.readouterr()
+    second = extract_project(str(ttl_file), cache=cache)
+    assert second.model_dump() == first.model_dump()
+    # run.py scripts still get their console summary on a hit
+    assert "[Extracted] project=MyTeam" in capsys.readouterr().out
+
+
+def test_cached_ir_keeps_shared_language_model(tmp_path, ttl_file):
+    cache = IRCache(tmp_path / "cache")
+    extract_project(str(ttl_file), cache=cache)
+    project = extract_project(str(ttl_file), cache=cache)
+    assert project.agents[0].language_model is project.language_models[0]
+
+
+def test_key_tracks_content_and_extractor_fingerprint(monkeypatch):
+    key = IRCache.key_for(TTL)
+    assert IRCache.key_for(TTL + "\n") != key
+    monkeypatch.setattr(ir_cache, "_fingerprint", "changed")
+    assert IRCache.key_for(TTL) != key
+
+
+def test_env_opt_in(tmp_path, ttl_file, monkeypatch):
+    monkeypatch.setenv("KG_TO_SCRIPT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv(ir_cache.IR_CACHE_ENV, raising=False)
+    extract_project(str(ttl_file))
+    assert IRCache().entries() == []
+
+    monkeypatch.setenv(ir_cache.IR_CACHE_ENV, "1")
+    extract_project(str(ttl_file))
+    assert len(IRCache().entries()) == 1
@@ -0,0 +1,172 @@
+"""
+Tests for normalize_ttl: golden output on the corpus, targeted repairs,
+linear scaling on large synthetic input, and the strict-parse fast path.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+
+from benchmarks.normalizer import synthetic_ttl
+from src.core.helpers import load_graph, parse_ttl
+from src.core.normalizer import REPAIRS, normalize_ttl
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+
+# SHA-256 prefixes of normalize_ttl output, recorded with the original
+# multi-pass implementation. Any change here must bump NORMALIZER_VERSION.
+GOLDEN = {
+    "AutoGen/L1_Multi-Agent_Conversation_and_Stand-up_Comedy_instances.ttl": "c7d7738e2a03c1a9",
+    "AutoGen/L2_Sequential_Chats_and_Customer_Onboarding_instances.ttl": "8ccf4b40bc014021",
+    "AutoGen/L3_Reflection_and_Blogpost_Writing_instances.ttl": "2078217569c51fcf",
+    "AutoGen/L4_Tool_Use_and_Conversational_Chess_instances.ttl": "024fad7a03bf94dd",
+    "AutoGen/L5_Coding_and_Financial_Analysis_instances.ttl": "f098614be5556a6a",
+    "AutoGen/L6-Planning_and_Stock_Report_Generation_instances.ttl": "8f9e660ebe993fa5",
+    "CrewAI/game-builder-crew_instances.ttl": "b10eadd89fc78cab",
+    "CrewAI/industry-agents_instances.ttl": "b5be05949f82e411",
+    "CrewAI/instagram_post_instances.ttl": "c1036048e094dc36",
+    "CrewAI/job-posting_instances.ttl": "bd6df6a47d5e008c",
+    "CrewAI/landing_page_generator_instances.ttl": "eb0a4c558c69e8da",
+    "CrewAI/markdown_validator_instances.ttl": "4443aa17144a506e",
+    "CrewAI/marketing_strategy_instances.ttl": "af297c4e0647ee96",
+    "CrewAI/match_profile_to_positions_instances.ttl": "0376c1b28f97e95e",
+    "CrewAI/meta_quest_knowledge_instances.ttl": "1c166376317087da",
+    "CrewAI/prep-for-a-meeting_instances.ttl": "19d83318a051a36a",
+    "CrewAI/recruitment_instances.ttl": "3fb678a84c19b658",
+    "CrewAI/screenplay_writer_instances.ttl": "03947de906d27547",
+    "CrewAI/starter_template_instances.ttl": "77cd6a9e61efc99d",
+    "CrewAI/stock_analysis_instances.ttl": "ae7e846caf1ff949",
+    "CrewAI/surprise_trip_instances.ttl": "e4316aab1d2f3518",
+    "CrewAI/trip_planner_instances.ttl": "2c650aa969173bdb",
+    "LangGraph/chat-agent_instances.ttl": "c58bb129b37ae584",
+    "LangGraph/email-agent_instances.ttl": "91198a8dbfac3b1a",
+    "LangGraph/open-code_instances.ttl": "84d91da757aaacef",
+    "LangGraph/pizza-orderer_instances.ttl": "9c79a18eb01ac48c",
+    "LangGraph/stockbroker_instances.ttl": "853d14a4b34f4fb7",
+    "LangGraph/supervisor_instances.ttl": "e0b6d786b4a5b08c",
+    "LangGraph/trip-planner_instances.ttl": "4ffd806a7ffc3c15",
+    "LangGraph/writer-agent_instances.ttl": "8ddd5c2b04549469",
+    "Mastra AI/agent_instances.ttl": "00b0517f9f938d15",
+    "Mastra AI/bird-checker-with-express_instances.ttl": "bd1e32b88f29b695",
+    "Mastra AI/bird-checker-with-nextjs-and-eval_instances.ttl": "a2267199897cf87b",
+    "Mastra AI/bird-checker-with-nextjs_instances.ttl": "7e73269f32edd26d",
+    "Mastra AI/crypto-chatbot_instances.ttl": "3b21c6c936fada73",
+    "Mastra AI/dane_instances.ttl": "9fa6373a89d506a8",
+    "Mastra AI/mcp-registry-registry_instances.ttl": "5d4e8bb48fbc1d3e",
+    "Mastra AI/openapi-spec-writer_instances.ttl": "a8b34181da546754",
+    "Mastra AI/quick-start_instances.ttl": "ccd556f707a36f2d",
+    "Mastra AI/stock-price-tool_instances.ttl": "c1407fa33f785e09",
+    "Mastra AI/travel-app_instances.ttl": "fae9c077f695f8ce",
+    "Mastra AI/weather-agent_instances.ttl": "1656381c3a9ba12a",
+    "Mastra AI/workflow-ai-recruiter_instances.ttl": "78b56e77721194e7",
+    "Mastra AI/workflow-with-inline-steps_instances.ttl": "a50e37f50a74efb8",
+    "Mastra AI/workflow-with-memory_instances.ttl": "afdc2e0b50aa6257",
+    "Mastra AI/workflow-with-separate-steps_instances.ttl": "0537804d961699ce",
+    "Mastra AI/yc-directory_instances.ttl": "9d07b5839c054e42",
+}
+
+
+@pytest.mark.parametrize("name", sorted(GOLDEN))
+def test_corpus_output_is_unchanged(name):
+    output = normalize_ttl((KG_ROOT / name).read_text(encoding="utf-8"))
+    assert hashlib.sha256(output.encode("utf-8")).hexdigest()[:16] == GOLDEN[name]
+
+
+def test_golden_covers_corpus():
+    assert sorted(GOLDEN) == sorted(f"{p.parent.name}/{p.name}" for p in KG_ROOT.glob("*/*.ttl"))
+
+
+def test_markdown_and_headers_are_commented_out():
+    content = "```turtle\nHere is the KG\n---\n@prefix : <http://x/#> .\n:a :b :c .\n===\n```\n"
+    assert normalize_ttl(content) == (
+        "# Here is the KG\n# ---\n@prefix : <http://x/#> .\n:a :b :c .\n# ==="
+    )
+
+
+def test_missing_periods_and_subject_colon():
+    content = "@prefix : <http://x/#> .\n:a :b :c ;\n    :d :e\nf :g :h .\n"
+    assert normalize_ttl(content) == (
+        "@prefix : <http://x/#> .\n:a :b :c ;\n    :d :e .\n:f :g :h ."
+    )
+
+
+def test_missing_standard_prefixes_are_injected():
+    content = "@prefix : <http://x/#> .\n:a rdfs:label \"A\" ; dcterms:source <http://y> .\n"
+    output = normalize_ttl(content)
+    assert output.startswith(
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n"
+        "@prefix dcterms: <http://purl.org/dc/terms/> .\n\n"
+    )
+
+
+def test_multiline_literals_become_triple_quoted():
+    content = "@prefix : <http://x/#> .\n:a :b \"one\ntwo \\\" three\" ; :c 'x\ny' ; :d \"\"\"ok\nfine\"\"\" .\n"
+    assert normalize_ttl(content) == (
+        "@prefix : <http://x/#> .\n"
+        ":a :b \"\"\"one\ntwo \\\" three\"\"\" ; :c '''x\ny''' ; :d \"\"\"ok\nfine\"\"\" ."
+    )
+
+
+def test_synthetic_document_parses():
+    graph = Graph()
+    graph.parse(data=normalize_ttl(synthetic_ttl(20_000)), format="turtle")
+    assert len(graph) > 0
+
+
+def _best_seconds(document: str) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        normalize_ttl(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_scales_linearly():
+    small = _best_seconds(synthetic_ttl(250_000))
+    large = _best_seconds(synthetic_ttl(2_000_000))
+    # 8x the input; generous headroom for timer noise, quadratic work would be ~64x.
+    assert large < small * 16
+
+
+def test_repairs_report_fired_steps():
+    repairs = []
+    normalize_ttl("```turtle\n@prefix : <http://x/#> .\n:a rdfs:label 'A\nB'\n:b :c :d .\n```\n", repairs)
+    assert repairs == ["markdown", "statement_periods", "prefixes", "multiline_literals"]
+    assert set(repairs) <= set(REPAIRS)
+
+
+def test_clean_input_reports_no_repairs():
+    repairs = []
+    normalize_ttl("@prefix : <http://x/#> .\n:a :b :c .\n\n", repairs)
+    assert repairs == []
+
+
+def test_parse_ttl_skips_repairs_for_valid_turtle(monkeypatch):
+    monkeypatch.setattr("src.core.helpers.normalize_ttl", lambda *_: pytest.fail("slow path"))
+    graph = parse_ttl("@prefix : <http://x/#> .\n:a :b \"\"\"x\n---\ny\"\"\" .\n")
+    # The separator inside the literal is left alone.
+    assert str(next(graph.objects())) == "x\n---\ny"
+
+
+def test_load_graph_logs_repairs(tmp_path, caplog):
+    clean = tmp_path / "clean.ttl"
+    clean.write_text("@prefix : <http://x/#> .\n:a :b :c .\n", encoding="utf-8")
+    dirty = tmp_path / "dirty.ttl"
+    dirty.write_text("@prefix : <http://x/#> .\n:a :b :c ;\n:d :e :f .\n", encoding="utf-8")
+
+    with caplog.at_level(logging.INFO, logger="src.core.helpers"):
+        load_graph(str(clean))
+        graph = load_graph(str(dirty))
+    assert len(graph) == 2
+    assert [r.getMessage() for r in caplog.records] == [
+        f"[Parsed] {clean}  strict",
+        f"[Repaired] {dirty}  repairs=statement_periods",
+    ]
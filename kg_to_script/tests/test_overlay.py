@@ -0,0 +1,83 @@
+"""
+Tests for copy-on-write adaptation (src/core/overlay.py).
+
+Adapters must leave the canonical project untouched, share every model they
+do not change, and produce the same result from a CompactProject as from
+the AgenticProject it came from.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+from src.core.compact import compact
+from src.core.models import AgentModel, AgenticProject, LanguageModelModel, TaskModel
+from src.core.overlay import patch_each, patched
+
+
+FRAMEWORKS = ("autogen", "crewai", "langgraph", "mastra")
+
+
+def _adapter(framework: str):
+    return importlib.import_module(f"src.frameworks.{framework}.adapter")
+
+
+def test_patched_copies_only_on_change():
+    agent = AgentModel(iri="urn:a", var_name="a", role="writer", tool_iris=["urn:t"])
+    assert patched(agent, role="writer") is agent
+
+    changed = patched(agent, role="editor", goal="")
+    assert changed is not agent and (changed.role, agent.role) == ("editor", "writer")
+    assert changed.tool_iris is agent.tool_iris
+
+    agents = [agent]
+    assert patch_each(agents, lambda a: a) is agents
+    assert patch_each(agents, lambda a: patched(a, role="x"))[0].role == "x"
+
+
+def test_adapters_leave_canonical_project_untouched(kg_path, kg_project):
+    project = kg_project(kg_path)
+    before = project.model_dump()
+    agents, tasks = list(project.agents), list(project.tasks)
+
+    results = {framework: _adapter(framework).adapt(project) for framework in FRAMEWORKS}
+
+    assert project.model_dump() == before
+    assert all(a is b for a, b in zip(project.agents, agents))
+    assert all(a is b for a, b in zip(project.tasks, tasks))
+    for framework, result in results.items():
+        assert _adapter(framework).adapt(compact(project)) == result, framework
+
+
+def test_untouched_models_are_shared():
+    lm = LanguageModelModel(iri="urn:lm", name="GPT-4o", provider="openai", model_name="gpt-4o")
+    agent = AgentModel(
+        iri="urn:a", var_name="a", role="writer", goal="write", backstory="b", system_prompt="b",
+        language_model=lm,
+    )
+    task = TaskModel(
+        iri="urn:t", var_name="t", description="d", expected_output="o", agent_iri="urn:a", agent_var_name="a",
+    )
+    bare = TaskModel(iri="urn:u", var_name="draft_post")
+    project = AgenticProject(name="p", agents=[agent], tasks=[task, bare], language_models=[lm])
+
+    crew = _adapter("crewai").adapt(project)
+    assert crew.agents[0] is agent and crew.language_models[0] is lm
+    assert task in crew.tasks and any(t is task for t in crew.tasks)
+    patched_bare = next(t for t in crew.tasks if t.iri == "urn:u")
+    assert patched_bare is not bare and patched_bare.description == "Draft Post"
+    assert bare.description == ""
+
+    autogen = _adapter("autogen").adapt(project)
+    assert autogen.agents[0] is agent and autogen.tasks[0] is task
+
+
+def test_crewai_relinks_inferred_language_model():
+    lm = LanguageModelModel(iri="urn:lm", name="Ollama llama3.1")
+    agent = AgentModel(iri="urn:a", var_name="a", language_model=lm)
+    project = AgenticProject(name="p", agents=[agent], language_models=[lm])
+
+    crew = _adapter("crewai").adapt(project)
+    assert crew.language_models[0].provider == "ollama"
+    assert crew.agents[0].language_model is crew.language_models[0]
+    assert lm.provider == "" and agent.language_model is lm
@@ -0,0 +1,89 @@
+"""
+Tests for multi-team partitioned extraction (partition_by_team / extract_teams).
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from rdflib import Graph, URIRef
+from rdflib.namespace import RDF
+
+from src.core.extractor import extract_project
+from src.core.partition import extract_teams, partition_by_team
+
+
+KG_ROOT = Path(__file__).resolve().parents[2] / "script_to_kg" / "generated_kgs"
+MERGED = [
+    "LangGraph/chat-agent_instances.ttl",
+    "LangGraph/email-agent_instances.ttl",
+    "CrewAI/recruitment_instances.ttl",
+    "CrewAI/trip_planner_instances.ttl",
+]
+
+ONTO = "http://www.w3id.org/agentic-ai/onto#"
+
+
+def _teams_ttl(n: int) -> str:
+    lines = [
+        "@prefix : <http://www.w3id.org/agentic-ai/onto#> .",
+        "@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .",
+        ":gpt4 a :LanguageModel ; rdfs:label \"GPT-4\" .",
+    ]
+    for i in range(n):
+        lines += [
+            f":team{i} a :Team ; rdfs:label \"Team{i}\" ; :hasAgentMember :agent{i} .",
+            f":agent{i} a :LLMAgent ; :agentRole \"Role{i}\" ; :useLanguageModel :gpt4 .",
+            # Only reachable backwards: the task points at the agent.
+            f":task{i} a :Task ; rdfs:label \"Task{i}\" ; :performedByAgent :agent{i} .",
+        ]
+    return "\n".join(lines)
+
+
+def _graph(text: str) -> Graph:
+    return Graph().parse(data=text, format="turtle")
+
+
+def test_partitions_follow_links_and_share_individuals():
+    parts = partition_by_team(_graph(_teams_ttl(2)))
+    assert list(parts) == [URIRef(f"{ONTO}team0"), URIRef(f"{ONTO}team1")]
+
+    def members(part):
+        names = ("team0", "agent0", "task0", "team1", "agent1", "task1", "gpt4")
+        return {name for name in names if part.objects(URIRef(f"{ONTO}{name}"), RDF.type)}
+
+    assert members(parts[URIRef(f"{ONTO}team0")]) == {"team0", "agent0", "task0", "gpt4"}
+    assert members(parts[URIRef(f"{ONTO}team1")]) == {"team1", "agent1", "task1", "gpt4"}
+
+
+def test_extract_teams_matches_per_file_extraction(tmp_path):
+    merged = tmp_path / "merged.ttl"
+    merged.write_text("\n".join((KG_ROOT / name).read_text(encoding="utf-8") for name in MERGED), encoding="utf-8")
+
+    projects = extract_teams(str(merged))
+    expected = [extract_project(str(KG_ROOT / name)) for name in MERGED]
+    assert [p.team_iri for p in projects] == [p.team_iri for p in expected]
+    for project, single in zip(projects, expected):
+        assert project.model_dump() == single.model_dump()
+
+
+def test_single_team_graph_is_extracted_whole():
+    path = KG_ROOT / "CrewAI" / "stock_analysis_instances.ttl"
+    [project] = extract_teams(str(path))
+    assert project.model_dump() == extract_project(str(path)).model_dump()
+
+
+def test_partitioning_scales_linearly():
+    def best(graph: Graph) -> float:
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            partition_by_team(graph)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    small = best(_graph(_teams_ttl(100)))
+    large = best(_graph(_teams_ttl(800)))
+    # 8x the teams and triples; teams x graph work would be ~64x.
+    assert large < small * 20
@@ -0,0 +1,64 @@
+"""
+Tests for the prepared-query registry.
+
+Every *_QUERY constant must compile, and a compiled query must return the
+same rows as its raw string against the same graph.
+"""
+
+from __future__ import annotations
+
+import pytest
+from rdflib import Graph
+
+from src.core import prepared, queries
+
+
+TTL_TEAM = """
+@prefix : <http://www.w3id.org/agentic-ai/onto#> .
+@prefix dcterms: <http://purl.org/dc/terms/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+:my_team a :Team ;
+    rdfs:label "MyTeam" ;
+    :hasAgentMember :agent_alice .
+
+:agent_alice a :LLMAgent ;
+    :agentRole "Leader" ;
+    :agentToolUsage :tool_web .
+
+:tool_web a :Tool ;
+    rdfs:label "WebTool" .
+"""
+
+
+def test_registry_covers_every_query_constant():
+    expected = {name for name in vars(queries) if name.endswith("_QUERY")}
+    assert set(prepared.QUERY_NAMES) == expected
+    assert set(prepared.prepare_all()) == expected
+
+
+def test_prepared_query_is_compiled_once():
+    assert prepared.get_prepared("AGENTS_QUERY") is prepared.AGENTS_QUERY
+
+
+def test_unknown_query_name():
+    with pytest.raises(KeyError):
+        prepared.get_prepared("NOT_A_QUERY")
+    with pytest.raises(AttributeError):
+        getattr(prepared, "NOT_A_QUERY")
+
+
+@pytest.mark.parametrize("name", prepared.QUERY_NAMES)
+def test_prepared_matches_raw(name):
+    g = Graph()
+    g.parse(data=TTL_TEAM, format="turtle")
+    raw_rows = sorted((tuple(row) for row in g.query(getattr(queries, name))), key=repr)
+    prepared_rows = sorted((tuple(row) for row in g.query(prepared.get_prepared(name))), key=repr)
+    assert raw_rows == prepared_rows
+
+
+def test_query_name_reverse_lookup():
+    assert prepared.query_name(prepared.TEAM_QUERY) == "TEAM_QUERY"
+    assert prepared.query_name(queries.TEAM_QUERY) == "TEAM_QUERY"
+    with pytest.raises(KeyError):
+        prepared.query_name("SELECT * WHERE { ?s ?p ?o }")
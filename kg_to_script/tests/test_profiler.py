@@ -0,0 +1,79 @@
+"""
+Tests for the opt-in extraction profiler.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from src.core import profiler
+from src.core.extractor import extract_project, extract_projects
+from src.core.helpers import load_graph
+from src.core.prepared import get_prepared
+
+
+TTL = """
+@prefix : <http://www.w3id.org/agentic-ai/onto#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+:my_team a :Team ;
+    rdfs:label "MyTeam" ;
+    :hasAgentMember :agent_alice, :agent_bob .
+
+:agent_alice a :LLMAgent ; :agentRole "Leader" .
+:agent_bob a :LLMAgent ; :agentRole "Helper" .
+"""
+
+
+@pytest.fixture
+def ttl_file(tmp_path):
+    path = tmp_path / "team.ttl"
+    path.write_text(TTL, encoding="utf-8")
+    return path
+
+
+def test_profile_file_gets_one_record_per_kg(tmp_path, ttl_file):
+    target = tmp_path / "profile.jsonl"
+    plain = extract_project(str(ttl_file))
+    profiled = extract_project(str(ttl_file), backend="index", profile=str(target))
+    assert profiled.model_dump() == plain.model_dump()
+
+    [record] = profiler.load_profiles(target)
+    assert record["path"] == str(ttl_file)
+    assert {"load_graph", "parse", "build_index"} <= set(record["stages"])
+    assert "normalize_ttl" not in record["stages"]  # strict parse succeeded
+    assert "_extract_agents" in record["functions"]
+    assert "_link_team_relations" in record["functions"]
+
+    agents = record["queries"]["AGENTS_QUERY"]
+    expected_rows = len(list(load_graph(str(ttl_file)).query(get_prepared("AGENTS_QUERY"))))
+    assert agents["calls"] == 1
+    assert agents["rows"] == expected_rows == 2
+    assert agents["seconds"] > 0
+    assert record["total_seconds"] >= record["stages"]["load_graph"]
+
+
+def test_env_var_logs_json_record(ttl_file, monkeypatch, caplog):
+    monkeypatch.setenv(profiler.PROFILE_ENV, "1")
+    with caplog.at_level(logging.INFO, logger="src.core.profiler"):
+        extract_project(str(ttl_file))
+    [message] = [r.getMessage() for r in caplog.records if r.getMessage().startswith("[Profile]")]
+    assert json.loads(message[len("[Profile] "):])["queries"]["TEAM_QUERY"]["rows"] == 1
+
+
+def test_profiling_is_off_by_default(ttl_file, monkeypatch):
+    monkeypatch.delenv(profiler.PROFILE_ENV, raising=False)
+    [result] = extract_projects([str(ttl_file)], workers=1)
+    assert result.ok and result.profile is None
+    assert profiler.active_profile() is None
+
+
+def test_batch_results_carry_profiles_for_summary(ttl_file):
+    results = extract_projects([str(ttl_file)] * 2, workers=1, profile=True)
+    assert all(result.profile for result in results)
+    summary = profiler.summarize(result.profile for result in results)
+    assert "2 KGs" in summary
+    assert "AGENTS_QUERY" in summary and "_extract_agents" in summary
@@ -0,0 +1,98 @@
+"""
+Scaling tests for extraction on large synthetic teams.
+
+A team of N agents and N tasks, with several relation links per entity, is
+extracted at N = 1k, 10k and 50k. Time per entity must stay roughly flat;
+a quadratic relation pass makes it grow with N. The graph is built in
+memory and extracted with backend="index", the path meant for large KGs.
+Timing runs with the garbage collector paused, as timeit does: full
+collections walk every live object, including the graph under test, and
+would add a size-dependent cost that is not the extractor's.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS
+
+from src.core.extractor import _Attacher, extract_project_from_graph
+from src.core.index import TripleIndex
+
+
+AGENTO = Namespace("http://www.w3id.org/agentic-ai/onto#")
+EX = Namespace("http://example.org/scale#")
+
+SIZES = (1_000, 10_000, 50_000)
+
+# Allowed growth of time per entity between consecutive sizes. Linear
+# passes stay near 1; one quadratic pass multiplies it by the size ratio.
+MAX_PER_ENTITY_GROWTH = 2.5
+
+
+def _build_team(n: int) -> Graph:
+    """One :Team whose n agents and n tasks carry tool, interaction and resource links."""
+    g = Graph()
+    add = g.add
+    team = EX.team
+    n_tools = max(1, n // 10)
+    add((team, RDF.type, AGENTO.Team))
+    add((team, RDFS.label, Literal("Scale Team")))
+    for i in range(n_tools):
+        add((EX[f"tool{i}"], RDF.type, AGENTO.Tool))
+        add((EX[f"tool{i}"], RDFS.label, Literal(f"Tool {i}")))
+    for i in range(n):
+        agent, task = EX[f"agent{i}"], EX[f"task{i}"]
+        add((agent, RDF.type, AGENTO.LLMAgent))
+        add((agent, AGENTO.agentRole, Literal(f"Role {i}")))
+        add((agent, AGENTO.agentToolUsage, EX[f"tool{i % n_tools}"]))
+        for k in (1, 2, 3):
+            add((agent, AGENTO.interactsWith, EX[f"agent{(i + k) % n}"]))
+        add((team, AGENTO.hasAgentMember, agent))
+        add((task, RDF.type, AGENTO.Task))
+        add((task, RDFS.label, Literal(f"task_{i}")))
+        add((task, AGENTO.producedResource, EX[f"res{i}"]))
+        if i:
+            add((task, AGENTO.requiresResource, EX[f"res{i - 1}"]))
+    return g
+
+
+def _seconds_per_entity(n: int, repeat: int) -> float:
+    index = TripleIndex(_build_team(n))
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            project = extract_project_from_graph(index, backend="index")
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    assert len(project.agents) == n and len(project.tasks) == n
+    assert len(project.agent_member_iris) == n
+    assert project.tasks[-1].context_task_var_names == [f"task_{n - 2}"]
+    return best / n
+
+
+def test_extraction_time_grows_linearly():
+    per_entity = [_seconds_per_entity(n, repeat=3 if n < 50_000 else 1) for n in SIZES]
+    for smaller, larger, (n_small, n_large) in zip(per_entity, per_entity[1:], zip(SIZES, SIZES[1:])):
+        assert larger <= smaller * MAX_PER_ENTITY_GROWTH, (
+            f"time per entity grew {larger / smaller:.1f}x from {n_small} to {n_large} entities"
+        )
+
+
+def test_attacher_dedups_in_first_seen_order():
+    attach = _Attacher()
+    values = ["seed"]
+    for value in ["a", "b", "a", "seed"] + [f"v{i}" for i in range(40)] + ["b", "v3", "v39"]:
+        attach(values, value)
+    assert values == ["seed", "a", "b"] + [f"v{i}" for i in range(40)]
+
+    # A second list is tracked separately.
+    other = []
+    attach(other, "a")
+    assert other == ["a"]
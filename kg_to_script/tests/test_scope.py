@@ -0,0 +1,87 @@
+"""
+Tests for extraction scopes.
+
+Each adapter's EXTRACTION_SCOPE must generate exactly the same project as a
+full extraction for every KG in script_to_kg/generated_kgs, while skipping
+the queries outside the scope.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core.extractor import extract_project, extract_project_from_graph
+from src.core.ir_cache import IRCache
+from src.core.profiler import profiling
+from src.core.scope import COLLECTIONS, FULL_SCOPE, RELATIONS, ExtractionScope
+
+
+FRAMEWORKS = ("autogen", "crewai", "langgraph", "mastra")
+
+# Generated files that embed a timestamp (.generated_files holds manifest.json's hash).
+VOLATILE_FILES = {"manifest.json", ".generated_files"}
+
+def _read_tree(root: Path):
+    files = {}
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            if name not in VOLATILE_FILES:
+                path = Path(dirpath) / name
+                files[str(path.relative_to(root))] = path.read_bytes()
+    return files
+
+
+@pytest.mark.parametrize("framework", FRAMEWORKS)
+def test_adapter_scope_generates_same_project(tmp_path, framework, kg_path, kg_graph):
+    adapter = importlib.import_module(f"src.frameworks.{framework}.adapter")
+    generator = importlib.import_module(f"src.frameworks.{framework}.generator")
+    graph = kg_graph(kg_path)
+
+    outputs = []
+    for scope in (FULL_SCOPE, adapter.EXTRACTION_SCOPE):
+        out = tmp_path / ("full" if scope.is_full else "scoped")
+        generator.generate_project(adapter.adapt(extract_project_from_graph(graph, scope=scope)), str(out))
+        outputs.append(_read_tree(out))
+    assert outputs[0] == outputs[1]
+
+
+def test_scope_skips_queries(kg_paths, kg_graph):
+    path = kg_paths[0]
+    graph = kg_graph(path)
+    with profiling(str(path)) as full:
+        extract_project_from_graph(graph)
+    with profiling(str(path)) as empty:
+        project = extract_project_from_graph(graph, scope=ExtractionScope(collections=(), relations=()))
+
+    assert "GOALS_QUERY" in full.queries and "GOALS_QUERY" not in empty.queries
+    assert not any(name.startswith("_link_") for name in empty.functions)
+    assert len(empty.queries) < len(full.queries)
+    assert project.agents and not project.goals and not project.env_vars
+
+
+def test_full_scope_is_default():
+    assert FULL_SCOPE == ExtractionScope(collections=COLLECTIONS, relations=RELATIONS)
+    assert FULL_SCOPE.is_full
+    assert not ExtractionScope(relations=()).is_full
+
+
+def test_unknown_scope_entry():
+    with pytest.raises(ValueError, match="goalz"):
+        ExtractionScope(collections=("goalz",))
+
+
+def test_ir_cache_keys_by_scope(tmp_path, kg_paths):
+    path = kg_paths[0]
+    cache = IRCache(tmp_path)
+    scoped = ExtractionScope(collections=(), relations=())
+    content = path.read_text(encoding="utf-8")
+    assert cache.key_for(content, scoped) != cache.key_for(content)
+
+    full = extract_project(str(path), cache=cache)
+    partial = extract_project(str(path), cache=cache, scope=scoped)
+    assert extract_project(str(path), cache=cache) == full
+    assert extract_project(str(path), cache=cache, scope=scoped) == partial
@@ -0,0 +1,91 @@
+"""
+Tests for the synthetic AgentO KG generator (benchmarks/synthetic.py).
+
+Clean documents must parse as strict Turtle and extract to the requested
+shape; every injected defect must break strict parsing and be repaired by
+normalize_ttl back to the clean graph.
+"""
+
+from __future__ import annotations
+
+import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from benchmarks.synthetic import DEFECTS, TOPOLOGIES, synthetic_kg
+from src.core.extractor import extract_project_from_graph
+from src.core.helpers import parse_ttl
+from src.core.models import WorkflowType
+
+
+EXPECTED_TYPES = {
+    "chain": WorkflowType.SEQUENTIAL,
+    "fanout": WorkflowType.BRANCHING,
+    "cycle": WorkflowType.LOOP,
+    "nested": WorkflowType.SEQUENTIAL,
+}
+
+
+def _strict(document: str) -> Graph:
+    return Graph().parse(data=document, format="turtle")
+
+
+def test_same_seed_same_document():
+    assert synthetic_kg(agents=5, seed=3) == synthetic_kg(agents=5, seed=3)
+    assert synthetic_kg(agents=5, seed=3) != synthetic_kg(agents=5, seed=4)
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+def test_extracts_requested_shape(topology):
+    document = synthetic_kg(agents=6, tasks=12, tools=3, steps=10, topology=topology, kickoff_inputs=3, seed=1)
+    project = extract_project_from_graph(_strict(document))
+
+    assert (len(project.agents), len(project.tasks), len(project.tools)) == (6, 12, 3)
+    assert len(project.agent_member_iris) == 6
+    assert len(project.input_variables) == 3
+    assert all(variable.has_default for variable in project.input_variables)
+    assert project.system_configs["process"] == "sequential"
+    assert any(task.context_task_var_names for task in project.tasks)
+    assert all(len(agent.configs) == 2 for agent in project.agents)
+
+    step_patterns = [workflow for workflow in project.workflows if workflow.steps]
+    assert sum(len(workflow.steps) for workflow in step_patterns) == 10
+    assert {workflow.workflow_type for workflow in step_patterns} == {EXPECTED_TYPES[topology]}
+
+
+def test_nested_patterns():
+    document = synthetic_kg(tasks=20, topology="nested", pattern_size=2, seed=2)
+    workflows = extract_project_from_graph(_strict(document)).workflows
+
+    leaves = [workflow for workflow in workflows if workflow.steps]
+    assert len(leaves) == 10 and all(len(leaf.steps) == 2 for leaf in leaves)
+    assert [leaf.next_pattern_iri.split("#")[-1] for leaf in leaves[:-1]] == [
+        f"pattern_leaf_{n}" for n in range(1, 10)
+    ]
+    assert any(workflow.sub_pattern_iris for workflow in workflows if not workflow.steps)
+
+
+@pytest.mark.parametrize("defect", DEFECTS)
+def test_defects_are_repaired_to_clean_graph(defect):
+    clean = synthetic_kg(agents=5, tasks=10, seed=5)
+    broken = synthetic_kg(agents=5, tasks=10, seed=5, defects=[defect], defect_rate=0.5)
+    with pytest.raises(Exception):
+        _strict(broken)
+
+    repairs = []
+    assert isomorphic(parse_ttl(broken, repairs), _strict(clean))
+    assert defect in repairs
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+def test_all_defects_together(topology):
+    clean = synthetic_kg(agents=5, tasks=10, topology=topology, seed=6)
+    broken = synthetic_kg(agents=5, tasks=10, topology=topology, seed=6, defects=DEFECTS, defect_rate=1.0)
+    assert isomorphic(parse_ttl(broken), _strict(clean))
+
+
+def test_unknown_arguments():
+    with pytest.raises(ValueError, match="topology"):
+        synthetic_kg(topology="ring")
+    with pytest.raises(ValueError, match="defects"):
+        synthetic_kg(defects=["typos"])